@@ -33,6 +33,8 @@ from pants.util.docutil import doc_url
 
 
 class PythonAwsLambdaHandlerField(StringField, AsyncFieldMixin, SecondaryOwnerMixin):
+    __slots__ = ()
+
     alias = "handler"
     required = True
     value: str
@@ -118,6 +120,8 @@ async def resolve_python_aws_handler(
 
 
 class PythonAwsLambdaDependencies(Dependencies):
+    __slots__ = ()
+
     supports_transitive_excludes = True
 
 
@@ -165,6 +169,8 @@ async def inject_lambda_handler_dependency(
 
 
 class PythonAwsLambdaRuntime(StringField):
+    __slots__ = ()
+
     PYTHON_RUNTIME_REGEX = r"python(?P<major>\d)\.(?P<minor>\d+)"
 
     alias = "runtime"
@@ -10,10 +10,14 @@ from pants.engine.target import StringField
 
 
 class ProtobufPythonInterpreterConstraints(InterpreterConstraintsField):
+    __slots__ = ()
+
     alias = "python_interpreter_constraints"
 
 
 class PythonSourceRootField(StringField):
+    __slots__ = ()
+
     alias = "python_source_root"
     help = (
         "The source root to generate Python sources under.\n\nIf unspecified, the source root the "
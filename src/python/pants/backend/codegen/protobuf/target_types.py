@@ -30,10 +30,13 @@ from pants.util.logging import LogLevel
 # NB: We subclass Dependencies so that specific backends can add dependency injection rules to
 # `protobuf_source` targets.
 class ProtobufDependenciesField(Dependencies):
+    __slots__ = ()
     pass
 
 
 class ProtobufGrpcToggleField(BoolField):
+    __slots__ = ()
+
     alias = "grpc"
     default = False
     help = "Whether to generate gRPC code or not."
@@ -54,6 +57,8 @@ def find_all_protobuf_targets(targets: AllTargets) -> AllProtobufTargets:
 
 
 class ProtobufSourceField(SingleSourceField):
+    __slots__ = ()
+
     expected_file_extensions = (".proto",)
 
 
@@ -77,11 +82,15 @@ class ProtobufSourceTarget(Target):
 
 
 class ProtobufSourcesGeneratingSourcesField(MultipleSourcesField):
+    __slots__ = ()
+
     default = ("*.proto",)
     expected_file_extensions = (".proto",)
 
 
 class ProtobufSourcesOverridesField(OverridesField):
+    __slots__ = ()
+
     help = generate_file_based_overrides_field_help_message(
         ProtobufSourceTarget.alias,
         (
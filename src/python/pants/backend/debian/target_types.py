@@ -14,6 +14,8 @@ from pants.util.docutil import doc_url
 
 
 class DebianControlFile(MultipleSourcesField):
+    __slots__ = ()
+
     required = True
     expected_num_files = 1
     help = (
@@ -23,6 +25,8 @@ class DebianControlFile(MultipleSourcesField):
 
 
 class DebianSymlinks(DictStringToStringField):
+    __slots__ = ()
+
     alias = "symlinks"
     help = (
         "Symlinks to create for each target being packaged.\n\n"
@@ -31,12 +35,16 @@ class DebianSymlinks(DictStringToStringField):
 
 
 class DebianInstallPrefix(StringField):
+    __slots__ = ()
+
     alias = "install_prefix"
     default = "/opt"
     help = "Absolute path to a directory where Debian package will be installed to."
 
 
 class DebianPackageDependencies(SpecialCasedDependencies):
+    __slots__ = ()
+
     alias = "packages"
     required = True
     help = (
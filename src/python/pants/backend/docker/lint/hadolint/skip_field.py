@@ -6,6 +6,8 @@ from pants.engine.target import BoolField
 
 
 class SkipHadolintField(BoolField):
+    __slots__ = ()
+
     alias = "skip_hadolint"
     default = False
     help = "If true, don't run hadolint on this target's Dockerfile."
@@ -21,6 +21,8 @@ from pants.util.docutil import doc_url
 
 
 class DockerBuildArgsField(StringSequenceField):
+    __slots__ = ()
+
     alias = "extra_build_args"
     default = ()
     help = (
@@ -32,6 +34,8 @@ class DockerBuildArgsField(StringSequenceField):
 
 
 class DockerImageSourceField(SingleSourceField):
+    __slots__ = ()
+
     default = "Dockerfile"
 
     # When the default glob value is in effect, we don't want the normal glob match error behavior
@@ -51,6 +55,8 @@ class DockerImageSourceField(SingleSourceField):
 
 
 class DockerImageInstructionsField(StringSequenceField):
+    __slots__ = ()
+
     alias = "instructions"
     required = False
     help = (
@@ -74,6 +80,8 @@ class DockerImageInstructionsField(StringSequenceField):
 
 
 class DockerImageTagsField(StringSequenceField):
+    __slots__ = ()
+
     alias = "image_tags"
     default = ("latest",)
     help = (
@@ -85,10 +93,14 @@ class DockerImageTagsField(StringSequenceField):
 
 
 class DockerDependenciesField(Dependencies):
+    __slots__ = ()
+
     supports_transitive_excludes = True
 
 
 class DockerRegistriesField(StringSequenceField):
+    __slots__ = ()
+
     alias = "registries"
     default = (ALL_DEFAULT_REGISTRIES,)
     help = (
@@ -125,6 +137,8 @@ class DockerRegistriesField(StringSequenceField):
 
 
 class DockerRepositoryField(StringField):
+    __slots__ = ()
+
     alias = "repository"
     help = (
         'The repository name for the Docker image. e.g. "<repository>/<name>".\n\n'
@@ -135,6 +149,8 @@ class DockerRepositoryField(StringField):
 
 
 class DockerSkipPushField(BoolField):
+    __slots__ = ()
+
     alias = "skip_push"
     default = False
     help = "If set to true, do not push this image to registries when running `./pants publish`."
@@ -0,0 +1,6 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from pants.build_graph.backend_manifest import BackendManifest
+
+MANIFEST = BackendManifest(goals=("java-dump-first-party-dep-map", "java-dump-source-analysis"))
@@ -45,7 +45,10 @@ async def package_go_binary(field_set: GoBinaryFieldSet) -> BuiltPackage:
     import_config = await Get(
         ImportConfig, ImportConfigRequest(built_package.import_paths_to_pkg_a_files)
     )
-    input_digest = await Get(Digest, MergeDigests([built_package.digest, import_config.digest]))
+    input_digest = await Get(
+        Digest,
+        MergeDigests([*built_package.import_paths_to_digests.values(), import_config.digest]),
+    )
 
     output_filename = PurePath(field_set.output_path.value_or_default(file_ending=None))
     binary = await Get(
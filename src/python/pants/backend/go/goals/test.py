@@ -229,7 +229,10 @@ async def run_go_tests(
     import_config = await Get(
         ImportConfig, ImportConfigRequest(built_main_pkg.import_paths_to_pkg_a_files)
     )
-    input_digest = await Get(Digest, MergeDigests([built_main_pkg.digest, import_config.digest]))
+    input_digest = await Get(
+        Digest,
+        MergeDigests([*built_main_pkg.import_paths_to_digests.values(), import_config.digest]),
+    )
 
     binary = await Get(
         LinkedGoBinary,
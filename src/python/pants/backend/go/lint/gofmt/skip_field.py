@@ -6,6 +6,8 @@ from pants.engine.target import BoolField
 
 
 class SkipGofmtField(BoolField):
+    __slots__ = ()
+
     alias = "skip_gofmt"
     default = False
     help = "If true, don't run gofmt on this package."
@@ -6,6 +6,8 @@ from pants.engine.target import BoolField
 
 
 class SkipGoVetField(BoolField):
+    __slots__ = ()
+
     alias = "skip_go_vet"
     default = False
     help = "If true, don't run `go vet` on this target's code."
@@ -29,6 +29,8 @@ from pants.engine.target import (
 
 
 class GoModSourcesField(MultipleSourcesField):
+    __slots__ = ()
+
     alias = "_sources"
     default = ("go.mod", "go.sum")
     expected_num_files = range(1, 3)  # i.e. 1 or 2.
@@ -64,6 +66,8 @@ class GoModSourcesField(MultipleSourcesField):
 
 # TODO: This field probably shouldn't be registered.
 class GoModDependenciesField(Dependencies):
+    __slots__ = ()
+
     alias = "_dependencies"
 
 
@@ -89,6 +93,8 @@ class GoModTarget(Target):
 
 
 class GoPackageSourcesField(MultipleSourcesField):
+    __slots__ = ()
+
     default = ("*.go", "*.s")
     expected_file_extensions = (".go", ".s")
 
@@ -118,10 +124,13 @@ class GoPackageSourcesField(MultipleSourcesField):
 
 
 class GoPackageDependenciesField(Dependencies):
+    __slots__ = ()
     pass
 
 
 class SkipGoTestsField(BoolField):
+    __slots__ = ()
+
     alias = "skip_tests"
     default = False
     help = "If true, don't run this package's tests."
@@ -148,6 +157,8 @@ class GoPackageTarget(Target):
 
 
 class GoImportPathField(StringField):
+    __slots__ = ()
+
     alias = "import_path"
     help = (
         "Import path in Go code to import this package.\n\n"
@@ -158,6 +169,7 @@ class GoImportPathField(StringField):
 
 
 class GoThirdPartyPackageDependenciesField(Dependencies):
+    __slots__ = ()
     pass
 
 
@@ -189,6 +201,8 @@ class GoThirdPartyPackageTarget(Target):
 
 
 class GoBinaryMainPackageField(StringField, AsyncFieldMixin):
+    __slots__ = ()
+
     alias = "main"
     help = (
         "Address of the `go_package` with the `main` for this binary.\n\n"
@@ -212,6 +226,8 @@ class GoBinaryMainPackageRequest(EngineAwareParameter):
 
 
 class GoBinaryDependenciesField(Dependencies):
+    __slots__ = ()
+
     # This is only used to inject a dependency from the `GoBinaryMainPackageField`. Users should
     # add any explicit dependencies to the `go_package`.
     alias = "_dependencies"
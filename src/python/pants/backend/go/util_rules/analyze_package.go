@@ -331,6 +331,10 @@ func main() {
 
 	for _, arg := range os.Args[1:] {
 		pkg, err := analyzePackage(arg, buildContext)
+		if pkg == nil {
+			// Always emit one result per directory, since the caller may analyze many at once.
+			pkg = &Package{}
+		}
 		if err != nil {
 			pkg.Error = err.Error()
 		}
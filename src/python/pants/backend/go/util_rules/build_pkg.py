@@ -179,11 +179,25 @@ class FallibleBuiltGoPackage(EngineAwareReturnType):
 class BuiltGoPackage:
     """A package and its dependencies compiled as `__pkg__.a` files.
 
-    The packages are arranged into `__pkgs__/{path_safe(import_path)}/__pkg__.a`.
+    The packages are arranged into `__pkgs__/{path_safe(import_path)}/__pkg__.a`. Each archive is
+    kept in its own digest, rather than being merged with the archives of its dependencies at
+    every level of the import graph: consumers which need all of the archives (e.g. to link a
+    binary) should merge `import_paths_to_digests`.
     """
 
-    digest: Digest
+    import_path: str
     import_paths_to_pkg_a_files: FrozenDict[str, str]
+    import_paths_to_digests: FrozenDict[str, Digest]
+
+    @property
+    def pkg_a_file(self) -> str:
+        """The path of the archive of this package (excluding its dependencies)."""
+        return self.import_paths_to_pkg_a_files[self.import_path]
+
+    @property
+    def archive_digest(self) -> Digest:
+        """The digest containing the archive of this package (excluding its dependencies)."""
+        return self.import_paths_to_digests[self.import_path]
 
 
 @dataclass(unsafe_hash=True)
@@ -240,7 +254,9 @@ async def build_go_package(request: BuildGoPackageRequest) -> FallibleBuiltGoPac
     )
 
     import_paths_to_pkg_a_files: dict[str, str] = {}
-    dep_digests = []
+    import_paths_to_digests: dict[str, Digest] = {}
+    direct_import_paths_to_pkg_a_files: dict[str, str] = {}
+    direct_dep_digests = []
     for maybe_dep in maybe_built_deps:
         if maybe_dep.output is None:
             return dataclasses.replace(
@@ -248,11 +264,15 @@ async def build_go_package(request: BuildGoPackageRequest) -> FallibleBuiltGoPac
             )
         dep = maybe_dep.output
         import_paths_to_pkg_a_files.update(dep.import_paths_to_pkg_a_files)
-        dep_digests.append(dep.digest)
+        import_paths_to_digests.update(dep.import_paths_to_digests)
+        # The export data in an archive is self-contained, so (like `go build`) the compiler is
+        # only given the archives of the packages which are imported directly.
+        direct_import_paths_to_pkg_a_files[dep.import_path] = dep.pkg_a_file
+        direct_dep_digests.append(dep.archive_digest)
 
     merged_deps_digest, import_config, embedcfg = await MultiGet(
-        Get(Digest, MergeDigests(dep_digests)),
-        Get(ImportConfig, ImportConfigRequest(FrozenDict(import_paths_to_pkg_a_files))),
+        Get(Digest, MergeDigests(direct_dep_digests)),
+        Get(ImportConfig, ImportConfigRequest(FrozenDict(direct_import_paths_to_pkg_a_files))),
         Get(RenderedEmbedConfig, RenderEmbedConfigRequest(request.embed_config)),
     )
 
@@ -353,10 +373,15 @@ async def build_go_package(request: BuildGoPackageRequest) -> FallibleBuiltGoPac
 
     path_prefix = os.path.join("__pkgs__", path_safe(request.import_path))
     import_paths_to_pkg_a_files[request.import_path] = os.path.join(path_prefix, "__pkg__.a")
-    output_digest = await Get(Digest, AddPrefix(compilation_digest, path_prefix))
-    merged_result_digest = await Get(Digest, MergeDigests([*dep_digests, output_digest]))
+    import_paths_to_digests[request.import_path] = await Get(
+        Digest, AddPrefix(compilation_digest, path_prefix)
+    )
 
-    output = BuiltGoPackage(merged_result_digest, FrozenDict(import_paths_to_pkg_a_files))
+    output = BuiltGoPackage(
+        request.import_path,
+        FrozenDict(import_paths_to_pkg_a_files),
+        FrozenDict(import_paths_to_digests),
+    )
     return FallibleBuiltGoPackage(output, request.import_path)
 
 
@@ -57,13 +57,15 @@ def assert_built(
     rule_runner: RuleRunner, request: BuildGoPackageRequest, *, expected_import_paths: list[str]
 ) -> None:
     built_package = rule_runner.request(BuiltGoPackage, [request])
-    result_files = rule_runner.request(Snapshot, [built_package.digest]).files
     expected = {
         import_path: os.path.join("__pkgs__", path_safe(import_path), "__pkg__.a")
         for import_path in expected_import_paths
     }
     assert dict(built_package.import_paths_to_pkg_a_files) == expected
-    assert sorted(result_files) == sorted(expected.values())
+    assert built_package.import_paths_to_digests.keys() == expected.keys()
+    # Each package's archive is in its own digest, rather than being merged with its dependencies.
+    for import_path, digest in built_package.import_paths_to_digests.items():
+        assert rule_runner.request(Snapshot, [digest]).files == (expected[import_path],)
 
 
 def test_build_pkg(rule_runner: RuleRunner) -> None:
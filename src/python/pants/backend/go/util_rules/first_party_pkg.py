@@ -9,6 +9,8 @@ import pkgutil
 from dataclasses import dataclass
 from typing import ClassVar
 
+import ijson
+
 from pants.backend.go.target_types import GoPackageSourcesField
 from pants.backend.go.util_rules.build_pkg import BuildGoPackageRequest, BuiltGoPackage
 from pants.backend.go.util_rules.go_mod import (
@@ -19,14 +21,22 @@ from pants.backend.go.util_rules.go_mod import (
 )
 from pants.backend.go.util_rules.import_analysis import ImportConfig, ImportConfigRequest
 from pants.backend.go.util_rules.link import LinkedGoBinary, LinkGoBinaryRequest
+from pants.base.specs import AddressSpecs, DescendantAddresses
 from pants.build_graph.address import Address
 from pants.engine.engine_aware import EngineAwareParameter
 from pants.engine.fs import CreateDigest, Digest, FileContent, MergeDigests
 from pants.engine.process import FallibleProcessResult, Process
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
-from pants.engine.target import HydratedSources, HydrateSourcesRequest, WrappedTarget
+from pants.engine.target import (
+    HydratedSources,
+    HydrateSourcesRequest,
+    UnexpandedTargets,
+    WrappedTarget,
+)
 from pants.util.dirutil import fast_relpath
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
+from pants.util.strutil import pluralize
 
 logger = logging.getLogger(__name__)
 
@@ -124,43 +134,113 @@ class PackageAnalyzerSetup:
     PATH: ClassVar[str] = "./_analyze_package"
 
 
-@rule
-async def compute_first_party_package_info(
-    request: FirstPartyPkgInfoRequest, analyzer: PackageAnalyzerSetup
-) -> FallibleFirstPartyPkgInfo:
-    owning_go_mod = await Get(OwningGoMod, OwningGoModRequest(request.address))
-    wrapped_target, import_path_info, go_mod_info = await MultiGet(
-        Get(WrappedTarget, Address, request.address),
-        Get(FirstPartyPkgImportPath, FirstPartyPkgImportPathRequest(request.address)),
-        Get(GoModInfo, GoModInfoRequest(owning_go_mod.address)),
+@dataclass(frozen=True)
+class AllFirstPartyPkgAnalysesRequest(EngineAwareParameter):
+    """Analyze all the first-party packages owned by a `go_mod` target, in a single process."""
+
+    go_mod_address: Address
+
+    def debug_hint(self) -> str:
+        return self.go_mod_address.spec
+
+
+@dataclass(frozen=True)
+class AllFirstPartyPkgAnalyses:
+    """The raw JSON analysis of each first-party package of a `go_mod`, keyed by its directory.
+
+    Use `FirstPartyPkgInfo` instead, which is computed (and cached) per-package from this.
+    """
+
+    analyses: FrozenDict[str, str]
+    exit_code: int = 0
+    stderr: str | None = None
+
+
+@rule(desc="Analyze first-party Go packages", level=LogLevel.DEBUG)
+async def analyze_all_first_party_packages(
+    request: AllFirstPartyPkgAnalysesRequest, analyzer: PackageAnalyzerSetup
+) -> AllFirstPartyPkgAnalyses:
+    # We don't expect `go_package` targets to be generated, so we can use UnexpandedTargets.
+    candidate_targets = await Get(
+        UnexpandedTargets,
+        AddressSpecs([DescendantAddresses(request.go_mod_address.spec_path)]),
     )
+    candidate_pkg_targets = [
+        tgt for tgt in candidate_targets if tgt.has_field(GoPackageSourcesField)
+    ]
+    owning_go_mods = await MultiGet(
+        Get(OwningGoMod, OwningGoModRequest(tgt.address)) for tgt in candidate_pkg_targets
+    )
+    # Exclude the packages of any nested `go_mod`.
+    pkg_targets = [
+        tgt
+        for tgt, owning_go_mod in zip(candidate_pkg_targets, owning_go_mods)
+        if owning_go_mod.address == request.go_mod_address
+    ]
 
-    pkg_sources = await Get(
-        HydratedSources,
-        HydrateSourcesRequest(wrapped_target.target[GoPackageSourcesField]),
+    all_pkg_sources = await MultiGet(
+        Get(HydratedSources, HydrateSourcesRequest(tgt[GoPackageSourcesField]))
+        for tgt in pkg_targets
     )
     input_digest = await Get(
         Digest,
-        MergeDigests([pkg_sources.snapshot.digest, analyzer.digest]),
+        MergeDigests([*(sources.snapshot.digest for sources in all_pkg_sources), analyzer.digest]),
     )
+
+    # The analyzer emits one JSON object per directory argument, in order.
+    dir_paths = sorted({tgt.address.spec_path or "." for tgt in pkg_targets})
     result = await Get(
         FallibleProcessResult,
         Process(
-            (analyzer.PATH, request.address.spec_path or "."),
+            (analyzer.PATH, *dir_paths),
             input_digest=input_digest,
-            description=f"Determine metadata for {request.address}",
+            description=(
+                f"Determine metadata for {pluralize(len(dir_paths), 'first-party package')} of "
+                f"{request.go_mod_address}"
+            ),
             level=LogLevel.DEBUG,
         ),
     )
     if result.exit_code != 0:
+        return AllFirstPartyPkgAnalyses(
+            FrozenDict(), exit_code=result.exit_code, stderr=result.stderr.decode("utf-8")
+        )
+
+    return AllFirstPartyPkgAnalyses(
+        FrozenDict(
+            (dir_path, json.dumps(metadata))
+            for dir_path, metadata in zip(
+                dir_paths, ijson.items(result.stdout, "", multiple_values=True)
+            )
+        )
+    )
+
+
+@rule
+async def compute_first_party_package_info(
+    request: FirstPartyPkgInfoRequest,
+) -> FallibleFirstPartyPkgInfo:
+    owning_go_mod = await Get(OwningGoMod, OwningGoModRequest(request.address))
+    wrapped_target, import_path_info, go_mod_info, all_analyses = await MultiGet(
+        Get(WrappedTarget, Address, request.address),
+        Get(FirstPartyPkgImportPath, FirstPartyPkgImportPathRequest(request.address)),
+        Get(GoModInfo, GoModInfoRequest(owning_go_mod.address)),
+        Get(AllFirstPartyPkgAnalyses, AllFirstPartyPkgAnalysesRequest(owning_go_mod.address)),
+    )
+
+    pkg_sources = await Get(
+        HydratedSources,
+        HydrateSourcesRequest(wrapped_target.target[GoPackageSourcesField]),
+    )
+    if all_analyses.exit_code != 0:
         return FallibleFirstPartyPkgInfo(
             info=None,
             import_path=import_path_info.import_path,
-            exit_code=result.exit_code,
-            stderr=result.stderr.decode("utf-8"),
+            exit_code=all_analyses.exit_code,
+            stderr=all_analyses.stderr,
         )
 
-    metadata = json.loads(result.stdout)
+    metadata = json.loads(all_analyses.analyses[request.address.spec_path or "."])
     if "Error" in metadata or "InvalidGoFiles" in metadata:
         error = metadata.get("Error", "")
         if error:
@@ -233,7 +313,8 @@ async def setup_analyzer() -> PackageAnalyzerSetup:
     )
     main_pkg_a_file_path = built_analyzer_pkg.import_paths_to_pkg_a_files["main"]
     input_digest = await Get(
-        Digest, MergeDigests([built_analyzer_pkg.digest, import_config.digest])
+        Digest,
+        MergeDigests([*built_analyzer_pkg.import_paths_to_digests.values(), import_config.digest]),
     )
 
     analyzer = await Get(
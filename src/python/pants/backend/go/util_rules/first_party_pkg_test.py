@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import json
 import os.path
 from textwrap import dedent
 from typing import Iterable
@@ -21,6 +22,8 @@ from pants.backend.go.util_rules import (
     third_party_pkg,
 )
 from pants.backend.go.util_rules.first_party_pkg import (
+    AllFirstPartyPkgAnalyses,
+    AllFirstPartyPkgAnalysesRequest,
     FallibleFirstPartyPkgInfo,
     FirstPartyPkgImportPath,
     FirstPartyPkgImportPathRequest,
@@ -45,6 +48,7 @@ def rule_runner() -> RuleRunner:
             *link.rules(),
             *assembly.rules(),
             QueryRule(FallibleFirstPartyPkgInfo, [FirstPartyPkgInfoRequest]),
+            QueryRule(AllFirstPartyPkgAnalyses, [AllFirstPartyPkgAnalysesRequest]),
             QueryRule(FirstPartyPkgImportPath, [FirstPartyPkgImportPathRequest]),
         ],
         target_types=[GoModTarget, GoPackageTarget],
@@ -199,6 +203,49 @@ def test_package_info(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_analyze_all_packages_of_go_mod(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": "go_mod(name='mod')\ngo_package(name='pkg')",
+            "go.mod": "module go.example.com/foo\ngo 1.17\n",
+            "f.go": "package foo\n",
+            "a/BUILD": "go_package()",
+            "a/f.go": 'package a\nimport "go.example.com/foo/b"\n',
+            "b/BUILD": "go_package()",
+            "b/f.go": "package b\n",
+            "bad/BUILD": "go_package()",
+            "bad/f.go": "invalid!!!",
+            # A package of a nested `go_mod` should not be analyzed with the outer `go_mod`.
+            "nested/BUILD": "go_mod(name='mod')\ngo_package(name='pkg')",
+            "nested/go.mod": "module go.example.com/nested\ngo 1.17\n",
+            "nested/f.go": "package nested\n",
+        }
+    )
+    result = rule_runner.request(
+        AllFirstPartyPkgAnalyses,
+        [AllFirstPartyPkgAnalysesRequest(Address("", target_name="mod"))],
+    )
+    assert result.exit_code == 0
+    analyses = {dir_path: json.loads(analysis) for dir_path, analysis in result.analyses.items()}
+    assert set(analyses) == {".", "a", "b", "bad"}
+    assert analyses["."]["GoFiles"] == ["f.go"]
+    assert analyses["a"]["Imports"] == ["go.example.com/foo/b"]
+    assert "Imports" not in analyses["b"]
+    assert "Error" in analyses["bad"]
+
+    # The analysis is split into per-package results, where a failure is local to its package.
+    maybe_info = rule_runner.request(
+        FallibleFirstPartyPkgInfo, [FirstPartyPkgInfoRequest(Address("a"))]
+    )
+    assert maybe_info.info is not None
+    assert maybe_info.info.imports == ("go.example.com/foo/b",)
+    maybe_info = rule_runner.request(
+        FallibleFirstPartyPkgInfo, [FirstPartyPkgInfoRequest(Address("bad"))]
+    )
+    assert maybe_info.info is None
+    assert maybe_info.exit_code == 1
+
+
 def test_invalid_package(rule_runner) -> None:
     rule_runner.write_files(
         {
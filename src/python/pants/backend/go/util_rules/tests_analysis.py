@@ -77,7 +77,8 @@ async def setup_analyzer() -> AnalyzerSetup:
     )
     main_pkg_a_file_path = built_analyzer_pkg.import_paths_to_pkg_a_files["main"]
     input_digest = await Get(
-        Digest, MergeDigests([built_analyzer_pkg.digest, import_config.digest])
+        Digest,
+        MergeDigests([*built_analyzer_pkg.import_paths_to_digests.values(), import_config.digest]),
     )
 
     analyzer = await Get(
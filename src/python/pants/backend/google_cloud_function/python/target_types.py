@@ -34,6 +34,8 @@ from pants.util.docutil import doc_url
 
 
 class PythonGoogleCloudFunctionHandlerField(StringField, AsyncFieldMixin, SecondaryOwnerMixin):
+    __slots__ = ()
+
     alias = "handler"
     required = True
     value: str
@@ -119,6 +121,8 @@ async def resolve_python_google_cloud_function_handler(
 
 
 class PythonGoogleCloudFunctionDependencies(Dependencies):
+    __slots__ = ()
+
     supports_transitive_excludes = True
 
 
@@ -175,6 +179,8 @@ class PythonGoogleCloudFunctionRuntimes(Enum):
 
 
 class PythonGoogleCloudFunctionRuntime(StringField):
+    __slots__ = ()
+
     PYTHON_RUNTIME_REGEX = r"^python(?P<major>\d)(?P<minor>\d+)$"
 
     alias = "runtime"
@@ -208,6 +214,8 @@ class GoogleCloudFunctionTypes(Enum):
 
 class PythonGoogleCloudFunctionType(StringField):
 
+    __slots__ = ()
+
     alias = "type"
     required = True
     valid_choices = GoogleCloudFunctionTypes
@@ -30,10 +30,14 @@ from pants.jvm.target_types import (
 
 
 class JavaSourceField(SingleSourceField):
+    __slots__ = ()
+
     expected_file_extensions = (".java",)
 
 
 class JavaGeneratorSources(MultipleSourcesField):
+    __slots__ = ()
+
     expected_file_extensions = (".java",)
 
 
@@ -57,6 +61,7 @@ class JavaGeneratorFieldSet(FieldSet):
 
 
 class JavaTestSourceField(JavaSourceField):
+    __slots__ = ()
     pass
 
 
@@ -73,6 +78,8 @@ class JunitTestTarget(Target):
 
 
 class JavaTestsGeneratorSourcesField(JavaGeneratorSources):
+    __slots__ = ()
+
     default = ("*Test.java",)
 
 
@@ -126,6 +133,8 @@ class JavaSourceTarget(Target):
 
 
 class JavaSourcesGeneratorSourcesField(JavaGeneratorSources):
+    __slots__ = ()
+
     default = ("*.java",) + tuple(f"!{pat}" for pat in JavaTestsGeneratorSourcesField.default)
 
 
@@ -167,6 +176,8 @@ async def generate_targets_from_java_sources(
 
 
 class JvmMainClassName(StringField):
+    __slots__ = ()
+
     alias = "main"
     required = True
     help = (
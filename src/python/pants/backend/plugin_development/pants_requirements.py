@@ -19,6 +19,8 @@ from pants.version import MAJOR_MINOR, PANTS_SEMVER
 
 
 class PantsRequirementsTestutilField(BoolField):
+    __slots__ = ()
+
     alias = "testutil"
     default = True
     help = "If true, include `pantsbuild.pants.testutil` to write tests for your plugin."
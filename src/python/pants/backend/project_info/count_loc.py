@@ -1,19 +1,28 @@
 # Copyright 2019 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
-from typing import Tuple
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import json
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import DefaultDict, Iterable, List, Tuple
 
 from pants.core.util_rules.external_tool import (
     DownloadedExternalTool,
     ExternalToolRequest,
     TemplatedExternalTool,
 )
+from pants.engine.collection import Collection
 from pants.engine.console import Console
-from pants.engine.fs import Digest, MergeDigests, SpecsSnapshot
+from pants.engine.fs import Digest, DigestSubset, MergeDigests, PathGlobs, SpecsSnapshot
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.platform import Platform
 from pants.engine.process import Process, ProcessResult
-from pants.engine.rules import Get, collect_rules, goal_rule
+from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule, rule
 from pants.option.custom_types import shell_str
 from pants.util.logging import LogLevel
 from pants.util.strutil import pluralize
@@ -71,6 +80,152 @@ class CountLinesOfCode(Goal):
     subsystem_cls = CountLinesOfCodeSubsystem
 
 
+@dataclass(frozen=True)
+class LanguageLinesOfCode:
+    """The lines of code counted by `scc` for one language."""
+
+    language: str
+    files: int
+    lines: int
+    blanks: int
+    comments: int
+    code: int
+    complexity: int
+    bytes: int
+
+    @classmethod
+    def from_scc_json(cls, entry: dict) -> LanguageLinesOfCode:
+        return cls(
+            language=entry["Name"],
+            files=entry["Count"],
+            lines=entry["Lines"],
+            blanks=entry["Blank"],
+            comments=entry["Comment"],
+            code=entry["Code"],
+            complexity=entry["Complexity"],
+            bytes=entry["Bytes"],
+        )
+
+    def __add__(self, other: LanguageLinesOfCode) -> LanguageLinesOfCode:
+        assert self.language == other.language
+        return LanguageLinesOfCode(
+            language=self.language,
+            files=self.files + other.files,
+            lines=self.lines + other.lines,
+            blanks=self.blanks + other.blanks,
+            comments=self.comments + other.comments,
+            code=self.code + other.code,
+            complexity=self.complexity + other.complexity,
+            bytes=self.bytes + other.bytes,
+        )
+
+
+class LinesOfCode(Collection[LanguageLinesOfCode]):
+    pass
+
+
+@dataclass(frozen=True)
+class DirectoryLinesOfCodeRequest:
+    """The files of a single directory (excluding its subdirectories) to count lines of code for.
+
+    Each directory is counted by its own process, which is cached by the content of its files. So
+    re-counting a repository only re-runs `scc` for the directories with changed files.
+    """
+
+    directory: str
+    digest: Digest
+
+
+def aggregate_lines_of_code(counts: Iterable[LanguageLinesOfCode]) -> LinesOfCode:
+    """Sum the counts of each language, ordered (as `scc` orders them) by descending file count."""
+    by_language: dict[str, LanguageLinesOfCode] = {}
+    for count in counts:
+        existing = by_language.get(count.language)
+        by_language[count.language] = count if existing is None else existing + count
+    return LinesOfCode(
+        sorted(by_language.values(), key=lambda count: (-count.files, count.language))
+    )
+
+
+# The COCOMO model parameters, average wage and overhead which `scc` uses by default: see
+# https://github.com/boyter/scc#cocomo.
+_COCOMO_ORGANIC = (2.4, 1.05, 2.5, 0.38)
+_COCOMO_AVERAGE_WAGE = 56286
+_COCOMO_OVERHEAD = 2.4
+
+_SCC_RULE = "\u2500" * 79
+_SCC_ROW = "{:<20} {:>9} {:>9} {:>8} {:>9} {:>8} {:>10}"
+
+
+def format_lines_of_code(counts: LinesOfCode) -> str:
+    """Format counts as `scc` formats its default table, including its COCOMO estimates."""
+    total = LanguageLinesOfCode("Total", 0, 0, 0, 0, 0, 0, 0)
+    for count in counts:
+        total += dataclasses.replace(count, language="Total")
+    lines = [
+        _SCC_RULE,
+        _SCC_ROW.format("Language", "Files", "Lines", "Blanks", "Comments", "Code", "Complexity"),
+        _SCC_RULE,
+        *(_format_row(count) for count in counts),
+        _SCC_RULE,
+        _format_row(total),
+        _SCC_RULE,
+    ]
+
+    a, b, c, d = _COCOMO_ORGANIC
+    effort = a * (total.code / 1000) ** b
+    schedule = c * effort ** d
+    people = effort / schedule if schedule else 0.0
+    cost = effort * (_COCOMO_AVERAGE_WAGE // 12) * _COCOMO_OVERHEAD
+    lines.extend(
+        [
+            f"Estimated Cost to Develop (organic) ${int(cost):,}",
+            f"Estimated Schedule Effort (organic) {schedule:f} months",
+            f"Estimated People Required (organic) {people:f}",
+            _SCC_RULE,
+            f"Processed {total.bytes} bytes, {total.bytes / 1_000_000:.3f} megabytes (SI)",
+            _SCC_RULE,
+        ]
+    )
+    return "\n".join(lines) + "\n"
+
+
+def _format_row(count: LanguageLinesOfCode) -> str:
+    return _SCC_ROW.format(
+        count.language[:20],
+        count.files,
+        count.lines,
+        count.blanks,
+        count.comments,
+        count.code,
+        count.complexity,
+    )
+
+
+@rule(desc="Count lines of code", level=LogLevel.DEBUG)
+async def count_loc_in_directory(
+    request: DirectoryLinesOfCodeRequest, succinct_code_counter: SuccinctCodeCounter
+) -> LinesOfCode:
+    scc_program = await Get(
+        DownloadedExternalTool,
+        ExternalToolRequest,
+        succinct_code_counter.get_request(Platform.current),
+    )
+    input_digest = await Get(Digest, MergeDigests((scc_program.digest, request.digest)))
+    result = await Get(
+        ProcessResult,
+        Process(
+            argv=(scc_program.exe, "--format", "json", request.directory or "."),
+            input_digest=input_digest,
+            description=f"Count lines of code in {request.directory or 'the build root'}",
+            level=LogLevel.DEBUG,
+        ),
+    )
+    return LinesOfCode(
+        LanguageLinesOfCode.from_scc_json(entry) for entry in json.loads(result.stdout) or ()
+    )
+
+
 @goal_rule
 async def count_loc(
     console: Console,
@@ -80,6 +235,25 @@ async def count_loc(
     if not specs_snapshot.snapshot.files:
         return CountLinesOfCode(exit_code=0)
 
+    # Without passthrough args (which may change the format of the output of `scc`), each directory
+    # is counted separately, and the counts are aggregated here.
+    if not succinct_code_counter.args:
+        files_by_dir: DefaultDict[str, List[str]] = defaultdict(list)
+        for file in specs_snapshot.snapshot.files:
+            files_by_dir[os.path.dirname(file)].append(file)
+        dirs_and_files = list(files_by_dir.items())
+        dir_digests = await MultiGet(
+            Get(Digest, DigestSubset(specs_snapshot.snapshot.digest, PathGlobs(files)))
+            for _, files in dirs_and_files
+        )
+        dir_counts = await MultiGet(
+            Get(LinesOfCode, DirectoryLinesOfCodeRequest(directory, digest))
+            for (directory, _), digest in zip(dirs_and_files, dir_digests)
+        )
+        counts = aggregate_lines_of_code(itertools.chain.from_iterable(dir_counts))
+        console.print_stdout(format_lines_of_code(counts))
+        return CountLinesOfCode(exit_code=0)
+
     scc_program = await Get(
         DownloadedExternalTool,
         ExternalToolRequest,
@@ -4,7 +4,12 @@
 import pytest
 
 from pants.backend.project_info import count_loc
-from pants.backend.project_info.count_loc import CountLinesOfCode
+from pants.backend.project_info.count_loc import (
+    CountLinesOfCode,
+    LanguageLinesOfCode,
+    aggregate_lines_of_code,
+    format_lines_of_code,
+)
 from pants.backend.python.target_types import PythonSourcesGeneratorTarget
 from pants.core.util_rules import external_tool
 from pants.engine.target import MultipleSourcesField, Target
@@ -66,6 +71,56 @@ def test_count_loc(rule_runner: RuleRunner) -> None:
     assert_counts(result.stdout, "Elixir", comment=1, code=1)
 
 
+def test_count_loc_nested_directories(rule_runner: RuleRunner) -> None:
+    # Each directory is counted separately, and the counts of a language are summed across them.
+    rule_runner.write_files(
+        {
+            "src/py/a.py": "print('a')\n",
+            "src/py/sub/b.py": "# A comment.\nprint('b')\n",
+            "src/py/z.py": "\nprint('z')\n",
+            "src/py/BUILD": "python_sources()",
+            "src/py/sub/BUILD": "python_sources()",
+        }
+    )
+    result = rule_runner.run_goal_rule(CountLinesOfCode, args=["src/py::"])
+    assert result.exit_code == 0
+    assert_counts(result.stdout, "Python", num_files=3, blank=1, comment=1, code=3)
+    assert "Estimated Cost to Develop" in result.stdout
+
+
+def loc(language: str, files: int, code: int) -> LanguageLinesOfCode:
+    return LanguageLinesOfCode(
+        language=language,
+        files=files,
+        lines=code + 1,
+        blanks=1,
+        comments=0,
+        code=code,
+        complexity=0,
+        bytes=code * 10,
+    )
+
+
+def test_aggregate_lines_of_code() -> None:
+    counts = aggregate_lines_of_code(
+        [loc("Python", 1, 10), loc("Elixir", 2, 5), loc("Python", 2, 3), loc("BASH", 2, 1)]
+    )
+    assert list(counts) == [
+        LanguageLinesOfCode("Python", 3, 15, 2, 0, 13, 0, 130),
+        LanguageLinesOfCode("BASH", 2, 2, 1, 0, 1, 0, 10),
+        LanguageLinesOfCode("Elixir", 2, 6, 1, 0, 5, 0, 50),
+    ]
+
+
+def test_format_lines_of_code() -> None:
+    stdout = format_lines_of_code(aggregate_lines_of_code([loc("Python", 2, 3), loc("Go", 1, 1)]))
+    assert_counts(stdout, "Python", num_files=2, blank=1, code=3)
+    assert_counts(stdout, "Go", blank=1, code=1)
+    assert_counts(stdout, "Total", num_files=3, blank=2, code=4)
+    assert "Estimated Cost to Develop (organic) $" in stdout
+    assert "Processed 40 bytes, 0.000 megabytes (SI)" in stdout
+
+
 def test_passthrough_args(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {"foo.py": "print('hello world!')\n", "BUILD": "python_sources(name='foo')"}
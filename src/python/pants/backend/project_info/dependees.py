@@ -3,12 +3,12 @@
 
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Iterable, Set, cast
+from typing import Iterable, Iterator, List, Set, cast
 
 from pants.engine.addresses import Address, Addresses
 from pants.engine.collection import DeduplicatedCollection
 from pants.engine.console import Console
-from pants.engine.goal import Goal, GoalSubsystem, LineOriented
+from pants.engine.goal import Goal, GoalSubsystem, StreamingLineOriented
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule, rule
 from pants.engine.target import AllUnexpandedTargets, Dependencies, DependenciesRequest
 from pants.util.frozendict import FrozenDict
@@ -59,29 +59,45 @@ class Dependees(DeduplicatedCollection[Address]):
     sort_input = True
 
 
+def iter_dependees(
+    address_to_dependees: AddressToDependees, roots: Iterable[Address], *, transitive: bool
+) -> Iterator[List[Address]]:
+    """Yield the dependees of the roots (excluding the roots themselves), one level at a time.
+
+    Each level contains only the dependees which were not in a previous level, in the order in which
+    they were found.
+    """
+    seen = set(roots)
+    frontier: Iterable[Address] = roots
+    while frontier:
+        level = []
+        for address in frontier:
+            for dependee in address_to_dependees.mapping.get(address, ()):
+                if dependee not in seen:
+                    seen.add(dependee)
+                    level.append(dependee)
+        if level:
+            yield level
+        if not transitive:
+            return
+        frontier = level
+
+
 @rule(level=LogLevel.DEBUG)
 def find_dependees(
     request: DependeesRequest, address_to_dependees: AddressToDependees
 ) -> Dependees:
-    check = set(request.addresses)
-    known_dependents: Set[Address] = set()
-    while True:
-        dependents = set(known_dependents)
-        for target in check:
-            target_dependees = address_to_dependees.mapping.get(target, FrozenOrderedSet())
-            dependents.update(target_dependees)
-        check = dependents - known_dependents
-        if not check or not request.transitive:
-            result = (
-                dependents | set(request.addresses)
-                if request.include_roots
-                else dependents - set(request.addresses)
-            )
-            return Dependees(result)
-        known_dependents = dependents
-
-
-class DependeesSubsystem(LineOriented, GoalSubsystem):
+    dependees: Set[Address] = set()
+    for level in iter_dependees(
+        address_to_dependees, request.addresses, transitive=request.transitive
+    ):
+        dependees.update(level)
+    if request.include_roots:
+        dependees.update(request.addresses)
+    return Dependees(dependees)
+
+
+class DependeesSubsystem(StreamingLineOriented, GoalSubsystem):
     name = "dependees"
     help = "List all targets that depend on any of the input files/targets."
 
@@ -116,8 +132,26 @@ class DependeesGoal(Goal):
 
 @goal_rule
 async def dependees_goal(
-    specified_addresses: Addresses, dependees_subsystem: DependeesSubsystem, console: Console
+    specified_addresses: Addresses,
+    dependees_subsystem: DependeesSubsystem,
+    console: Console,
+    address_to_dependees: AddressToDependees,
 ) -> DependeesGoal:
+    if dependees_subsystem.stream:
+        with dependees_subsystem.line_printer(console) as printer:
+            if dependees_subsystem.closed and printer.print_lines(
+                address.spec for address in specified_addresses
+            ):
+                return DependeesGoal(exit_code=0)
+            for level in iter_dependees(
+                address_to_dependees,
+                specified_addresses,
+                transitive=dependees_subsystem.transitive,
+            ):
+                if printer.print_lines(address.spec for address in level):
+                    break
+        return DependeesGoal(exit_code=0)
+
     dependees = await Get(
         Dependees,
         DependeesRequest(
@@ -126,9 +160,8 @@ async def dependees_goal(
             include_roots=dependees_subsystem.closed,
         ),
     )
-    with dependees_subsystem.line_oriented(console) as print_stdout:
-        for address in dependees:
-            print_stdout(address.spec)
+    with dependees_subsystem.line_printer(console) as printer:
+        printer.print_lines(address.spec for address in dependees)
     return DependeesGoal(exit_code=0)
 
 
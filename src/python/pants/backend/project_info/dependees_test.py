@@ -5,10 +5,13 @@ from typing import List
 
 import pytest
 
-from pants.backend.project_info.dependees import DependeesGoal
+from pants.backend.project_info.dependees import AddressToDependees, DependeesGoal, iter_dependees
 from pants.backend.project_info.dependees import rules as dependee_rules
+from pants.engine.addresses import Address
 from pants.engine.target import Dependencies, SpecialCasedDependencies, Target
 from pants.testutil.rule_runner import RuleRunner
+from pants.util.frozendict import FrozenDict
+from pants.util.ordered_set import FrozenOrderedSet
 
 
 class SpecialDeps(SpecialCasedDependencies):
@@ -94,3 +97,38 @@ def test_special_cased_dependencies(rule_runner: RuleRunner) -> None:
         transitive=True,
         expected=["intermediate:intermediate", "leaf:leaf", "special:special"],
     )
+
+
+def test_stream(rule_runner: RuleRunner) -> None:
+    rule_runner.add_to_build_file("other_leaf", "tgt(dependencies=['intermediate'])")
+    # Each level of dependees is printed in the order in which it was resolved.
+    result = rule_runner.run_goal_rule(
+        DependeesGoal, args=["--stream", "--transitive", "--closed", "base"]
+    )
+    assert result.stdout.splitlines() == [
+        "base:base",
+        "intermediate:intermediate",
+        "leaf:leaf",
+        "other_leaf:other_leaf",
+    ]
+    result = rule_runner.run_goal_rule(
+        DependeesGoal, args=["--stream", "--transitive", "--limit=2", "base"]
+    )
+    assert result.stdout.splitlines() == ["intermediate:intermediate", "leaf:leaf"]
+
+
+def test_iter_dependees() -> None:
+    a, b, c, d = (Address("", target_name=name) for name in ("a", "b", "c", "d"))
+    address_to_dependees = AddressToDependees(
+        FrozenDict(
+            {
+                a: FrozenOrderedSet([b]),
+                b: FrozenOrderedSet([c, a]),
+                c: FrozenOrderedSet([d, b]),
+            }
+        )
+    )
+    assert list(iter_dependees(address_to_dependees, [a], transitive=False)) == [[b]]
+    # Neither the roots nor the dependees of previous levels are repeated.
+    assert list(iter_dependees(address_to_dependees, [a], transitive=True)) == [[b], [c], [d]]
+    assert list(iter_dependees(address_to_dependees, [d], transitive=True)) == []
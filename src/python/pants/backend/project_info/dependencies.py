@@ -2,15 +2,16 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
 import itertools
-from typing import cast
+from typing import Sequence, Set, cast
 
-from pants.engine.addresses import Addresses
+from pants.engine.addresses import Address, Addresses
 from pants.engine.console import Console
-from pants.engine.goal import Goal, GoalSubsystem, LineOriented
+from pants.engine.goal import Goal, GoalSubsystem, StreamingLineOriented
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule
 from pants.engine.target import Dependencies as DependenciesField
 from pants.engine.target import (
     DependenciesRequest,
+    Target,
     Targets,
     TransitiveTargets,
     TransitiveTargetsRequest,
@@ -18,7 +19,7 @@ from pants.engine.target import (
 )
 
 
-class DependenciesSubsystem(LineOriented, GoalSubsystem):
+class DependenciesSubsystem(StreamingLineOriented, GoalSubsystem):
     name = "dependencies"
     help = "List the dependencies of the input files/targets."
 
@@ -57,6 +58,43 @@ class Dependencies(Goal):
 async def dependencies(
     console: Console, addresses: Addresses, dependencies_subsystem: DependenciesSubsystem
 ) -> Dependencies:
+    if dependencies_subsystem.stream:
+        with dependencies_subsystem.line_printer(console) as printer:
+            # NB: Only the addresses and the current frontier of the graph walk are retained, and
+            # each level of the walk is printed as soon as it has been resolved. Unlike
+            # `TransitiveTargets`, transitive excludes (`!!`) are not applied, because they may be
+            # declared by targets which have not yet been walked.
+            seen: Set[Address] = set()
+            if dependencies_subsystem.closed:
+                seen.update(addresses)
+                if printer.print_lines(addr.spec for addr in addresses):
+                    return Dependencies(exit_code=0)
+            # NB: We must preserve target generators for the roots, i.e. not replace with their
+            # generated targets.
+            frontier: Sequence[Target] = await Get(UnexpandedTargets, Addresses, addresses)
+            while frontier:
+                dependencies_per_target = await MultiGet(
+                    Get(
+                        Targets,
+                        DependenciesRequest(
+                            tgt.get(DependenciesField), include_special_cased_deps=True
+                        ),
+                    )
+                    for tgt in frontier
+                )
+                new_dependencies = []
+                for tgt in itertools.chain.from_iterable(dependencies_per_target):
+                    if tgt.address not in seen:
+                        seen.add(tgt.address)
+                        new_dependencies.append(tgt)
+                if (
+                    printer.print_lines(tgt.address.spec for tgt in new_dependencies)
+                    or not dependencies_subsystem.transitive
+                ):
+                    break
+                frontier = new_dependencies
+        return Dependencies(exit_code=0)
+
     if dependencies_subsystem.transitive:
         transitive_targets = await Get(
             TransitiveTargets, TransitiveTargetsRequest(addresses, include_special_cased_deps=True)
@@ -81,9 +119,8 @@ async def dependencies(
     for tgt in targets:
         address_strings.add(tgt.address.spec)
 
-    with dependencies_subsystem.line_oriented(console) as print_stdout:
-        for address in sorted(address_strings):
-            print_stdout(address)
+    with dependencies_subsystem.line_printer(console) as printer:
+        printer.print_lines(sorted(address_strings))
 
     return Dependencies(exit_code=0)
 
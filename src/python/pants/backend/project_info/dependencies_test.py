@@ -180,3 +180,24 @@ def test_python_dependencies(rule_runner: RuleRunner) -> None:
         ],
         closed=True,
     )
+
+
+def test_stream(rule_runner: RuleRunner) -> None:
+    create_python_requirement_tgt(rule_runner, name="req1")
+    create_python_sources(rule_runner, path="dep/target", dependencies=["3rdparty/python:req1"])
+    create_python_sources(rule_runner, path="some/target", dependencies=["dep/target"])
+    create_python_sources(rule_runner, path="other/target", dependencies=["some/target"])
+
+    def assert_streamed(args: List[str], expected: List[str]) -> None:
+        result = rule_runner.run_goal_rule(Dependencies, args=["--stream", *args])
+        assert result.stdout.splitlines() == expected
+
+    # Each level of the transitive dependencies is printed in the order in which it was resolved.
+    assert_streamed(
+        ["--transitive", "--closed", "other/target"],
+        ["other/target:target", "some/target:target", "dep/target:target", "3rdparty/python:req1"],
+    )
+    assert_streamed(["other/target"], ["some/target:target"])
+    assert_streamed(
+        ["--transitive", "--limit=2", "other/target"], ["some/target:target", "dep/target:target"]
+    )
@@ -3,25 +3,28 @@
 
 import itertools
 from pathlib import PurePath
-from typing import Iterable, cast
+from typing import Iterable, Sequence, Set, cast
 
 from pants.base.build_root import BuildRoot
 from pants.engine.addresses import Address, Addresses, BuildFileAddress
 from pants.engine.console import Console
-from pants.engine.goal import Goal, GoalSubsystem, LineOriented
+from pants.engine.goal import Goal, GoalSubsystem, StreamingLineOriented
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule
 from pants.engine.target import (
+    Dependencies,
+    DependenciesRequest,
     HydratedSources,
     HydrateSourcesRequest,
     SourcesField,
     Target,
+    Targets,
     TransitiveTargets,
     TransitiveTargetsRequest,
     UnexpandedTargets,
 )
 
 
-class FiledepsSubsystem(LineOriented, GoalSubsystem):
+class FiledepsSubsystem(StreamingLineOriented, GoalSubsystem):
     name = "filedeps"
     help = "List all source and BUILD files a target depends on."
 
@@ -80,6 +83,70 @@ async def file_deps(
     build_root: BuildRoot,
     addresses: Addresses,
 ) -> Filedeps:
+    def format_path(rel_path: str) -> str:
+        return (
+            PurePath(build_root.path, rel_path).as_posix()
+            if filedeps_subsystem.absolute
+            else rel_path
+        )
+
+    if filedeps_subsystem.stream:
+        with filedeps_subsystem.line_printer(console) as printer:
+            # NB: Only the addresses and paths which have been printed and the current frontier of
+            # the graph walk are retained, and the files of each level of the walk are printed as
+            # soon as they have been resolved. Unlike `TransitiveTargets`, transitive excludes
+            # (`!!`) are not applied, because they may be declared by targets which have not yet
+            # been walked.
+            # NB: We must preserve target generators for the roots, i.e. not replace with their
+            # generated targets.
+            frontier: Sequence[Target] = await Get(UnexpandedTargets, Addresses, addresses)
+            visited: Set[Address] = {tgt.address for tgt in frontier}
+            seen_paths: Set[str] = set()
+            while frontier:
+                build_file_addresses = await MultiGet(
+                    Get(BuildFileAddress, Address, tgt.address) for tgt in frontier
+                )
+                paths_per_target: Iterable[Iterable[str]]
+                if filedeps_subsystem.globs:
+                    paths_per_target = (
+                        tgt.get(SourcesField).filespec["includes"] for tgt in frontier
+                    )
+                else:
+                    hydrated_sources_per_target = await MultiGet(
+                        Get(HydratedSources, HydrateSourcesRequest(tgt.get(SourcesField)))
+                        for tgt in frontier
+                    )
+                    paths_per_target = (
+                        hydrated_sources.snapshot.files
+                        for hydrated_sources in hydrated_sources_per_target
+                    )
+                new_paths = []
+                for bfa, paths in zip(build_file_addresses, paths_per_target):
+                    for rel_path in (bfa.rel_path, *paths):
+                        if rel_path not in seen_paths:
+                            seen_paths.add(rel_path)
+                            new_paths.append(rel_path)
+                if (
+                    printer.print_lines(format_path(rel_path) for rel_path in new_paths)
+                    or not filedeps_subsystem.transitive
+                ):
+                    break
+
+                dependencies_per_target = await MultiGet(
+                    Get(
+                        Targets,
+                        DependenciesRequest(tgt.get(Dependencies), include_special_cased_deps=True),
+                    )
+                    for tgt in frontier
+                )
+                new_dependencies = []
+                for tgt in itertools.chain.from_iterable(dependencies_per_target):
+                    if tgt.address not in visited:
+                        visited.add(tgt.address)
+                        new_dependencies.append(tgt)
+                frontier = new_dependencies
+        return Filedeps(exit_code=0)
+
     targets: Iterable[Target]
     if filedeps_subsystem.transitive:
         transitive_targets = await Get(
@@ -111,14 +178,8 @@ async def file_deps(
             )
         )
 
-    with filedeps_subsystem.line_oriented(console) as print_stdout:
-        for rel_path in sorted(unique_rel_paths):
-            final_path = (
-                PurePath(build_root.path, rel_path).as_posix()
-                if filedeps_subsystem.absolute
-                else rel_path
-            )
-            print_stdout(final_path)
+    with filedeps_subsystem.line_printer(console) as printer:
+        printer.print_lines(format_path(rel_path) for rel_path in sorted(unique_rel_paths))
 
     return Filedeps(exit_code=0)
 
@@ -171,6 +171,31 @@ def test_multiple_targets_one_source_overlapping(rule_runner: RuleRunner) -> Non
     )
 
 
+def test_stream(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "dep/f.ext": "",
+            "dep/BUILD": "tgt()",
+            "a/f2.ext": "",
+            "a/f1.ext": "",
+            "a/BUILD": "tgt(dependencies=['dep'])",
+        }
+    )
+
+    def assert_streamed(args: list[str], expected: list[str]) -> None:
+        result = rule_runner.run_goal_rule(filedeps.Filedeps, args=("--filedeps-stream", *args))
+        assert result.stdout.splitlines() == expected
+
+    # The files of each target are printed after its BUILD file, and the files of dependencies
+    # are printed after those of their dependees.
+    assert_streamed(
+        ["--filedeps-transitive", "a"],
+        ["a/BUILD", "a/f1.ext", "a/f2.ext", "dep/BUILD", "dep/f.ext"],
+    )
+    assert_streamed(["a"], ["a/BUILD", "a/f1.ext", "a/f2.ext"])
+    assert_streamed(["--filedeps-transitive", "--filedeps-limit=2", "a"], ["a/BUILD", "a/f1.ext"])
+
+
 def test_globs(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
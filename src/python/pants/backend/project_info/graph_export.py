@@ -0,0 +1,221 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""Export the resolved dependency graph of all targets, for consumption by external tools.
+
+The export is newline-delimited JSON. The first line is a header, and each following line is the
+record of a single target, in which addresses are referred to by integer ids:
+
+    {"version": 1, "incremental": false}
+    {"id": 0, "address": "src/py:lib", "type": "python_sources", "sources": [...], ...}
+
+The `explicit` dependencies of a target are those declared in its `dependencies` field, and its
+`implicit` dependencies are those which were inferred, injected, or generated.
+
+Given a previous complete export with `--previous`, ids are preserved across exports, and only the
+records of targets which were added or changed are written, followed by a final line with the ids of
+the targets which were removed: `{"removed": [...]}`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable, Iterator, Mapping, cast
+
+from pants.engine.addresses import Address, Addresses
+from pants.engine.console import Console
+from pants.engine.goal import Goal, GoalSubsystem, Outputting
+from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule
+from pants.engine.target import (
+    AllTargetsRequest,
+    AllUnexpandedTargets,
+    Dependencies,
+    DependenciesRequest,
+    ExplicitlyProvidedDependencies,
+    SourcesField,
+    SourcesPaths,
+    SourcesPathsRequest,
+    Target,
+)
+
+EXPORT_VERSION = 1
+
+
+class GraphExportSubsystem(Outputting, GoalSubsystem):
+    name = "graph-export"
+    help = "Export the dependency graph of all targets as newline-delimited JSON."
+
+    @classmethod
+    def register_options(cls, register):
+        super().register_options(register)
+        register(
+            "--previous",
+            type=str,
+            default=None,
+            metavar="<path>",
+            help=(
+                "The path of a previous complete export. If set, the ids of addresses are preserved "
+                "from it, and only the targets which were added, changed or removed since it are "
+                "exported."
+            ),
+        )
+
+    @property
+    def previous(self) -> str | None:
+        return cast("str | None", self.options.previous)
+
+
+class GraphExport(Goal):
+    subsystem_cls = GraphExportSubsystem
+
+
+class AddressIds:
+    """Interns addresses as integer ids, in the order in which they are first seen."""
+
+    def __init__(self, previous: Mapping[str, int] | None = None) -> None:
+        self._ids: dict[str, int] = dict(previous or {})
+        self._next_id = max(self._ids.values(), default=-1) + 1
+
+    def __call__(self, address: Address) -> int:
+        spec = address.spec
+        address_id = self._ids.get(spec)
+        if address_id is None:
+            address_id = self._next_id
+            self._ids[spec] = address_id
+            self._next_id += 1
+        return address_id
+
+
+class PreviousExport:
+    """The records of a previous complete export, by address."""
+
+    def __init__(self, records: Iterable[dict[str, Any]]) -> None:
+        self.records = {record["address"]: record for record in records}
+
+    @property
+    def ids(self) -> dict[str, int]:
+        return {address: record["id"] for address, record in self.records.items()}
+
+    @classmethod
+    def parse(cls, lines: Iterable[str]) -> PreviousExport:
+        lines_iter = iter(lines)
+        header = json.loads(next(lines_iter, "{}"))
+        if header.get("version") != EXPORT_VERSION:
+            raise ValueError(
+                f"The previous export has version {header.get('version')}, but only version "
+                f"{EXPORT_VERSION} is supported. Please re-export the graph without `--previous`."
+            )
+        if header.get("incremental"):
+            raise ValueError(
+                "The previous export is incremental: it must be a complete export, i.e. one "
+                "which was exported without `--previous`."
+            )
+        return cls(json.loads(line) for line in lines_iter if line.strip())
+
+    @classmethod
+    def read(cls, path: str) -> PreviousExport:
+        with open(path) as f:
+            return cls.parse(f)
+
+
+def export_records(
+    targets: Iterable[Target],
+    sources_paths: Iterable[SourcesPaths],
+    dependencies: Iterable[Addresses],
+    explicitly_provided: Iterable[ExplicitlyProvidedDependencies],
+    address_ids: AddressIds,
+) -> list[dict[str, Any]]:
+    """Create the records of targets, which are ordered by address."""
+    targets_data = sorted(
+        zip(targets, sources_paths, dependencies, explicitly_provided),
+        key=lambda target_data: target_data[0].address,
+    )
+    # NB: Ids are assigned to all of the targets before any of their dependencies, so that the ids
+    # of a fresh export are in address order.
+    for tgt, *_ in targets_data:
+        address_ids(tgt.address)
+    records = []
+    for tgt, tgt_sources_paths, tgt_dependencies, tgt_explicitly_provided in targets_data:
+        explicit = [
+            address_ids(address)
+            for address in tgt_dependencies
+            if address in tgt_explicitly_provided.includes
+        ]
+        implicit = [
+            address_ids(address)
+            for address in tgt_dependencies
+            if address not in tgt_explicitly_provided.includes
+        ]
+        records.append(
+            {
+                "id": address_ids(tgt.address),
+                "address": tgt.address.spec,
+                "type": tgt.alias,
+                "sources": list(tgt_sources_paths.files),
+                "explicit": sorted(explicit),
+                "implicit": sorted(implicit),
+            }
+        )
+    return records
+
+
+def export_lines(
+    records: list[dict[str, Any]], previous: PreviousExport | None = None
+) -> Iterator[str]:
+    """Format records as lines of an export, relative to the previous export if given."""
+    yield json.dumps({"version": EXPORT_VERSION, "incremental": previous is not None})
+    if previous is None:
+        yield from (json.dumps(record) for record in records)
+        return
+    yield from (
+        json.dumps(record)
+        for record in records
+        if previous.records.get(record["address"]) != record
+    )
+    current_addresses = {record["address"] for record in records}
+    removed = sorted(
+        record["id"]
+        for address, record in previous.records.items()
+        if address not in current_addresses
+    )
+    yield json.dumps({"removed": removed})
+
+
+@goal_rule
+async def graph_export(
+    console: Console, graph_export_subsystem: GraphExportSubsystem
+) -> GraphExport:
+    previous = (
+        PreviousExport.read(graph_export_subsystem.previous)
+        if graph_export_subsystem.previous
+        else None
+    )
+
+    all_targets = await Get(AllUnexpandedTargets, AllTargetsRequest())
+    all_sources_paths = await MultiGet(
+        Get(SourcesPaths, SourcesPathsRequest(tgt.get(SourcesField))) for tgt in all_targets
+    )
+    all_dependencies = await MultiGet(
+        Get(Addresses, DependenciesRequest(tgt.get(Dependencies), include_special_cased_deps=True))
+        for tgt in all_targets
+    )
+    all_explicitly_provided = await MultiGet(
+        Get(ExplicitlyProvidedDependencies, DependenciesRequest(tgt.get(Dependencies)))
+        for tgt in all_targets
+    )
+
+    records = export_records(
+        all_targets,
+        all_sources_paths,
+        all_dependencies,
+        all_explicitly_provided,
+        AddressIds(previous.ids if previous else None),
+    )
+    with graph_export_subsystem.output(console) as write_stdout:
+        for line in export_lines(records, previous):
+            write_stdout(f"{line}\n")
+    return GraphExport(exit_code=0)
+
+
+def rules():
+    return collect_rules()
@@ -0,0 +1,127 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from pants.backend.project_info import graph_export
+from pants.backend.project_info.graph_export import (
+    AddressIds,
+    GraphExport,
+    PreviousExport,
+    export_lines,
+)
+from pants.engine.addresses import Address
+from pants.engine.target import Dependencies, MultipleSourcesField, Target
+from pants.testutil.rule_runner import RuleRunner
+
+
+class MockSources(MultipleSourcesField):
+    default = ("*.ext",)
+
+
+class MockTarget(Target):
+    alias = "tgt"
+    core_fields = (MockSources, Dependencies)
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    return RuleRunner(rules=graph_export.rules(), target_types=[MockTarget])
+
+
+def run_export(rule_runner: RuleRunner, *args: str) -> list[dict]:
+    result = rule_runner.run_goal_rule(GraphExport, args=args)
+    assert result.exit_code == 0
+    return [json.loads(line) for line in result.stdout.splitlines()]
+
+
+def test_export(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "a/f.ext": "",
+            "a/BUILD": "tgt(dependencies=['b'])",
+            "b/BUILD": "tgt(sources=[])",
+        }
+    )
+    header, *records = run_export(rule_runner)
+    assert header == {"version": 1, "incremental": False}
+    assert records == [
+        {
+            "id": 0,
+            "address": "a:a",
+            "type": "tgt",
+            "sources": ["a/f.ext"],
+            "explicit": [1],
+            "implicit": [],
+        },
+        {"id": 1, "address": "b:b", "type": "tgt", "sources": [], "explicit": [], "implicit": []},
+    ]
+
+
+def test_export_incremental(rule_runner: RuleRunner, tmp_path: Path) -> None:
+    rule_runner.write_files(
+        {
+            "b/BUILD": "tgt(sources=[])",
+            "c/BUILD": "tgt(sources=[])",
+            "d/BUILD": "tgt(sources=[])",
+        }
+    )
+    previous = tmp_path / "previous.ndjson"
+    previous.write_text("\n".join(json.dumps(line) for line in run_export(rule_runner)) + "\n")
+
+    rule_runner.write_files(
+        {
+            "a/BUILD": "tgt(sources=[], dependencies=['d'])",
+            "c/BUILD": "tgt(sources=[], dependencies=['d'])",
+        }
+    )
+    Path(rule_runner.build_root, "b/BUILD").unlink()
+    header, *records = run_export(rule_runner, f"--graph-export-previous={previous}")
+    assert header == {"version": 1, "incremental": True}
+    # The ids of the previous export are preserved, and new addresses are assigned new ids.
+    assert records == [
+        {"id": 3, "address": "a:a", "type": "tgt", "sources": [], "explicit": [2], "implicit": []},
+        {"id": 1, "address": "c:c", "type": "tgt", "sources": [], "explicit": [2], "implicit": []},
+        {"removed": [0]},
+    ]
+
+
+def test_address_ids() -> None:
+    address_ids = AddressIds({"a:a": 0, "c:c": 3})
+    assert address_ids(Address("a")) == 0
+    assert address_ids(Address("b")) == 4
+    assert address_ids(Address("c")) == 3
+    assert address_ids(Address("b")) == 4
+    assert AddressIds()(Address("b")) == 0
+
+
+def test_export_lines() -> None:
+    record_a = {"id": 0, "address": "a:a", "type": "tgt", "explicit": [], "implicit": [1]}
+    record_b = {"id": 1, "address": "b:b", "type": "tgt", "explicit": [], "implicit": []}
+    record_c = {"id": 2, "address": "c:c", "type": "tgt", "explicit": [], "implicit": []}
+    lines = list(export_lines([record_a, record_b]))
+    assert [json.loads(line) for line in lines] == [
+        {"version": 1, "incremental": False},
+        record_a,
+        record_b,
+    ]
+
+    previous = PreviousExport.parse(lines)
+    assert previous.ids == {"a:a": 0, "b:b": 1}
+    changed_a = {**record_a, "implicit": [2]}
+    assert [json.loads(line) for line in export_lines([changed_a, record_c], previous)] == [
+        {"version": 1, "incremental": True},
+        changed_a,
+        record_c,
+        {"removed": [1]},
+    ]
+
+    with pytest.raises(ValueError, match="must be a complete export"):
+        PreviousExport.parse(export_lines([record_a], previous))
+    with pytest.raises(ValueError, match="only version 1 is supported"):
+        PreviousExport.parse(['{"version": 0}'])
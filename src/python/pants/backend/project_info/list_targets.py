@@ -6,14 +6,14 @@ from typing import Dict, cast
 
 from pants.engine.addresses import Address, Addresses
 from pants.engine.console import Console
-from pants.engine.goal import Goal, GoalSubsystem, LineOriented
+from pants.engine.goal import Goal, GoalSubsystem, StreamingLineOriented
 from pants.engine.rules import Get, collect_rules, goal_rule
 from pants.engine.target import DescriptionField, UnexpandedTargets
 
 logger = logging.getLogger(__name__)
 
 
-class ListSubsystem(LineOriented, GoalSubsystem):
+class ListSubsystem(StreamingLineOriented, GoalSubsystem):
     name = "list"
     help = "Lists all targets matching the file or target arguments."
 
@@ -55,15 +55,17 @@ async def list_targets(
                 if tgt.get(DescriptionField).value is not None
             },
         )
-        with list_subsystem.line_oriented(console) as print_stdout:
-            for address, description in addresses_with_descriptions.items():
-                formatted_description = "\n  ".join(description.strip().split("\n"))
-                print_stdout(f"{address.spec}\n  {formatted_description}")
+        with list_subsystem.line_printer(console) as printer:
+            printer.print_lines(
+                "{}\n  {}".format(address.spec, "\n  ".join(description.strip().split("\n")))
+                for address, description in addresses_with_descriptions.items()
+            )
         return List(exit_code=0)
 
-    with list_subsystem.line_oriented(console) as print_stdout:
-        for address in sorted(addresses):
-            print_stdout(address.spec)
+    with list_subsystem.line_printer(console) as printer:
+        printer.print_lines(
+            address.spec for address in (addresses if list_subsystem.stream else sorted(addresses))
+        )
     return List(exit_code=0)
 
 
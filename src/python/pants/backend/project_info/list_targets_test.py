@@ -18,7 +18,13 @@ class MockTarget(Target):
     core_fields = (DescriptionField,)
 
 
-def run_goal(targets: list[MockTarget], *, show_documented: bool = False) -> tuple[str, str]:
+def run_goal(
+    targets: list[MockTarget],
+    *,
+    show_documented: bool = False,
+    stream: bool = False,
+    limit: int | None = None,
+) -> tuple[str, str]:
     with mock_console(create_options_bootstrapper()) as (console, stdio_reader):
         run_rule_with_mocks(
             list_targets,
@@ -29,6 +35,8 @@ def run_goal(targets: list[MockTarget], *, show_documented: bool = False) -> tup
                     sep="\\n",
                     output_file=None,
                     documented=show_documented,
+                    stream=stream,
+                    limit=limit,
                 ),
                 console,
             ],
@@ -62,6 +70,23 @@ def test_list_normal() -> None:
     )
 
 
+def test_list_stream_and_limit() -> None:
+    addresses = (
+        Address("", target_name="t2"),
+        Address("", target_name="t1"),
+        Address("", target_name="t3"),
+    )
+    targets = [MockTarget({}, addr) for addr in addresses]
+    # When streaming, addresses are printed in the order they were resolved in.
+    stdout, _ = run_goal(targets, stream=True)
+    assert stdout.splitlines() == ["//:t2", "//:t1", "//:t3"]
+    stdout, _ = run_goal(targets, stream=True, limit=2)
+    assert stdout.splitlines() == ["//:t2", "//:t1"]
+    # Otherwise, the limit is applied to the sorted addresses.
+    stdout, _ = run_goal(targets, limit=2)
+    assert stdout.splitlines() == ["//:t1", "//:t2"]
+
+
 def test_no_targets_warns() -> None:
     _, stderr = run_goal([])
     assert re.search("WARN.* No targets", stderr)
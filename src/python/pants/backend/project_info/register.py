@@ -9,6 +9,7 @@ from pants.backend.project_info import (
     dependencies,
     filedeps,
     filter_targets,
+    graph_export,
     list_roots,
     list_targets,
     peek,
@@ -23,6 +24,7 @@ def rules():
         *dependencies.rules(),
         *filedeps.rules(),
         *filter_targets.rules(),
+        *graph_export.rules(),
         *list_roots.rules(),
         *list_targets.rules(),
         *peek.rules(),
@@ -7,7 +7,7 @@ import re
 import textwrap
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, cast
+from typing import Any, Iterable, cast
 
 from pants.base.exiter import PANTS_FAILED_EXIT_CODE, PANTS_SUCCEEDED_EXIT_CODE
 from pants.engine.collection import Collection
@@ -184,6 +184,28 @@ class ContentMatcher(Matcher):
         super().__init__(content_pattern.pattern, content_pattern.inverted)
 
 
+class ContentMatchers:
+    """The content matchers which apply to a file, which check the file's content in one pass."""
+
+    def __init__(self, content_matchers: Iterable[tuple[str, ContentMatcher]], encoding: str):
+        self._content_matchers = tuple(content_matchers)
+        self._encoding = encoding
+
+    def check(self, content: bytes) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Returns a pair (matching, nonmatching), in which each element is a tuple of pattern
+        names."""
+        # NB: The content is decoded once, rather than once per pattern.
+        text = content.decode(self._encoding)
+        matching = []
+        nonmatching = []
+        for name, content_matcher in self._content_matchers:
+            if content_matcher.matches(text):
+                matching.append(name)
+            else:
+                nonmatching.append(name)
+        return tuple(matching), tuple(nonmatching)
+
+
 class MultiMatcher:
     def __init__(self, config: ValidationConfig):
         """Class to check multiple regex matching on files.
@@ -226,9 +248,27 @@ class MultiMatcher:
 
     def check_source_file(self, path, content):
         content_pattern_names, encoding = self.get_applicable_content_pattern_names(path)
-        matching, nonmatching = self.check_content(content_pattern_names, content, encoding)
+        if not content_pattern_names or not encoding:
+            return RegexMatchResult(path, (), ())
+        # Content patterns are checked in the order in which they were configured.
+        ordered_content_pattern_names = tuple(
+            name for name in self._content_matchers if name in content_pattern_names
+        )
+        matching, nonmatching = self.get_content_matchers(
+            ordered_content_pattern_names, encoding
+        ).check(content)
         return RegexMatchResult(path, matching, nonmatching)
 
+    @memoized_method
+    def get_content_matchers(
+        self, content_pattern_names: tuple[str, ...], encoding: str
+    ) -> ContentMatchers:
+        """The matchers for the named content patterns, which are shared by all files to which the
+        same patterns apply."""
+        return ContentMatchers(
+            ((name, self._content_matchers[name]) for name in content_pattern_names), encoding
+        )
+
     def check_content(self, content_pattern_names, content, encoding):
         """Check which of the named patterns matches the given content.
 
@@ -240,15 +280,7 @@ class MultiMatcher:
         """
         if not content_pattern_names or not encoding:
             return (), ()
-
-        matching = []
-        nonmatching = []
-        for content_pattern_name in content_pattern_names:
-            if self._content_matchers[content_pattern_name].matches(content.decode(encoding)):
-                matching.append(content_pattern_name)
-            else:
-                nonmatching.append(content_pattern_name)
-        return tuple(matching), tuple(nonmatching)
+        return self.get_content_matchers(tuple(content_pattern_names), encoding).check(content)
 
     def get_applicable_content_pattern_names(self, path):
         """Return the content patterns applicable to a given path.
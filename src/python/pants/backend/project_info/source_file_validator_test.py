@@ -124,6 +124,20 @@ class TestMultiMatcherTest:
             "foo/bar/baz.py", ("python_header",), ("no_six",)
         ) == matcher.check_source_file("foo/bar/baz.py", py_file_content)
 
+    def test_check_source_file_pattern_order(self, matcher: MultiMatcher) -> None:
+        content = b"import six\n"
+        # Content patterns are reported in the order in which they were configured.
+        assert RegexMatchResult(
+            "foo/bar/baz.py", (), ("python_header", "no_six")
+        ) == matcher.check_source_file("foo/bar/baz.py", content)
+        assert RegexMatchResult("foo/bar/baz.c", (), ()) == matcher.check_source_file(
+            "foo/bar/baz.c", content
+        )
+        # Files to which the same patterns apply share their matchers.
+        assert matcher.get_content_matchers(
+            ("jvm_header",), "utf8"
+        ) is matcher.get_content_matchers(("jvm_header",), "utf8")
+
     def test_multiple_encodings_error(self, matcher: MultiMatcher) -> None:
         with pytest.raises(
             ValueError,
@@ -28,6 +28,8 @@ logger = logging.getLogger(__name__)
 
 
 class PyPiRepositories(StringSequenceField):
+    __slots__ = ()
+
     alias = "pypi_repositories"
     help = "List of PyPi repositories to publish the target package to."
 
@@ -36,6 +38,8 @@ class PyPiRepositories(StringSequenceField):
 
 
 class SkipTwineUploadField(BoolField):
+    __slots__ = ()
+
     alias = "skip_twine"
     default = False
     help = "If true, don't publish this target's packages using Twine."
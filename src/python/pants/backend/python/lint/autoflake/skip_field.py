@@ -12,6 +12,8 @@ from pants.engine.target import BoolField
 
 
 class SkipAutoflakeField(BoolField):
+    __slots__ = ()
+
     alias = "skip_autoflake"
     default = False
     help = "If true, don't run Autoflake on this target's code."
@@ -12,6 +12,8 @@ from pants.engine.target import BoolField
 
 
 class SkipBanditField(BoolField):
+    __slots__ = ()
+
     alias = "skip_bandit"
     default = False
     help = "If true, don't run Bandit on this target's code."
@@ -0,0 +1,10 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from pants.build_graph.backend_manifest import BackendManifest
+
+MANIFEST = BackendManifest(
+    goals=("fmt", "lint", "generate-lockfiles"),
+    options_scopes=("black",),
+    target_field_modules=("pants.backend.python.lint.black.skip_field",),
+)
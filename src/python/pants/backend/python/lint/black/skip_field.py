@@ -12,6 +12,8 @@ from pants.engine.target import BoolField
 
 
 class SkipBlackField(BoolField):
+    __slots__ = ()
+
     alias = "skip_black"
     default = False
     help = "If true, don't run Black on this target's code."
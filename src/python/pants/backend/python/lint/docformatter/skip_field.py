@@ -12,6 +12,8 @@ from pants.engine.target import BoolField
 
 
 class SkipDocformatterField(BoolField):
+    __slots__ = ()
+
     alias = "skip_docformatter"
     default = False
     help = "If true, don't run Docformatter on this target's code."
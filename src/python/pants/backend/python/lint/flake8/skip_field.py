@@ -12,6 +12,8 @@ from pants.engine.target import BoolField
 
 
 class SkipFlake8Field(BoolField):
+    __slots__ = ()
+
     alias = "skip_flake8"
     default = False
     help = "If true, don't run Flake8 on this target's code."
@@ -12,6 +12,8 @@ from pants.engine.target import BoolField
 
 
 class SkipIsortField(BoolField):
+    __slots__ = ()
+
     alias = "skip_isort"
     default = False
     help = "If true, don't run isort on this target's code."
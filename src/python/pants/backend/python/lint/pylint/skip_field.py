@@ -12,6 +12,8 @@ from pants.engine.target import BoolField
 
 
 class SkipPylintField(BoolField):
+    __slots__ = ()
+
     alias = "skip_pylint"
     default = False
     help = "If true, don't run Pylint on this target's code."
@@ -12,6 +12,8 @@ from pants.engine.target import BoolField
 
 
 class SkipPyUpgradeField(BoolField):
+    __slots__ = ()
+
     alias = "skip_pyupgrade"
     default = False
     help = "If true, don't run pyupgrade on this target's code."
@@ -12,6 +12,8 @@ from pants.engine.target import BoolField
 
 
 class SkipYapfField(BoolField):
+    __slots__ = ()
+
     alias = "skip_yapf"
     default = False
     help = "If true, don't run yapf on this target's code."
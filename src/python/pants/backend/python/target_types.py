@@ -73,15 +73,21 @@ if TYPE_CHECKING:
 
 
 class PythonSourceField(SingleSourceField):
+    __slots__ = ()
+
     # Note that Python scripts often have no file ending.
     expected_file_extensions: ClassVar[tuple[str, ...]] = ("", ".py", ".pyi")
 
 
 class PythonGeneratingSourcesBase(MultipleSourcesField):
+    __slots__ = ()
+
     expected_file_extensions: ClassVar[tuple[str, ...]] = ("", ".py", ".pyi")
 
 
 class InterpreterConstraintsField(StringSequenceField):
+    __slots__ = ()
+
     alias = "interpreter_constraints"
     help = (
         "The Python interpreters this code is compatible with.\n\nEach element should be written "
@@ -124,6 +130,8 @@ class UnrecognizedResolveNamesError(Exception):
 
 
 class PythonResolveField(StringField, AsyncFieldMixin):
+    __slots__ = ()
+
     alias = "experimental_resolve"
     # TODO(#12314): Figure out how to model the default and disabling lockfile, e.g. if we
     #  hardcode to `default` or let the user set it.
@@ -205,6 +213,8 @@ class PexBinaryDefaults(Subsystem):
 
 # See `target_types_rules.py` for a dependency injection rule.
 class PexBinaryDependencies(Dependencies):
+    __slots__ = ()
+
     supports_transitive_excludes = True
 
 
@@ -285,6 +295,8 @@ class ConsoleScript(MainSpecification):
 
 
 class PexEntryPointField(AsyncFieldMixin, SecondaryOwnerMixin, Field):
+    __slots__ = ()
+
     alias = "entry_point"
     default = None
     help = (
@@ -334,6 +346,8 @@ class ResolvePexEntryPointRequest:
 
 
 class PexScriptField(Field):
+    __slots__ = ()
+
     alias = "script"
     default = None
     help = (
@@ -355,6 +369,8 @@ class PexScriptField(Field):
 
 
 class PexPlatformsField(StringSequenceField):
+    __slots__ = ()
+
     alias = "platforms"
     help = (
         "The platforms the built PEX should be compatible with.\n\nThis defaults to the current "
@@ -375,6 +391,8 @@ class PexPlatformsField(StringSequenceField):
 
 
 class PexInheritPathField(StringField):
+    __slots__ = ()
+
     alias = "inherit_path"
     valid_choices = ("false", "fallback", "prefer")
     help = (
@@ -395,6 +413,8 @@ class PexInheritPathField(StringField):
 
 
 class PexStripEnvField(BoolField):
+    __slots__ = ()
+
     alias = "strip_pex_env"
     default = True
     help = (
@@ -408,12 +428,16 @@ class PexStripEnvField(BoolField):
 
 
 class PexIgnoreErrorsField(BoolField):
+    __slots__ = ()
+
     alias = "ignore_errors"
     default = False
     help = "Should PEX ignore when it cannot resolve dependencies?"
 
 
 class PexShebangField(StringField):
+    __slots__ = ()
+
     alias = "shebang"
     help = (
         "Set the generated PEX to use this shebang, rather than the default of PEX choosing a "
@@ -424,6 +448,8 @@ class PexShebangField(StringField):
 
 
 class PexEmitWarningsField(TriBoolField):
+    __slots__ = ()
+
     alias = "emit_warnings"
     help = (
         "Whether or not to emit PEX warnings at runtime.\n\nThe default is determined by the "
@@ -437,6 +463,8 @@ class PexEmitWarningsField(TriBoolField):
 
 
 class PexResolveLocalPlatformsField(TriBoolField):
+    __slots__ = ()
+
     alias = "resolve_local_platforms"
     help = (
         f"For each of the `{PexPlatformsField.alias}` specified, attempt to find a local "
@@ -458,6 +486,8 @@ class PexExecutionMode(Enum):
 
 
 class PexExecutionModeField(StringField):
+    __slots__ = ()
+
     alias = "execution_mode"
     valid_choices = PexExecutionMode
     expected_type = str
@@ -482,6 +512,8 @@ class PexLayout(Enum):
 
 
 class PexLayoutField(StringField):
+    __slots__ = ()
+
     alias = "layout"
     valid_choices = PexLayout
     expected_type = str
@@ -505,6 +537,8 @@ class PexLayoutField(StringField):
 
 
 class PexIncludeToolsField(BoolField):
+    __slots__ = ()
+
     alias = "include_tools"
     default = False
     help = (
@@ -557,6 +591,8 @@ class PexBinary(Target):
 
 
 class PythonTestSourceField(PythonSourceField):
+    __slots__ = ()
+
     expected_file_extensions = (".py", "")  # Note that this does not include `.pyi`.
 
     def validate_resolved_files(self, files: Sequence[str]) -> None:
@@ -574,10 +610,14 @@ class PythonTestSourceField(PythonSourceField):
 
 
 class PythonTestsDependencies(Dependencies):
+    __slots__ = ()
+
     supports_transitive_excludes = True
 
 
 class PythonTestsTimeout(IntField):
+    __slots__ = ()
+
     alias = "timeout"
     help = (
         "A timeout (in seconds) used by each test file belonging to this target.\n\n"
@@ -603,6 +643,8 @@ class PythonTestsTimeout(IntField):
 
 
 class PythonTestsExtraEnvVars(StringSequenceField):
+    __slots__ = ()
+
     alias = "extra_env_vars"
     help = (
         "Additional environment variables to include in test processes. "
@@ -613,6 +655,8 @@ class PythonTestsExtraEnvVars(StringSequenceField):
 
 
 class SkipPythonTestsField(BoolField):
+    __slots__ = ()
+
     alias = "skip_tests"
     default = False
     help = "If true, don't run this target's tests."
@@ -643,6 +687,8 @@ class PythonTestTarget(Target):
 
 
 class PythonTestsGeneratingSourcesField(PythonGeneratingSourcesBase):
+    __slots__ = ()
+
     expected_file_extensions = (".py", "")  # Note that this does not include `.pyi`.
     default = ("test_*.py", "*_test.py", "tests.py")
 
@@ -663,6 +709,8 @@ class PythonTestsGeneratingSourcesField(PythonGeneratingSourcesBase):
 
 
 class PythonTestsOverrideField(OverridesField):
+    __slots__ = ()
+
     help = generate_file_based_overrides_field_help_message(
         PythonTestTarget.alias,
         (
@@ -702,6 +750,8 @@ class PythonSourceTarget(Target):
 
 
 class PythonSourcesOverridesField(OverridesField):
+    __slots__ = ()
+
     help = generate_file_based_overrides_field_help_message(
         PythonSourceTarget.alias,
         (
@@ -715,10 +765,14 @@ class PythonSourcesOverridesField(OverridesField):
 
 
 class PythonTestUtilsGeneratingSourcesField(PythonGeneratingSourcesBase):
+    __slots__ = ()
+
     default = ("conftest.py", "test_*.pyi", "*_test.pyi", "tests.pyi")
 
 
 class PythonSourcesGeneratingSourcesField(PythonGeneratingSourcesBase):
+    __slots__ = ()
+
     default = (
         ("*.py", "*.pyi")
         + tuple(f"!{pat}" for pat in PythonTestsGeneratingSourcesField.default)
@@ -800,6 +854,8 @@ def format_invalid_requirement_string_error(
 
 
 class _PipRequirementSequenceField(Field):
+    __slots__ = ()
+
     value: tuple[PipRequirement, ...]
 
     @classmethod
@@ -843,6 +899,8 @@ class _PipRequirementSequenceField(Field):
 
 
 class PythonRequirementsField(_PipRequirementSequenceField):
+    __slots__ = ()
+
     alias = "requirements"
     required = True
     help = (
@@ -861,6 +919,8 @@ _default_module_mapping_url = git_url(
 
 
 class PythonRequirementModulesField(StringSequenceField):
+    __slots__ = ()
+
     alias = "modules"
     help = (
         "The modules this requirement provides (used for dependency inference).\n\n"
@@ -875,6 +935,8 @@ class PythonRequirementModulesField(StringSequenceField):
 
 
 class PythonRequirementTypeStubModulesField(StringSequenceField):
+    __slots__ = ()
+
     alias = "type_stub_modules"
     help = (
         "The modules this requirement provides if the requirement is a type stub (used for "
@@ -955,6 +1017,8 @@ def parse_requirements_file(content: str, *, rel_path: str) -> Iterator[PipRequi
 
 
 class PythonRequirementsFileSources(MultipleSourcesField):
+    __slots__ = ()
+
     required = True
     uses_source_roots = False
 
@@ -972,10 +1036,14 @@ class PythonRequirementsFile(Target):
 
 # See `target_types_rules.py` for a dependency injection rule.
 class PythonDistributionDependencies(Dependencies):
+    __slots__ = ()
+
     supports_transitive_excludes = True
 
 
 class PythonProvidesField(ScalarField, AsyncFieldMixin):
+    __slots__ = ()
+
     alias = "provides"
     expected_type = PythonArtifact
     expected_type_help = "setup_py(name='my-dist', **kwargs)"
@@ -996,6 +1064,8 @@ class PythonProvidesField(ScalarField, AsyncFieldMixin):
 
 
 class PythonDistributionEntryPointsField(NestedDictStringToStringField, AsyncFieldMixin):
+    __slots__ = ()
+
     alias = "entry_points"
     required = False
     help = (
@@ -1096,12 +1166,16 @@ class ResolvePythonDistributionEntryPointsRequest:
 
 
 class WheelField(BoolField):
+    __slots__ = ()
+
     alias = "wheel"
     default = True
     help = "Whether to build a wheel for the distribution."
 
 
 class SDistField(BoolField):
+    __slots__ = ()
+
     alias = "sdist"
     default = True
     help = "Whether to build an sdist for the distribution."
@@ -1133,18 +1207,26 @@ class ConfigSettingsField(DictStringToStringSequenceField):
     to an as-yet-nonexistent "DictStringToStringOrStringSequenceField".
     """
 
+    __slots__ = ()
+
 
 class WheelConfigSettingsField(ConfigSettingsField):
+    __slots__ = ()
+
     alias = "wheel_config_settings"
     help = "PEP-517 config settings to pass to the build backend when building a wheel."
 
 
 class SDistConfigSettingsField(ConfigSettingsField):
+    __slots__ = ()
+
     alias = "sdist_config_settings"
     help = "PEP-517 config settings to pass to the build backend when building an sdist."
 
 
 class GenerateSetupField(TriBoolField):
+    __slots__ = ()
+
     alias = "generate_setup"
     required = False
     # The default behavior if this field is unspecified is controlled by the
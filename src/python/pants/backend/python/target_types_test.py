@@ -104,6 +104,17 @@ def test_timeout_calculation() -> None:
     assert_timeout_calculated(field_value=10, timeouts_enabled=False, expected=None)
 
 
+def test_field_slots() -> None:
+    addr = Address("", target_name="t")
+    for tgt in (
+        PythonSourceTarget({"source": "f.py"}, addr),
+        PythonTestTarget({"source": "f_test.py"}, addr),
+        PexBinary({"entry_point": "f.py"}, addr),
+    ):
+        for field in tgt.field_values.values():
+            assert not hasattr(field, "__dict__"), type(field)
+
+
 @pytest.mark.parametrize(
     ["entry_point", "expected"],
     (
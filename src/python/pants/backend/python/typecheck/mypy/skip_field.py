@@ -12,6 +12,8 @@ from pants.engine.target import BoolField
 
 
 class SkipMyPyField(BoolField):
+    __slots__ = ()
+
     alias = "skip_mypy"
     default = False
     help = "If true, don't run MyPy on this target's code."
@@ -17,6 +17,7 @@ from pants.build_graph.address import Address
 from pants.engine.engine_aware import EngineAwareParameter
 from pants.engine.target import Target
 from pants.util.frozendict import FrozenDict
+from pants.util.memo import memoized
 from pants.util.ordered_set import FrozenOrderedSet, OrderedSet
 
 
@@ -37,6 +38,72 @@ _FS = TypeVar("_FS", bound=FieldSetWithInterpreterConstraints)
 
 # The current maxes are 2.7.18 and 3.6.15.  We go much higher, for safety.
 _PATCH_VERSION_UPPER_BOUND = 30
+_PATCH_VERSIONS = _PATCH_VERSION_UPPER_BOUND + 1
+
+
+# NB: The versions which a set of constraints allows are represented as bitsets: for a single
+# major.minor version, bit `p` is set if patch version `p` is allowed, and for an interpreter universe,
+# the bits of each major.minor version (in sorted order) are concatenated. Because relatively few
+# distinct constraints and universes are used in a repo, the bitsets are memoized for the lifetime of
+# the process, which avoids re-evaluating specifiers for every target.
+
+
+@memoized
+def _requirement_patch_bits(requirement: Requirement, major: int, minor: int) -> int:
+    """The patch versions of `major.minor` which `requirement` allows, as a bitset."""
+    bits = 0
+    for patch in range(_PATCH_VERSIONS):
+        if requirement.specifier.contains(f"{major}.{minor}.{patch}"):  # type: ignore[attr-defined]
+            bits |= 1 << patch
+    return bits
+
+
+@memoized
+def _universe_major_minors(interpreter_universe: tuple[str, ...]) -> tuple[tuple[int, int], ...]:
+    """Validate and sort the major.minor versions of the interpreter universe.
+
+    Python 2.7 must be the only Python 2 version in the universe, if at all, and Python 3 is the
+    last major release of Python, which the core devs have committed to in public several times.
+    """
+    major_minors = []
+    for major_minor in interpreter_universe:
+        major, minor = _major_minor_to_int(major_minor)
+        if major == 2:
+            if minor != 7:
+                raise AssertionError(
+                    "Unexpected value in `[python].interpreter_versions_universe`: "
+                    f"{major_minor}. Expected the only Python 2 value to be '2.7', given that "
+                    f"all other versions are unmaintained or do not exist."
+                )
+            major_minors.append((2, minor))
+        elif major == 3:
+            major_minors.append((3, minor))
+        else:
+            raise AssertionError(
+                "Unexpected value in `[python].interpreter_versions_universe`: "
+                f"{major_minor}. Expected to only include '2.7' and/or Python 3 versions, "
+                "given that Python 3 will be the last major Python version. Please open an "
+                "issue at https://github.com/pantsbuild/pants/issues/new if this is no longer "
+                "true."
+            )
+    return tuple(sorted(major_minors))
+
+
+@memoized
+def _version_bits(
+    constraints: InterpreterConstraints, interpreter_universe: tuple[str, ...]
+) -> int:
+    bits = 0
+    for i, (major, minor) in enumerate(_universe_major_minors(interpreter_universe)):
+        bits |= constraints._patch_bits(major, minor) << (i * _PATCH_VERSIONS)
+    return bits
+
+
+@memoized
+def _merged_constraints(constraint_sets: frozenset[tuple[str, ...]]) -> InterpreterConstraints:
+    # NB: Memoizing the merge interns the result, so that equal constraints share one instance
+    # (along with its cached hash).
+    return InterpreterConstraints(InterpreterConstraints.merge_constraint_sets(constraint_sets))
 
 
 # Normally we would subclass `DeduplicatedCollection`, but we want a custom constructor.
@@ -63,6 +130,7 @@ class InterpreterConstraints(FrozenOrderedSet[Requirement], EngineAwareParameter
         return str(self)
 
     @staticmethod
+    @memoized
     def parse_constraint(constraint: str) -> Requirement:
         """Parse an interpreter constraint, e.g., CPython>=2.7,<3.
 
@@ -157,10 +225,11 @@ class InterpreterConstraints(FrozenOrderedSet[Requirement], EngineAwareParameter
     def create_from_compatibility_fields(
         cls, fields: Iterable[InterpreterConstraintsField], python_setup: PythonSetup
     ) -> InterpreterConstraints:
-        constraint_sets = {field.value_or_global_default(python_setup) for field in fields}
+        constraint_sets = frozenset(
+            tuple(field.value_or_global_default(python_setup)) for field in fields
+        )
         # This will OR within each field and AND across fields.
-        merged_constraints = cls.merge_constraint_sets(constraint_sets)
-        return InterpreterConstraints(merged_constraints)
+        return _merged_constraints(constraint_sets)
 
     @classmethod
     def group_field_sets_by_constraints(
@@ -185,14 +254,18 @@ class InterpreterConstraints(FrozenOrderedSet[Requirement], EngineAwareParameter
             args.extend(["--interpreter-constraint", str(constraint)])
         return args
 
+    def _patch_bits(self, major: int, minor: int) -> int:
+        bits = 0
+        for req in self:
+            bits |= _requirement_patch_bits(req, major, minor)
+        return bits
+
     def _valid_patch_versions(self, major: int, minor: int) -> Iterator[int]:
-        for p in range(0, _PATCH_VERSION_UPPER_BOUND + 1):
-            for req in self:
-                if req.specifier.contains(f"{major}.{minor}.{p}"):  # type: ignore[attr-defined]
-                    yield p
+        bits = self._patch_bits(major, minor)
+        return (p for p in range(_PATCH_VERSIONS) if bits & (1 << p))
 
     def _includes_version(self, major: int, minor: int) -> bool:
-        return any(True for _ in self._valid_patch_versions(major, minor))
+        return self._patch_bits(major, minor) != 0
 
     def includes_python2(self) -> bool:
         """Checks if any of the constraints include Python 2.
@@ -290,6 +363,25 @@ class InterpreterConstraints(FrozenOrderedSet[Requirement], EngineAwareParameter
             return "*"
         return " || ".join(specifiers)
 
+    def _version_bits(self, interpreter_universe: Iterable[str]) -> int:
+        """The versions of the interpreter universe which these constraints allow, as a bitset.
+
+        Raises if there are constraints, but they do not allow any version of the universe.
+        """
+        if not self:
+            return 0
+        bits = _version_bits(self, tuple(interpreter_universe))
+        if not bits:
+            raise ValueError(
+                f"The interpreter constraints `{self}` are not compatible with any of the "
+                "interpreter versions from `[python].interpreter_versions_universe`.\n\n"
+                "Please either change these interpreter constraints or update the "
+                "`interpreter_versions_universe` to include the interpreters set in these "
+                "constraints. Run `./pants help-advanced python` for more information on the "
+                "`interpreter_versions_universe` option."
+            )
+        return bits
+
     def enumerate_python_versions(
         self, interpreter_universe: Iterable[str]
     ) -> FrozenOrderedSet[tuple[int, int, int]]:
@@ -302,58 +394,25 @@ class InterpreterConstraints(FrozenOrderedSet[Requirement], EngineAwareParameter
         - Python 3 is the last major release of Python, which the core devs have committed to in
           public several times.
         """
-        if not self:
-            return FrozenOrderedSet()
-
-        minors = []
-        for major_minor in interpreter_universe:
-            major, minor = _major_minor_to_int(major_minor)
-            if major == 2:
-                if minor != 7:
-                    raise AssertionError(
-                        "Unexpected value in `[python].interpreter_versions_universe`: "
-                        f"{major_minor}. Expected the only Python 2 value to be '2.7', given that "
-                        f"all other versions are unmaintained or do not exist."
-                    )
-                minors.append((2, minor))
-            elif major == 3:
-                minors.append((3, minor))
-            else:
-                raise AssertionError(
-                    "Unexpected value in `[python].interpreter_versions_universe`: "
-                    f"{major_minor}. Expected to only include '2.7' and/or Python 3 versions, "
-                    "given that Python 3 will be the last major Python version. Please open an "
-                    "issue at https://github.com/pantsbuild/pants/issues/new if this is no longer "
-                    "true."
-                )
-
-        valid_patches = FrozenOrderedSet(
+        interpreter_universe = tuple(interpreter_universe)
+        bits = self._version_bits(interpreter_universe)
+        return FrozenOrderedSet(
             (major, minor, patch)
-            for (major, minor) in sorted(minors)
-            for patch in self._valid_patch_versions(major, minor)
+            for i, (major, minor) in enumerate(_universe_major_minors(interpreter_universe))
+            for patch in range(_PATCH_VERSIONS)
+            if bits & (1 << (i * _PATCH_VERSIONS + patch))
         )
 
-        if not valid_patches:
-            raise ValueError(
-                f"The interpreter constraints `{self}` are not compatible with any of the "
-                "interpreter versions from `[python].interpreter_versions_universe`.\n\n"
-                "Please either change these interpreter constraints or update the "
-                "`interpreter_versions_universe` to include the interpreters set in these "
-                "constraints. Run `./pants help-advanced python` for more information on the "
-                "`interpreter_versions_universe` option."
-            )
-
-        return valid_patches
-
     def contains(self, other: InterpreterConstraints, interpreter_universe: Iterable[str]) -> bool:
         """Returns True if the `InterpreterConstraints` specified in `other` is a subset of these
         `InterpreterConstraints`.
 
         This is restricted to the set of minor Python versions specified in `universe`.
         """
-        this = self.enumerate_python_versions(interpreter_universe)
-        that = other.enumerate_python_versions(interpreter_universe)
-        return this.issuperset(that)
+        interpreter_universe = tuple(interpreter_universe)
+        this = self._version_bits(interpreter_universe)
+        that = other._version_bits(interpreter_universe)
+        return that & ~this == 0
 
     def partition_into_major_minor_versions(
         self, interpreter_universe: Iterable[str]
@@ -281,6 +281,22 @@ def test_group_field_sets_by_constraints() -> None:
     )
 
 
+def test_create_from_compatibility_fields_interns() -> None:
+    python_setup = create_subsystem(PythonSetup, interpreter_constraints=[])
+    field_sets = [
+        MockFieldSet.create_for_test(Address("", target_name="a"), "==3.6.*"),
+        MockFieldSet.create_for_test(Address("", target_name="b"), "==3.6.*"),
+    ]
+    a, b = (
+        InterpreterConstraints.create_from_compatibility_fields(
+            [fs.interpreter_constraints], python_setup
+        )
+        for fs in field_sets
+    )
+    assert a == InterpreterConstraints(["CPython==3.6.*"])
+    assert a is b
+
+
 def test_group_field_sets_by_constraints_with_unsorted_inputs() -> None:
     py3_fs = [
         MockFieldSet.create_for_test(
@@ -424,6 +440,29 @@ def test_contains(candidate, target, matches) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    "constraints",
+    (
+        ["==2.7.*"],
+        [">=3.6.5,<3.8"],
+        ["==2.7.*", ">=3.8,!=3.9.2"],
+        ["<3.6", ">=3.6"],
+        ["CPython>=3.7", "PyPy==3.6.*"],
+    ),
+)
+def test_contains_matches_enumerate(constraints: list[str]) -> None:
+    universe = ["2.7", "3.6", "3.7", "3.8", "3.9"]
+    ics = InterpreterConstraints(constraints)
+    versions = ics.enumerate_python_versions(universe)
+    for other in ([">=3.7"], ["==2.7.18"], ["==3.6.*"], [">=3.8.2,<3.9"]):
+        other_ics = InterpreterConstraints(other)
+        assert ics.contains(other_ics, universe) == versions.issuperset(
+            other_ics.enumerate_python_versions(universe)
+        )
+    # The universe may be any iterable, and is only consumed once.
+    assert ics.contains(ics, iter(universe))
+
+
 def test_constraints_are_correctly_sorted_at_construction() -> None:
     # #12578: This list itself is out of order, and `CPython>=3.6,<4,!=3.7.*` is specified with
     # out-of-order component requirements. This test verifies that the list is fully sorted after
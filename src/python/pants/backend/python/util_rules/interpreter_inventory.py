@@ -0,0 +1,250 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""An inventory of the Python interpreters on the interpreter search path.
+
+Rather than asking Pex to discover an interpreter for each distinct set of interpreter constraints,
+the candidate interpreters on the search path are listed (along with their inode, mtime and size)
+by a single cheap process. Each candidate is then probed once for its implementation and version.
+Probes are keyed by the stat of their candidate, so they are cached persistently and only re-run
+when the candidate binary changes. Interpreter constraints are then matched in-process.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from textwrap import dedent
+from typing import Iterable
+
+from pants.backend.python.util_rules import pex_environment
+from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
+from pants.backend.python.util_rules.pex_environment import PexEnvironment, PythonExecutable
+from pants.engine.collection import Collection
+from pants.engine.process import (
+    BinaryNotFoundError,
+    FallibleProcessResult,
+    Process,
+    ProcessCacheScope,
+    ProcessResult,
+)
+from pants.engine.rules import Get, MultiGet, collect_rules, rule
+from pants.python.binaries import PythonBinary
+from pants.util.logging import LogLevel
+
+logger = logging.getLogger(__name__)
+
+
+# N.B.: This script runs with the `PythonBinary`, and so must be compatible with Python 3.6+.
+#
+# The names of candidate binaries match those that Pex considers when searching for interpreters.
+_LIST_CANDIDATES_SCRIPT = dedent(
+    """\
+    import json, os, re, sys
+
+    NAME = re.compile(r"^(?:python|pypy)(?:\\d+(?:\\.\\d+)*)?$")
+
+    def entries(search_path_entry):
+        if os.path.isdir(search_path_entry):
+            for name in sorted(os.listdir(search_path_entry)):
+                if NAME.match(name):
+                    yield os.path.join(search_path_entry, name)
+        elif os.path.isfile(search_path_entry):
+            yield search_path_entry
+
+    seen = set()
+    for search_path_entry in sys.argv[1:]:
+        for path in entries(search_path_entry):
+            path = os.path.realpath(path)
+            if path in seen or not os.access(path, os.X_OK):
+                continue
+            seen.add(path)
+            try:
+                stat = os.stat(path)
+                with open(path, "rb") as fp:
+                    is_script = fp.read(2) == b"#!"
+            except OSError:
+                continue
+            print(json.dumps([path, stat.st_ino, stat.st_mtime_ns, stat.st_size, is_script]))
+    """
+)
+
+# N.B.: This script runs with each candidate interpreter, and so must be compatible with Python 2.7
+# and Python 3.5+.
+_PROBE_SCRIPT = dedent(
+    """\
+    import json, os, platform, sys
+
+    print(
+        json.dumps(
+            [
+                os.path.realpath(sys.executable),
+                platform.python_implementation(),
+                list(sys.version_info[:3]),
+            ]
+        )
+    )
+    """
+)
+
+
+@dataclass(frozen=True)
+class InterpreterCandidate:
+    """A binary on the interpreter search path which may be a Python interpreter."""
+
+    path: str
+    inode: int
+    mtime_ns: int
+    size: int
+    # Whether the candidate is a script (e.g. a Pyenv shim) rather than a binary. The interpreter
+    # that a script runs may change without the script itself changing.
+    is_script: bool
+
+    @property
+    def stat_key(self) -> str:
+        return f"{self.inode}:{self.mtime_ns}:{self.size}"
+
+
+class InterpreterCandidates(Collection[InterpreterCandidate]):
+    pass
+
+
+@dataclass(frozen=True)
+class InterpreterInfo:
+    path: str
+    implementation: str
+    version: tuple[int, int, int]
+    # A fingerprint of the candidate which was probed, which changes when its binary does.
+    fingerprint: str
+
+    @property
+    def version_str(self) -> str:
+        return ".".join(str(component) for component in self.version)
+
+    def satisfies(self, interpreter_constraints: InterpreterConstraints) -> bool:
+        implementation = self.implementation.lower()
+        version = self.version_str
+        return any(
+            constraint.key == implementation
+            and constraint.specifier.contains(version)  # type: ignore[attr-defined]
+            for constraint in interpreter_constraints
+        )
+
+
+class InterpreterInventory(Collection[InterpreterInfo]):
+    """The distinct interpreters on the interpreter search path, in search path order."""
+
+    def select(self, interpreter_constraints: InterpreterConstraints) -> InterpreterInfo | None:
+        """Select the interpreter that Pex would: the lowest compatible version.
+
+        Ties are broken by search path order.
+        """
+        compatible = [info for info in self if info.satisfies(interpreter_constraints)]
+        return min(compatible, key=lambda info: info.version, default=None)
+
+
+@rule(desc="List candidate Python interpreters", level=LogLevel.DEBUG)
+async def list_interpreter_candidates(
+    pex_env: PexEnvironment, python_binary: PythonBinary
+) -> InterpreterCandidates:
+    result = await Get(
+        ProcessResult,
+        Process(
+            argv=(
+                python_binary.path,
+                "-c",
+                _LIST_CANDIDATES_SCRIPT,
+                *pex_env.interpreter_search_paths,
+            ),
+            description="List candidate Python interpreters",
+            level=LogLevel.DEBUG,
+            # NB: Listing the candidates is cheap, because it only stats them. Probes of the
+            # candidates (which are comparatively expensive) are cached persistently by stat.
+            cache_scope=ProcessCacheScope.PER_RESTART_SUCCESSFUL,
+        ),
+    )
+    return InterpreterCandidates(
+        InterpreterCandidate(path, inode, mtime_ns, size, is_script)
+        for path, inode, mtime_ns, size, is_script in (
+            json.loads(line) for line in result.stdout.decode().splitlines()
+        )
+    )
+
+
+def _fingerprint(candidate: InterpreterCandidate, probe_output: bytes) -> str:
+    hasher = hashlib.sha256(f"{candidate.path}:{candidate.stat_key}".encode())
+    hasher.update(probe_output)
+    return hasher.hexdigest()
+
+
+@rule(desc="Probe Python interpreters", level=LogLevel.DEBUG)
+async def interpreter_inventory(candidates: InterpreterCandidates) -> InterpreterInventory:
+    results = await MultiGet(
+        Get(
+            FallibleProcessResult,
+            Process(
+                # NB: The stat of the candidate is not used by the probe, but is included in the
+                # argv so that the probe is re-run if the candidate changes.
+                argv=(candidate.path, "-c", _PROBE_SCRIPT, candidate.stat_key),
+                description=f"Probe Python interpreter {candidate.path}",
+                level=LogLevel.DEBUG,
+                cache_scope=(
+                    ProcessCacheScope.PER_RESTART_SUCCESSFUL
+                    if candidate.is_script
+                    else ProcessCacheScope.SUCCESSFUL
+                ),
+            ),
+        )
+        for candidate in candidates
+    )
+
+    infos: dict[str, InterpreterInfo] = {}
+    for candidate, result in zip(candidates, results):
+        if result.exit_code != 0:
+            logger.debug(
+                f"Ignoring {candidate.path}, which is not a usable Python interpreter:\n"
+                f"{result.stderr.decode()}"
+            )
+            continue
+        path, implementation, (major, minor, micro) = json.loads(result.stdout.decode())
+        if path not in infos:
+            infos[path] = InterpreterInfo(
+                path=path,
+                implementation=implementation,
+                version=(major, minor, micro),
+                fingerprint=_fingerprint(candidate, result.stdout),
+            )
+    return InterpreterInventory(infos.values())
+
+
+def _format_inventory(inventory: Iterable[InterpreterInfo]) -> str:
+    return "\n".join(
+        f"  {info.path} ({info.implementation} {info.version_str})" for info in inventory
+    )
+
+
+@rule(desc="Find Python interpreter for constraints", level=LogLevel.DEBUG)
+async def find_interpreter(
+    interpreter_constraints: InterpreterConstraints, inventory: InterpreterInventory
+) -> PythonExecutable:
+    info = inventory.select(interpreter_constraints)
+    if info is None:
+        formatted_constraints = " OR ".join(
+            str(constraint) for constraint in interpreter_constraints
+        )
+        raise BinaryNotFoundError(
+            f"Could not find a Python interpreter compatible with {formatted_constraints} on the "
+            "interpreter search path (see `[python-bootstrap].search_path`). "
+            + (
+                f"The interpreters found were:\n{_format_inventory(inventory)}"
+                if inventory
+                else "No interpreters were found."
+            )
+        )
+    return PythonExecutable(path=info.path, fingerprint=info.fingerprint)
+
+
+def rules():
+    return [*collect_rules(), *pex_environment.rules()]
@@ -0,0 +1,90 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from pants.backend.python.util_rules import interpreter_inventory
+from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
+from pants.backend.python.util_rules.interpreter_inventory import (
+    InterpreterCandidates,
+    InterpreterInfo,
+    InterpreterInventory,
+)
+from pants.backend.python.util_rules.pex_environment import PythonExecutable
+from pants.engine.rules import QueryRule
+from pants.testutil.rule_runner import RuleRunner
+
+
+def info(path: str, version: tuple[int, int, int], implementation: str = "CPython"):
+    return InterpreterInfo(
+        path=path, implementation=implementation, version=version, fingerprint=path
+    )
+
+
+INVENTORY = InterpreterInventory(
+    [
+        info("/usr/bin/python3.9", (3, 9, 7)),
+        info("/usr/bin/python2.7", (2, 7, 18)),
+        info("/opt/pypy/bin/pypy3", (3, 7, 10), implementation="PyPy"),
+        info("/usr/local/bin/python3.7", (3, 7, 12)),
+        info("/usr/bin/python3.7", (3, 7, 3)),
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    "constraints,expected",
+    [
+        # The lowest compatible version is selected.
+        (["CPython>=3.6"], "/usr/bin/python3.7"),
+        (["CPython>=3.7.5"], "/usr/local/bin/python3.7"),
+        (["CPython==2.7.*", "CPython>=3.9"], "/usr/bin/python2.7"),
+        (["CPython>=3.8"], "/usr/bin/python3.9"),
+        (["PyPy"], "/opt/pypy/bin/pypy3"),
+        (["CPython>=3.10"], None),
+    ],
+)
+def test_select(constraints: list[str], expected: str | None) -> None:
+    selected = INVENTORY.select(InterpreterConstraints(constraints))
+    assert (selected.path if selected else None) == expected
+
+
+def test_select_ties_by_search_path_order() -> None:
+    inventory = InterpreterInventory([info("/b/python3", (3, 8, 1)), info("/a/python3", (3, 8, 1))])
+    selected = inventory.select(InterpreterConstraints(["CPython==3.8.*"]))
+    assert selected is not None and selected.path == "/b/python3"
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    return RuleRunner(
+        rules=[
+            *interpreter_inventory.rules(),
+            QueryRule(InterpreterCandidates, []),
+            QueryRule(InterpreterInventory, []),
+            QueryRule(PythonExecutable, [InterpreterConstraints]),
+        ]
+    )
+
+
+def test_find_interpreter(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options([], env_inherit={"PATH", "PYENV_ROOT", "HOME"})
+    candidates = rule_runner.request(InterpreterCandidates, [])
+    assert candidates
+    # Each candidate is listed once, by its real path.
+    assert len({candidate.path for candidate in candidates}) == len(candidates)
+
+    inventory = rule_runner.request(InterpreterInventory, [])
+    major, minor = sys.version_info[:2]
+    assert any(info.version[:2] == (major, minor) for info in inventory)
+
+    python = rule_runner.request(
+        PythonExecutable, [InterpreterConstraints([f"CPython=={major}.{minor}.*"])]
+    )
+    selected = inventory.select(InterpreterConstraints([f"CPython=={major}.{minor}.*"]))
+    assert selected is not None
+    assert python == PythonExecutable(path=selected.path, fingerprint=selected.fingerprint)
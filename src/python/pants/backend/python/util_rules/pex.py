@@ -23,7 +23,7 @@ from pants.backend.python.subsystems.setup import InvalidLockfileBehavior, Pytho
 from pants.backend.python.target_types import MainSpecification, PexLayout
 from pants.backend.python.target_types import PexPlatformsField as PythonPlatformsField
 from pants.backend.python.target_types import PythonRequirementsField
-from pants.backend.python.util_rules import pex_cli
+from pants.backend.python.util_rules import interpreter_inventory, pex_cli
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.backend.python.util_rules.lockfile_metadata import (
     InvalidLockfileError,
@@ -285,62 +285,6 @@ class OptionalPex:
     maybe_pex: Pex | None
 
 
-@rule(desc="Find Python interpreter for constraints", level=LogLevel.DEBUG)
-async def find_interpreter(
-    interpreter_constraints: InterpreterConstraints, pex_runtime_env: PexRuntimeEnvironment
-) -> PythonExecutable:
-    formatted_constraints = " OR ".join(str(constraint) for constraint in interpreter_constraints)
-    result = await Get(
-        ProcessResult,
-        PexCliProcess(
-            description=f"Find interpreter for constraints: {formatted_constraints}",
-            # Here, we run the Pex CLI with no requirements, which just selects an interpreter.
-            # Normally, this would start an isolated repl. By passing `--`, we force the repl to
-            # instead act as an interpreter (the selected one) and tell us about itself. The upshot
-            # is we run the Pex interpreter selection logic unperturbed but without resolving any
-            # distributions.
-            argv=(
-                *interpreter_constraints.generate_pex_arg_list(),
-                "--",
-                "-c",
-                # N.B.: The following code snippet must be compatible with Python 2.7 and
-                # Python 3.5+.
-                #
-                # When hashing, we pick 8192 for efficiency of reads and fingerprint updates
-                # (writes) since it's a common OS buffer size and an even multiple of the
-                # hash block size.
-                dedent(
-                    """\
-                    import hashlib, os, sys
-
-                    python = os.path.realpath(sys.executable)
-                    print(python)
-
-                    hasher = hashlib.sha256()
-                    with open(python, "rb") as fp:
-                      for chunk in iter(lambda: fp.read(8192), b""):
-                          hasher.update(chunk)
-                    print(hasher.hexdigest())
-                    """
-                ),
-            ),
-            level=LogLevel.DEBUG,
-            # NB: We want interpreter discovery to re-run fairly frequently
-            # (PER_RESTART_SUCCESSFUL), but not on every run of Pants (NEVER, which is effectively
-            # per-Session). See #10769 for a solution that is less of a tradeoff.
-            cache_scope=ProcessCacheScope.PER_RESTART_SUCCESSFUL,
-        ),
-    )
-    path, fingerprint = result.stdout.decode().strip().splitlines()
-
-    if pex_runtime_env.verbosity > 0:
-        log_output = result.stderr.decode()
-        if log_output:
-            logger.info("%s", log_output)
-
-    return PythonExecutable(path=path, fingerprint=fingerprint)
-
-
 @dataclass(frozen=True)
 class BuildPexResult:
     result: ProcessResult
@@ -1177,4 +1121,4 @@ async def determine_pex_resolve_info(pex_pex: PexPEX, pex: Pex) -> PexResolveInf
 
 
 def rules():
-    return [*collect_rules(), *pex_cli.rules()]
+    return [*collect_rules(), *interpreter_inventory.rules(), *pex_cli.rules()]
@@ -7,7 +7,10 @@ import logging
 from itertools import chain
 
 from pants.backend.java.target_types import JavaFieldSet, JavaGeneratorFieldSet, JavaSourceField
+from pants.backend.scala.compile import scalac_incremental
 from pants.backend.scala.compile.scala_subsystem import ScalaSubsystem
+from pants.backend.scala.compile.scalac_incremental import CompileScalaIncrementallyRequest
+from pants.backend.scala.compile.scalac_subsystem import ScalacSubsystem
 from pants.backend.scala.target_types import ScalaFieldSet, ScalaGeneratorFieldSet, ScalaSourceField
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.engine.fs import EMPTY_DIGEST, AddPrefix, Digest, MergeDigests
@@ -30,6 +33,7 @@ from pants.jvm.resolve.coursier_fetch import (
     MaterializedClasspathRequest,
 )
 from pants.jvm.resolve.coursier_setup import Coursier
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
 logger = logging.getLogger(__name__)
@@ -46,6 +50,7 @@ async def compile_scala_source(
     coursier: Coursier,
     jdk_setup: JdkSetup,
     scala: ScalaSubsystem,
+    scalac: ScalacSubsystem,
     union_membership: UnionMembership,
     request: CompileScalaSourceRequest,
 ) -> FallibleClasspathEntry:
@@ -145,6 +150,44 @@ async def compile_scala_source(
         Digest, AddPrefix(merged_transitive_dependency_classpath_entries_digest, usercp)
     )
 
+    classpath_arg = ClasspathEntry.arg(
+        ClasspathEntry.closure(direct_dependency_classpath_entries), prefix=usercp
+    )
+
+    output_file = f"{request.component.representative.address.path_safe_spec}.scalac.jar"
+
+    if scalac.incremental:
+        tool_digest = await Get(
+            Digest,
+            MergeDigests(
+                (
+                    prefixed_transitive_dependency_classpath_digest,
+                    tool_classpath.digest,
+                    jdk_setup.digest,
+                )
+            ),
+        )
+        return await Get(
+            FallibleClasspathEntry,
+            CompileScalaIncrementallyRequest(
+                component=request.component,
+                sources=tuple(sources for _, sources in component_members_and_scala_source_files),
+                input_digest=tool_digest,
+                scalac_argv=(
+                    *jdk_setup.args(bash, tool_classpath.classpath_entries()),
+                    "scala.tools.nsc.Main",
+                    "-bootclasspath",
+                    ":".join(tool_classpath.classpath_entries()),
+                ),
+                classpath_arg=classpath_arg,
+                output_file=output_file,
+                use_nailgun=jdk_setup.digest,
+                env=FrozenDict(jdk_setup.env),
+                append_only_caches=FrozenDict(jdk_setup.append_only_caches),
+                dependencies=direct_dependency_classpath_entries,
+            ),
+        )
+
     merged_digest = await Get(
         Digest,
         MergeDigests(
@@ -159,12 +202,6 @@ async def compile_scala_source(
             )
         ),
     )
-
-    classpath_arg = ClasspathEntry.arg(
-        ClasspathEntry.closure(direct_dependency_classpath_entries), prefix=usercp
-    )
-
-    output_file = f"{request.component.representative.address.path_safe_spec}.scalac.jar"
     process_result = await Get(
         FallibleProcessResult,
         Process(
@@ -209,5 +246,6 @@ def rules():
     return [
         *collect_rules(),
         *jvm_compile_rules(),
+        *scalac_incremental.rules(),
         UnionRule(ClasspathEntryRequest, CompileScalaSourceRequest),
     ]
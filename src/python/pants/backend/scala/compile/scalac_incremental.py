@@ -0,0 +1,588 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""Incremental compilation of the Scala sources of a `CoarsenedTarget`.
+
+The classfiles produced by the previous compile of a component are persisted in an append-only
+named cache, along with a manifest which records the content fingerprint of each source file and
+the source file which produced each classfile. On the next compile, only the files which changed
+(and the files which transitively use the symbols that they provide) are recompiled against the
+remaining classfiles.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import textwrap
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from itertools import chain
+from typing import ClassVar, Mapping
+
+from pants.backend.scala.dependency_inference import scala_parser
+from pants.backend.scala.dependency_inference.scala_parser import (
+    FallibleScalaSourceDependencyAnalysisResult,
+    ScalaSourceDependencyAnalysis,
+)
+from pants.core.util_rules.archive import ZipBinary
+from pants.core.util_rules.source_files import SourceFiles
+from pants.engine.fs import (
+    EMPTY_DIGEST,
+    AddPrefix,
+    CreateDigest,
+    Digest,
+    DigestContents,
+    DigestEntries,
+    DigestSubset,
+    Directory,
+    FileContent,
+    FileEntry,
+    MergeDigests,
+    PathGlobs,
+    RemovePrefix,
+    Snapshot,
+)
+from pants.engine.process import (
+    BashBinary,
+    FallibleProcessResult,
+    Process,
+    ProcessCacheScope,
+    ProcessResult,
+)
+from pants.engine.rules import Get, MultiGet, collect_rules, rule
+from pants.engine.target import CoarsenedTarget
+from pants.jvm.compile import ClasspathEntry, CompileResult, FallibleClasspathEntry
+from pants.util.frozendict import FrozenDict
+from pants.util.logging import LogLevel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ScalacIncrementalState:
+    """The state persisted between compiles of a component.
+
+    `sources` maps each source file to the fingerprint of its content, `provided_symbols` maps each
+    Scala source file to the symbols which it provided, and `classfiles` maps each classfile to the
+    source file which produced it (or None if it could not be attributed).
+    """
+
+    inputs_fingerprint: str
+    sources: FrozenDict[str, str]
+    provided_symbols: FrozenDict[str, tuple[str, ...]]
+    classfiles: FrozenDict[str, str | None]
+
+    version: ClassVar[int] = 2
+
+    def to_json(self) -> bytes:
+        return json.dumps(
+            {
+                "version": self.version,
+                "inputs_fingerprint": self.inputs_fingerprint,
+                "sources": dict(self.sources),
+                "provided_symbols": {
+                    source: list(symbols) for source, symbols in self.provided_symbols.items()
+                },
+                "classfiles": dict(self.classfiles),
+            },
+            sort_keys=True,
+        ).encode()
+
+    @classmethod
+    def from_json(cls, content: bytes) -> ScalacIncrementalState | None:
+        """Parse a persisted state, or return None if it is corrupt or from another version."""
+        try:
+            data = json.loads(content)
+            if data["version"] != cls.version:
+                return None
+            return cls(
+                inputs_fingerprint=data["inputs_fingerprint"],
+                sources=FrozenDict(data["sources"]),
+                provided_symbols=FrozenDict(
+                    (source, tuple(symbols)) for source, symbols in data["provided_symbols"].items()
+                ),
+                classfiles=FrozenDict(data["classfiles"]),
+            )
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+
+@dataclass(frozen=True)
+class IncrementalCompilePlan:
+    sources_to_compile: tuple[str, ...]
+    classfiles_to_keep: tuple[str, ...]
+
+
+def _classfile_prefix(encoded_symbol: str) -> str:
+    for suffix in ("$.MODULE$", "$"):
+        if encoded_symbol.endswith(suffix):
+            encoded_symbol = encoded_symbol[: -len(suffix)]
+            break
+    return encoded_symbol.replace(".", "/")
+
+
+def classfile_owners(analyses: Mapping[str, ScalaSourceDependencyAnalysis]) -> dict[str, str]:
+    """Map classfile path prefixes (e.g. `org/pantsbuild/Foo`) to the source file providing them.
+
+    Prefixes which are provided by more than one source file are omitted.
+    """
+    owners: dict[str, str] = {}
+    ambiguous = set()
+    for source, analysis in analyses.items():
+        for symbol in analysis.provided_symbols_encoded:
+            prefix = _classfile_prefix(symbol)
+            if owners.setdefault(prefix, source) != source:
+                ambiguous.add(prefix)
+    for prefix in ambiguous:
+        del owners[prefix]
+    return owners
+
+
+def classfile_owner(classfile: str, owners: Mapping[str, str]) -> str | None:
+    """Find the source file which produced the given classfile, if it can be determined.
+
+    Nested and synthetic classes (e.g. `Foo$Bar.class` or `Foo$.class`) belong to the source file
+    which provides their outermost class.
+    """
+    if not classfile.endswith(".class"):
+        return None
+    prefix = classfile[: -len(".class")]
+    while prefix:
+        owner = owners.get(prefix)
+        if owner:
+            return owner
+        prefix, _, _ = prefix.rpartition("$")
+    return None
+
+
+@dataclass(frozen=True)
+class SymbolIndex:
+    """The symbols provided and used by each of the current Scala sources of a component.
+
+    `users` maps each symbol to the source files which (may) use it, and `wildcard_importers` maps
+    each name which is imported with a wildcard (e.g. `foo` for `import foo._`) to the source files
+    which import it.
+    """
+
+    provided: Mapping[str, tuple[str, ...]]
+    users: Mapping[str, set[str]]
+    wildcard_importers: Mapping[str, set[str]]
+
+    @classmethod
+    def from_analyses(cls, analyses: Mapping[str, ScalaSourceDependencyAnalysis]) -> SymbolIndex:
+        users: dict[str, set[str]] = defaultdict(set)
+        wildcard_importers: dict[str, set[str]] = defaultdict(set)
+        for source, analysis in analyses.items():
+            for symbol in chain(
+                analysis.all_imports(), analysis.fully_qualified_consumed_symbols()
+            ):
+                users[symbol].add(source)
+            for imports in analysis.imports_by_scope.values():
+                for imp in imports:
+                    if imp.is_wildcard:
+                        wildcard_importers[imp.name].add(source)
+        return cls(
+            provided={
+                source: tuple(analysis.provided_symbols) for source, analysis in analyses.items()
+            },
+            users=users,
+            wildcard_importers=wildcard_importers,
+        )
+
+    def is_wildcard_imported(self, symbol: str, *, excluding: str) -> bool:
+        """Whether any source other than `excluding` imports an enclosing name of the symbol with a
+        wildcard."""
+        name = symbol
+        while "." in name:
+            name, _, _ = name.rpartition(".")
+            if self.wildcard_importers.get(name, set()) - {excluding}:
+                return True
+        return False
+
+
+def plan_incremental_compile(
+    previous_state: ScalacIncrementalState | None,
+    inputs_fingerprint: str,
+    sources: Mapping[str, str],
+    symbols: SymbolIndex,
+) -> IncrementalCompilePlan | None:
+    """Decide which sources to recompile, or return None if all sources must be recompiled.
+
+    The users of every symbol which a changed (or deleted) source provided either before or after
+    the change are invalidated, so that a removed symbol which is still used fails the compile.
+    """
+    if previous_state is None or previous_state.inputs_fingerprint != inputs_fingerprint:
+        return None
+
+    changed = [
+        source
+        for source, fingerprint in sources.items()
+        if previous_state.sources.get(source) != fingerprint
+    ]
+    deleted = [source for source in previous_state.sources if source not in sources]
+    if any(not source.endswith(".scala") for source in (*changed, *deleted)):
+        # Java sources are only parsed by scalac, so we cannot track which files use them.
+        return None
+    if any(
+        source in previous_state.sources and source not in previous_state.provided_symbols
+        for source in (*changed, *deleted)
+    ):
+        # Without the symbols which a source provided before it changed, we cannot tell which
+        # files used them.
+        return None
+
+    previously_provided = previous_state.provided_symbols
+
+    def provided_symbols(source: str) -> set[str]:
+        return {*previously_provided.get(source, ()), *symbols.provided.get(source, ())}
+
+    for source in (*changed, *deleted):
+        if any(
+            symbols.is_wildcard_imported(symbol, excluding=source)
+            for symbol in provided_symbols(source)
+        ):
+            # Consumers of a wildcard import cannot be attributed to the symbols that they use.
+            return None
+
+    invalidated = set(changed)
+    queue = deque((*changed, *deleted))
+    while queue:
+        source = queue.popleft()
+        for symbol in provided_symbols(source):
+            for user in symbols.users.get(symbol, ()):
+                if user != source and user in sources and user not in invalidated:
+                    invalidated.add(user)
+                    queue.append(user)
+
+    classfiles_to_keep = []
+    for classfile, owner in previous_state.classfiles.items():
+        if owner is None:
+            if invalidated or deleted:
+                # An unattributed classfile might have been produced by an invalidated source.
+                return None
+        elif owner not in invalidated and owner in sources:
+            classfiles_to_keep.append(classfile)
+
+    return IncrementalCompilePlan(
+        sources_to_compile=tuple(sorted(invalidated)),
+        classfiles_to_keep=tuple(sorted(classfiles_to_keep)),
+    )
+
+
+@dataclass(frozen=True)
+class ScalacIncrementalStateRequest:
+    key: str
+
+
+@dataclass(frozen=True)
+class ScalacPreviousState:
+    state: ScalacIncrementalState | None
+    classfiles_digest: Digest
+
+
+_CACHE_NAME = "scalac_incremental"
+_CACHE_DIR = "__scalac_incremental_cache"
+
+
+@rule(desc="Restore incremental scalac state", level=LogLevel.DEBUG)
+async def restore_scalac_incremental_state(
+    bash: BashBinary, request: ScalacIncrementalStateRequest
+) -> ScalacPreviousState:
+    restore_dir = "__scalac_state"
+    # TODO: Locate `cat`, `cp` and `mkdir`.
+    script = textwrap.dedent(
+        f"""\
+        set -eu
+        state_dir="{_CACHE_DIR}/{request.key}"
+        mkdir -p {restore_dir}
+        if [ -f "$state_dir/current" ]; then
+          generation="$(cat "$state_dir/current")"
+          cp "$state_dir/$generation/manifest.json" {restore_dir}/manifest.json
+          cp -R "$state_dir/$generation/classes" {restore_dir}/classes
+        fi
+        """
+    )
+    result = await Get(
+        FallibleProcessResult,
+        Process(
+            argv=(bash.path, "-c", script),
+            append_only_caches={_CACHE_NAME: _CACHE_DIR},
+            output_directories=(restore_dir,),
+            description=f"Restore incremental scalac state for {request.key}",
+            level=LogLevel.DEBUG,
+            # The state changes outside of the knowledge of the engine.
+            cache_scope=ProcessCacheScope.PER_SESSION,
+        ),
+    )
+    if result.exit_code != 0:
+        # The state was being replaced concurrently: fall back to a full compile.
+        return ScalacPreviousState(None, EMPTY_DIGEST)
+
+    manifest_digest = await Get(
+        Digest, DigestSubset(result.output_digest, PathGlobs([f"{restore_dir}/manifest.json"]))
+    )
+    manifest_contents = await Get(DigestContents, Digest, manifest_digest)
+    if not manifest_contents:
+        return ScalacPreviousState(None, EMPTY_DIGEST)
+    classfiles_digest = await Get(
+        Digest, DigestSubset(result.output_digest, PathGlobs([f"{restore_dir}/classes/**"]))
+    )
+    classfiles_digest = await Get(Digest, RemovePrefix(classfiles_digest, f"{restore_dir}/classes"))
+    return ScalacPreviousState(
+        ScalacIncrementalState.from_json(manifest_contents[0].content), classfiles_digest
+    )
+
+
+@dataclass(frozen=True)
+class CompileScalaIncrementallyRequest:
+    """Compile the given sources of a component, reusing the classfiles of its last compile.
+
+    `input_digest` contains everything needed to invoke `scalac_argv` other than the sources, and
+    `classpath_arg` is the classpath of the component's dependencies (relative to that digest).
+    """
+
+    component: CoarsenedTarget
+    sources: tuple[SourceFiles, ...]
+    input_digest: Digest
+    scalac_argv: tuple[str, ...]
+    classpath_arg: str
+    output_file: str
+    use_nailgun: Digest
+    env: FrozenDict[str, str]
+    append_only_caches: FrozenDict[str, str]
+    dependencies: tuple[ClasspathEntry, ...]
+
+
+@rule(desc="Compile incrementally with scalac")
+async def compile_scala_incrementally(
+    bash: BashBinary, zip_binary: ZipBinary, request: CompileScalaIncrementallyRequest
+) -> FallibleClasspathEntry:
+    key = request.component.representative.address.path_safe_spec
+    sources_digest = await Get(
+        Digest, MergeDigests(sources.snapshot.digest for sources in request.sources)
+    )
+    scala_sources = [
+        sources
+        for sources in request.sources
+        if sources.files and sources.files[0].endswith(".scala")
+    ]
+    source_entries, previous = await MultiGet(
+        Get(DigestEntries, Digest, sources_digest),
+        Get(ScalacPreviousState, ScalacIncrementalStateRequest(key)),
+    )
+    fallible_analyses = await MultiGet(
+        Get(FallibleScalaSourceDependencyAnalysisResult, SourceFiles, sources)
+        for sources in scala_sources
+    )
+    source_fingerprints = {
+        entry.path: entry.file_digest.fingerprint
+        for entry in source_entries
+        if isinstance(entry, FileEntry)
+    }
+    inputs_fingerprint = hashlib.sha256(
+        json.dumps([request.input_digest.fingerprint, request.scalac_argv]).encode()
+    ).hexdigest()
+
+    # If any source cannot be analyzed (likely due to a syntax error), compile everything, and
+    # let scalac report the error.
+    owners: dict[str, str] = {}
+    symbols = SymbolIndex.from_analyses({})
+    plan = None
+    if all(analysis.process_result.exit_code == 0 for analysis in fallible_analyses):
+        analyses = await MultiGet(
+            Get(ScalaSourceDependencyAnalysis, FallibleScalaSourceDependencyAnalysisResult, fa)
+            for fa in fallible_analyses
+        )
+        analysis_by_source = {
+            sources.files[0]: analysis for sources, analysis in zip(scala_sources, analyses)
+        }
+        owners = classfile_owners(analysis_by_source)
+        symbols = SymbolIndex.from_analyses(analysis_by_source)
+        plan = plan_incremental_compile(
+            previous.state, inputs_fingerprint, source_fingerprints, symbols
+        )
+
+    if plan is None:
+        logger.debug(f"Compiling all sources of {request.component} with scalac.")
+        sources_to_compile: tuple[str, ...] = tuple(
+            sorted(source for source in source_fingerprints if source.endswith(".scala"))
+        )
+        kept_classfiles_digest = EMPTY_DIGEST
+        previous_classfiles: Mapping[str, str | None] = {}
+    else:
+        logger.debug(
+            f"Recompiling {len(plan.sources_to_compile)} of {len(source_fingerprints)} sources "
+            f"of {request.component} with scalac."
+        )
+        sources_to_compile = plan.sources_to_compile
+        kept_classfiles_digest = (
+            await Get(
+                Digest,
+                DigestSubset(previous.classfiles_digest, PathGlobs(plan.classfiles_to_keep)),
+            )
+            if plan.classfiles_to_keep
+            else EMPTY_DIGEST
+        )
+        assert previous.state is not None
+        previous_classfiles = previous.state.classfiles
+
+    compiled_classfiles_digest = EMPTY_DIGEST
+    if sources_to_compile:
+        keptcp = "__keptcp"
+        dest_dir = "__scalac_out"
+        prefixed_kept_classfiles_digest, dest_dir_digest = await MultiGet(
+            Get(Digest, AddPrefix(kept_classfiles_digest, keptcp)),
+            Get(Digest, CreateDigest([Directory(dest_dir)])),
+        )
+        merged_digest = await Get(
+            Digest,
+            MergeDigests(
+                (
+                    request.input_digest,
+                    sources_digest,
+                    prefixed_kept_classfiles_digest,
+                    dest_dir_digest,
+                )
+            ),
+        )
+        classpath_arg = ":".join(cp for cp in (keptcp, request.classpath_arg) if cp)
+        # NB: Java sources are always passed, since scalac only parses them for their symbols.
+        java_sources = sorted(source for source in source_fingerprints if source.endswith(".java"))
+        compile_result = await Get(
+            FallibleProcessResult,
+            Process(
+                argv=[
+                    *request.scalac_argv,
+                    "-classpath",
+                    classpath_arg,
+                    "-d",
+                    dest_dir,
+                    *sources_to_compile,
+                    *java_sources,
+                ],
+                input_digest=merged_digest,
+                use_nailgun=request.use_nailgun,
+                output_directories=(dest_dir,),
+                description=(
+                    f"Compile {request.component} with scalac "
+                    f"({len(sources_to_compile)} of {len(source_fingerprints)} sources)"
+                ),
+                level=LogLevel.DEBUG,
+                append_only_caches=request.append_only_caches,
+                env=request.env,
+            ),
+        )
+        if compile_result.exit_code != 0:
+            return FallibleClasspathEntry.from_fallible_process_result(
+                str(request.component), compile_result, None
+            )
+        compiled_classfiles_digest = await Get(
+            Digest, RemovePrefix(compile_result.output_digest, dest_dir)
+        )
+
+    compiled_snapshot, kept_snapshot = await MultiGet(
+        Get(Snapshot, Digest, compiled_classfiles_digest),
+        Get(Snapshot, Digest, kept_classfiles_digest),
+    )
+    compiled_classfiles = set(compiled_snapshot.files)
+    if compiled_classfiles.intersection(kept_snapshot.files):
+        # A recompiled source now provides a classfile which was attributed to another source.
+        kept_classfiles_digest = await Get(
+            Digest,
+            DigestSubset(
+                kept_classfiles_digest,
+                PathGlobs(f for f in kept_snapshot.files if f not in compiled_classfiles),
+            ),
+        )
+        kept_snapshot = await Get(Snapshot, Digest, kept_classfiles_digest)
+    classfiles_digest = await Get(
+        Digest, MergeDigests((kept_snapshot.digest, compiled_classfiles_digest))
+    )
+    output_classpath = ClasspathEntry(EMPTY_DIGEST, (request.output_file,), request.dependencies)
+    if not (compiled_classfiles or kept_snapshot.files):
+        return FallibleClasspathEntry(
+            description=str(request.component),
+            result=CompileResult.SUCCEEDED,
+            output=output_classpath,
+            exit_code=0,
+        )
+
+    state = ScalacIncrementalState(
+        inputs_fingerprint=inputs_fingerprint,
+        sources=FrozenDict(source_fingerprints),
+        provided_symbols=FrozenDict(symbols.provided),
+        classfiles=FrozenDict(
+            {
+                **{f: previous_classfiles.get(f) for f in kept_snapshot.files},
+                **{f: classfile_owner(f, owners) for f in compiled_classfiles},
+            }
+        ),
+    )
+    manifest = state.to_json()
+    generation = f"g-{hashlib.sha256(manifest).hexdigest()[:16]}"
+    classes_dir = "__scalac_classes"
+    manifest_path = "__scalac_manifest.json"
+    prefixed_classfiles_digest, manifest_digest = await MultiGet(
+        Get(Digest, AddPrefix(classfiles_digest, classes_dir)),
+        Get(Digest, CreateDigest([FileContent(manifest_path, manifest)])),
+    )
+    jar_input_digest = await Get(
+        Digest, MergeDigests((prefixed_classfiles_digest, manifest_digest))
+    )
+
+    # NB: The new state is written under a fresh directory which is then atomically published by
+    # replacing the `current` pointer, so that concurrent restores observe either the old or the
+    # new state (or fail, and fall back to a full compile).
+    # TODO: Locate `cat`, `cp`, `mkdir`, `mktemp`, `mv` and `rm`.
+    script = textwrap.dedent(
+        f"""\
+        set -eu
+        (cd {classes_dir} && {zip_binary.path} -q -r ../{request.output_file} .)
+        state_dir="{_CACHE_DIR}/{key}"
+        generation="{generation}"
+        mkdir -p "$state_dir"
+        if [ ! -d "$state_dir/$generation" ]; then
+          tmp_dir="$(mktemp -d "$state_dir/tmp.XXXXXX")"
+          cp -R {classes_dir} "$tmp_dir/classes"
+          cp {manifest_path} "$tmp_dir/manifest.json"
+          mv "$tmp_dir" "$state_dir/$generation" || rm -rf "$tmp_dir"
+        fi
+        echo "$generation" > "$state_dir/current.tmp.$$"
+        mv -f "$state_dir/current.tmp.$$" "$state_dir/current"
+        for old_generation in "$state_dir"/g-*; do
+          if [ "$old_generation" != "$state_dir/$generation" ]; then
+            rm -rf "$old_generation"
+          fi
+        done
+        """
+    )
+    jar_result = await Get(
+        ProcessResult,
+        Process(
+            argv=(bash.path, "-c", script),
+            input_digest=jar_input_digest,
+            append_only_caches={_CACHE_NAME: _CACHE_DIR},
+            output_files=(request.output_file,),
+            description=f"Capture outputs of {request.component} for scalac",
+            # The state is written outside of the knowledge of the engine.
+            cache_scope=ProcessCacheScope.PER_SESSION,
+            level=LogLevel.TRACE,
+        ),
+    )
+    return FallibleClasspathEntry(
+        description=str(request.component),
+        result=CompileResult.SUCCEEDED,
+        output=ClasspathEntry(
+            jar_result.output_digest, output_classpath.filenames, request.dependencies
+        ),
+        exit_code=0,
+    )
+
+
+def rules():
+    return [
+        *collect_rules(),
+        *scala_parser.rules(),
+    ]
@@ -0,0 +1,193 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from pants.backend.scala.compile.scalac_incremental import (
+    IncrementalCompilePlan,
+    ScalacIncrementalState,
+    SymbolIndex,
+    classfile_owner,
+    classfile_owners,
+    plan_incremental_compile,
+)
+from pants.backend.scala.dependency_inference.scala_parser import (
+    ScalaImport,
+    ScalaSourceDependencyAnalysis,
+)
+from pants.util.frozendict import FrozenDict
+from pants.util.ordered_set import FrozenOrderedSet
+
+
+def analysis(
+    provided: list[str],
+    consumed: Sequence[str] = (),
+    imports: Sequence[str] = (),
+    wildcard_imports: Sequence[str] = (),
+) -> ScalaSourceDependencyAnalysis:
+    return ScalaSourceDependencyAnalysis(
+        provided_symbols=FrozenOrderedSet(f"org.pantsbuild.{p}" for p in provided),
+        provided_symbols_encoded=FrozenOrderedSet(
+            s for p in provided for s in (f"org.pantsbuild.{p}", f"org.pantsbuild.{p}$")
+        ),
+        imports_by_scope=FrozenDict(
+            {
+                "org.pantsbuild": (
+                    *(ScalaImport(name=i, alias=None, is_wildcard=False) for i in imports),
+                    *(ScalaImport(name=i, alias=None, is_wildcard=True) for i in wildcard_imports),
+                )
+            }
+        ),
+        consumed_symbols_by_scope=FrozenDict({"org.pantsbuild": FrozenOrderedSet(consumed)}),
+        scopes=FrozenOrderedSet(["org.pantsbuild"]),
+    )
+
+
+ANALYSES = {
+    "A.scala": analysis(["A"]),
+    "B.scala": analysis(["B"], consumed=["A"]),
+    "C.scala": analysis(["C"], imports=["org.pantsbuild.B"]),
+    "D.scala": analysis(["D"]),
+}
+
+
+def state(
+    sources: dict[str, str],
+    classfiles: dict[str, str | None],
+    inputs_fingerprint: str = "inputs",
+    analyses: dict[str, ScalaSourceDependencyAnalysis] = ANALYSES,
+) -> ScalacIncrementalState:
+    return ScalacIncrementalState(
+        inputs_fingerprint,
+        FrozenDict(sources),
+        FrozenDict(SymbolIndex.from_analyses(analyses).provided),
+        FrozenDict(classfiles),
+    )
+
+
+def test_classfile_owner() -> None:
+    owners = classfile_owners(ANALYSES)
+    assert classfile_owner("org/pantsbuild/A.class", owners) == "A.scala"
+    assert classfile_owner("org/pantsbuild/A$.class", owners) == "A.scala"
+    assert classfile_owner("org/pantsbuild/B$Inner$1.class", owners) == "B.scala"
+    assert classfile_owner("org/pantsbuild/Unknown.class", owners) is None
+    assert classfile_owner("META-INF/MANIFEST.MF", owners) is None
+
+
+def test_classfile_owners_ambiguous() -> None:
+    owners = classfile_owners({"A.scala": analysis(["A"]), "A2.scala": analysis(["A"])})
+    assert classfile_owner("org/pantsbuild/A.class", owners) is None
+
+
+def test_symbol_index() -> None:
+    symbols = SymbolIndex.from_analyses(
+        {**ANALYSES, "E.scala": analysis(["E"], wildcard_imports=["org.pantsbuild.sub"])}
+    )
+    assert symbols.provided["A.scala"] == ("org.pantsbuild.A",)
+    assert symbols.users["org.pantsbuild.A"] == {"B.scala"}
+    assert symbols.users["org.pantsbuild.B"] == {"C.scala"}
+    assert symbols.wildcard_importers == {"org.pantsbuild.sub": {"E.scala"}}
+    assert symbols.is_wildcard_imported("org.pantsbuild.sub.X", excluding="A.scala")
+    assert symbols.is_wildcard_imported("org.pantsbuild.sub.X.Y", excluding="A.scala")
+    assert not symbols.is_wildcard_imported("org.pantsbuild.sub.X", excluding="E.scala")
+    assert not symbols.is_wildcard_imported("org.pantsbuild.X", excluding="A.scala")
+
+
+def test_state_json_roundtrip() -> None:
+    original = state({"A.scala": "1"}, {"org/pantsbuild/A.class": "A.scala", "x.class": None})
+    assert ScalacIncrementalState.from_json(original.to_json()) == original
+    assert ScalacIncrementalState.from_json(b"{not json") is None
+    assert ScalacIncrementalState.from_json(b'{"version": 0}') is None
+
+
+def test_plan() -> None:
+    sources = {"A.scala": "1", "B.scala": "1", "C.scala": "1", "D.scala": "1"}
+    previous = state(
+        sources,
+        {
+            "org/pantsbuild/A.class": "A.scala",
+            "org/pantsbuild/B.class": "B.scala",
+            "org/pantsbuild/C.class": "C.scala",
+            "org/pantsbuild/D.class": "D.scala",
+        },
+    )
+
+    def plan(current: dict[str, str], **kwargs) -> IncrementalCompilePlan | None:
+        return plan_incremental_compile(
+            kwargs.get("previous", previous),
+            kwargs.get("inputs_fingerprint", "inputs"),
+            current,
+            SymbolIndex.from_analyses(kwargs.get("analyses", ANALYSES)),
+        )
+
+    # Nothing changed.
+    assert plan(sources) == IncrementalCompilePlan((), tuple(sorted(previous.classfiles)))
+
+    # A change is propagated to the (transitive) users of the changed file.
+    assert plan({**sources, "A.scala": "2"}) == IncrementalCompilePlan(
+        ("A.scala", "B.scala", "C.scala"), ("org/pantsbuild/D.class",)
+    )
+    assert plan({**sources, "D.scala": "2"}) == IncrementalCompilePlan(
+        ("D.scala",),
+        ("org/pantsbuild/A.class", "org/pantsbuild/B.class", "org/pantsbuild/C.class"),
+    )
+
+    # New files are compiled.
+    assert plan({**sources, "E.scala": "1"}) == IncrementalCompilePlan(
+        ("E.scala",), tuple(sorted(previous.classfiles))
+    )
+
+    # Deleted files are dropped, and their users are recompiled.
+    assert plan({k: v for k, v in sources.items() if k != "D.scala"}) == IncrementalCompilePlan(
+        (), ("org/pantsbuild/A.class", "org/pantsbuild/B.class", "org/pantsbuild/C.class")
+    )
+    without_a = {k: v for k, v in sources.items() if k != "A.scala"}
+    analyses_without_a = {k: v for k, v in ANALYSES.items() if k != "A.scala"}
+    assert plan(without_a, analyses=analyses_without_a) == IncrementalCompilePlan(
+        ("B.scala", "C.scala"), ("org/pantsbuild/D.class",)
+    )
+
+    # Otherwise, fall back to a full compile.
+    assert plan(sources, previous=None) is None
+    assert plan(sources, inputs_fingerprint="other") is None
+    assert plan({**sources, "J.java": "1"}) is None
+    unattributed = state(sources, {**previous.classfiles, "org/pantsbuild/X.class": None})
+    assert plan({**sources, "D.scala": "2"}, previous=unattributed) is None
+
+
+def test_plan_removed_symbol() -> None:
+    sources = {"A.scala": "1", "B.scala": "1"}
+    previous = state(
+        sources,
+        {"org/pantsbuild/A.class": "A.scala", "org/pantsbuild/B.class": "B.scala"},
+        analyses={"A.scala": analysis(["A"]), "B.scala": analysis(["B"], consumed=["A"])},
+    )
+    # A.scala no longer provides the symbol which B.scala uses, so B.scala must be recompiled (and
+    # fail), rather than linked against the stale classfile of A.
+    current = {"A.scala": analysis(["Renamed"]), "B.scala": analysis(["B"], consumed=["A"])}
+    assert plan_incremental_compile(
+        previous, "inputs", {**sources, "A.scala": "2"}, SymbolIndex.from_analyses(current)
+    ) == IncrementalCompilePlan(("A.scala", "B.scala"), ())
+
+
+def test_plan_wildcard_import() -> None:
+    analyses = {
+        "A.scala": analysis(["A"]),
+        "B.scala": analysis(["B"], wildcard_imports=["org.pantsbuild"]),
+    }
+    sources = {"A.scala": "1", "B.scala": "1"}
+    previous = state(
+        sources,
+        {"org/pantsbuild/A.class": "A.scala", "org/pantsbuild/B.class": "B.scala"},
+        analyses=analyses,
+    )
+    symbols = SymbolIndex.from_analyses(analyses)
+    # B.scala may use anything in the package of A.scala, so everything must be recompiled.
+    assert (
+        plan_incremental_compile(previous, "inputs", {**sources, "A.scala": "2"}, symbols) is None
+    )
+    assert plan_incremental_compile(
+        previous, "inputs", {**sources, "B.scala": "2"}, symbols
+    ) == IncrementalCompilePlan(("B.scala",), ("org/pantsbuild/A.class",))
@@ -0,0 +1,37 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from typing import cast
+
+from pants.option.subsystem import Subsystem
+
+
+class ScalacSubsystem(Subsystem):
+    options_scope = "scalac"
+    help = "The Scala compiler."
+
+    @classmethod
+    def register_options(cls, register):
+        super().register_options(register)
+        register(
+            "--incremental",
+            type=bool,
+            default=False,
+            advanced=True,
+            help=(
+                "If true, recompile only the files of a compilation unit which changed (and the "
+                "files which use the symbols that they define) since the unit was last compiled, "
+                "rather than recompiling all of its files.\n\nThe classfiles of the previous "
+                "compile are kept in an append-only named cache. If that state is missing or "
+                "unusable, or if the dependencies or compiler of the unit have changed, all of "
+                "the files of the unit are recompiled.\n\nDependencies between files are "
+                "approximated from the symbols that each file names, and so this mode is "
+                "experimental: if a change is not picked up, disable it to force a full compile."
+            ),
+        )
+
+    @property
+    def incremental(self) -> bool:
+        return cast(bool, self.options.incremental)
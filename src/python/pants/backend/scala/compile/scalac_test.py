@@ -38,6 +38,8 @@ from pants.jvm.testutil import (
 )
 from pants.jvm.util_rules import rules as util_rules
 from pants.testutil.rule_runner import PYTHON_BOOTSTRAP_ENV, QueryRule, RuleRunner, logging
+from pants.util.collections import assert_single_element
+from pants.util.logging import LogLevel
 
 NAMED_RESOLVE_OPTIONS = '--jvm-resolves={"test": "coursier_resolve.lockfile"}'
 DEFAULT_RESOLVE_OPTION = "--jvm-default-resolve=test"
@@ -150,6 +152,66 @@ def test_compile_no_deps(rule_runner: RuleRunner) -> None:
     assert check_result.exit_code == 0
 
 
+@logging
+@maybe_skip_jdk_test
+def test_compile_incremental(rule_runner: RuleRunner, caplog) -> None:
+    rule_runner.set_options(
+        args=[NAMED_RESOLVE_OPTIONS, DEFAULT_RESOLVE_OPTION, "--scalac-incremental"],
+        env_inherit=PYTHON_BOOTSTRAP_ENV,
+    )
+    caplog.set_level(LogLevel.DEBUG.level, logger="pants.backend.scala.compile.scalac_incremental")
+
+    def compile_component(a_source: str) -> set[str]:
+        # NB: The explicit dependency cycle puts both files in a single component.
+        rule_runner.write_files(
+            {
+                "BUILD": dedent(
+                    """\
+                    scala_sources(name='a', sources=['A.scala'], dependencies=[':b'])
+                    scala_sources(name='b', sources=['B.scala'], dependencies=[':a'])
+                    """
+                ),
+                "coursier_resolve.lockfile": CoursierResolvedLockfile(entries=())
+                .to_json()
+                .decode("utf-8"),
+                "A.scala": a_source,
+                "B.scala": "package org.pantsbuild.example\n\nclass B\n",
+            }
+        )
+        coarsened_target = expect_single_expanded_coarsened_target(
+            rule_runner, Address(spec_path="", target_name="a")
+        )
+        assert len(coarsened_target.members) == 2
+        compiled_classfiles = rule_runner.request(
+            ClasspathEntry,
+            [
+                CompileScalaSourceRequest(
+                    component=coarsened_target, resolve=make_resolve(rule_runner)
+                )
+            ],
+        )
+        classpath = rule_runner.request(RenderedClasspath, [compiled_classfiles.digest])
+        return assert_single_element(classpath.content.values())
+
+    assert compile_component("package org.pantsbuild.example\n\nclass A\nclass Extra\n") == {
+        "org/pantsbuild/example/A.class",
+        "org/pantsbuild/example/B.class",
+        "org/pantsbuild/example/Extra.class",
+    }
+    assert "Compiling all sources of" in caplog.text
+
+    # The state of the previous compile is restored in a new session, so only the changed file is
+    # recompiled, the classfile of the unchanged file is reused, and the classfiles of the previous
+    # compile of the changed file are discarded.
+    caplog.clear()
+    rule_runner.new_session("second_compile")
+    assert compile_component("package org.pantsbuild.example\n\nclass A\n") == {
+        "org/pantsbuild/example/A.class",
+        "org/pantsbuild/example/B.class",
+    }
+    assert "Recompiling 1 of 2 sources of" in caplog.text
+
+
 @logging
 @maybe_skip_jdk_test
 def test_compile_with_deps(rule_runner: RuleRunner) -> None:
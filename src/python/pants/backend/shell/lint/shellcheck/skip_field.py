@@ -11,6 +11,8 @@ from pants.engine.target import BoolField
 
 
 class SkipShellcheckField(BoolField):
+    __slots__ = ()
+
     alias = "skip_shellcheck"
     default = False
     help = "If true, don't run Shellcheck on this target's code."
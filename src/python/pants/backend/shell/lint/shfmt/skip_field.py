@@ -11,6 +11,8 @@ from pants.engine.target import BoolField
 
 
 class SkipShfmtField(BoolField):
+    __slots__ = ()
+
     alias = "skip_shfmt"
     default = False
     help = "If true, don't run shfmt on this target's code."
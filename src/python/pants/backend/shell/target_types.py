@@ -37,12 +37,16 @@ from pants.util.enums import match
 
 
 class ShellSourceField(SingleSourceField):
+    __slots__ = ()
+
     # Normally, we would add `expected_file_extensions = ('.sh',)`, but Bash scripts don't need a
     # file extension, so we don't use this.
     uses_source_roots = False
 
 
 class ShellGeneratingSourcesBases(MultipleSourcesField):
+    __slots__ = ()
+
     uses_source_roots = False
 
 
@@ -94,10 +98,14 @@ class Shunit2Shell(Enum):
 
 
 class Shunit2TestDependenciesField(Dependencies):
+    __slots__ = ()
+
     supports_transitive_excludes = True
 
 
 class Shunit2TestTimeoutField(IntField):
+    __slots__ = ()
+
     alias = "timeout"
     help = (
         "A timeout (in seconds) used by each test file belonging to this target.\n\n"
@@ -107,16 +115,21 @@ class Shunit2TestTimeoutField(IntField):
 
 
 class SkipShunit2TestsField(BoolField):
+    __slots__ = ()
+
     alias = "skip_tests"
     default = False
     help = "If true, don't run this target's tests."
 
 
 class Shunit2TestSourceField(ShellSourceField):
+    __slots__ = ()
     pass
 
 
 class Shunit2ShellField(StringField):
+    __slots__ = ()
+
     alias = "shell"
     valid_choices = Shunit2Shell
     help = "Which shell to run the tests with. If unspecified, Pants will look for a shebang line."
@@ -151,10 +164,14 @@ class Shunit2TestTarget(Target):
 
 
 class Shunit2TestsGeneratorSourcesField(ShellGeneratingSourcesBases):
+    __slots__ = ()
+
     default = ("*_test.sh", "test_*.sh", "tests.sh")
 
 
 class Shunit2TestsOverrideField(OverridesField):
+    __slots__ = ()
+
     help = generate_file_based_overrides_field_help_message(
         Shunit2TestTarget.alias,
         (
@@ -230,10 +247,14 @@ class ShellSourceTarget(Target):
 
 
 class ShellSourcesGeneratingSourcesField(ShellGeneratingSourcesBases):
+    __slots__ = ()
+
     default = ("*.sh",) + tuple(f"!{pat}" for pat in Shunit2TestsGeneratorSourcesField.default)
 
 
 class ShellSourcesOverridesField(OverridesField):
+    __slots__ = ()
+
     help = generate_file_based_overrides_field_help_message(
         ShellSourceTarget.alias,
         (
@@ -299,6 +320,8 @@ async def generate_targets_from_shell_sources(
 
 
 class ShellCommandCommandField(StringField):
+    __slots__ = ()
+
     alias = "command"
     required = True
     help = (
@@ -307,6 +330,8 @@ class ShellCommandCommandField(StringField):
 
 
 class ShellCommandOutputsField(StringSequenceField):
+    __slots__ = ()
+
     alias = "outputs"
     help = (
         "Specify the shell command output files and directories.\n\n"
@@ -315,6 +340,8 @@ class ShellCommandOutputsField(StringSequenceField):
 
 
 class ShellCommandSourcesField(MultipleSourcesField):
+    __slots__ = ()
+
     # We solely register this field for codegen to work.
     alias = "_sources"
     uses_source_roots = False
@@ -322,6 +349,8 @@ class ShellCommandSourcesField(MultipleSourcesField):
 
 
 class ShellCommandTimeoutField(IntField):
+    __slots__ = ()
+
     alias = "timeout"
     default = 30
     help = "Command execution timeout (in seconds)."
@@ -329,6 +358,8 @@ class ShellCommandTimeoutField(IntField):
 
 
 class ShellCommandToolsField(StringSequenceField):
+    __slots__ = ()
+
     alias = "tools"
     required = True
     help = (
@@ -340,12 +371,16 @@ class ShellCommandToolsField(StringSequenceField):
 
 
 class ShellCommandLogOutputField(BoolField):
+    __slots__ = ()
+
     alias = "log_output"
     default = False
     help = "Set to true if you want the output from the command logged to the console."
 
 
 class ShellCommandRunWorkdirField(StringField):
+    __slots__ = ()
+
     alias = "workdir"
     default = "."
     help = "Sets the current working directory of the command, relative to the project root."
@@ -16,6 +16,8 @@ from pants.engine.target import (
 
 
 class TerraformModuleSourcesField(MultipleSourcesField):
+    __slots__ = ()
+
     default = ("*.tf",)
     expected_file_extensions = (".tf",)
 
@@ -38,6 +40,8 @@ class TerraformModuleTarget(Target):
 
 
 class TerraformModulesGeneratingSourcesField(MultipleSourcesField):
+    __slots__ = ()
+
     # TODO: This currently only globs .tf files but not non-.tf files referenced by Terraform config. This
     # should be updated to allow for the generated TerraformModule targets to capture all files in the diectory
     # other than BUILD files.
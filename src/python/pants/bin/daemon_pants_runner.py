@@ -1,13 +1,12 @@
 # Copyright 2015 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+from __future__ import annotations
+
 import logging
-import os
 import sys
 import time
-from contextlib import contextmanager
-from threading import Lock
-from typing import Dict, Tuple
+from typing import Callable, Dict, Tuple
 
 from pants.base.exiter import PANTS_FAILED_EXIT_CODE, ExitCode
 from pants.bin.local_pants_runner import LocalPantsRunner
@@ -30,70 +29,51 @@ class DaemonPantsRunner:
     def __init__(self, core: PantsDaemonCore) -> None:
         super().__init__()
         self._core = core
-        self._run_lock = Lock()
 
     @staticmethod
-    def _send_stderr(stderr_fileno: int, msg: str) -> None:
-        """Used to send stderr on a raw filehandle _before_ stdio replacement.
-
-        TODO: This method will be removed as part of #7654.
-        """
-        with os.fdopen(stderr_fileno, mode="w", closefd=False) as stderr:
-            print(msg, file=stderr, flush=True)
-
-    @contextmanager
-    def _one_run_at_a_time(
-        self, stderr_fileno: int, cancellation_latch: PySessionCancellationLatch, timeout: float
-    ):
-        """Acquires exclusive access within the daemon.
-
-        Periodically prints a message on the given stderr_fileno while exclusive access cannot be
-        acquired.
+    def _wait_for_other_runs(
+        cancellation_latch: PySessionCancellationLatch, timeout: float, max_concurrent_runs: int
+    ) -> Callable[[int], None]:
+        """Returns a callback for `PantsDaemonCore.prepare`, called while this run cannot start.
 
-        TODO: This method will be removed as part of #7654, so it currently polls the lock and
-        cancellation latch rather than waiting for both of them asynchronously, which would be a bit
-        cleaner.
+        Periodically prints a message while waiting, and gives up if the run is cancelled or the
+        timeout elapses.
         """
-
         render_timeout = 5
-        should_poll_forever = timeout <= 0
         start = time.time()
-        render_deadline = start + render_timeout
-        deadline = None if should_poll_forever else start + timeout
-
-        def should_keep_polling(now):
-            return not cancellation_latch.is_cancelled() and (not deadline or deadline > now)
-
-        acquired = self._run_lock.acquire(blocking=False)
-        if not acquired:
-            # If we don't acquire immediately, send an explanation.
-            length = "forever" if should_poll_forever else f"up to {timeout} seconds"
-            self._send_stderr(
-                stderr_fileno,
-                f"Another pants invocation is running. Will wait {length} for it to finish before giving up.\n"
-                "If you don't want to wait for the first run to finish, please press Ctrl-C and run "
-                "this command with PANTS_CONCURRENT=True in the environment.\n",
-            )
-        while True:
+        deadline = None if timeout <= 0 else start + timeout
+        render_deadline: float | None = None
+
+        def on_wait(active_runs: int) -> None:
+            nonlocal render_deadline
             now = time.time()
-            if acquired:
-                try:
-                    yield
-                    break
-                finally:
-                    self._run_lock.release()
-            elif should_keep_polling(now):
-                if now > render_deadline:
-                    self._send_stderr(
-                        stderr_fileno,
-                        f"Waiting for invocation to finish (waited for {int(now - start)}s so far)...\n",
-                    )
-                    render_deadline = now + render_timeout
-                acquired = self._run_lock.acquire(blocking=True, timeout=0.1)
-            else:
+            if cancellation_latch.is_cancelled() or (deadline is not None and now > deadline):
                 raise ExclusiveRequestTimeout(
-                    "Timed out while waiting for another pants invocation to finish."
+                    "Timed out while waiting for other pants invocations to finish."
+                )
+            if render_deadline is None:
+                # If we don't start immediately, send an explanation.
+                length = "forever" if deadline is None else f"up to {timeout} seconds"
+                print(
+                    "Other pants invocations are running, either with different options or up "
+                    f"to the `--pantsd-max-concurrent-runs` limit of {max_concurrent_runs}. Will "
+                    f"wait {length} for them to finish before giving up.\n"
+                    "If you don't want to wait, please press Ctrl-C and run this command with "
+                    "PANTS_CONCURRENT=True in the environment.",
+                    file=sys.stderr,
+                    flush=True,
                 )
+                render_deadline = now + render_timeout
+            elif now > render_deadline:
+                print(
+                    f"Waiting for other invocations to finish (waited for {int(now - start)}s so "
+                    "far)...",
+                    file=sys.stderr,
+                    flush=True,
+                )
+                render_deadline = now + render_timeout
+
+        return on_wait
 
     def single_daemonized_run(
         self,
@@ -116,20 +96,32 @@ class DaemonPantsRunner:
             start_time = float(env_start_time) if env_start_time else time.time()
 
             options_bootstrapper = OptionsBootstrapper.create(
-                env=env, args=args, allow_pantsrc=True
+                env=env, args=args, allow_pantsrc=True, use_cache=True
+            )
+            max_concurrent_runs = (
+                options_bootstrapper.bootstrap_options.for_global_scope().pantsd_max_concurrent_runs
             )
 
-            # Run using the pre-warmed Session.
+            # Run using the pre-warmed Session, concurrently with any other compatible runs.
             complete_env = CompleteEnvironment(env)
-            scheduler, options_initializer = self._core.prepare(options_bootstrapper, complete_env)
-            runner = LocalPantsRunner.create(
-                complete_env,
+            with self._core.prepare(
                 options_bootstrapper,
-                scheduler=scheduler,
-                options_initializer=options_initializer,
-                cancellation_latch=cancellation_latch,
-            )
-            return runner.run(start_time)
+                complete_env,
+                max_concurrent_runs=max_concurrent_runs,
+                on_wait=self._wait_for_other_runs(
+                    cancellation_latch,
+                    float(env.get("PANTSD_REQUEST_TIMEOUT_LIMIT", -1)),
+                    max_concurrent_runs,
+                ),
+            ) as (scheduler, options_initializer):
+                runner = LocalPantsRunner.create(
+                    complete_env,
+                    options_bootstrapper,
+                    scheduler=scheduler,
+                    options_initializer=options_initializer,
+                    cancellation_latch=cancellation_latch,
+                )
+                return runner.run(start_time)
         except Exception as e:
             logger.exception(e)
             return PANTS_FAILED_EXIT_CODE
@@ -147,22 +139,18 @@ class DaemonPantsRunner:
         stdout_fileno: int,
         stderr_fileno: int,
     ) -> ExitCode:
-        request_timeout = float(env.get("PANTSD_REQUEST_TIMEOUT_LIMIT", -1))
-        # NB: Order matters: we acquire a lock before mutating either `sys.std*`, `os.environ`, etc.
-        with self._one_run_at_a_time(
-            stderr_fileno,
-            cancellation_latch=cancellation_latch,
-            timeout=request_timeout,
-        ):
-            # NB: `single_daemonized_run` implements exception handling, so only the most primitive
-            # errors will escape this function, where they will be logged by the server.
-            logger.info(f"handling request: `{' '.join(args)}`")
-            try:
-                with stdio_destination(
-                    stdin_fileno=stdin_fileno,
-                    stdout_fileno=stdout_fileno,
-                    stderr_fileno=stderr_fileno,
-                ):
-                    return self.single_daemonized_run(((command,) + args), env, cancellation_latch)
-            finally:
-                logger.info(f"request completed: `{' '.join(args)}`")
+        # NB: `single_daemonized_run` implements exception handling, so only the most primitive
+        # errors will escape this function, where they will be logged by the server.
+        #
+        # Concurrent runs are isolated from one another by their thread-local stdio destinations
+        # and Sessions, and are admitted by `PantsDaemonCore.prepare`.
+        logger.info(f"handling request: `{' '.join(args)}`")
+        try:
+            with stdio_destination(
+                stdin_fileno=stdin_fileno,
+                stdout_fileno=stdout_fileno,
+                stderr_fileno=stderr_fileno,
+            ):
+                return self.single_daemonized_run(((command,) + args), env, cancellation_latch)
+        finally:
+            logger.info(f"request completed: `{' '.join(args)}`")
@@ -7,6 +7,8 @@ import logging
 import sys
 from dataclasses import dataclass
 
+import psutil
+
 from pants.base.build_environment import get_buildroot
 from pants.base.exiter import PANTS_FAILED_EXIT_CODE, PANTS_SUCCEEDED_EXIT_CODE, ExitCode
 from pants.base.specs import Specs
@@ -114,7 +116,9 @@ class LocalPantsRunner:
         :param options_bootstrapper: The OptionsBootstrapper instance to reuse.
         :param scheduler: If being called from the daemon, a warmed scheduler to use.
         """
-        options_initializer = options_initializer or OptionsInitializer(options_bootstrapper)
+        options_initializer = options_initializer or OptionsInitializer(
+            options_bootstrapper, allow_lazy_backends=True
+        )
         build_config, options = options_initializer.build_config_and_options(
             options_bootstrapper, env, raise_=True
         )
@@ -132,7 +136,9 @@ class LocalPantsRunner:
         # Verify configs.
         global_bootstrap_options = options_bootstrapper.bootstrap_options.for_global_scope()
         if global_bootstrap_options.verify_config:
-            options.verify_configs(options_bootstrapper.config)
+            options.verify_configs(
+                options_bootstrapper.config, ignored_scopes=build_config.unloaded_options_scopes
+            )
 
         # If we're running with the daemon, we'll be handed a warmed Scheduler, which we use
         # to initialize a session here.
@@ -256,6 +262,8 @@ class LocalPantsRunner:
                 allow_async_completion=(
                     global_options.pantsd and global_options.streaming_workunits_complete_async
                 ),
+                queue_size=global_options.streaming_workunits_queue_size,
+                queue_full_policy=global_options.streaming_workunits_queue_full_policy,
             )
             with streaming_reporter:
                 engine_result = PANTS_FAILED_EXIT_CODE
@@ -263,6 +271,7 @@ class LocalPantsRunner:
                     engine_result = self._run_inner()
                 finally:
                     metrics = self.graph_session.scheduler_session.metrics()
+                    metrics["memory_usage_bytes"] = psutil.Process().memory_info().rss
                     self.run_tracker.set_pantsd_scheduler_metrics(metrics)
                     self.run_tracker.end_run(engine_result)
 
@@ -16,8 +16,6 @@ from pants.bin.pants_env_vars import (
     PANTSC_PROFILE,
     RECURSION_LIMIT,
 )
-from pants.bin.pants_runner import PantsRunner
-from pants.util.contextutil import maybe_profiled
 
 
 class PantsLoader:
@@ -86,8 +84,20 @@ class PantsLoader:
 
     @staticmethod
     def run_default_entrypoint() -> None:
+        start_time = time.time()
+        if not os.environ.get(PANTSC_PROFILE):
+            from pants.bin import pantsd_fast_path
+
+            exit_code = pantsd_fast_path.maybe_run(sys.argv, os.environ, start_time)
+            if exit_code is not None:
+                sys.exit(exit_code)
+
+        # N.B. These imports are deferred, since they are (comparatively) expensive, and are not
+        # needed by the pantsd fast path above.
+        from pants.bin.pants_runner import PantsRunner
+        from pants.util.contextutil import maybe_profiled
+
         with maybe_profiled(os.environ.get(PANTSC_PROFILE)):
-            start_time = time.time()
             try:
                 runner = PantsRunner(args=sys.argv, env=os.environ)
                 exit_code = runner.run(start_time)
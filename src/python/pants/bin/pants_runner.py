@@ -10,6 +10,7 @@ from typing import List, Mapping
 
 from pants.base.exception_sink import ExceptionSink
 from pants.base.exiter import ExitCode
+from pants.bin.pantsd_fast_path import DAEMON_KILLING_GOALS, scrub_pythonpath
 from pants.bin.remote_pants_runner import RemotePantsRunner
 from pants.engine.environment import CompleteEnvironment
 from pants.init.logging import initialize_stdio, stdio_destination
@@ -32,8 +33,7 @@ class PantsRunner:
     # easier to make the daemon the default use case. Once the daemon lifecycle is stable enough we
     # should be able to avoid needing to kill it at all.
     def will_terminate_pantsd(self) -> bool:
-        _DAEMON_KILLING_GOALS = frozenset(["kill-pantsd", "clean-all"])
-        return not frozenset(self.args).isdisjoint(_DAEMON_KILLING_GOALS)
+        return not frozenset(self.args).isdisjoint(DAEMON_KILLING_GOALS)
 
     def _should_run_with_pantsd(self, global_bootstrap_options: OptionValueContainer) -> bool:
         terminate_pantsd = self.will_terminate_pantsd()
@@ -50,13 +50,8 @@ class PantsRunner:
 
     @staticmethod
     def scrub_pythonpath() -> None:
-        # Do not propagate any PYTHONPATH that happens to have been set in our environment
-        # to our subprocesses.
-        # Note that don't warn (but still scrub) if RUNNING_PANTS_FROM_SOURCES is set. This allows
-        # scripts that run pants directly from sources, and therefore must set PYTHONPATH, to mute
-        # this warning.
-        pythonpath = os.environ.pop("PYTHONPATH", None)
-        if pythonpath and not os.environ.pop("RUNNING_PANTS_FROM_SOURCES", None):
+        pythonpath = scrub_pythonpath(os.environ)
+        if pythonpath:
             logger.debug(f"Scrubbed PYTHONPATH={pythonpath} from the environment.")
 
     def run(self, start_time: float) -> ExitCode:
@@ -0,0 +1,328 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""A minimal-import client which connects directly to an already running pantsd.
+
+Every run of `./pants` pays for the imports of its client before it is able to connect to pantsd,
+and so (unlike `pants_runner` and `remote_pants_runner`) this module must import only from the
+standard library and the native client. See `pantsd_fast_path_test.py`.
+
+To avoid parsing options, the fast path relies on a `FastPathRecord` which the full client writes
+into the pantsd metadata directory once it has parsed the options for a run, and validated (or
+launched) the daemon for them. The fast path is used for a later run only if that run has the same
+flags and `PANTS_*` environment variables, if none of the config files that the record depends on
+have changed, and if the running daemon still has the fingerprint recorded in it. In all other
+cases, the full client is used.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import signal
+import sys
+import termios
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from hashlib import sha256
+from typing import Iterable, Mapping, MutableMapping, Sequence
+
+from pants.engine.internals.native_engine import (
+    PantsdConnectionException,
+    PyExecutor,
+    PyNailgunClient,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Goals which terminate pantsd, and so must always run via the full client.
+DAEMON_KILLING_GOALS = frozenset(["kill-pantsd", "clean-all"])
+
+# Keep in sync with `BuildRoot.sentinel_files`.
+_BUILDROOT_SENTINEL_FILES = ("pants", "BUILDROOT", "BUILD_ROOT")
+
+# The fast path only looks for records in the default location for pantsd's metadata, since the
+# `--pants-subprocessdir` option cannot be parsed without the full client.
+DEFAULT_SUBPROCESSDIR = ".pids"
+
+_FAST_PATH_DIR = "fast_path"
+
+
+def host_fingerprint() -> str:
+    """A fingerprint that attempts to identify the potential scope of a live process.
+
+    See `ProcessManager.host_fingerprint`.
+    """
+    hasher = sha256()
+    for component in os.uname():
+        hasher.update(component.encode())
+    return hasher.hexdigest()[:12]
+
+
+def pantsd_metadata_dir(metadata_base_dir: str) -> str:
+    """The directory containing pantsd's process metadata: see `ProcessManager`."""
+    return os.path.join(metadata_base_dir, host_fingerprint(), "pantsd")
+
+
+def find_buildroot(env: Mapping[str, str]) -> str | None:
+    """Find the buildroot in the same way as `BuildRoot`, or return None if there is none."""
+    override_buildroot = env.get("PANTS_BUILDROOT_OVERRIDE")
+    if override_buildroot:
+        return override_buildroot
+    buildroot = os.path.realpath(os.getcwd())
+    while not any(
+        os.path.isfile(os.path.join(buildroot, sentinel)) for sentinel in _BUILDROOT_SENTINEL_FILES
+    ):
+        parent = os.path.dirname(buildroot)
+        if parent == buildroot:
+            return None
+        buildroot = parent
+    return buildroot
+
+
+def request_key(buildroot: str, args: Sequence[str], env: Mapping[str, str]) -> str:
+    """The key of the record for a run, which covers all inputs to options parsing except files.
+
+    Goals and specs do not affect the daemon, and so are excluded in order for a record to be
+    reused across runs of different goals.
+    """
+    flags = [arg for arg in args[1:] if arg.startswith("-")]
+    pants_env = sorted((k, v) for k, v in env.items() if k.startswith("PANTS_"))
+    return sha256(json.dumps([buildroot, flags, pants_env]).encode()).hexdigest()
+
+
+def _file_stat(path: str) -> list[int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+@dataclass(frozen=True)
+class FastPathRecord:
+    """Everything that the fast path needs to validate and connect to pantsd for a run."""
+
+    # The daemon options fingerprint and port of the pantsd instance that the record is for.
+    fingerprint: str
+    port: int
+    # The `[mtime_ns, size]` (or None, if absent) of every config file that options depended on.
+    files: dict[str, list[int] | None]
+    # Arguments (e.g. `[cli].alias` names) which force the use of the full client.
+    fallback_args: list[str]
+    timeout: float
+    core_threads: int
+    max_threads: int
+
+    VERSION = 2
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        fingerprint: str,
+        port: int,
+        config_paths: Iterable[str],
+        fallback_args: Iterable[str],
+        timeout: float,
+        core_threads: int,
+        max_threads: int,
+    ) -> FastPathRecord:
+        config_paths = sorted(set(config_paths))
+        return cls(
+            fingerprint=fingerprint,
+            port=port,
+            files={path: _file_stat(path) for path in config_paths},
+            fallback_args=sorted(set(fallback_args)),
+            timeout=timeout,
+            core_threads=core_threads,
+            max_threads=max_threads,
+        )
+
+    def is_valid_for(self, args: Sequence[str]) -> bool:
+        return not (DAEMON_KILLING_GOALS.union(self.fallback_args)).intersection(args[1:]) and all(
+            _file_stat(path) == stat for path, stat in self.files.items()
+        )
+
+    def to_json(self) -> str:
+        return json.dumps({"version": self.VERSION, **asdict(self)})
+
+    @classmethod
+    def from_json(cls, content: str) -> FastPathRecord | None:
+        try:
+            data = json.loads(content)
+            if data.pop("version", None) != cls.VERSION:
+                return None
+            return cls(**data)
+        except (ValueError, TypeError):
+            return None
+
+
+def _record_path(metadata_dir: str, key: str) -> str:
+    return os.path.join(metadata_dir, _FAST_PATH_DIR, key)
+
+
+def write_record(metadata_dir: str, key: str, record: FastPathRecord) -> None:
+    """Atomically write the record for a run into pantsd's metadata directory.
+
+    The records are deleted along with the rest of the metadata when pantsd is restarted.
+    """
+    path = _record_path(metadata_dir, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(record.to_json())
+    os.replace(tmp_path, path)
+
+
+def read_record(metadata_dir: str, key: str) -> FastPathRecord | None:
+    try:
+        with open(_record_path(metadata_dir, key), "r") as f:
+            return FastPathRecord.from_json(f.read())
+    except OSError:
+        return None
+
+
+def _read_metadata(metadata_dir: str, metadata_key: str) -> str | None:
+    try:
+        with open(os.path.join(metadata_dir, metadata_key), "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _daemon_matches(metadata_dir: str, record: FastPathRecord) -> bool:
+    # NB: Keep the metadata keys in sync with `ProcessManager`.
+    pid = _read_metadata(metadata_dir, "pid")
+    if (
+        _read_metadata(metadata_dir, "fingerprint") != record.fingerprint
+        or _read_metadata(metadata_dir, "socket") != str(record.port)
+        or not pid
+        or not pid.isdigit()
+    ):
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except OSError:
+        return False
+    return True
+
+
+@contextmanager
+def interrupts_ignored():
+    """Disables Python's default interrupt handling."""
+    old_handler = signal.signal(signal.SIGINT, handler=lambda s, f: None)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGINT, old_handler)
+
+
+def ttynames_to_env(stdin, stdout, stderr):
+    """Generate nailgun tty capability environment variables based on checking a set of fds.
+
+    TODO: There is a Rust implementation of this as well in `src/rust/engine/nailgun/src/client.rs`.
+
+    :param file stdin: The stream to check for stdin tty capabilities.
+    :param file stdout: The stream to check for stdout tty capabilities.
+    :param file stderr: The stream to check for stderr tty capabilities.
+    :returns: A dict containing the tty capability environment variables.
+    """
+
+    def gen_env_vars():
+        for fd_id, fd in ((0, stdin), (1, stdout), (2, stderr)):
+            if fd.isatty():
+                yield (f"NAILGUN_TTY_PATH_{fd_id}", os.ttyname(fd.fileno()) or b"")
+
+    return dict(gen_env_vars())
+
+
+class STTYSettings:
+    """Saves/restores stty settings."""
+
+    @classmethod
+    @contextmanager
+    def preserved(cls):
+        """Run potentially stty-modifying operations, e.g., REPL execution, in this
+        contextmanager."""
+        inst = cls()
+        inst.save_tty_flags()
+        try:
+            yield
+        finally:
+            inst.restore_tty_flags()
+
+    def __init__(self):
+        self._tty_flags = None
+
+    def save_tty_flags(self):
+        # N.B. `stty(1)` operates against stdin.
+        try:
+            self._tty_flags = termios.tcgetattr(sys.stdin.fileno())
+        except termios.error as e:
+            logger.debug(f"masking tcgetattr exception: {e!r}")
+
+    def restore_tty_flags(self):
+        if self._tty_flags:
+            try:
+                termios.tcsetattr(sys.stdin.fileno(), termios.TCSANOW, self._tty_flags)
+            except termios.error as e:
+                logger.debug(f"masking tcsetattr exception: {e!r}")
+
+
+def client_env(env: Mapping[str, str], start_time: float, timeout: float) -> dict[str, str]:
+    """The environment to send to pantsd for a run."""
+    return {
+        **env,
+        **ttynames_to_env(sys.stdin, sys.stdout, sys.stderr),
+        "PANTSD_RUNTRACKER_CLIENT_START_TIME": str(start_time),
+        "PANTSD_REQUEST_TIMEOUT_LIMIT": str(timeout),
+    }
+
+
+def scrub_pythonpath(env: MutableMapping[str, str]) -> str | None:
+    """Do not propagate any PYTHONPATH that happens to have been set in our environment to our
+    subprocesses.
+
+    Note that don't warn (but still scrub) if RUNNING_PANTS_FROM_SOURCES is set. This allows scripts
+    that run pants directly from sources, and therefore must set PYTHONPATH, to mute this warning.
+
+    :returns: The scrubbed PYTHONPATH, if it should be warned about.
+    """
+    pythonpath = env.pop("PYTHONPATH", None)
+    if pythonpath and not env.pop("RUNNING_PANTS_FROM_SOURCES", None):
+        return pythonpath
+    return None
+
+
+def maybe_run(args: Sequence[str], env: MutableMapping[str, str], start_time: float) -> int | None:
+    """Run via an already running pantsd, if there is a valid record for this run.
+
+    :returns: The exit code of the run, or None if the full client should be used instead.
+    """
+    if not DAEMON_KILLING_GOALS.isdisjoint(args[1:]):
+        return None
+    buildroot = find_buildroot(env)
+    if buildroot is None:
+        return None
+    metadata_dir = pantsd_metadata_dir(os.path.join(buildroot, DEFAULT_SUBPROCESSDIR))
+    record = read_record(metadata_dir, request_key(buildroot, args, env))
+    if record is None or not record.is_valid_for(args) or not _daemon_matches(metadata_dir, record):
+        return None
+
+    scrub_pythonpath(env)
+    executor = PyExecutor(core_threads=record.core_threads, max_threads=record.max_threads)
+    # We preserve TTY settings since the server might write directly to the TTY, and we'd like
+    # to clean up any side effects before exiting.
+    #
+    # We ignore keyboard interrupts because the nailgun client will handle them.
+    with STTYSettings.preserved(), interrupts_ignored():
+        try:
+            return PyNailgunClient(record.port, executor).execute(
+                args[0], list(args[1:]), client_env(env, start_time, record.timeout)
+            )
+        except PantsdConnectionException:
+            # The full client will retry, and restart pantsd if need be.
+            return None
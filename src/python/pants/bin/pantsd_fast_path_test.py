@@ -0,0 +1,131 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from textwrap import dedent
+
+from pants.bin.pantsd_fast_path import (
+    DEFAULT_SUBPROCESSDIR,
+    FastPathRecord,
+    maybe_run,
+    pantsd_metadata_dir,
+    read_record,
+    request_key,
+    write_record,
+)
+
+
+def create_record(tmp_path: Path) -> FastPathRecord:
+    return FastPathRecord.create(
+        fingerprint="abc123",
+        port=1234,
+        config_paths=[str(tmp_path / "pants.toml"), str(tmp_path / "missing.toml")],
+        fallback_args=["my-alias"],
+        timeout=60.0,
+        core_threads=2,
+        max_threads=8,
+    )
+
+
+def test_request_key() -> None:
+    key = request_key("/build", ["pants", "test", "::"], {"PANTS_LEVEL": "info"})
+    assert key == request_key("/build", ["pants", "lint", "src::"], {"PANTS_LEVEL": "info"})
+    assert key == request_key(
+        "/build", ["pants", "test", "::"], {"PANTS_LEVEL": "info", "HOME": "/home/user"}
+    )
+    assert key != request_key("/build", ["pants", "-ldebug", "test", "::"], {"PANTS_LEVEL": "info"})
+    assert key != request_key("/build", ["pants", "test", "::"], {"PANTS_LEVEL": "debug"})
+    assert key != request_key("/other", ["pants", "test", "::"], {"PANTS_LEVEL": "info"})
+
+
+def test_record_roundtrip(tmp_path: Path) -> None:
+    (tmp_path / "pants.toml").write_text("[GLOBAL]\nlevel = 'info'\n")
+    record = create_record(tmp_path)
+    assert record.files[str(tmp_path / "pants.toml")] is not None
+    assert record.files[str(tmp_path / "missing.toml")] is None
+
+    metadata_dir = str(tmp_path / "metadata")
+    write_record(metadata_dir, "key", record)
+    assert read_record(metadata_dir, "key") == record
+    assert read_record(metadata_dir, "other_key") is None
+    assert FastPathRecord.from_json('{"version": 0}') is None
+    assert FastPathRecord.from_json("not json") is None
+
+
+def test_record_validity(tmp_path: Path) -> None:
+    config = tmp_path / "pants.toml"
+    config.write_text("[GLOBAL]\nlevel = 'info'\n")
+    record = create_record(tmp_path)
+    assert record.is_valid_for(["pants", "test", "::"])
+
+    # Aliases and daemon-killing goals must go through the full client.
+    assert not record.is_valid_for(["pants", "my-alias", "::"])
+    assert not record.is_valid_for(["pants", "kill-pantsd"])
+
+    # As must changes to config files, including the creation of previously absent files.
+    (tmp_path / "missing.toml").write_text("")
+    assert not record.is_valid_for(["pants", "test", "::"])
+    os.unlink(tmp_path / "missing.toml")
+    assert record.is_valid_for(["pants", "test", "::"])
+    config.write_text("[GLOBAL]\nlevel = 'debug'\n")
+    assert not record.is_valid_for(["pants", "test", "::"])
+
+
+def test_maybe_run_without_record(tmp_path: Path) -> None:
+    env = {"PANTS_BUILDROOT_OVERRIDE": str(tmp_path)}
+    assert maybe_run(["pants", "test", "::"], env, 0.0) is None
+
+    # A record for a daemon which is no longer running is ignored.
+    metadata_dir = pantsd_metadata_dir(str(tmp_path / DEFAULT_SUBPROCESSDIR))
+    (tmp_path / "pants.toml").touch()
+    write_record(
+        metadata_dir,
+        request_key(str(tmp_path), ["pants", "test", "::"], env),
+        create_record(tmp_path),
+    )
+    assert maybe_run(["pants", "test", "::"], env, 0.0) is None
+
+
+def test_imports() -> None:
+    """The fast path must not (transitively) import anything except the stdlib and the engine.
+
+    Rather than asserting on a (noisy) import time, this asserts on which modules are imported.
+    """
+    script = dedent(
+        """\
+        import json, sys
+        before = set(sys.modules)
+        import pants.bin.pantsd_fast_path
+        print(json.dumps({
+            name: getattr(module, "__file__", None)
+            for name, module in sys.modules.items()
+            if name not in before
+        }))
+        """
+    )
+    result = subprocess.run([sys.executable, "-c", script], stdout=subprocess.PIPE, check=True)
+    imported = json.loads(result.stdout)
+
+    assert {name for name in imported if name.split(".")[0] == "pants"} == {
+        "pants",
+        "pants.bin",
+        "pants.bin.pantsd_fast_path",
+        "pants.engine",
+        "pants.engine.internals",
+        "pants.engine.internals.native_engine",
+    }
+    stdlib_dir = os.path.dirname(os.__file__)
+    third_party = sorted(
+        name
+        for name, path in imported.items()
+        if name.split(".")[0] != "pants"
+        and path is not None
+        and (not path.startswith(stdlib_dir) or "site-packages" in path)
+    )
+    assert not third_party
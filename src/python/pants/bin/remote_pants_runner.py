@@ -3,14 +3,13 @@
 
 import logging
 import os
-import signal
-import sys
-import termios
 import time
-from contextlib import contextmanager
 from typing import List, Mapping
 
+from pants.base.build_environment import get_buildroot
 from pants.base.exiter import ExitCode
+from pants.bin import pantsd_fast_path
+from pants.bin.pantsd_fast_path import STTYSettings, interrupts_ignored
 from pants.engine.internals.native_engine import PantsdConnectionException, PyNailgunClient
 from pants.option.global_options import GlobalOptions
 from pants.option.options_bootstrapper import OptionsBootstrapper
@@ -19,68 +18,6 @@ from pants.pantsd.pants_daemon_client import PantsDaemonClient
 logger = logging.getLogger(__name__)
 
 
-@contextmanager
-def interrupts_ignored():
-    """Disables Python's default interrupt handling."""
-    old_handler = signal.signal(signal.SIGINT, handler=lambda s, f: None)
-    try:
-        yield
-    finally:
-        signal.signal(signal.SIGINT, old_handler)
-
-
-def ttynames_to_env(stdin, stdout, stderr):
-    """Generate nailgun tty capability environment variables based on checking a set of fds.
-
-    TODO: There is a Rust implementation of this as well in `src/rust/engine/nailgun/src/client.rs`.
-
-    :param file stdin: The stream to check for stdin tty capabilities.
-    :param file stdout: The stream to check for stdout tty capabilities.
-    :param file stderr: The stream to check for stderr tty capabilities.
-    :returns: A dict containing the tty capability environment variables.
-    """
-
-    def gen_env_vars():
-        for fd_id, fd in ((0, stdin), (1, stdout), (2, stderr)):
-            if fd.isatty():
-                yield (f"NAILGUN_TTY_PATH_{fd_id}", os.ttyname(fd.fileno()) or b"")
-
-    return dict(gen_env_vars())
-
-
-class STTYSettings:
-    """Saves/restores stty settings."""
-
-    @classmethod
-    @contextmanager
-    def preserved(cls):
-        """Run potentially stty-modifying operations, e.g., REPL execution, in this
-        contextmanager."""
-        inst = cls()
-        inst.save_tty_flags()
-        try:
-            yield
-        finally:
-            inst.restore_tty_flags()
-
-    def __init__(self):
-        self._tty_flags = None
-
-    def save_tty_flags(self):
-        # N.B. `stty(1)` operates against stdin.
-        try:
-            self._tty_flags = termios.tcgetattr(sys.stdin.fileno())
-        except termios.error as e:
-            logger.debug(f"masking tcgetattr exception: {e!r}")
-
-    def restore_tty_flags(self):
-        if self._tty_flags:
-            try:
-                termios.tcsetattr(sys.stdin.fileno(), termios.TCSANOW, self._tty_flags)
-            except termios.error as e:
-                logger.debug(f"masking tcsetattr exception: {e!r}")
-
-
 class RemotePantsRunner:
     """A thin client variant of PantsRunner."""
 
@@ -115,22 +52,53 @@ class RemotePantsRunner:
         pantsd_handle = self._client.maybe_launch()
         logger.debug(f"Connecting to pantsd on port {pantsd_handle.port}")
 
+        self._maybe_write_fast_path_record(pantsd_handle)
         return self._connect_and_execute(pantsd_handle)
 
+    def _maybe_write_fast_path_record(self, pantsd_handle: PantsDaemonClient.Handle) -> None:
+        """Record how to connect to pantsd for this run, so that later runs with the same inputs
+        can skip options parsing: see `pantsd_fast_path`."""
+        global_options = self._bootstrap_options.for_global_scope()
+        if not global_options.pantsd_client_fast_path:
+            return
+        buildroot = get_buildroot()
+        if os.path.realpath(pantsd_handle.metadata_base_dir) != os.path.join(
+            buildroot, pantsd_fast_path.DEFAULT_SUBPROCESSDIR
+        ):
+            # The fast path can only locate pantsd's metadata in its default location.
+            return
+
+        core_threads, max_threads = GlobalOptions.compute_executor_arguments(global_options)
+        record = pantsd_fast_path.FastPathRecord.create(
+            fingerprint=self._client.options_fingerprint,
+            port=pantsd_handle.port,
+            config_paths=(
+                *OptionsBootstrapper.get_config_file_paths(env=self._env, args=self._args),
+                *self._options_bootstrapper.config.sources(),
+                *(os.path.expanduser(rcfile) for rcfile in global_options.pantsrc_files),
+            ),
+            fallback_args=self._options_bootstrapper.alias.definitions.keys(),
+            timeout=global_options.pantsd_timeout_when_multiple_invocations,
+            core_threads=core_threads,
+            max_threads=max_threads,
+        )
+        try:
+            pantsd_fast_path.write_record(
+                pantsd_fast_path.pantsd_metadata_dir(pantsd_handle.metadata_base_dir),
+                pantsd_fast_path.request_key(buildroot, self._args, self._env),
+                record,
+            )
+        except OSError as e:
+            logger.debug(f"Failed to write the pantsd fast path record: {e!r}")
+
     def _connect_and_execute(self, pantsd_handle: PantsDaemonClient.Handle) -> ExitCode:
         global_options = self._bootstrap_options.for_global_scope()
         executor = GlobalOptions.create_py_executor(global_options)
 
         # Merge the nailgun TTY capability environment variables with the passed environment dict.
-        ng_env = ttynames_to_env(sys.stdin, sys.stdout, sys.stderr)
-        modified_env = {
-            **self._env,
-            **ng_env,
-            "PANTSD_RUNTRACKER_CLIENT_START_TIME": str(self._start_time),
-            "PANTSD_REQUEST_TIMEOUT_LIMIT": str(
-                global_options.pantsd_timeout_when_multiple_invocations
-            ),
-        }
+        modified_env = pantsd_fast_path.client_env(
+            self._env, self._start_time, global_options.pantsd_timeout_when_multiple_invocations
+        )
 
         command = self._args[0]
         args = self._args[1:]
@@ -0,0 +1,60 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+# The module of a backend package which may define a `MANIFEST`, and the goals and flags which
+# require all backends to be loaded.
+MANIFEST_MODULE = "manifest"
+_LOAD_ALL_ARGS = frozenset(
+    ("help", "help-advanced", "help-all", "-h", "--help", "--help-advanced", "--help-all")
+)
+
+
+@dataclass(frozen=True)
+class BackendManifest:
+    """A cheap declaration of which runs need a backend, which allows `[GLOBAL].lazy_backends` to
+    skip importing the backend's rules for runs which do not.
+
+    A backend declares a manifest by defining a `MANIFEST` in the `manifest` module of its package,
+    which must not import anything expensive. Only backends which do not provide target types may
+    declare a manifest: backends which do are needed to parse BUILD files, and so always load.
+
+    :param goals: The goals which use the rules of the backend.
+    :param options_scopes: The options scopes which the backend registers. Passing a flag in one of
+      these scopes on the command line loads the backend, and sections for them in config files are
+      not reported as invalid when the backend is not loaded.
+    :param target_field_modules: Modules with a `rules()` function which registers the plugin
+      fields that the backend adds to targets. Because BUILD files may set these fields, they are
+      registered even when the backend is not loaded.
+    """
+
+    goals: tuple[str, ...]
+    options_scopes: tuple[str, ...] = ()
+    target_field_modules: tuple[str, ...] = ()
+
+    def is_needed(self, args: Sequence[str]) -> bool:
+        """Whether the backend is needed by a run with the given command line arguments.
+
+        Positional arguments cannot be distinguished from specs without loading backends, so this
+        errs on the side of loading the backend.
+        """
+        positional_args = []
+        for arg in args:
+            if arg == "--":
+                break
+            if arg in _LOAD_ALL_ARGS:
+                return True
+            if not arg.startswith("-"):
+                positional_args.append(arg)
+                continue
+            for scope in self.options_scopes:
+                if arg.startswith((f"--{scope}-", f"--no-{scope}-")):
+                    return True
+        # A run without goals displays help.
+        if not positional_args:
+            return True
+        return any(arg in self.goals for arg in positional_args)
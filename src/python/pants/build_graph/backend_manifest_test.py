@@ -0,0 +1,40 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import pytest
+
+from pants.build_graph.backend_manifest import BackendManifest
+
+MANIFEST = BackendManifest(goals=("fmt", "lint"), options_scopes=("black",))
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["lint", "::"],
+        ["fmt", "lint", "src/python::"],
+        ["test", "--black-skip", "::"],
+        ["test", "--no-black-skip", "::"],
+        ["help", "black"],
+        ["test", "--help"],
+        ["-h"],
+        [],
+    ],
+)
+def test_needed(args: list[str]) -> None:
+    assert MANIFEST.is_needed(args)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["test", "::"],
+        ["list", "lint/::"],
+        ["test", "--blackout", "::"],
+        ["run", "src:bin", "--", "lint", "--black-skip"],
+    ],
+)
+def test_not_needed(args: list[str]) -> None:
+    assert not MANIFEST.is_needed(args)
@@ -45,6 +45,8 @@ class BuildConfiguration:
     rules: FrozenOrderedSet[Rule]
     union_rules: FrozenOrderedSet[UnionRule]
     allow_unknown_options: bool
+    # The options scopes of backends which were not loaded, because the run did not need them.
+    unloaded_options_scopes: FrozenOrderedSet[str]
 
     @property
     def all_subsystems(self) -> tuple[type[Subsystem], ...]:
@@ -110,6 +112,7 @@ class BuildConfiguration:
         _rules: OrderedSet = field(default_factory=OrderedSet)
         _union_rules: OrderedSet = field(default_factory=OrderedSet)
         _allow_unknown_options: bool = False
+        _unloaded_options_scopes: OrderedSet = field(default_factory=OrderedSet)
 
         def registered_aliases(self) -> BuildFileAliases:
             """Return the registered aliases exposed in BUILD files.
@@ -239,6 +242,13 @@ class BuildConfiguration:
             """
             self._allow_unknown_options = True
 
+        def register_unloaded_options_scopes(self, options_scopes: Iterable[str]) -> None:
+            """Records the options scopes of a backend which was not loaded for this run.
+
+            Config for these scopes is not reported as invalid.
+            """
+            self._unloaded_options_scopes.update(options_scopes)
+
         def create(self) -> BuildConfiguration:
             registered_aliases = BuildFileAliases(
                 objects=self._exposed_object_by_alias.copy(),
@@ -255,4 +265,5 @@ class BuildConfiguration:
                 rules=FrozenOrderedSet(self._rules),
                 union_rules=FrozenOrderedSet(self._union_rules),
                 allow_unknown_options=self._allow_unknown_options,
+                unloaded_options_scopes=FrozenOrderedSet(self._unloaded_options_scopes),
             )
@@ -48,6 +48,8 @@ class BuiltPackage:
 
 
 class OutputPathField(StringField, AsyncFieldMixin):
+    __slots__ = ()
+
     alias = "output_path"
     help = (
         "Where the built asset should be located.\n\nIf undefined, this will use the path to the "
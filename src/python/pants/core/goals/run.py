@@ -37,6 +37,8 @@ class RunFieldSet(FieldSet, metaclass=ABCMeta):
 
 
 class RestartableField(BoolField):
+    __slots__ = ()
+
     alias = "restartable"
     default = False
     help = (
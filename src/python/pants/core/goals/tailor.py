@@ -4,14 +4,13 @@
 from __future__ import annotations
 
 import dataclasses
-import itertools
 import os
 from abc import ABCMeta
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import Iterable, Iterator, Mapping, Optional, cast
 
-from pants.base.specs import AddressSpecs, AscendantAddresses, Spec, Specs
+from pants.base.specs import Spec, Specs
 from pants.build_graph.address import Address
 from pants.core.util_rules import pants_bin
 from pants.core.util_rules.pants_bin import PantsBin
@@ -28,16 +27,10 @@ from pants.engine.fs import (
 )
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.internals.build_files import BuildFileOptions
+from pants.engine.internals.graph import OwnersIndex, OwnersIndexRequest
 from pants.engine.internals.selectors import Get, MultiGet
 from pants.engine.rules import collect_rules, goal_rule, rule
-from pants.engine.target import (
-    AllUnexpandedTargets,
-    SourcesField,
-    SourcesPaths,
-    SourcesPathsRequest,
-    Target,
-    UnexpandedTargets,
-)
+from pants.engine.target import AllUnexpandedTargets, SourcesField, Target
 from pants.engine.unions import UnionMembership, union
 from pants.source.filespec import Filespec, matches_filespec
 from pants.util.docutil import doc_url
@@ -45,6 +38,7 @@ from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.memo import memoized
 from pants.util.meta import frozen_after_init
+from pants.vcs.changed import ChangedFiles, ChangedFilesRequest
 
 
 @union
@@ -56,8 +50,12 @@ class PutativeTargetsRequest(metaclass=ABCMeta):
 @dataclass(frozen=True)
 class PutativeTargetsSearchPaths:
     dirs: tuple[str, ...]
+    # Whether to also search the subdirectories of `dirs`.
+    recursive: bool = True
 
     def path_globs(self, filename_glob: str) -> PathGlobs:
+        if not self.recursive:
+            return PathGlobs([os.path.join(d, filename_glob) for d in self.dirs])
         return PathGlobs([os.path.join(d, "**", filename_glob) for d in self.dirs])
 
 
@@ -256,6 +254,21 @@ class TailorSubsystem(GoalSubsystem):
             ),
         )
 
+        register(
+            "--changed-since",
+            type=str,
+            default=None,
+            help=(
+                "Only search directories in which files were added since this Git ref "
+                "(commit range/SHA/ref), including uncommitted and untracked files.\n\n"
+                "This is much faster than searching the whole repository, but will not notice "
+                "unowned files which were added before the ref, e.g. because a BUILD file was "
+                "deleted.\n\n"
+                "Note that this must be passed as `--tailor-changed-since`, because "
+                "`--changed-since` refers to the global option `[changed].since`."
+            ),
+        )
+
         register(
             "--build-file-name",
             advanced=True,
@@ -325,6 +338,10 @@ class TailorSubsystem(GoalSubsystem):
     def check(self) -> bool:
         return cast(bool, self.options.check)
 
+    @property
+    def changed_since(self) -> str | None:
+        return cast(Optional[str], self.options.changed_since)
+
     @property
     def build_file_name(self) -> str:
         return cast(str, self.options.build_file_name)
@@ -412,13 +429,9 @@ class AllOwnedSources(DeduplicatedCollection[str]):
 
 
 @rule(desc="Determine all files already owned by targets", level=LogLevel.DEBUG)
-async def determine_all_owned_sources(all_tgts: AllUnexpandedTargets) -> AllOwnedSources:
-    all_sources_paths = await MultiGet(
-        Get(SourcesPaths, SourcesPathsRequest(tgt.get(SourcesField))) for tgt in all_tgts
-    )
-    return AllOwnedSources(
-        itertools.chain.from_iterable(sources_paths.files for sources_paths in all_sources_paths)
-    )
+async def determine_all_owned_sources() -> AllOwnedSources:
+    owners_index = await Get(OwnersIndex, OwnersIndexRequest())
+    return AllOwnedSources(owners_index.owned_sources)
 
 
 @dataclass(frozen=True)
@@ -465,27 +478,20 @@ class DisjointSourcePutativeTarget:
 
 @rule
 async def restrict_conflicting_sources(ptgt: PutativeTarget) -> DisjointSourcePutativeTarget:
-    source_paths = await Get(
-        Paths,
-        PathGlobs(
-            SourcesField.prefix_glob_with_dirpath(ptgt.path, glob) for glob in ptgt.owned_sources
+    source_paths, owners_index = await MultiGet(
+        Get(
+            Paths,
+            PathGlobs(
+                SourcesField.prefix_glob_with_dirpath(ptgt.path, glob)
+                for glob in ptgt.owned_sources
+            ),
         ),
+        Get(OwnersIndex, OwnersIndexRequest()),
     )
-    source_path_set = set(source_paths.files)
-    source_dirs = {os.path.dirname(path) for path in source_path_set}
-    possible_owners = await Get(
-        UnexpandedTargets, AddressSpecs(AscendantAddresses(d) for d in source_dirs)
-    )
-    possible_owners_sources = await MultiGet(
-        Get(SourcesPaths, SourcesPathsRequest(t.get(SourcesField))) for t in possible_owners
-    )
-    conflicting_targets = []
-    for tgt, sources in zip(possible_owners, possible_owners_sources):
-        if source_path_set.intersection(sources.files):
-            conflicting_targets.append(tgt)
+    conflicting_addresses = owners_index.sources_owners_of(source_paths.files)
 
-    if conflicting_targets:
-        conflicting_addrs = sorted(tgt.address.spec for tgt in conflicting_targets)
+    if conflicting_addresses:
+        conflicting_addrs = sorted(address.spec for address in conflicting_addresses)
         explicit_srcs_str = ", ".join(ptgt.kwargs.get("sources") or [])  # type: ignore[arg-type]
         orig_sources_str = (
             f"[{explicit_srcs_str}]" if explicit_srcs_str else f"the default for {ptgt.type_alias}"
@@ -592,6 +598,29 @@ def specs_to_dirs(specs: Specs) -> tuple[str, ...]:
     return tuple(dir_specs) or ("",)
 
 
+def dirs_with_added_files(
+    added_files: Iterable[str], search_dirs: Iterable[str]
+) -> tuple[str, ...]:
+    """The directories containing added files which are (possibly nested) within the search dirs."""
+    search_dirs = tuple(search_dirs)
+
+    def in_search_dirs(dirname: str) -> bool:
+        return any(
+            not search_dir or dirname == search_dir or dirname.startswith(f"{search_dir}/")
+            for search_dir in search_dirs
+        )
+
+    return tuple(
+        sorted(
+            {
+                dirname
+                for dirname in (os.path.dirname(path) for path in added_files)
+                if in_search_dirs(dirname)
+            }
+        )
+    )
+
+
 @goal_rule
 async def tailor(
     tailor_subsystem: TailorSubsystem,
@@ -604,7 +633,19 @@ async def tailor(
 ) -> TailorGoal:
     tailor_subsystem.validate_build_file_name(build_file_options.patterns)
 
-    search_paths = PutativeTargetsSearchPaths(specs_to_dirs(specs))
+    search_dirs = specs_to_dirs(specs)
+    if tailor_subsystem.changed_since:
+        added_files = await Get(
+            ChangedFiles, ChangedFilesRequest(tailor_subsystem.changed_since, diff_filter="AR")
+        )
+        search_paths = PutativeTargetsSearchPaths(
+            dirs_with_added_files(added_files, search_dirs), recursive=False
+        )
+    else:
+        search_paths = PutativeTargetsSearchPaths(search_dirs)
+    if not search_paths.dirs:
+        return TailorGoal(exit_code=0)
+
     putative_targets_results = await MultiGet(
         Get(PutativeTargets, PutativeTargetsRequest, req_type(search_paths))
         for req_type in union_membership[PutativeTargetsRequest]
@@ -32,6 +32,7 @@ from pants.core.goals.tailor import (
     TailorSubsystem,
     UniquelyNamedPutativeTargets,
     default_sources_for_target_type,
+    dirs_with_added_files,
     group_by_dir,
     make_content_str,
     specs_to_dirs,
@@ -506,6 +507,39 @@ def test_specs_to_dirs() -> None:
         )
 
 
+def test_dirs_with_added_files() -> None:
+    added_files = [
+        "BUILD",
+        "src/python/foo/f.py",
+        "src/python/foo/g.py",
+        "src/python/foo/bar/f.py",
+        "src/python/foobar/f.py",
+        "tests/f.py",
+    ]
+    assert dirs_with_added_files(added_files, [""]) == (
+        "",
+        "src/python/foo",
+        "src/python/foo/bar",
+        "src/python/foobar",
+        "tests",
+    )
+    assert dirs_with_added_files(added_files, ["src/python/foo", "tests"]) == (
+        "src/python/foo",
+        "src/python/foo/bar",
+        "tests",
+    )
+    assert dirs_with_added_files(added_files, ["docs"]) == ()
+
+
+def test_search_paths_path_globs() -> None:
+    assert PutativeTargetsSearchPaths(("", "foo")).path_globs("*.f90") == PathGlobs(
+        ["**/*.f90", "foo/**/*.f90"]
+    )
+    assert PutativeTargetsSearchPaths(("", "foo"), recursive=False).path_globs(
+        "*.f90"
+    ) == PathGlobs(["*.f90", "foo/*.f90"])
+
+
 def test_tailor_rule_write_mode(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
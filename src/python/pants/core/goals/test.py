@@ -516,6 +516,8 @@ async def get_filtered_environment(test_subsystem: TestSubsystem) -> TestExtraEn
 
 
 class RuntimePackageDependenciesField(SpecialCasedDependencies):
+    __slots__ = ()
+
     alias = "runtime_package_dependencies"
     help = (
         "Addresses to targets that can be built with the `./pants package` goal and whose "
@@ -4,13 +4,14 @@
 from __future__ import annotations
 
 import dataclasses
+import itertools
 import logging
 import os.path
 import tokenize
 from collections import defaultdict
 from dataclasses import dataclass
 from io import BytesIO
-from typing import DefaultDict, Mapping, cast
+from typing import ClassVar, DefaultDict, Iterable, Mapping, cast
 
 from colors import green, red
 
@@ -19,12 +20,14 @@ from pants.backend.python.util_rules import pex
 from pants.backend.python.util_rules.pex import PexRequest, VenvPex, VenvPexProcess
 from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest
 from pants.core.util_rules.pants_bin import PantsBin
+from pants.engine.collection import Collection
 from pants.engine.console import Console
 from pants.engine.engine_aware import EngineAwareParameter
 from pants.engine.fs import (
     CreateDigest,
     Digest,
     DigestContents,
+    DigestSubset,
     FileContent,
     MergeDigests,
     PathGlobs,
@@ -42,6 +45,7 @@ from pants.util.docutil import doc_url
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.memo import memoized
+from pants.util.strutil import pluralize
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +61,10 @@ class RewrittenBuildFile:
     change_descriptions: tuple[str, ...]
 
 
+class RewrittenBuildFiles(Collection[RewrittenBuildFile]):
+    pass
+
+
 @union
 @dataclass(frozen=True)
 class RewrittenBuildFileRequest(EngineAwareParameter):
@@ -64,6 +72,10 @@ class RewrittenBuildFileRequest(EngineAwareParameter):
     lines: tuple[str, ...]
     colors_enabled: bool = dataclasses.field(compare=False)
 
+    # If set, all BUILD files are rewritten by one request of this type, rather than by one
+    # request per BUILD file. This is useful for fixers which are expensive to start, like Black.
+    batch_request_type: ClassVar[type[RewrittenBuildFilesRequest] | None] = None
+
     def debug_hint(self) -> str:
         return self.path
 
@@ -86,6 +98,15 @@ class RewrittenBuildFileRequest(EngineAwareParameter):
         return cast(str, green(s)) if self.colors_enabled else s
 
 
+@union
+@dataclass(frozen=True)
+class RewrittenBuildFilesRequest:
+    """A request to rewrite many BUILD files at once: see
+    `RewrittenBuildFileRequest.batch_request_type`."""
+
+    requests: tuple[RewrittenBuildFileRequest, ...]
+
+
 class DeprecationFixerRequest(RewrittenBuildFileRequest):
     """A fixer for deprecations.
 
@@ -178,11 +199,8 @@ async def update_build_files(
 
     rewrite_request_classes = []
     for request in union_membership[RewrittenBuildFileRequest]:
-        if issubclass(request, FormatWithBlackRequest):
-            if update_build_files_subsystem.fmt:
-                rewrite_request_classes.append(request)
-            else:
-                continue
+        if issubclass(request, FormatWithBlackRequest) and not update_build_files_subsystem.fmt:
+            continue
         if update_build_files_subsystem.fix_safe_deprecations or not issubclass(
             request, DeprecationFixerRequest
         ):
@@ -194,14 +212,22 @@ async def update_build_files(
     }
     build_file_to_change_descriptions: DefaultDict[str, list[str]] = defaultdict(list)
     for rewrite_request_cls in rewrite_request_classes:
-        all_rewritten_files = await MultiGet(
-            Get(
-                RewrittenBuildFile,
-                RewrittenBuildFileRequest,
-                rewrite_request_cls(build_file, lines, colors_enabled=console._use_colors),
-            )
+        rewrite_requests = [
+            rewrite_request_cls(build_file, lines, colors_enabled=console._use_colors)
             for build_file, lines in build_file_to_lines.items()
-        )
+        ]
+        all_rewritten_files: Iterable[RewrittenBuildFile]
+        if rewrite_request_cls.batch_request_type is not None:
+            all_rewritten_files = await Get(
+                RewrittenBuildFiles,
+                RewrittenBuildFilesRequest,
+                rewrite_request_cls.batch_request_type(tuple(rewrite_requests)),
+            )
+        else:
+            all_rewritten_files = await MultiGet(
+                Get(RewrittenBuildFile, RewrittenBuildFileRequest, rewrite_request)
+                for rewrite_request in rewrite_requests
+            )
         for rewritten_file in all_rewritten_files:
             if not rewritten_file.change_descriptions:
                 continue
@@ -255,14 +281,87 @@ async def update_build_files(
 # ------------------------------------------------------------------------------------------
 
 
+class FormatBuildFilesWithBlackRequest(RewrittenBuildFilesRequest):
+    """Format many BUILD files with Black, using as few processes as possible."""
+
+
 class FormatWithBlackRequest(RewrittenBuildFileRequest):
-    pass
+    batch_request_type = FormatBuildFilesWithBlackRequest
+
+
+@dataclass(frozen=True)
+class BlackBuildFilesBatch:
+    """BUILD files which use the same Black config files, and so can be formatted by one process."""
+
+    requests: tuple[RewrittenBuildFileRequest, ...]
+    config_files: Digest
+
+
+# The maximum number of BUILD files to format with one Black process. Batches are formed from
+# sorted paths, so that most batches (and their cached results) are stable as BUILD files change.
+_BLACK_BATCH_SIZE = 256
+
+
+def _applicable_config_files(
+    path: str, config_files: Iterable[str], black: Black
+) -> tuple[str, ...]:
+    """The config files which Black would consider when run on the BUILD file at the path."""
+    if black.config:
+        return tuple(config_files)
+    ancestor_dirs = set(recursive_dirname(os.path.dirname(path)))
+    return tuple(
+        config_file for config_file in config_files if os.path.dirname(config_file) in ancestor_dirs
+    )
 
 
 @rule
-async def format_build_file_with_black(
-    request: FormatWithBlackRequest, black: Black
-) -> RewrittenBuildFile:
+async def format_build_file_with_black(request: FormatWithBlackRequest) -> RewrittenBuildFile:
+    results = await Get(RewrittenBuildFiles, FormatBuildFilesWithBlackRequest((request,)))
+    return results[0]
+
+
+@rule(desc="Format BUILD files with Black", level=LogLevel.DEBUG)
+async def format_build_files_with_black(
+    request: FormatBuildFilesWithBlackRequest, black: Black
+) -> RewrittenBuildFiles:
+    all_dirs = set(
+        itertools.chain.from_iterable(
+            recursive_dirname(os.path.dirname(req.path)) for req in request.requests
+        )
+    )
+    config_files = await Get(ConfigFiles, ConfigFilesRequest, black.config_request(all_dirs))
+
+    # Black discovers its config relative to the files that it is run on, so BUILD files are
+    # partitioned by the config files which apply to them.
+    requests_by_config_files: DefaultDict[
+        tuple[str, ...], list[RewrittenBuildFileRequest]
+    ] = defaultdict(list)
+    for req in sorted(request.requests, key=lambda req: req.path):
+        applicable_config_files = _applicable_config_files(
+            req.path, config_files.snapshot.files, black
+        )
+        requests_by_config_files[applicable_config_files].append(req)
+
+    partition_config_digests = await MultiGet(
+        Get(Digest, DigestSubset(config_files.snapshot.digest, PathGlobs(applicable_config_files)))
+        for applicable_config_files in requests_by_config_files
+    )
+    batches = [
+        BlackBuildFilesBatch(tuple(reqs[i : i + _BLACK_BATCH_SIZE]), config_digest)
+        for reqs, config_digest in zip(requests_by_config_files.values(), partition_config_digests)
+        for i in range(0, len(reqs), _BLACK_BATCH_SIZE)
+    ]
+    results = await MultiGet(Get(RewrittenBuildFiles, BlackBuildFilesBatch, b) for b in batches)
+
+    # Preserve the order of the requests.
+    result_by_path = {result.path: result for result in itertools.chain.from_iterable(results)}
+    return RewrittenBuildFiles(result_by_path[req.path] for req in request.requests)
+
+
+@rule
+async def format_build_files_batch_with_black(
+    batch: BlackBuildFilesBatch, black: Black
+) -> RewrittenBuildFiles:
     black_pex_get = Get(
         VenvPex,
         PexRequest(
@@ -273,23 +372,19 @@ async def format_build_file_with_black(
             main=black.main,
         ),
     )
-    build_file_digest_get = Get(Digest, CreateDigest([request.to_file_content()]))
-    config_files_get = Get(
-        ConfigFiles, ConfigFilesRequest, black.config_request(recursive_dirname(request.path))
-    )
-    black_pex, build_file_digest, config_files = await MultiGet(
-        black_pex_get, build_file_digest_get, config_files_get
+    build_files_digest_get = Get(
+        Digest, CreateDigest([req.to_file_content() for req in batch.requests])
     )
+    black_pex, build_files_digest = await MultiGet(black_pex_get, build_files_digest_get)
 
-    input_digest = await Get(
-        Digest, MergeDigests((build_file_digest, config_files.snapshot.digest))
-    )
+    input_digest = await Get(Digest, MergeDigests((build_files_digest, batch.config_files)))
 
+    paths = tuple(req.path for req in batch.requests)
     argv = []
     if black.config:
         argv.extend(["--config", black.config])
     argv.extend(black.args)
-    argv.append(request.path)
+    argv.extend(paths)
 
     black_result = await Get(
         ProcessResult,
@@ -297,20 +392,34 @@ async def format_build_file_with_black(
             black_pex,
             argv=argv,
             input_digest=input_digest,
-            output_files=(request.path,),
-            description=f"Run Black on {request.path}.",
+            output_files=paths,
+            description=(
+                f"Run Black on {paths[0]}."
+                if len(paths) == 1
+                else f"Run Black on {pluralize(len(paths), 'BUILD file')}."
+            ),
             level=LogLevel.DEBUG,
         ),
     )
 
-    if black_result.output_digest == build_file_digest:
-        return RewrittenBuildFile(request.path, request.lines, change_descriptions=())
+    if black_result.output_digest == build_files_digest:
+        return RewrittenBuildFiles(
+            RewrittenBuildFile(req.path, req.lines, change_descriptions=())
+            for req in batch.requests
+        )
 
     result_contents = await Get(DigestContents, Digest, black_result.output_digest)
-    assert len(result_contents) == 1
-    result_lines = tuple(result_contents[0].content.decode("utf-8").splitlines())
-    return RewrittenBuildFile(
-        request.path, result_lines, change_descriptions=("Format with Black",)
+    result_lines_by_path = {
+        file_content.path: tuple(file_content.content.decode("utf-8").splitlines())
+        for file_content in result_contents
+    }
+    return RewrittenBuildFiles(
+        RewrittenBuildFile(req.path, req.lines, change_descriptions=())
+        if result_lines_by_path[req.path] == req.lines
+        else RewrittenBuildFile(
+            req.path, result_lines_by_path[req.path], change_descriptions=("Format with Black",)
+        )
+        for req in batch.requests
     )
 
 
@@ -526,4 +635,5 @@ def rules():
         # NB: We want this to come at the end so that running Black happens after all our
         # deprecation fixers.
         UnionRule(RewrittenBuildFileRequest, FormatWithBlackRequest),
+        UnionRule(RewrittenBuildFilesRequest, FormatBuildFilesWithBlackRequest),
     )
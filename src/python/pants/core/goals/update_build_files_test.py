@@ -11,6 +11,7 @@ import pytest
 from pants.backend.python.lint.black.subsystem import Black
 from pants.backend.python.util_rules import pex
 from pants.core.goals.update_build_files import (
+    FormatBuildFilesWithBlackRequest,
     FormatWithBlackRequest,
     RenameDeprecatedFieldsRequest,
     RenameDeprecatedTargetsRequest,
@@ -18,9 +19,13 @@ from pants.core.goals.update_build_files import (
     RenamedTargetTypes,
     RewrittenBuildFile,
     RewrittenBuildFileRequest,
+    RewrittenBuildFilesRequest,
     UpdateBuildFilesGoal,
     UpdateBuildFilesSubsystem,
+    _applicable_config_files,
     format_build_file_with_black,
+    format_build_files_batch_with_black,
+    format_build_files_with_black,
     maybe_rename_deprecated_fields,
     maybe_rename_deprecated_targets,
     update_build_files,
@@ -28,6 +33,7 @@ from pants.core.goals.update_build_files import (
 from pants.core.util_rules import config_files, pants_bin
 from pants.engine.rules import SubsystemRule, rule
 from pants.engine.unions import UnionRule
+from pants.testutil.option_util import create_subsystem
 from pants.testutil.rule_runner import RuleRunner
 
 # ------------------------------------------------------------------------------------------
@@ -130,6 +136,8 @@ def black_rule_runner() -> RuleRunner:
     return RuleRunner(
         rules=(
             format_build_file_with_black,
+            format_build_files_with_black,
+            format_build_files_batch_with_black,
             update_build_files,
             *pants_bin.rules(),
             *config_files.rules(),
@@ -137,6 +145,7 @@ def black_rule_runner() -> RuleRunner:
             SubsystemRule(Black),
             SubsystemRule(UpdateBuildFilesSubsystem),
             UnionRule(RewrittenBuildFileRequest, FormatWithBlackRequest),
+            UnionRule(RewrittenBuildFilesRequest, FormatBuildFilesWithBlackRequest),
         )
     )
 
@@ -184,6 +193,47 @@ def test_black_config(black_rule_runner: RuleRunner) -> None:
     assert Path(black_rule_runner.build_root, "BUILD").read_text() == "tgt(name='t')\n"
 
 
+def test_black_batches_by_config(black_rule_runner: RuleRunner) -> None:
+    black_rule_runner.write_files(
+        {
+            "BUILD": "tgt(name='t')\n",
+            "a/BUILD": 'tgt(name="t")\n',
+            "b/BUILD": "tgt(name='t')\n",
+            "b/pyproject.toml": "[tool.black]\nskip-string-normalization = 'true'\n",
+            "b/c/BUILD": "tgt( name='t' )\n",
+        },
+    )
+    result = black_rule_runner.run_goal_rule(UpdateBuildFilesGoal, env_inherit=BLACK_ENV_INHERIT)
+    assert result.exit_code == 0
+    assert result.stdout == dedent(
+        """\
+        Updated BUILD:
+          - Format with Black
+        Updated b/c/BUILD:
+          - Format with Black
+        """
+    )
+    build_root = Path(black_rule_runner.build_root)
+    assert (build_root / "BUILD").read_text() == 'tgt(name="t")\n'
+    assert (build_root / "a/BUILD").read_text() == 'tgt(name="t")\n'
+    assert (build_root / "b/BUILD").read_text() == "tgt(name='t')\n"
+    assert (build_root / "b/c/BUILD").read_text() == "tgt(name='t')\n"
+
+
+def test_applicable_config_files() -> None:
+    config_files = ("pyproject.toml", "a/pyproject.toml", "ab/pyproject.toml")
+    black = create_subsystem(Black, config=None)
+    assert _applicable_config_files("BUILD", config_files, black) == ("pyproject.toml",)
+    assert _applicable_config_files("a/b/BUILD", config_files, black) == (
+        "pyproject.toml",
+        "a/pyproject.toml",
+    )
+    black = create_subsystem(Black, config="ab/pyproject.toml")
+    assert _applicable_config_files("a/BUILD", ["ab/pyproject.toml"], black) == (
+        "ab/pyproject.toml",
+    )
+
+
 # ------------------------------------------------------------------------------------------
 # Renamed target types fixer
 # ------------------------------------------------------------------------------------------
@@ -39,7 +39,7 @@ from pants.core.util_rules import (
     stripped_source_files,
     subprocess_environment,
 )
-from pants.goal import anonymous_telemetry, stats_aggregator
+from pants.goal import anonymous_telemetry, perf_report, stats_aggregator
 from pants.python import binaries as python_binaries
 from pants.source import source_root
 
@@ -53,6 +53,7 @@ def rules():
         *lint.rules(),
         *update_build_files.rules(),
         *package.rules(),
+        *perf_report.rules(),
         *publish.rules(),
         *repl.rules(),
         *run.rules(),
@@ -56,6 +56,8 @@ from pants.util.logging import LogLevel
 
 
 class FileSourceField(SingleSourceField):
+    __slots__ = ()
+
     uses_source_roots = False
 
 
@@ -71,11 +73,15 @@ class FileTarget(Target):
 
 
 class FilesGeneratingSourcesField(MultipleSourcesField):
+    __slots__ = ()
+
     required = True
     uses_source_roots = False
 
 
 class FilesOverridesField(OverridesField):
+    __slots__ = ()
+
     help = generate_file_based_overrides_field_help_message(
         FileTarget.alias,
         (
@@ -140,12 +146,16 @@ async def generate_targets_from_files(
 
 
 class RelocatedFilesSources(MultipleSourcesField):
+    __slots__ = ()
+
     # We solely register this field for codegen to work.
     alias = "_sources"
     expected_num_files = 0
 
 
 class RelocatedFilesOriginalTargets(SpecialCasedDependencies):
+    __slots__ = ()
+
     alias = "files_targets"
     required = True
     help = (
@@ -156,6 +166,8 @@ class RelocatedFilesOriginalTargets(SpecialCasedDependencies):
 
 
 class RelocatedFilesSrcField(StringField):
+    __slots__ = ()
+
     alias = "src"
     required = True
     help = (
@@ -166,6 +178,8 @@ class RelocatedFilesSrcField(StringField):
 
 
 class RelocatedFilesDestField(StringField):
+    __slots__ = ()
+
     alias = "dest"
     required = True
     help = (
@@ -266,6 +280,8 @@ async def relocate_files(request: RelocateFilesViaCodegenRequest) -> GeneratedSo
 
 
 class ResourceSourceField(SingleSourceField):
+    __slots__ = ()
+
     uses_source_roots = True
 
 
@@ -282,10 +298,14 @@ class ResourceTarget(Target):
 
 
 class ResourcesGeneratingSourcesField(MultipleSourcesField):
+    __slots__ = ()
+
     required = True
 
 
 class ResourcesOverridesField(OverridesField):
+    __slots__ = ()
+
     help = generate_file_based_overrides_field_help_message(
         ResourceTarget.alias,
         (
@@ -365,6 +385,8 @@ class GenericTarget(Target):
 
 
 class ArchivePackages(SpecialCasedDependencies):
+    __slots__ = ()
+
     alias = "packages"
     help = (
         "Addresses to any targets that can be built with `./pants package`, e.g. "
@@ -377,6 +399,8 @@ class ArchivePackages(SpecialCasedDependencies):
 
 
 class ArchiveFiles(SpecialCasedDependencies):
+    __slots__ = ()
+
     alias = "files"
     help = (
         "Addresses to any `file`, `files`, or `relocated_files` targets to include in the "
@@ -392,6 +416,8 @@ class ArchiveFiles(SpecialCasedDependencies):
 
 
 class ArchiveFormatField(StringField):
+    __slots__ = ()
+
     alias = "format"
     valid_choices = ArchiveFormat
     required = True
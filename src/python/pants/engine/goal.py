@@ -4,7 +4,17 @@
 from abc import abstractmethod
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, ClassVar, Iterator, Tuple, Type, cast
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 from typing_extensions import final
 
@@ -147,3 +157,83 @@ class LineOriented(Outputting):
         sep = self.options.sep.encode().decode("unicode_escape")  # type: ignore[attr-defined]
         with self.output_sink(console) as output_sink:
             yield lambda msg: print(msg, file=output_sink, end=sep)
+
+
+class LinePrinter:
+    """Prints lines until an optional limit is reached."""
+
+    def __init__(
+        self, print_line: Callable[[str], None], flush: Callable[[], None], limit: Optional[int]
+    ) -> None:
+        self._print_line = print_line
+        self._flush = flush
+        self._remaining = limit
+
+    @property
+    def done(self) -> bool:
+        """Whether the limit has been reached, and so no more lines will be printed."""
+        return self._remaining is not None and self._remaining <= 0
+
+    def print_lines(self, lines: Iterable[str]) -> bool:
+        """Print the given lines (up to the limit), and then flush them.
+
+        Returns whether the limit has been reached.
+        """
+        for line in lines:
+            if self.done:
+                break
+            self._print_line(line)
+            if self._remaining is not None:
+                self._remaining -= 1
+        self._flush()
+        return self.done
+
+
+class StreamingLineOriented(LineOriented):
+    """A mixin for line-oriented goals which can print their results as they are resolved.
+
+    By default, such goals sort their results once all of them have been resolved. With `--stream`,
+    each batch of results is printed as soon as it is resolved, and the goal stops resolving results
+    once `--limit` of them have been printed.
+    """
+
+    @classmethod
+    def register_options(cls, register):
+        super().register_options(register)
+        register(
+            "--stream",
+            type=bool,
+            default=False,
+            help=(
+                "Print results in the order that they are resolved, as soon as they are resolved, "
+                "rather than sorting them once all of them have been resolved. Useful when piping "
+                "the output of a large query to another command."
+            ),
+        )
+        register(
+            "--limit",
+            type=int,
+            default=None,
+            help=(
+                "Print at most this many results. With `--stream`, no further results are resolved "
+                "once this many have been printed."
+            ),
+        )
+
+    @property
+    def stream(self) -> bool:
+        return cast(bool, self.options.stream)  # type: ignore[attr-defined]
+
+    @property
+    def limit(self) -> Optional[int]:
+        return cast(Optional[int], self.options.limit)  # type: ignore[attr-defined]
+
+    @final
+    @contextmanager
+    def line_printer(self, console: "Console") -> Iterator[LinePrinter]:
+        """Given a Console, yields a `LinePrinter` for stdout or a file, which respects `--limit`."""
+        sep = self.options.sep.encode().decode("unicode_escape")  # type: ignore[attr-defined]
+        with self.output_sink(console) as output_sink:
+            yield LinePrinter(
+                lambda msg: print(msg, file=output_sink, end=sep), output_sink.flush, self.limit
+            )
@@ -2,7 +2,7 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
 from pants.engine.console import Console
-from pants.engine.goal import Goal, GoalSubsystem, LineOriented
+from pants.engine.goal import Goal, GoalSubsystem, LineOriented, StreamingLineOriented
 from pants.engine.rules import goal_rule
 from pants.option.scope import ScopeInfo
 from pants.testutil.option_util import create_goal_subsystem, create_options_bootstrapper
@@ -36,6 +36,36 @@ def test_line_oriented_goal() -> None:
         assert stdio_reader.get_stdout() == "output...line oriented\n"
 
 
+def test_streaming_line_oriented_goal() -> None:
+    class StreamingGoalOptions(StreamingLineOriented, GoalSubsystem):
+        name = "dummy"
+
+    class StreamingGoal(Goal):
+        subsystem_cls = StreamingGoalOptions
+
+    @goal_rule
+    def output_rule(console: Console, options: StreamingGoalOptions) -> StreamingGoal:
+        with options.line_printer(console) as printer:
+            assert not printer.print_lines(["a", "b"])
+            assert printer.print_lines(["c", "d"])
+            assert printer.done
+            assert printer.print_lines(["e"])
+        return StreamingGoal(0)
+
+    with mock_console(create_options_bootstrapper()) as (console, stdio_reader):
+        result: StreamingGoal = run_rule_with_mocks(
+            output_rule,
+            rule_args=[
+                console,
+                create_goal_subsystem(
+                    StreamingGoalOptions, sep="\\n", output_file=None, stream=True, limit=3
+                ),
+            ],
+        )
+        assert result.exit_code == 0
+        assert stdio_reader.get_stdout() == "a\nb\nc\n"
+
+
 def test_goal_scope_flag() -> None:
     class DummyGoal(GoalSubsystem):
         name = "dummy"
@@ -524,6 +524,123 @@ class Owners(Collection[Address]):
     pass
 
 
+def _secondary_owner_fields(tgt: Target) -> tuple[SecondaryOwnerMixin, ...]:
+    # We can't use `tgt.get()` because this is a mixin, and there technically may be >1 field.
+    return tuple(
+        field  # type: ignore[misc]
+        for field in tgt.field_values.values()
+        if isinstance(field, SecondaryOwnerMixin)
+    )
+
+
+def _is_literal_path(glob: str) -> bool:
+    return not any(c in glob for c in "*?[!") and os.path.normpath(glob) == glob
+
+
+@dataclass(frozen=True)
+class OwnersIndexRequest:
+    """Index the owners of all files in the project: use with `OwnersIndex`."""
+
+
+@dataclass(frozen=True)
+class OwnersIndex:
+    """The owners of the live files in the project, as determined by `find_owners`.
+
+    The index is computed once per change to the build graph, and makes finding the owners of N
+    files O(N), rather than matching every candidate target against every file. It is shared by
+    `find_owners` (and so `--changed-since`) and `tailor`.
+    """
+
+    # The targets whose `sources` match each file.
+    source_owners: FrozenDict[str, tuple[Address, ...]]
+    # The targets whose secondary owner fields match each file by its literal path.
+    secondary_owners: FrozenDict[str, tuple[Address, ...]]
+    # The targets defined in each BUILD file.
+    build_file_owners: FrozenDict[str, tuple[Address, ...]]
+    # Secondary owner fields which use globs, and so must be matched against each file.
+    secondary_owner_globs: tuple[tuple[Address, SecondaryOwnerMixin], ...]
+
+    def owners_of(self, paths: Iterable[str]) -> tuple[FrozenOrderedSet[Address], frozenset[str]]:
+        """The owners of the given live files, and which of the files are owned by a `sources` or
+        secondary owner field."""
+        paths = tuple(paths)
+        owners: OrderedSet[Address] = OrderedSet()
+        matched: set[str] = set()
+        for path in paths:
+            file_owners = (*self.source_owners.get(path, ()), *self.secondary_owners.get(path, ()))
+            if file_owners:
+                owners.update(file_owners)
+                matched.add(path)
+            owners.update(self.build_file_owners.get(path, ()))
+        for address, field in self.secondary_owner_globs:
+            matching_files = matches_filespec(field.filespec, paths=paths)
+            if matching_files:
+                owners.add(address)
+                matched.update(matching_files)
+        return FrozenOrderedSet(owners), frozenset(matched)
+
+    @property
+    def owned_sources(self) -> Iterable[str]:
+        """The files which are matched by the `sources` of any target."""
+        return self.source_owners.keys()
+
+    def sources_owners_of(self, paths: Iterable[str]) -> FrozenOrderedSet[Address]:
+        """The targets whose `sources` match the given files, with generated targets replaced by
+        the target generators which declared them."""
+        return FrozenOrderedSet(
+            address.maybe_convert_to_target_generator()
+            for path in paths
+            for address in self.source_owners.get(path, ())
+        )
+
+
+@rule(desc="Index the owners of all files", level=LogLevel.DEBUG)
+async def index_owners(_: OwnersIndexRequest) -> OwnersIndex:
+    all_tgts = await Get(AllTargets, AllTargetsRequest())
+    all_sources_paths = await MultiGet(
+        Get(SourcesPaths, SourcesPathsRequest(tgt.get(SourcesField))) for tgt in all_tgts
+    )
+    build_file_addresses = await MultiGet(
+        Get(BuildFileAddress, Address, tgt.address) for tgt in all_tgts
+    )
+
+    source_owners: dict[str, OrderedSet[Address]] = {}
+    secondary_owners: dict[str, OrderedSet[Address]] = {}
+    build_file_owners: dict[str, list[Address]] = {}
+    secondary_owner_globs = []
+    for tgt, sources_paths, bfa in zip(all_tgts, all_sources_paths, build_file_addresses):
+        for path in sources_paths.files:
+            source_owners.setdefault(path, OrderedSet()).add(tgt.address)
+        build_file_owners.setdefault(bfa.rel_path, []).append(tgt.address)
+        for field in _secondary_owner_fields(tgt):
+            filespec = field.filespec
+            if filespec.get("excludes") or not all(
+                _is_literal_path(include) for include in filespec["includes"]
+            ):
+                secondary_owner_globs.append((tgt.address, field))
+                continue
+            for include in filespec["includes"]:
+                secondary_owners.setdefault(include, OrderedSet()).add(tgt.address)
+
+    return OwnersIndex(
+        source_owners=FrozenDict(
+            (path, tuple(addresses)) for path, addresses in source_owners.items()
+        ),
+        secondary_owners=FrozenDict(
+            (path, tuple(addresses)) for path, addresses in secondary_owners.items()
+        ),
+        build_file_owners=FrozenDict(
+            (path, tuple(addresses)) for path, addresses in build_file_owners.items()
+        ),
+        secondary_owner_globs=tuple(secondary_owner_globs),
+    )
+
+
+# Finding the owners of files in only a few directories is cheaper via their ascendant targets than
+# by indexing the owners of every file in the project, at least when the index is not yet memoized.
+_OWNERS_INDEX_MIN_DIRS = 100
+
+
 @rule(desc="Find which targets own certain files")
 async def find_owners(owners_request: OwnersRequest) -> Owners:
     # Determine which of the sources are live and which are deleted.
@@ -534,19 +651,29 @@ async def find_owners(owners_request: OwnersRequest) -> Owners:
     live_dirs = FrozenOrderedSet(os.path.dirname(s) for s in live_files)
     deleted_dirs = FrozenOrderedSet(os.path.dirname(s) for s in deleted_files)
 
+    matching_addresses: OrderedSet[Address] = OrderedSet()
+    unmatched_sources = set(owners_request.sources)
+
+    use_index = len(live_dirs) >= _OWNERS_INDEX_MIN_DIRS
+    if use_index:
+        owners_index = await Get(OwnersIndex, OwnersIndexRequest())
+        live_owners, matched_live_files = owners_index.owners_of(live_files)
+        matching_addresses.update(live_owners)
+        unmatched_sources -= matched_live_files
+
     # Walk up the buildroot looking for targets that would conceivably claim changed sources.
     # For live files, we use Targets, which causes more precise, often file-level, targets
     # to be created. For deleted files we use UnexpandedTargets, which have the original declared
     # glob.
-    live_candidate_specs = tuple(AscendantAddresses(directory=d) for d in live_dirs)
+    live_candidate_specs = (
+        () if use_index else tuple(AscendantAddresses(directory=d) for d in live_dirs)
+    )
     deleted_candidate_specs = tuple(AscendantAddresses(directory=d) for d in deleted_dirs)
     live_candidate_tgts, deleted_candidate_tgts = await MultiGet(
         Get(Targets, AddressSpecs(live_candidate_specs)),
         Get(UnexpandedTargets, AddressSpecs(deleted_candidate_specs)),
     )
 
-    matching_addresses: OrderedSet[Address] = OrderedSet()
-    unmatched_sources = set(owners_request.sources)
     for live in (True, False):
         candidate_tgts: Sequence[Target]
         if live:
@@ -565,14 +692,8 @@ async def find_owners(owners_request: OwnersRequest) -> Owners:
                 matches_filespec(candidate_tgt.get(SourcesField).filespec, paths=sources_set)
             )
             # Also consider secondary ownership, meaning it's not a `SourcesField` field with
-            # primary ownership, but the target still should match the file. We can't use
-            # `tgt.get()` because this is a mixin, and there technically may be >1 field.
-            secondary_owner_fields = tuple(
-                field  # type: ignore[misc]
-                for field in candidate_tgt.field_values.values()
-                if isinstance(field, SecondaryOwnerMixin)
-            )
-            for secondary_owner_field in secondary_owner_fields:
+            # primary ownership, but the target still should match the file.
+            for secondary_owner_field in _secondary_owner_fields(candidate_tgt):
                 matching_files.update(
                     matches_filespec(secondary_owner_field.filespec, paths=sources_set)
                 )
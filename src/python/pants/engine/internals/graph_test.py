@@ -29,12 +29,15 @@ from pants.engine.fs import (
     Snapshot,
     SpecsSnapshot,
 )
+from pants.engine.internals import graph
 from pants.engine.internals.graph import (
     AmbiguousCodegenImplementationsException,
     AmbiguousImplementationsException,
     CycleException,
     NoApplicableTargetsException,
     Owners,
+    OwnersIndex,
+    OwnersIndexRequest,
     OwnersRequest,
     TooManyTargetsException,
     TransitiveExcludesNotSupportedError,
@@ -665,6 +668,7 @@ def owners_rule_runner() -> RuleRunner:
             generate_mock_generated_target,
             UnionRule(GenerateTargetsRequest, MockGenerateTargetsRequest),
             QueryRule(Owners, [OwnersRequest]),
+            QueryRule(OwnersIndex, [OwnersIndexRequest]),
         ],
         target_types=[
             MockTarget,
@@ -802,6 +806,62 @@ def test_owners_build_file(owners_rule_runner: RuleRunner) -> None:
     )
 
 
+def test_owners_index(owners_rule_runner: RuleRunner, monkeypatch) -> None:
+    owners_rule_runner.write_files(
+        {
+            "demo/f1.txt": "",
+            "demo/f2.txt": "",
+            "demo/unowned.txt": "",
+            "demo/BUILD": dedent(
+                """\
+                target(name='f1', sources=['f1.txt'])
+                generator(name='generator', sources=['f*.txt'])
+                secondary_owner(name='secondary', secondary_owner_field='f2.txt')
+                secondary_owner(name='secondary-glob', secondary_owner_field='*.txt')
+                """
+            ),
+        }
+    )
+    index = owners_rule_runner.request(OwnersIndex, [OwnersIndexRequest()])
+    assert [address for address, _ in index.secondary_owner_globs] == [
+        Address("demo", target_name="secondary-glob")
+    ]
+    owners, matched = index.owners_of(["demo/f2.txt", "demo/BUILD"])
+    assert set(owners) == {
+        Address("demo", target_name="generator", relative_file_path="f2.txt"),
+        Address("demo", target_name="secondary"),
+        Address("demo", target_name="secondary-glob"),
+        Address("demo", target_name="f1"),
+        Address("demo", target_name="generator", relative_file_path="f1.txt"),
+    }
+    # A BUILD file owns the targets defined in it, but is not owned by them.
+    assert matched == {"demo/f2.txt"}
+
+    # Only `sources` fields own sources for `tailor`, which refers to declared targets.
+    assert set(index.owned_sources) == {"demo/f1.txt", "demo/f2.txt"}
+    assert set(index.sources_owners_of(["demo/f1.txt", "demo/unowned.txt"])) == {
+        Address("demo", target_name="f1"),
+        Address("demo", target_name="generator"),
+    }
+
+    # Live files are looked up in the index, while deleted files still use ascendant targets.
+    monkeypatch.setattr(graph, "_OWNERS_INDEX_MIN_DIRS", 0)
+    assert_owners(
+        owners_rule_runner,
+        ["demo/f1.txt", "demo/deleted.txt"],
+        expected={
+            Address("demo", target_name="f1"),
+            Address("demo", target_name="generator", relative_file_path="f1.txt"),
+            Address("demo", target_name="secondary-glob"),
+        },
+    )
+    assert_owners(
+        owners_rule_runner,
+        ["demo/unowned.txt"],
+        expected={Address("demo", target_name="secondary-glob")},
+    )
+
+
 @pytest.fixture
 def specs_rule_runner() -> RuleRunner:
     return RuleRunner(
@@ -257,6 +257,7 @@ def session_record_test_observation(
 ) -> None: ...
 def session_isolated_shallow_clone(session: PySession, build_id: str) -> PySession: ...
 def graph_len(scheduler: PyScheduler) -> int: ...
+def graph_evict_idle_nodes(scheduler: PyScheduler, idle_sessions: int) -> int: ...
 def graph_visualize(scheduler: PyScheduler, session: PySession, path: str) -> None: ...
 def graph_invalidate_paths(scheduler: PyScheduler, paths: Iterable[str]) -> int: ...
 def graph_invalidate_all_paths(scheduler: PyScheduler) -> int: ...
@@ -314,6 +315,7 @@ class PySession:
         build_id: str,
         session_values: SessionValues,
         cancellation_latch: PySessionCancellationLatch,
+        advance_epoch: bool,
     ) -> None: ...
     def cancel(self) -> None: ...
     def is_cancelled(self) -> bool: ...
@@ -207,6 +207,8 @@ class Scheduler:
             local_cleanup=execution_options.process_cleanup,
             local_parallelism=execution_options.process_execution_local_parallelism,
             local_enable_nailgun=execution_options.process_execution_local_enable_nailgun,
+            local_nailgun_pool_size=execution_options.process_execution_local_nailgun_pool_size,
+            local_nailgun_idle_timeout_secs=execution_options.process_execution_local_nailgun_idle_timeout,
             remote_parallelism=execution_options.process_execution_remote_parallelism,
         )
 
@@ -289,6 +291,11 @@ class Scheduler:
     def graph_len(self) -> int:
         return native_engine.graph_len(self.py_scheduler)
 
+    def evict_idle_nodes(self, idle_sessions: int) -> int:
+        """Evicts the memoized values of Nodes which have not been used by the most recent
+        `idle_sessions` Sessions, and returns the number of evicted Nodes."""
+        return native_engine.graph_evict_idle_nodes(self.py_scheduler, idle_sessions)
+
     def execution_add_root_select(
         self, execution_request: PyExecutionRequest, subject_or_params: Any | Params, product: type
     ) -> None:
@@ -310,8 +317,13 @@ class Scheduler:
         dynamic_ui: bool = False,
         session_values: SessionValues | None = None,
         cancellation_latch: PySessionCancellationLatch | None = None,
+        advance_epoch: bool = True,
     ) -> SchedulerSession:
-        """Creates a new SchedulerSession for this Scheduler."""
+        """Creates a new SchedulerSession for this Scheduler.
+
+        Unless `advance_epoch` is False, the session begins a new epoch of use of the Graph, which
+        is used to decide which Nodes are idle when evicting them.
+        """
         return SchedulerSession(
             self,
             PySession(
@@ -320,6 +332,7 @@ class Scheduler:
                 build_id=build_id,
                 session_values=session_values or SessionValues(),
                 cancellation_latch=cancellation_latch or PySessionCancellationLatch(),
+                advance_epoch=advance_epoch,
             ),
         )
 
@@ -4,7 +4,9 @@
 from __future__ import annotations
 
 import logging
+import queue
 import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Callable, Iterable, Sequence, Tuple
@@ -19,6 +21,7 @@ from pants.engine.rules import Get, MultiGet, QueryRule, collect_rules, rule
 from pants.engine.target import Targets
 from pants.engine.unions import UnionMembership, union
 from pants.goal.run_tracker import RunTracker
+from pants.option.global_options import WorkunitsQueueFullPolicy
 from pants.option.options_bootstrapper import OptionsBootstrapper
 from pants.util.logging import LogLevel
 
@@ -168,7 +171,8 @@ async def construct_workunits_callback_factories(
 
 
 class StreamingWorkunitHandler:
-    """Periodically calls each registered WorkunitsCallback in a dedicated thread.
+    """Periodically polls for workunits, and calls each registered WorkunitsCallback with them in a
+    dedicated thread per callback.
 
     This class should be used as a context manager.
     """
@@ -183,6 +187,8 @@ class StreamingWorkunitHandler:
         report_interval_seconds: float,
         allow_async_completion: bool,
         max_workunit_verbosity: LogLevel = LogLevel.TRACE,
+        queue_size: int = 16,
+        queue_full_policy: WorkunitsQueueFullPolicy = WorkunitsQueueFullPolicy.block,
     ) -> None:
         scheduler = scheduler.isolated_shallow_clone("streaming_workunit_handler_session")
         self.callbacks = callbacks
@@ -202,6 +208,8 @@ class StreamingWorkunitHandler:
                 #  setting.
                 max_workunit_verbosity=max_workunit_verbosity,
                 allow_async_completion=allow_async_completion,
+                queue_size=queue_size,
+                queue_full_policy=queue_full_policy,
             )
             if callbacks
             else None
@@ -220,6 +228,87 @@ class StreamingWorkunitHandler:
             self.thread_runner.join()
 
 
+class _CallbackWorker(threading.Thread):
+    """Calls a single WorkunitsCallback with the batches of workunits in its bounded queue."""
+
+    def __init__(
+        self,
+        callback: WorkunitsCallback,
+        context: StreamingWorkunitContext,
+        queue_size: int,
+        queue_full_policy: WorkunitsQueueFullPolicy,
+        logging_destination: Any,
+    ) -> None:
+        super().__init__(daemon=True, name=f"WorkunitsCallback-{type(callback).__name__}")
+        self.callback = callback
+        self.context = context
+        self.queue_full_policy = queue_full_policy
+        self.logging_destination = logging_destination
+        self._queue: queue.Queue[
+            tuple[tuple[Workunit, ...], tuple[Workunit, ...], bool]
+        ] = queue.Queue(maxsize=queue_size)
+        self._failed = False
+
+        # Timing stats, which are logged once the final batch has been handled.
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.dropped_batches = 0
+
+    def submit(
+        self,
+        started_workunits: tuple[Workunit, ...],
+        completed_workunits: tuple[Workunit, ...],
+        finished: bool,
+    ) -> None:
+        batch = (started_workunits, completed_workunits, finished)
+        if finished or self.queue_full_policy == WorkunitsQueueFullPolicy.block:
+            self._queue.put(batch)
+            return
+        try:
+            self._queue.put_nowait(batch)
+        except queue.Full:
+            self.dropped_batches += 1
+
+    def _call(
+        self,
+        started_workunits: tuple[Workunit, ...],
+        completed_workunits: tuple[Workunit, ...],
+        finished: bool,
+    ) -> None:
+        start = time.time()
+        try:
+            self.callback(
+                started_workunits=started_workunits,
+                completed_workunits=completed_workunits,
+                finished=finished,
+                context=self.context,
+            )
+        except Exception as e:
+            # Rather than failing the run, skip any further calls to this callback.
+            self._failed = True
+            logger.error(
+                f"Workunits callback {self.name} failed, and will not be called again: {e!r}"
+            )
+        finally:
+            elapsed = time.time() - start
+            self.calls += 1
+            self.total_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+
+    def run(self) -> None:
+        native_engine.stdio_thread_set_destination(self.logging_destination)
+        finished = False
+        while not finished:
+            started_workunits, completed_workunits, finished = self._queue.get()
+            if not self._failed:
+                self._call(started_workunits, completed_workunits, finished)
+        logger.debug(
+            f"Workunits callback {self.name} took {self.total_seconds:.3f}s over {self.calls} "
+            f"calls (at most {self.max_seconds:.3f}s), and dropped {self.dropped_batches} batches."
+        )
+
+
 class _InnerHandler(threading.Thread):
     def __init__(
         self,
@@ -229,32 +318,44 @@ class _InnerHandler(threading.Thread):
         report_interval: float,
         max_workunit_verbosity: LogLevel,
         allow_async_completion: bool,
+        queue_size: int,
+        queue_full_policy: WorkunitsQueueFullPolicy,
     ) -> None:
         super().__init__(daemon=True)
         self.scheduler = scheduler
         self.context = context
         self.stop_request = threading.Event()
         self.report_interval = report_interval
-        self.callbacks = callbacks
         self.max_workunit_verbosity = max_workunit_verbosity
-        # TODO: Have a thread per callback so that some callbacks can always finish async even
-        #  if others must be finished synchronously.
-        self.block_until_complete = not allow_async_completion or any(
-            callback.can_finish_async is False for callback in self.callbacks
-        )
         # Get the parent thread's logging destination. Note that this thread has not yet started
         # as we are only in the constructor.
         self.logging_destination = native_engine.stdio_thread_get_destination()
+        self.workers = [
+            _CallbackWorker(
+                callback,
+                context,
+                queue_size=queue_size,
+                queue_full_policy=queue_full_policy,
+                logging_destination=self.logging_destination,
+            )
+            for callback in callbacks
+        ]
+        # Callbacks which must complete before the run does.
+        self.blocking_workers = [
+            worker
+            for worker in self.workers
+            if not allow_async_completion or worker.callback.can_finish_async is False
+        ]
 
     def poll_workunits(self, *, finished: bool) -> None:
         workunits = self.scheduler.poll_workunits(self.max_workunit_verbosity)
-        for callback in self.callbacks:
-            callback(
-                started_workunits=workunits["started"],
-                completed_workunits=workunits["completed"],
-                finished=finished,
-                context=self.context,
-            )
+        for worker in self.workers:
+            worker.submit(workunits["started"], workunits["completed"], finished)
+
+    def start(self) -> None:
+        for worker in self.workers:
+            worker.start()
+        super().start()
 
     def run(self) -> None:
         # First, set the thread's logging destination to the parent thread's, meaning the console.
@@ -267,13 +368,23 @@ class _InnerHandler(threading.Thread):
             # completed, depending on whether the thread was joined or not.
             self.poll_workunits(finished=True)
 
+    def join(self, timeout: float | None = None) -> None:
+        """Join this thread, and all callback threads."""
+        super().join(timeout)
+        for worker in self.workers:
+            worker.join(timeout)
+
     def end(self) -> None:
         self.stop_request.set()
-        if self.block_until_complete:
+        if self.blocking_workers:
             logger.debug(
-                "Async completion is disabled: waiting for workunit callbacks to complete..."
+                "Waiting for workunit callbacks which cannot complete asynchronously: "
+                f"{', '.join(worker.name for worker in self.blocking_workers)}..."
             )
+            # The final batch of workunits is polled by this thread.
             super().join()
+            for worker in self.blocking_workers:
+                worker.join()
         else:
             logger.debug(
                 "Async completion is enabled: workunit callbacks will complete in the background."
@@ -0,0 +1,100 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import threading
+from typing import cast
+
+from pants.engine.internals import native_engine
+from pants.engine.internals.scheduler import Workunit
+from pants.engine.streaming_workunit_handler import (
+    StreamingWorkunitContext,
+    WorkunitsCallback,
+    _CallbackWorker,
+)
+from pants.option.global_options import WorkunitsQueueFullPolicy
+
+
+class RecordingCallback(WorkunitsCallback):
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.unblocked = threading.Event()
+        self.unblocked.set()
+        self.completed: list[Workunit] = []
+        self.finished = False
+
+    @property
+    def can_finish_async(self) -> bool:
+        return False
+
+    def __call__(self, *, started_workunits, completed_workunits, finished, context) -> None:
+        self.unblocked.wait()
+        if self.fail:
+            raise Exception("Failed!")
+        self.completed.extend(completed_workunits)
+        self.finished = finished
+
+
+def create_worker(
+    callback: WorkunitsCallback,
+    *,
+    queue_size: int = 2,
+    queue_full_policy: WorkunitsQueueFullPolicy = WorkunitsQueueFullPolicy.block,
+) -> _CallbackWorker:
+    return _CallbackWorker(
+        callback,
+        cast(StreamingWorkunitContext, None),
+        queue_size=queue_size,
+        queue_full_policy=queue_full_policy,
+        logging_destination=native_engine.stdio_thread_get_destination(),
+    )
+
+
+def workunit(name: str) -> Workunit:
+    return {"name": name}
+
+
+def test_calls_callback() -> None:
+    callback = RecordingCallback()
+    worker = create_worker(callback)
+    worker.start()
+    worker.submit((), (workunit("a"),), finished=False)
+    worker.submit((), (workunit("b"),), finished=False)
+    worker.submit((), (), finished=True)
+    worker.join(timeout=10)
+    assert not worker.is_alive()
+    assert callback.completed == [workunit("a"), workunit("b")]
+    assert callback.finished
+    assert worker.calls == 3
+    assert worker.dropped_batches == 0
+
+
+def test_drop_when_full() -> None:
+    callback = RecordingCallback()
+    callback.unblocked.clear()
+    worker = create_worker(callback, queue_size=1, queue_full_policy=WorkunitsQueueFullPolicy.drop)
+    # Before the worker starts, the first batch fills the queue, and so the second is dropped.
+    worker.submit((), (workunit("a"),), finished=False)
+    worker.submit((), (workunit("b"),), finished=False)
+    assert worker.dropped_batches == 1
+
+    worker.start()
+    callback.unblocked.set()
+    # The final batch is never dropped.
+    worker.submit((), (workunit("c"),), finished=True)
+    worker.join(timeout=10)
+    assert callback.completed == [workunit("a"), workunit("c")]
+    assert callback.finished
+
+
+def test_failing_callback() -> None:
+    callback = RecordingCallback(fail=True)
+    worker = create_worker(callback)
+    worker.start()
+    worker.submit((), (workunit("a"),), finished=False)
+    worker.submit((), (), finished=True)
+    worker.join(timeout=10)
+    # The worker stops calling the callback after it fails, but still consumes its queue.
+    assert not worker.is_alive()
+    assert worker.calls == 1
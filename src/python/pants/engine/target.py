@@ -51,7 +51,12 @@ from pants.util.collections import ensure_list, ensure_str_list
 from pants.util.dirutil import fast_relpath
 from pants.util.docutil import doc_url
 from pants.util.frozendict import FrozenDict
-from pants.util.memo import memoized_classproperty, memoized_method, memoized_property
+from pants.util.memo import (
+    memoized_classmethod,
+    memoized_classproperty,
+    memoized_method,
+    memoized_property,
+)
 from pants.util.meta import frozen_after_init
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.strutil import pluralize
@@ -88,6 +93,10 @@ class Field:
     than `Any`. The type hint for `raw_value` is used to generate documentation, e.g. for
     `./pants help $target_type`.
 
+    Unless a field inherits `AsyncFieldMixin`, the value that it computes for a `raw_value` of
+    `None` must not depend on the `address`: a single instance of its default is shared by all
+    targets which leave the field off.
+
     Set the `help` class property with a description, which will be used in `./pants help`. For the
     best rendering, use soft wrapping (e.g. implicit string concatenation) within paragraphs, but
     hard wrapping (`\n`) to separate distinct paragraphs and/or lists.
@@ -127,6 +136,10 @@ class Field:
     deprecated_alias: ClassVar[str | None] = None
     deprecated_alias_removal_version: ClassVar[str | None] = None
 
+    # NB: There is an instance of a field for (nearly) every field of every target, so we avoid a
+    # `__dict__` per instance. Subclasses should declare `__slots__ = ()` for the same reason.
+    __slots__ = ("value", "_is_frozen")
+
     @final
     def __init__(self, raw_value: Optional[Any], address: Address) -> None:
         self._check_deprecated(raw_value, address)
@@ -228,6 +241,8 @@ class AsyncFieldMixin(Field):
         sources2 = await Get(HydratedSources, HydrateSourcesRequest(custom_tgt.get(CustomSources)))
     """
 
+    __slots__ = ("address",)
+
     @final  # type: ignore[misc]
     def __init__(self, raw_value: Optional[Any], address: Address) -> None:
         super().__init__(raw_value, address)
@@ -268,6 +283,20 @@ class AsyncFieldMixin(Field):
 _F = TypeVar("_F", bound=Field)
 
 
+# Fields without an address are immutable and equal by value, so the default of each such field type
+# is shared by all targets which leave it off, rather than being recreated per target.
+_default_fields: dict[type[Field], Field] = {}
+
+
+def _default_field(field_type: type[_F], address: Address) -> _F:
+    if issubclass(field_type, AsyncFieldMixin):
+        return field_type(None, address)
+    default = _default_fields.get(field_type)
+    if default is None:
+        default = _default_fields[field_type] = field_type(None, address)
+    return cast(_F, default)
+
+
 @frozen_after_init
 class Target:
     """A Target represents an addressable set of metadata.
@@ -343,31 +372,45 @@ class Target:
     def _calculate_field_values(
         self, unhydrated_values: dict[str, Any], address: Address
     ) -> FrozenDict[type[Field], Field]:
+        sorted_field_types, aliases_to_field_types = self._field_types_by_alias(self.plugin_fields)
         field_values = {}
-        valid_aliases = set()
-        aliases_to_field_types = {}
-        for field_type in self.field_types:
-            valid_aliases.add(field_type.alias)
-            aliases_to_field_types[field_type.alias] = field_type
-            if field_type.deprecated_alias is not None:
-                aliases_to_field_types[field_type.deprecated_alias] = field_type
         for alias, value in unhydrated_values.items():
-            if alias not in aliases_to_field_types:
+            field_type = aliases_to_field_types.get(alias)
+            if field_type is None:
+                valid_aliases = sorted(field_type.alias for field_type in sorted_field_types)
                 raise InvalidFieldException(
                     f"Unrecognized field `{alias}={value}` in target {address}. Valid fields for "
-                    f"the target type `{self.alias}`: {sorted(valid_aliases)}.",
+                    f"the target type `{self.alias}`: {valid_aliases}.",
                 )
-            field_type = aliases_to_field_types[alias]
             field_values[field_type] = field_type(value, address)
 
         # For undefined fields, mark the raw value as None.
-        for field_type in set(self.field_types) - set(field_values.keys()):
-            field_values[field_type] = field_type(None, address)
         return FrozenDict(
-            sorted(
-                field_values.items(),
-                key=lambda field_type_to_val_pair: field_type_to_val_pair[0].alias,
+            (
+                field_type,
+                field_values[field_type]
+                if field_type in field_values
+                else _default_field(field_type, address),
             )
+            for field_type in sorted_field_types
+        )
+
+    @final
+    @memoized_classmethod
+    def _field_types_by_alias(
+        cls, plugin_fields: tuple[type[Field], ...]
+    ) -> tuple[tuple[type[Field], ...], FrozenDict[str, type[Field]]]:
+        """The field types of the target type (sorted by alias), and a mapping of each of their
+        aliases (including deprecated aliases) to them."""
+        field_types = (*cls.core_fields, *plugin_fields)
+        aliases_to_field_types = {}
+        for field_type in field_types:
+            aliases_to_field_types[field_type.alias] = field_type
+            if field_type.deprecated_alias is not None:
+                aliases_to_field_types[field_type.deprecated_alias] = field_type
+        return (
+            tuple(sorted(set(field_types), key=lambda field_type: field_type.alias)),
+            FrozenDict(aliases_to_field_types),
         )
 
     @final
@@ -1263,6 +1306,8 @@ class ScalarField(Generic[T], Field):
                 return super().compute_value(raw_value, address=address)
     """
 
+    __slots__ = ()
+
     expected_type: ClassVar[Type[T]]
     expected_type_description: ClassVar[str]
     value: Optional[T]
@@ -1288,6 +1333,8 @@ class BoolField(Field):
     defined.
     """
 
+    __slots__ = ()
+
     value: bool
     default: ClassVar[bool]
 
@@ -1304,6 +1351,8 @@ class BoolField(Field):
 class TriBoolField(ScalarField[bool]):
     """A field whose value is a boolean or None, which is meant to represent a tri-state."""
 
+    __slots__ = ()
+
     expected_type = bool
     expected_type_description = "a boolean or None"
 
@@ -1337,6 +1386,8 @@ class ValidNumbers(Enum):
 
 
 class IntField(ScalarField[int]):
+    __slots__ = ()
+
     expected_type = int
     expected_type_description = "an integer"
     valid_numbers: ClassVar[ValidNumbers] = ValidNumbers.all
@@ -1349,6 +1400,8 @@ class IntField(ScalarField[int]):
 
 
 class FloatField(ScalarField[float]):
+    __slots__ = ()
+
     expected_type = float
     expected_type_description = "a float"
     valid_numbers: ClassVar[ValidNumbers] = ValidNumbers.all
@@ -1367,6 +1420,8 @@ class StringField(ScalarField[str]):
     `valid_choices`.
     """
 
+    __slots__ = ()
+
     expected_type = str
     expected_type_description = "a string"
     valid_choices: ClassVar[Optional[Union[Type[Enum], Tuple[str, ...]]]] = None
@@ -1406,6 +1461,8 @@ class SequenceField(Generic[T], Field):
                 return super().compute_value(raw_value, address=address)
     """
 
+    __slots__ = ()
+
     expected_element_type: ClassVar[Type[T]]
     expected_type_description: ClassVar[str]
     value: Optional[Tuple[T, ...]]
@@ -1431,6 +1488,8 @@ class SequenceField(Generic[T], Field):
 
 
 class StringSequenceField(SequenceField[str]):
+    __slots__ = ()
+
     expected_element_type = str
     expected_type_description = "an iterable of strings (e.g. a list of strings)"
 
@@ -1442,6 +1501,8 @@ class StringSequenceField(SequenceField[str]):
 
 
 class DictStringToStringField(Field):
+    __slots__ = ()
+
     value: Optional[FrozenDict[str, str]]
     default: ClassVar[Optional[FrozenDict[str, str]]] = None
 
@@ -1463,6 +1524,8 @@ class DictStringToStringField(Field):
 
 
 class NestedDictStringToStringField(Field):
+    __slots__ = ()
+
     value: Optional[FrozenDict[str, FrozenDict[str, str]]]
     default: ClassVar[Optional[FrozenDict[str, FrozenDict[str, str]]]] = None
 
@@ -1492,6 +1555,8 @@ class NestedDictStringToStringField(Field):
 
 
 class DictStringToStringSequenceField(Field):
+    __slots__ = ()
+
     value: Optional[FrozenDict[str, Tuple[str, ...]]]
     default: ClassVar[Optional[FrozenDict[str, Tuple[str, ...]]]] = None
 
@@ -1549,6 +1614,8 @@ class SourcesField(AsyncFieldMixin, Field):
         default glob doesn't match any files if required, to alert the user appropriately.
     """
 
+    __slots__ = ()
+
     expected_file_extensions: ClassVar[tuple[str, ...] | None] = None
     expected_num_files: ClassVar[int | range | None] = None
     uses_source_roots: ClassVar[bool] = True
@@ -1718,6 +1785,8 @@ class MultipleSourcesField(SourcesField, StringSequenceField):
     `tgt.get(MultipleSourcesField)`.
     """
 
+    __slots__ = ()
+
     alias = "sources"
     help = (
         "A list of files and globs that belong to this target.\n\n"
@@ -1741,6 +1810,8 @@ class SingleSourceField(SourcesField, StringField):
     `tgt.get(SingleSourceField)`.
     """
 
+    __slots__ = ()
+
     alias = "source"
     help = (
         "A single file that belongs to this target.\n\n"
@@ -1923,6 +1994,8 @@ class SecondaryOwnerMixin(ABC):
     properly, like the `sources` field.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def filespec(self) -> Filespec:
@@ -1966,6 +2039,8 @@ class Dependencies(StringSequenceField, AsyncFieldMixin):
     DependenciesRequest(tgt[Dependencies])`.
     """
 
+    __slots__ = ()
+
     alias = "dependencies"
     help = (
         "Addresses to other targets that this target depends on, e.g. ['helloworld/subdir:lib']."
@@ -2230,6 +2305,8 @@ class SpecialCasedDependencies(StringSequenceField, AsyncFieldMixin):
     tgt.get(MyField).to_unparsed_address_inputs()`.
     """
 
+    __slots__ = ()
+
     def to_unparsed_address_inputs(self) -> UnparsedAddressInputs:
         return UnparsedAddressInputs(self.value or (), owning_address=self.address)
 
@@ -2240,6 +2317,8 @@ class SpecialCasedDependencies(StringSequenceField, AsyncFieldMixin):
 
 
 class Tags(StringSequenceField):
+    __slots__ = ()
+
     alias = "tags"
     help = (
         "Arbitrary strings to describe a target.\n\nFor example, you may tag some test targets "
@@ -2249,6 +2328,8 @@ class Tags(StringSequenceField):
 
 
 class DescriptionField(StringField):
+    __slots__ = ()
+
     alias = "description"
     help = (
         "A human-readable description of the target.\n\nUse `./pants list --documented ::` to see "
@@ -2268,6 +2349,8 @@ class OverridesField(AsyncFieldMixin, Field):
     example, `{"f.ext": {"tags": ['my_tag']}}`.
     """
 
+    __slots__ = ()
+
     alias = "overrides"
     value: dict[tuple[str, ...], dict[str, Any]] | None
     default: ClassVar[None] = None  # A default does not make sense for this field.
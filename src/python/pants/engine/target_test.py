@@ -204,6 +204,33 @@ def test_field_hydration_is_eager() -> None:
     assert "//:bad_extension" in str(exc)
 
 
+def test_default_fields_are_shared() -> None:
+    class FortranSources(MultipleSourcesField):
+        pass
+
+    class FortranLibrary(Target):
+        alias = "fortran_library"
+        core_fields = (FortranVersion, FortranExtensions, FortranSources)
+
+    tgt1 = FortranLibrary({FortranVersion.alias: "dev0"}, Address("", target_name="tgt1"))
+    tgt2 = FortranLibrary({}, Address("", target_name="tgt2"))
+    assert tgt1[FortranExtensions] is tgt2[FortranExtensions]
+    assert tgt1[FortranVersion].value == "dev0"
+    assert tgt2[FortranVersion].value is None
+    # Fields with an address are not shared.
+    assert tgt1[FortranSources].address == tgt1.address
+    assert tgt2[FortranSources].address == tgt2.address
+
+    # The fields are ordered by alias.
+    assert list(tgt1.field_values) == [FortranExtensions, FortranSources, FortranVersion]
+
+
+def test_field_slots() -> None:
+    addr = Address("", target_name="tgt")
+    for field in (Tags(None, addr), Dependencies(None, addr)):
+        assert not hasattr(field, "__dict__")
+
+
 def test_has_fields() -> None:
     empty_union_membership = UnionMembership({})
     tgt = FortranTarget({}, Address("", target_name="lib"))
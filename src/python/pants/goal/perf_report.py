@@ -0,0 +1,308 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Sequence, cast
+
+from pants.engine.console import Console
+from pants.engine.goal import Goal, GoalSubsystem, LineOriented
+from pants.engine.rules import collect_rules, goal_rule
+from pants.goal.workunit_export import ExportedWorkunit, find_workunits_file, read_workunits
+from pants.option.global_options import GlobalOptions
+
+# The names of the workunits which represent the execution of a process (as opposed to, e.g., a
+# cache lookup for it).
+PROCESS_WORKUNIT_NAMES = ("run_local_process", "run_execute_request", "run_nailgun_process")
+
+_NANOS_PER_SEC = 1_000_000_000
+
+
+@dataclass(frozen=True)
+class CriticalPathEntry:
+    depth: int
+    workunit: ExportedWorkunit
+
+
+def _children_by_parent(
+    workunits: Iterable[ExportedWorkunit],
+) -> tuple[list[ExportedWorkunit], dict[str, list[ExportedWorkunit]]]:
+    """Returns the roots of the workunit forest, and the children of each workunit."""
+    workunits = list(workunits)
+    span_ids = {wu.span_id for wu in workunits}
+    roots = []
+    children: dict[str, list[ExportedWorkunit]] = defaultdict(list)
+    for wu in workunits:
+        if wu.parent_id is None or wu.parent_id not in span_ids:
+            roots.append(wu)
+        else:
+            children[wu.parent_id].append(wu)
+    return roots, children
+
+
+def _blocking_children(children: Sequence[ExportedWorkunit]) -> list[ExportedWorkunit]:
+    """The chain of children which the completion of their parent waited on, in execution order.
+
+    Starting from the child which completed last, this repeatedly selects the child which
+    completed last before the previously selected child started.
+    """
+    chain = []
+    bound = None
+    for child in sorted(children, key=lambda wu: wu.end_nanos, reverse=True):
+        if bound is None or child.end_nanos <= bound:
+            chain.append(child)
+            bound = child.start_nanos
+    chain.reverse()
+    return chain
+
+
+def critical_path(workunits: Iterable[ExportedWorkunit]) -> list[CriticalPathEntry]:
+    """The chain of workunits which determined the duration of the run.
+
+    The path starts at the longest root workunit, and descends through the children which each
+    workunit waited on. Reducing the duration of workunits on the critical path (or removing them)
+    will reduce the duration of the run, whereas workunits off of the path ran concurrently with it.
+    """
+    roots, children = _children_by_parent(workunits)
+    if not roots:
+        return []
+    path = []
+    stack = [(0, max(roots, key=lambda wu: wu.duration_nanos))]
+    while stack:
+        depth, wu = stack.pop()
+        path.append(CriticalPathEntry(depth, wu))
+        stack.extend(
+            (depth + 1, child) for child in reversed(_blocking_children(children[wu.span_id]))
+        )
+    return path
+
+
+def _union_nanos(intervals: Iterable[tuple[int, int]]) -> int:
+    total = 0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - cast(int, current_start)
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - cast(int, current_start)
+    return total
+
+
+def self_time_nanos(workunits: Iterable[ExportedWorkunit]) -> dict[str, tuple[int, int]]:
+    """The number of workunits with each name, and their total self time.
+
+    The self time of a workunit is the portion of its duration during which none of its children
+    were running.
+    """
+    workunits = list(workunits)
+    _, children = _children_by_parent(workunits)
+    result: dict[str, tuple[int, int]] = {}
+    for wu in workunits:
+        children_nanos = _union_nanos(
+            (max(child.start_nanos, wu.start_nanos), min(child.end_nanos, wu.end_nanos))
+            for child in children[wu.span_id]
+            if child.start_nanos < wu.end_nanos and child.end_nanos > wu.start_nanos
+        )
+        count, total = result.get(wu.name, (0, 0))
+        result[wu.name] = (count + 1, total + max(0, wu.duration_nanos - children_nanos))
+    return result
+
+
+def _intervals(workunits: Sequence[ExportedWorkunit], intervals: int) -> tuple[int, float] | None:
+    """The start of the run, and the width of each of `intervals` equal intervals of its duration."""
+    roots, _ = _children_by_parent(workunits)
+    if not roots:
+        return None
+    start = min(wu.start_nanos for wu in roots)
+    end = max(wu.end_nanos for wu in roots)
+    if end <= start:
+        return None
+    return start, (end - start) / intervals
+
+
+def parallelism(workunits: Iterable[ExportedWorkunit], *, intervals: int) -> list[float]:
+    """The effective parallelism of the run in each of `intervals` equal intervals of its duration.
+
+    The effective parallelism during an interval is the average number of processes which were
+    executing during it. Other workunits are not counted, since they might be blocked (e.g. while
+    waiting for a slot in which to execute a process). Intervals with a parallelism below the number
+    of available cores are those in which more cores would not have helped.
+    """
+    workunits = list(workunits)
+    bounds = _intervals(workunits, intervals)
+    if bounds is None:
+        return []
+    start, width = bounds
+    busy_nanos = [0.0] * intervals
+    for wu in workunits:
+        if wu.name not in PROCESS_WORKUNIT_NAMES:
+            continue
+        first = max(0, int((wu.start_nanos - start) // width))
+        last = min(intervals - 1, int((wu.end_nanos - start) // width))
+        for i in range(first, last + 1):
+            interval_start = start + i * width
+            overlap = min(interval_start + width, wu.end_nanos) - max(
+                interval_start, wu.start_nanos
+            )
+            if overlap > 0:
+                busy_nanos[i] += overlap
+    return [busy / width for busy in busy_nanos]
+
+
+def process_totals(workunits: Iterable[ExportedWorkunit]) -> dict[str, tuple[int, int]]:
+    """The number and total duration of process executions, by how they were executed."""
+    result: dict[str, tuple[int, int]] = {}
+    for wu in workunits:
+        if wu.name in PROCESS_WORKUNIT_NAMES:
+            count, total = result.get(wu.name, (0, 0))
+            result[wu.name] = (count + 1, total + wu.duration_nanos)
+    return result
+
+
+def counter_totals(workunits: Iterable[ExportedWorkunit]) -> Counter[str]:
+    counters: Counter[str] = Counter()
+    for wu in workunits:
+        counters.update(wu.counters)
+    return counters
+
+
+def _secs(nanos: int) -> str:
+    return f"{nanos / _NANOS_PER_SEC:.3f}s"
+
+
+def format_critical_path(workunits: Sequence[ExportedWorkunit]) -> list[str]:
+    path = critical_path(workunits)
+    if not path:
+        return []
+    lines = [f"Critical path ({_secs(path[0].workunit.duration_nanos)}):"]
+    for entry in path:
+        wu = entry.workunit
+        description = f" ({wu.description})" if wu.description else ""
+        lines.append(
+            f"  {_secs(wu.duration_nanos):>10}  {'  ' * entry.depth}{wu.name}{description}"
+        )
+    return lines
+
+
+def format_parallelism(workunits: Sequence[ExportedWorkunit], *, intervals: int = 10) -> list[str]:
+    by_interval = parallelism(workunits, intervals=intervals)
+    bounds = _intervals(workunits, intervals)
+    if not by_interval or bounds is None:
+        return []
+    _, width = bounds
+    lines = [f"Effective parallelism (average {sum(by_interval) / intervals:.1f}):"]
+    for i, value in enumerate(by_interval):
+        lines.append(
+            f"  {_secs(round(i * width)):>10} - {_secs(round((i + 1) * width)):>10}  {value:.1f}"
+        )
+    return lines
+
+
+def format_report(workunits: Sequence[ExportedWorkunit], *, top: int) -> list[str]:
+    lines = []
+    for section in (format_critical_path(workunits), format_parallelism(workunits)):
+        if section:
+            lines.extend(section)
+            lines.append("")
+
+    self_times = sorted(self_time_nanos(workunits).items(), key=lambda item: -item[1][1])
+    lines.append(f"Self time (top {min(top, len(self_times))} of {len(self_times)}):")
+    for name, (count, total) in self_times[:top]:
+        lines.append(f"  {_secs(total):>10}  {count:>6}x  {name}")
+    lines.append("")
+
+    lines.append("Process executions:")
+    processes = process_totals(workunits)
+    if not processes:
+        lines.append("  (none)")
+    for name, (count, total) in sorted(processes.items()):
+        lines.append(f"  {_secs(total):>10}  {count:>6}x  {name}")
+
+    counters = counter_totals(workunits)
+    if counters:
+        lines.append("")
+        lines.append("Counters:")
+        lines.extend(f"  {name}: {count}" for name, count in sorted(counters.items()))
+    return lines
+
+
+class PerfReportSubsystem(LineOriented, GoalSubsystem):
+    name = "perf-report"
+    help = (
+        "Report the critical path, effective parallelism, self time of each rule, and process "
+        "executions of a previous run, from the workunits which it exported with "
+        "`--stats-export-workunits`."
+    )
+
+    @classmethod
+    def register_options(cls, register):
+        super().register_options(register)
+        register(
+            "--run-id",
+            type=str,
+            default=None,
+            help=(
+                "The id of the run to report on (e.g. `pants_run_2021_11_01_12_00_00_000_abc`). "
+                "Defaults to the most recent run which exported its workunits."
+            ),
+        )
+        register(
+            "--top",
+            type=int,
+            default=20,
+            help="The number of workunit names to report self time for.",
+        )
+
+    @property
+    def run_id(self) -> str | None:
+        return cast("str | None", self.options.run_id)
+
+    @property
+    def top(self) -> int:
+        return cast(int, self.options.top)
+
+
+class PerfReport(Goal):
+    subsystem_cls = PerfReportSubsystem
+
+
+@goal_rule
+def perf_report(
+    console: Console, perf_report_subsystem: PerfReportSubsystem, global_options: GlobalOptions
+) -> PerfReport:
+    run_tracker_dir = Path(global_options.options.pants_workdir) / "run-tracker"
+    path = find_workunits_file(run_tracker_dir, perf_report_subsystem.run_id)
+    if path is None:
+        run_description = (
+            f"run `{perf_report_subsystem.run_id}`"
+            if perf_report_subsystem.run_id
+            else "any completed run"
+        )
+        console.print_stderr(
+            f"No exported workunits were found for {run_description} in {run_tracker_dir}. "
+            "Run with `--stats-export-workunits` to export them."
+        )
+        return PerfReport(exit_code=1)
+
+    try:
+        workunits = read_workunits(path)
+    except ValueError as e:
+        console.print_stderr(str(e))
+        return PerfReport(exit_code=1)
+    with perf_report_subsystem.line_oriented(console) as print_stdout:
+        print_stdout(f"Run {path.parent.name}: {len(workunits)} workunits.")
+        print_stdout("")
+        for line in format_report(workunits, top=perf_report_subsystem.top):
+            print_stdout(line)
+    return PerfReport(exit_code=0)
+
+
+def rules():
+    return collect_rules()
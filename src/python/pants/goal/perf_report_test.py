@@ -0,0 +1,116 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from pants.goal.perf_report import (
+    counter_totals,
+    critical_path,
+    format_parallelism,
+    format_report,
+    parallelism,
+    process_totals,
+    self_time_nanos,
+)
+from pants.goal.workunit_export import ExportedWorkunit
+
+
+def workunit(
+    span_id: str,
+    parent_id: str | None,
+    name: str,
+    start: int,
+    end: int,
+    counters: dict[str, int] | None = None,
+) -> ExportedWorkunit:
+    return ExportedWorkunit(
+        span_id=span_id,
+        parent_id=parent_id,
+        name=name,
+        level="DEBUG",
+        start_nanos=start,
+        duration_nanos=end - start,
+        description=None,
+        counters=counters or {},
+        artifacts={},
+    )
+
+
+# A root which waits on `a` and then on `c`, while `b` runs concurrently with `a`, and `d` is a
+# process which `c` waits on.
+WORKUNITS = [
+    workunit("root", None, "root", 0, 100),
+    workunit("a", "root", "rule_a", 0, 40),
+    workunit("b", "root", "rule_b", 10, 30),
+    workunit("c", "root", "rule_c", 50, 95, counters={"local_cache_requests": 1}),
+    workunit("d", "c", "run_local_process", 60, 90, counters={"local_cache_requests": 2}),
+]
+
+
+def test_critical_path() -> None:
+    assert [(entry.depth, entry.workunit.span_id) for entry in critical_path(WORKUNITS)] == [
+        (0, "root"),
+        (1, "a"),
+        (1, "c"),
+        (2, "d"),
+    ]
+    assert critical_path([]) == []
+
+
+def test_self_time() -> None:
+    assert self_time_nanos(WORKUNITS) == {
+        # 100 minus the union of [0, 40] and [50, 95].
+        "root": (1, 15),
+        "rule_a": (1, 40),
+        "rule_b": (1, 20),
+        "rule_c": (1, 15),
+        "run_local_process": (1, 30),
+    }
+
+
+def test_parallelism() -> None:
+    # Only process `d` is counted, which runs during [60, 90].
+    assert parallelism(WORKUNITS, intervals=5) == [0.0, 0.0, 0.0, 1.0, 0.5]
+    assert parallelism([], intervals=5) == []
+
+
+def test_parallelism_queued_process() -> None:
+    # The second process waits for a slot while the first runs, which is not parallel work.
+    workunits = [
+        workunit("root", None, "root", 0, 100),
+        workunit("p1", "root", "process", 0, 50),
+        workunit("r1", "p1", "run_local_process", 0, 50),
+        workunit("p2", "root", "process", 0, 100),
+        workunit("s2", "p2", "acquire_command_runner_slot", 0, 50),
+        workunit("r2", "p2", "run_local_process", 50, 100),
+    ]
+    assert parallelism(workunits, intervals=2) == [1.0, 1.0]
+
+
+def test_format_parallelism() -> None:
+    second = 1_000_000_000
+    workunits = [
+        workunit("root", None, "root", 0, 2 * second),
+        workunit("p", "root", "run_local_process", 0, second),
+    ]
+    assert format_parallelism(workunits, intervals=3) == [
+        "Effective parallelism (average 0.5):",
+        "      0.000s -     0.667s  1.0",
+        "      0.667s -     1.333s  0.5",
+        "      1.333s -     2.000s  0.0",
+    ]
+    assert format_parallelism([], intervals=3) == []
+
+
+def test_totals() -> None:
+    assert process_totals(WORKUNITS) == {"run_local_process": (1, 30)}
+    assert counter_totals(WORKUNITS) == {"local_cache_requests": 3}
+
+
+def test_format_report() -> None:
+    report = format_report(WORKUNITS, top=2)
+    assert report[0] == "Critical path (0.000s):"
+    assert "Effective parallelism (average 0.3):" in report
+    assert "Self time (top 2 of 5):" in report
+    assert "Process executions:" in report
+    assert "  local_cache_requests: 3" in report
@@ -91,8 +91,10 @@ class RunTracker:
         # pantsd stats.
         self._pantsd_metrics: dict[str, int] = dict()
 
-        self.run_logs_file = info_dir / self.run_id / "logs"
-        self.run_logs_file.parent.mkdir(exist_ok=True, parents=True)
+        # A directory for files which are specific to this run, such as its logs.
+        self.run_dir = info_dir / self.run_id
+        self.run_dir.mkdir(exist_ok=True, parents=True)
+        self.run_logs_file = self.run_dir / "logs"
         native_engine.set_per_run_log_path(str(self.run_logs_file))
 
         # Initialized in `start()`.
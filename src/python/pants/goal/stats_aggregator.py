@@ -5,9 +5,12 @@ from __future__ import annotations
 
 import base64
 import logging
+import os
 from collections import Counter
+from pathlib import Path
 from typing import cast
 
+from pants.base.build_environment import get_buildroot
 from pants.engine.internals.scheduler import Workunit
 from pants.engine.rules import collect_rules, rule
 from pants.engine.streaming_workunit_handler import (
@@ -17,6 +20,9 @@ from pants.engine.streaming_workunit_handler import (
     WorkunitsCallbackFactoryRequest,
 )
 from pants.engine.unions import UnionRule
+from pants.goal.perf_report import format_critical_path, format_parallelism
+from pants.goal.trace_export import TraceFileCallback
+from pants.goal.workunit_export import ExportedWorkunit, WorkunitExportCallback
 from pants.option.subsystem import Subsystem
 
 logger = logging.getLogger(__name__)
@@ -40,11 +46,60 @@ class StatsAggregatorSubsystem(Subsystem):
                 "`[GLOBAL].plugins`."
             ),
         )
+        register(
+            "--export-workunits",
+            advanced=True,
+            type=bool,
+            default=False,
+            help=(
+                "Record all completed workunits of the run (their names, timings, counters and "
+                "artifact digests) to a compact file in the run's directory under "
+                "`[GLOBAL].pants_workdir`, for analysis with the `perf-report` goal."
+            ),
+        )
+
+        register(
+            "--critical-path",
+            advanced=True,
+            type=bool,
+            default=False,
+            help=(
+                "At the end of the Pants run, log its critical path: the chain of rules and "
+                "processes which determined its duration. Also log the effective parallelism of "
+                "the run over time, which shows where more cores would (and would not) have made "
+                "the run faster."
+            ),
+        )
+
+        register(
+            "--trace-file",
+            advanced=True,
+            type=str,
+            default=None,
+            help=(
+                "Write the workunits of the run to this path (relative to the build root) in the "
+                "Chrome Trace Event Format, for viewing with https://ui.perfetto.dev or "
+                "`chrome://tracing`. Processes are shown on the execution slot that they ran in, "
+                "along with cache hits and counters."
+            ),
+        )
 
     @property
     def log(self) -> bool:
         return cast(bool, self.options.log)
 
+    @property
+    def critical_path(self) -> bool:
+        return cast(bool, self.options.critical_path)
+
+    @property
+    def export_workunits(self) -> bool:
+        return cast(bool, self.options.export_workunits)
+
+    @property
+    def trace_file(self) -> str | None:
+        return cast("str | None", self.options.trace_file)
+
 
 class StatsAggregatorCallback(WorkunitsCallback):
     def __init__(self, *, has_histogram_module: bool) -> None:
@@ -117,6 +172,38 @@ class StatsAggregatorCallback(WorkunitsCallback):
             )
 
 
+class CriticalPathCallback(WorkunitsCallback):
+    """Logs the critical path of a run: see `[stats].critical_path`."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.workunits: list[ExportedWorkunit] = []
+
+    @property
+    def can_finish_async(self) -> bool:
+        # We need to finish synchronously for access to the console.
+        return False
+
+    def __call__(
+        self,
+        *,
+        started_workunits: tuple[Workunit, ...],
+        completed_workunits: tuple[Workunit, ...],
+        finished: bool,
+        context: StreamingWorkunitContext,
+    ) -> None:
+        self.workunits.extend(ExportedWorkunit.from_workunit(wu) for wu in completed_workunits)
+        if not finished:
+            return
+
+        critical_path_lines = format_critical_path(self.workunits)
+        if not critical_path_lines:
+            logger.info("No workunits were completed, so there is no critical path.")
+            return
+        logger.info("\n".join(critical_path_lines))
+        logger.info("\n".join(format_parallelism(self.workunits)))
+
+
 class StatsAggregatorCallbackFactoryRequest:
     """A unique request type that is installed to trigger construction of the WorkunitsCallback."""
 
@@ -147,8 +234,48 @@ def construct_callback(
     )
 
 
+class CriticalPathCallbackFactoryRequest:
+    """A unique request type that is installed to trigger construction of the WorkunitsCallback."""
+
+
+@rule
+def construct_critical_path_callback(
+    _: CriticalPathCallbackFactoryRequest, subsystem: StatsAggregatorSubsystem
+) -> WorkunitsCallbackFactory:
+    enabled = subsystem.critical_path
+    return WorkunitsCallbackFactory(lambda: CriticalPathCallback() if enabled else None)
+
+
+class WorkunitExportCallbackFactoryRequest:
+    """A unique request type that is installed to trigger construction of the WorkunitsCallback."""
+
+
+@rule
+def construct_workunit_export_callback(
+    _: WorkunitExportCallbackFactoryRequest, subsystem: StatsAggregatorSubsystem
+) -> WorkunitsCallbackFactory:
+    enabled = subsystem.export_workunits
+    return WorkunitsCallbackFactory(lambda: WorkunitExportCallback() if enabled else None)
+
+
+class TraceFileCallbackFactoryRequest:
+    """A unique request type that is installed to trigger construction of the WorkunitsCallback."""
+
+
+@rule
+def construct_trace_file_callback(
+    _: TraceFileCallbackFactoryRequest, subsystem: StatsAggregatorSubsystem
+) -> WorkunitsCallbackFactory:
+    trace_file = subsystem.trace_file
+    path = Path(get_buildroot(), os.path.expanduser(trace_file)) if trace_file else None
+    return WorkunitsCallbackFactory(lambda: TraceFileCallback(path) if path else None)
+
+
 def rules():
     return [
         UnionRule(WorkunitsCallbackFactoryRequest, StatsAggregatorCallbackFactoryRequest),
+        UnionRule(WorkunitsCallbackFactoryRequest, CriticalPathCallbackFactoryRequest),
+        UnionRule(WorkunitsCallbackFactoryRequest, WorkunitExportCallbackFactoryRequest),
+        UnionRule(WorkunitsCallbackFactoryRequest, TraceFileCallbackFactoryRequest),
         *collect_rules(),
     ]
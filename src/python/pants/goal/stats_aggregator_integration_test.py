@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
+import json
 import re
+from pathlib import Path
 
 from pants.testutil.pants_integration_test import run_pants, setup_tmpdir
 
@@ -39,3 +41,25 @@ def test_warn_if_no_histograms() -> None:
     assert "Counters:" in result.stderr
     assert "Please run with `--plugins=hdrhistogram`" in result.stderr
     assert "Observation histogram summaries:" not in result.stderr
+
+
+def test_critical_path() -> None:
+    result = run_pants(["--stats-critical-path", "roots"])
+    result.assert_success()
+    assert "Critical path (" in result.stderr
+    assert "Effective parallelism (average " in result.stderr
+
+
+def test_export_workunits() -> None:
+    run_pants(["--stats-export-workunits", "roots"]).assert_success()
+    result = run_pants(["perf-report"])
+    result.assert_success()
+    assert "Critical path (" in result.stdout
+    assert "Self time (top " in result.stdout
+
+
+def test_trace_file(tmp_path: Path) -> None:
+    trace_file = tmp_path / "trace.json"
+    run_pants(["--stats-trace-file", str(trace_file), "roots"]).assert_success()
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    assert any(event["ph"] == "X" for event in events)
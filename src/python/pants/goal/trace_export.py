@@ -0,0 +1,212 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""Conversion of the completed workunits of a run to the Chrome Trace Event Format.
+
+The resulting file can be opened with https://ui.perfetto.dev or `chrome://tracing`. Processes
+which held an execution slot are placed on one track per slot, which shows how well the slots were
+utilized. All other workunits are packed onto as few tracks as possible, such that a workunit is
+only ever drawn beneath its own parent.
+
+See https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+from pants.engine.internals.scheduler import Workunit
+from pants.engine.streaming_workunit_handler import StreamingWorkunitContext, WorkunitsCallback
+from pants.goal.workunit_export import ExportedWorkunit
+
+logger = logging.getLogger(__name__)
+
+
+# The (Chrome trace) process ids of the two groups of tracks.
+RULES_PID = 1
+PROCESSES_PID = 2
+
+# The values of the `source` metadata of a process which was not run, because it hit a cache.
+CACHE_HIT_SOURCES = ("HitLocally", "HitRemotely")
+
+_NANOS_PER_MICRO = 1_000
+
+
+def _execution_slots(workunits: Sequence[ExportedWorkunit]) -> dict[str, int]:
+    """The execution slot of each workunit which ran in one, or whose ancestor did."""
+    by_span_id = {wu.span_id: wu for wu in workunits}
+    slots: dict[str, int | None] = {}
+    for wu in workunits:
+        chain = []
+        current: ExportedWorkunit | None = wu
+        slot = None
+        while current is not None:
+            if current.span_id in slots:
+                slot = slots[current.span_id]
+                break
+            chain.append(current.span_id)
+            current_slot = current.metadata.get("execution_slot")
+            if isinstance(current_slot, int):
+                slot = current_slot
+                break
+            current = by_span_id.get(current.parent_id) if current.parent_id else None
+        for span_id in chain:
+            slots[span_id] = slot
+    return {span_id: slot for span_id, slot in slots.items() if slot is not None}
+
+
+class _Track:
+    """A track on which each workunit is either nested directly within its parent, or follows the
+    workunits before it."""
+
+    def __init__(self) -> None:
+        # The span ids and end times of the currently open workunits on the track, outermost first.
+        self._open: list[tuple[str, int]] = []
+
+    def try_place(self, wu: ExportedWorkunit) -> bool:
+        while self._open and self._open[-1][1] <= wu.start_nanos:
+            self._open.pop()
+        if self._open:
+            span_id, end_nanos = self._open[-1]
+            if span_id != wu.parent_id or end_nanos < wu.end_nanos:
+                return False
+        self._open.append((wu.span_id, wu.end_nanos))
+        return True
+
+
+def _rule_tracks(workunits: Iterable[ExportedWorkunit]) -> dict[str, int]:
+    """Assign workunits to tracks, preferring the track of their parent."""
+    tracks: list[_Track] = []
+    assignments: dict[str, int] = {}
+    for wu in sorted(workunits, key=lambda wu: (wu.start_nanos, -wu.duration_nanos)):
+        parent_track = assignments.get(wu.parent_id) if wu.parent_id else None
+        candidates = [parent_track] if parent_track is not None else []
+        candidates.extend(i for i in range(len(tracks)) if i != parent_track)
+        for i in candidates:
+            if tracks[i].try_place(wu):
+                assignments[wu.span_id] = i
+                break
+        else:
+            track = _Track()
+            track.try_place(wu)
+            assignments[wu.span_id] = len(tracks)
+            tracks.append(track)
+    return assignments
+
+
+def _micros(nanos: int) -> float:
+    return nanos / _NANOS_PER_MICRO
+
+
+def trace_events(workunits: Sequence[ExportedWorkunit]) -> list[dict[str, Any]]:
+    """Convert workunits to trace events, with timestamps relative to the start of the first."""
+    if not workunits:
+        return []
+    start = min(wu.start_nanos for wu in workunits)
+    slots = _execution_slots(workunits)
+    rule_tracks = _rule_tracks(wu for wu in workunits if wu.span_id not in slots)
+
+    events: list[dict[str, Any]] = [
+        {"ph": "M", "name": "process_name", "pid": RULES_PID, "args": {"name": "Rules"}},
+        {"ph": "M", "name": "process_name", "pid": PROCESSES_PID, "args": {"name": "Processes"}},
+    ]
+    events.extend(
+        {
+            "ph": "M",
+            "name": "thread_name",
+            "pid": PROCESSES_PID,
+            "tid": slot,
+            "args": {"name": f"Execution slot {slot}"},
+        }
+        for slot in sorted(set(slots.values()))
+    )
+
+    for wu in workunits:
+        if wu.span_id in slots:
+            pid, tid, category = PROCESSES_PID, slots[wu.span_id], "process"
+        else:
+            pid, tid, category = RULES_PID, rule_tracks[wu.span_id], "rule"
+        args: dict[str, Any] = {"level": wu.level, **wu.metadata}
+        if wu.description:
+            args["description"] = wu.description
+        if wu.counters:
+            args["counters"] = wu.counters
+        events.append(
+            {
+                "ph": "X",
+                "name": wu.name,
+                "cat": category,
+                "ts": _micros(wu.start_nanos - start),
+                "dur": _micros(wu.duration_nanos),
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            }
+        )
+        if wu.metadata.get("source") in CACHE_HIT_SOURCES:
+            events.append(
+                {
+                    "ph": "i",
+                    "s": "t",
+                    "name": f"Cache hit: {wu.description or wu.name}",
+                    "cat": "cache",
+                    "ts": _micros(wu.end_nanos - start),
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"source": wu.metadata["source"]},
+                }
+            )
+
+    # Counters are reported as running totals, as of the completion of each workunit.
+    totals: Counter[str] = Counter()
+    for wu in sorted(workunits, key=lambda wu: wu.end_nanos):
+        for name, value in sorted(wu.counters.items()):
+            totals[name] += value
+            events.append(
+                {
+                    "ph": "C",
+                    "name": name,
+                    "ts": _micros(wu.end_nanos - start),
+                    "pid": RULES_PID,
+                    "args": {"value": totals[name]},
+                }
+            )
+    return events
+
+
+def write_trace(workunits: Sequence[ExportedWorkunit], path: str | os.PathLike) -> None:
+    with open(path, "w") as f:
+        json.dump({"traceEvents": trace_events(workunits), "displayTimeUnit": "ms"}, f)
+
+
+class TraceFileCallback(WorkunitsCallback):
+    """Writes the workunits of a run to a trace file: see `[stats].trace_file`."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__()
+        self._path = path
+        self._workunits: list[ExportedWorkunit] = []
+
+    @property
+    def can_finish_async(self) -> bool:
+        return True
+
+    def __call__(
+        self,
+        *,
+        started_workunits: tuple[Workunit, ...],
+        completed_workunits: tuple[Workunit, ...],
+        finished: bool,
+        context: StreamingWorkunitContext,
+    ) -> None:
+        self._workunits.extend(ExportedWorkunit.from_workunit(wu) for wu in completed_workunits)
+        if not finished:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        write_trace(self._workunits, self._path)
+        logger.debug(f"Wrote a trace of {len(self._workunits)} workunits to {self._path}.")
@@ -0,0 +1,119 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from pants.goal.trace_export import PROCESSES_PID, RULES_PID, trace_events, write_trace
+from pants.goal.workunit_export import ExportedWorkunit
+
+
+def workunit(
+    span_id: str,
+    parent_id: str | None,
+    name: str,
+    start: int,
+    end: int,
+    **kwargs,
+) -> ExportedWorkunit:
+    return ExportedWorkunit(
+        span_id=span_id,
+        parent_id=parent_id,
+        name=name,
+        level="DEBUG",
+        start_nanos=1_000_000 + start * 1_000,
+        duration_nanos=(end - start) * 1_000,
+        description=kwargs.pop("description", None),
+        counters=kwargs.pop("counters", {}),
+        artifacts={},
+        metadata=kwargs.pop("metadata", {}),
+    )
+
+
+# A root rule with two concurrent children, one of which runs a process in slot 1, and a process
+# which hit the cache.
+WORKUNITS = [
+    workunit("root", None, "root", 0, 100),
+    workunit("a", "root", "rule_a", 0, 60),
+    workunit("b", "root", "rule_b", 10, 50),
+    workunit(
+        "p",
+        "a",
+        "multi_platform_process",
+        5,
+        55,
+        metadata={"execution_slot": 1, "source": "RanLocally"},
+        counters={"local_process_total_time_run_ms": 50},
+    ),
+    workunit("l", "p", "run_local_process", 6, 54, description="Run pytest"),
+    workunit(
+        "h",
+        "b",
+        "multi_platform_process",
+        20,
+        21,
+        description="Build a PEX",
+        metadata={"source": "HitLocally"},
+        counters={"local_cache_requests_cached": 1},
+    ),
+]
+
+
+def events_by_phase(phase: str) -> list[dict]:
+    return [event for event in trace_events(WORKUNITS) if event["ph"] == phase]
+
+
+def test_complete_events() -> None:
+    complete = {event["name"] + ":" + str(event["ts"]): event for event in events_by_phase("X")}
+    assert len(complete) == len(WORKUNITS)
+
+    tracks = {
+        (event["name"], event["ts"]): (event["pid"], event["tid"]) for event in complete.values()
+    }
+    # Processes (and their children) are placed on the track of their execution slot.
+    assert tracks[("multi_platform_process", 5.0)] == (PROCESSES_PID, 1)
+    assert tracks[("run_local_process", 6.0)] == (PROCESSES_PID, 1)
+    # The root and its first child share a track. The second child (and the cache hit below it)
+    # would be drawn beneath the first child on that track, so it needs another.
+    assert tracks[("root", 0.0)] == (RULES_PID, 0)
+    assert tracks[("rule_a", 0.0)] == (RULES_PID, 0)
+    assert tracks[("rule_b", 10.0)] == (RULES_PID, 1)
+    assert tracks[("multi_platform_process", 20.0)] == (RULES_PID, 1)
+
+    process = complete["run_local_process:6.0"]
+    assert process["dur"] == 48.0
+    assert process["args"] == {"level": "DEBUG", "description": "Run pytest"}
+
+
+def test_metadata_events() -> None:
+    assert {
+        (event["name"], event["pid"], event.get("tid")): event["args"]["name"]
+        for event in events_by_phase("M")
+    } == {
+        ("process_name", RULES_PID, None): "Rules",
+        ("process_name", PROCESSES_PID, None): "Processes",
+        ("thread_name", PROCESSES_PID, 1): "Execution slot 1",
+    }
+
+
+def test_cache_hits_and_counters() -> None:
+    assert [(event["name"], event["ts"]) for event in events_by_phase("i")] == [
+        ("Cache hit: Build a PEX", 21.0)
+    ]
+    assert [(event["name"], event["ts"], event["args"]) for event in events_by_phase("C")] == [
+        ("local_cache_requests_cached", 21.0, {"value": 1}),
+        ("local_process_total_time_run_ms", 55.0, {"value": 50}),
+    ]
+
+
+def test_write_trace(tmp_path: Path) -> None:
+    path = tmp_path / "trace.json"
+    write_trace(WORKUNITS, path)
+    trace = json.loads(path.read_text())
+    assert trace["displayTimeUnit"] == "ms"
+    assert trace["traceEvents"] == trace_events(WORKUNITS)
+
+    write_trace([], path)
+    assert json.loads(path.read_text())["traceEvents"] == []
@@ -0,0 +1,188 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""A compact, append-only export of the completed workunits of a run, for offline analysis.
+
+An export file begins with `MAGIC`, which is followed by one batch per poll of the
+StreamingWorkunitHandler. Each batch is a 4-byte big-endian length, followed by that many bytes of
+zlib-compressed JSON which holds one list per column of `ExportedWorkunit`. Storing the workunits of
+a batch by column (rather than as one object per workunit) keeps repeated keys out of the file, and
+places similar values (e.g. rule names) next to one another, which compresses well.
+
+See the `perf-report` goal.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import zlib
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Sequence
+
+from pants.engine.fs import Digest, FileDigest, Snapshot
+from pants.engine.internals.scheduler import Workunit
+from pants.engine.streaming_workunit_handler import StreamingWorkunitContext, WorkunitsCallback
+
+logger = logging.getLogger(__name__)
+
+
+# The final byte is the version of the format, which must be bumped whenever the columns change.
+MAGIC = b"PANTSWU\x02"
+# The name of the export file in the run's directory (see `RunTracker.run_dir`). The file is written
+# with a suffix, and renamed once the run has completed.
+WORKUNITS_FILE_NAME = "workunits"
+_PARTIAL_SUFFIX = ".partial"
+_LENGTH = struct.Struct(">I")
+
+
+@dataclass(frozen=True)
+class ExportedWorkunit:
+    span_id: str
+    parent_id: str | None
+    name: str
+    level: str
+    # Nanoseconds since the epoch.
+    start_nanos: int
+    duration_nanos: int
+    description: str | None
+    counters: dict[str, int]
+    # Artifact names to the fingerprint and size of their (File)Digest.
+    artifacts: dict[str, tuple[str, int]]
+    # The metadata of the workunit which has a serializable value (e.g. the `execution_slot` of a
+    # process).
+    metadata: dict[str, int | str] = field(default_factory=dict)
+
+    @property
+    def end_nanos(self) -> int:
+        return self.start_nanos + self.duration_nanos
+
+    @classmethod
+    def from_workunit(cls, workunit: Workunit) -> ExportedWorkunit:
+        """Convert a completed workunit as reported to a `WorkunitsCallback`."""
+        artifacts = {}
+        for name, artifact in workunit.get("artifacts", {}).items():
+            digest: Digest | FileDigest = (
+                artifact.digest if isinstance(artifact, Snapshot) else artifact
+            )
+            artifacts[name] = (digest.fingerprint, digest.serialized_bytes_length)
+        return cls(
+            span_id=workunit["span_id"],
+            parent_id=workunit.get("parent_id"),
+            name=workunit["name"],
+            level=workunit["level"],
+            start_nanos=workunit["start_secs"] * 1_000_000_000 + workunit["start_nanos"],
+            duration_nanos=(
+                workunit.get("duration_secs", 0) * 1_000_000_000 + workunit.get("duration_nanos", 0)
+            ),
+            description=workunit.get("description"),
+            counters=dict(workunit.get("counters", {})),
+            artifacts=artifacts,
+            metadata={
+                key: value
+                for key, value in workunit.get("metadata", {}).items()
+                if isinstance(value, (int, str))
+            },
+        )
+
+
+_COLUMNS = tuple(f.name for f in fields(ExportedWorkunit))
+
+
+def encode_batch(workunits: Sequence[ExportedWorkunit]) -> bytes:
+    columns = {column: [getattr(wu, column) for wu in workunits] for column in _COLUMNS}
+    payload = zlib.compress(json.dumps(columns, separators=(",", ":")).encode())
+    return _LENGTH.pack(len(payload)) + payload
+
+
+def _decode_batch(payload: bytes) -> Iterator[ExportedWorkunit]:
+    columns: dict[str, list[Any]] = json.loads(zlib.decompress(payload))
+    for values in zip(*(columns[column] for column in _COLUMNS)):
+        row = dict(zip(_COLUMNS, values))
+        row["artifacts"] = {name: tuple(digest) for name, digest in row["artifacts"].items()}
+        yield ExportedWorkunit(**row)
+
+
+def _read_batches(f: BinaryIO) -> Iterator[ExportedWorkunit]:
+    magic = f.read(len(MAGIC))
+    if magic != MAGIC:
+        if len(magic) == len(MAGIC) and magic[:-1] == MAGIC[:-1]:
+            raise ValueError(
+                f"{f.name} is in version {magic[-1]} of the workunits export format, but only "
+                f"version {MAGIC[-1]} is supported. Please re-run with `--stats-export-workunits`."
+            )
+        raise ValueError(f"{f.name} is not a workunits export file.")
+    while True:
+        header = f.read(_LENGTH.size)
+        if len(header) < _LENGTH.size:
+            return
+        (length,) = _LENGTH.unpack(header)
+        payload = f.read(length)
+        if len(payload) < length:
+            # The last batch of a run which was killed while writing it.
+            logger.debug(f"Ignoring a truncated batch at the end of {f.name}.")
+            return
+        yield from _decode_batch(payload)
+
+
+def read_workunits(path: str | os.PathLike) -> list[ExportedWorkunit]:
+    """Read all workunits from an export file, in the order that they completed."""
+    with open(path, "rb") as f:
+        return list(_read_batches(f))
+
+
+def find_workunits_file(run_tracker_dir: Path, run_id: str | None = None) -> Path | None:
+    """Find the export file of the given run, or of the most recent run which has one."""
+    if run_id is not None:
+        path = run_tracker_dir / run_id / WORKUNITS_FILE_NAME
+        return path if path.is_file() else None
+    if not run_tracker_dir.is_dir():
+        return None
+    # NB: Run ids do not reliably sort by time (their milliseconds are not zero-padded), so the most
+    # recently written export file is used.
+    paths = [
+        run_dir / WORKUNITS_FILE_NAME
+        for run_dir in run_tracker_dir.iterdir()
+        if (run_dir / WORKUNITS_FILE_NAME).is_file()
+    ]
+    return max(paths, key=lambda path: path.stat().st_mtime_ns, default=None)
+
+
+class WorkunitExportCallback(WorkunitsCallback):
+    """Exports the completed workunits of a run: see `[stats].export_workunits`."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._file: BinaryIO | None = None
+        self._path: Path | None = None
+
+    @property
+    def can_finish_async(self) -> bool:
+        return True
+
+    def __call__(
+        self,
+        *,
+        started_workunits: tuple[Workunit, ...],
+        completed_workunits: tuple[Workunit, ...],
+        finished: bool,
+        context: StreamingWorkunitContext,
+    ) -> None:
+        if self._file is None:
+            self._path = context.run_tracker.run_dir / WORKUNITS_FILE_NAME
+            self._file = open(f"{self._path}{_PARTIAL_SUFFIX}", "wb")
+            self._file.write(MAGIC)
+
+        if completed_workunits:
+            self._file.write(
+                encode_batch([ExportedWorkunit.from_workunit(wu) for wu in completed_workunits])
+            )
+            self._file.flush()
+
+        if finished:
+            self._file.close()
+            os.replace(f"{self._path}{_PARTIAL_SUFFIX}", self._path)
+            logger.debug(f"Exported workunits to {self._path}.")
@@ -0,0 +1,121 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pants.goal.workunit_export import (
+    MAGIC,
+    WORKUNITS_FILE_NAME,
+    ExportedWorkunit,
+    encode_batch,
+    find_workunits_file,
+    read_workunits,
+)
+
+
+def workunit(span_id: str, parent_id: str | None = None, **kwargs) -> ExportedWorkunit:
+    return ExportedWorkunit(
+        span_id=span_id,
+        parent_id=parent_id,
+        name=kwargs.pop("name", "some_rule"),
+        level=kwargs.pop("level", "DEBUG"),
+        start_nanos=kwargs.pop("start_nanos", 1_000),
+        duration_nanos=kwargs.pop("duration_nanos", 500),
+        description=kwargs.pop("description", None),
+        counters=kwargs.pop("counters", {}),
+        artifacts=kwargs.pop("artifacts", {}),
+        metadata=kwargs.pop("metadata", {}),
+    )
+
+
+def test_from_workunit() -> None:
+    assert ExportedWorkunit.from_workunit(
+        {
+            "name": "pants.backend.python.rules.a_rule",
+            "span_id": "a1",
+            "parent_id": "b2",
+            "level": "TRACE",
+            "start_secs": 2,
+            "start_nanos": 5,
+            "duration_secs": 1,
+            "duration_nanos": 10,
+            "description": "A rule",
+            "metadata": {"execution_slot": 3, "source": "RanLocally", "py_value": object()},
+            "artifacts": {},
+            "counters": {"local_cache_requests": 1},
+        }
+    ) == workunit(
+        "a1",
+        "b2",
+        name="pants.backend.python.rules.a_rule",
+        level="TRACE",
+        start_nanos=2_000_000_005,
+        duration_nanos=1_000_000_010,
+        description="A rule",
+        counters={"local_cache_requests": 1},
+        metadata={"execution_slot": 3, "source": "RanLocally"},
+    )
+
+
+def test_roundtrip(tmp_path: Path) -> None:
+    first_batch = [
+        workunit("a", counters={"local_cache_requests": 2}),
+        workunit(
+            "b",
+            "a",
+            description="Running a process",
+            artifacts={"stdout": ("abc", 12)},
+            metadata={"execution_slot": 1},
+        ),
+    ]
+    second_batch = [workunit("c", "a", name="other_rule")]
+    path = tmp_path / WORKUNITS_FILE_NAME
+    path.write_bytes(MAGIC + encode_batch(first_batch) + encode_batch(second_batch))
+    assert read_workunits(path) == [*first_batch, *second_batch]
+
+    # A truncated trailing batch is ignored.
+    path.write_bytes(MAGIC + encode_batch(first_batch) + encode_batch(second_batch)[:-3])
+    assert read_workunits(path) == first_batch
+
+    path.write_bytes(b"not an export")
+    with pytest.raises(ValueError, match="is not a workunits export file"):
+        read_workunits(path)
+
+    # Files in another version of the format are rejected before they are decoded.
+    path.write_bytes(MAGIC[:-1] + bytes([MAGIC[-1] - 1]) + encode_batch(first_batch))
+    with pytest.raises(ValueError, match="version 1 of the workunits export format"):
+        read_workunits(path)
+
+
+def test_find_workunits_file(tmp_path: Path) -> None:
+    assert find_workunits_file(tmp_path / "missing") is None
+
+    for run_id in ("pants_run_2021_01_01", "pants_run_2021_01_02", "pants_run_2021_01_03"):
+        (tmp_path / run_id).mkdir()
+    # The most recent run did not export its workunits.
+    for run_id in ("pants_run_2021_01_01", "pants_run_2021_01_02"):
+        (tmp_path / run_id / WORKUNITS_FILE_NAME).write_bytes(MAGIC)
+
+    expected = tmp_path / "pants_run_2021_01_02" / WORKUNITS_FILE_NAME
+    os.utime(tmp_path / "pants_run_2021_01_01" / WORKUNITS_FILE_NAME, ns=(1_000, 1_000))
+    os.utime(expected, ns=(2_000, 2_000))
+    assert find_workunits_file(tmp_path) == expected
+
+    # Run ids within the same second do not sort by time, since their milliseconds are not padded.
+    (tmp_path / "pants_run_2021_01_02_00_00_00_123_abc").mkdir()
+    (tmp_path / "pants_run_2021_01_02_00_00_00_95_def").mkdir()
+    later = tmp_path / "pants_run_2021_01_02_00_00_00_123_abc" / WORKUNITS_FILE_NAME
+    earlier = tmp_path / "pants_run_2021_01_02_00_00_00_95_def" / WORKUNITS_FILE_NAME
+    for path, mtime in ((earlier, 3_000), (later, 4_000)):
+        path.write_bytes(MAGIC)
+        os.utime(path, ns=(mtime, mtime))
+    assert find_workunits_file(tmp_path) == later
+    assert find_workunits_file(tmp_path, "pants_run_2021_01_01") == (
+        tmp_path / "pants_run_2021_01_01" / WORKUNITS_FILE_NAME
+    )
+    assert find_workunits_file(tmp_path, "pants_run_2021_01_03") is None
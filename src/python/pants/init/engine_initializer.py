@@ -25,7 +25,7 @@ from pants.engine.internals.selectors import Params
 from pants.engine.internals.session import SessionValues
 from pants.engine.rules import QueryRule, collect_rules, rule
 from pants.engine.streaming_workunit_handler import rules as streaming_workunit_handler_rules
-from pants.engine.target import RegisteredTargetTypes
+from pants.engine.target import RegisteredTargetTypes, TransitiveTargets, TransitiveTargetsRequest
 from pants.engine.unions import UnionMembership
 from pants.init import specs_calculator
 from pants.option.global_options import (
@@ -272,7 +272,9 @@ class EngineInitializer:
                     QueryRule(goal_type, GraphSession.goal_param_types)
                     for goal_type in goal_map.values()
                 ),
-                QueryRule(Snapshot, [PathGlobs]),  # Used by the SchedulerService.
+                # Used by the SchedulerService.
+                QueryRule(Snapshot, [PathGlobs]),
+                QueryRule(TransitiveTargets, [TransitiveTargetsRequest]),
             )
         )
 
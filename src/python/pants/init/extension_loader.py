@@ -3,11 +3,12 @@
 
 import importlib
 import traceback
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from pkg_resources import Requirement, WorkingSet
 
 from pants.base.exceptions import BackendConfigurationError
+from pants.build_graph.backend_manifest import MANIFEST_MODULE, BackendManifest
 from pants.build_graph.build_configuration import BuildConfiguration
 from pants.util.ordered_set import FrozenOrderedSet
 
@@ -29,6 +30,7 @@ def load_backends_and_plugins(
     working_set: WorkingSet,
     backends: List[str],
     bc_builder: Optional[BuildConfiguration.Builder] = None,
+    requested_args: Optional[Sequence[str]] = None,
 ) -> BuildConfiguration:
     """Load named plugins and source backends.
 
@@ -36,9 +38,11 @@ def load_backends_and_plugins(
     :param working_set: A pkg_resources.WorkingSet to load plugins from.
     :param backends: v2 backends to load.
     :param bc_builder: The BuildConfiguration (for adding aliases).
+    :param requested_args: If set, the command line arguments of the run, which are used to skip
+      loading the backends which declare a `BackendManifest` that the run does not need.
     """
     bc_builder = bc_builder or BuildConfiguration.Builder()
-    load_build_configuration_from_source(bc_builder, backends)
+    load_build_configuration_from_source(bc_builder, backends, requested_args)
     load_plugins(bc_builder, plugins, working_set)
     return bc_builder.create()
 
@@ -100,20 +104,68 @@ def load_plugins(
 
 
 def load_build_configuration_from_source(
-    build_configuration: BuildConfiguration.Builder, backends: List[str]
+    build_configuration: BuildConfiguration.Builder,
+    backends: List[str],
+    requested_args: Optional[Sequence[str]] = None,
 ) -> None:
     """Installs pants backend packages to provide BUILD file symbols and cli goals.
 
     :param build_configuration: The BuildConfiguration (for adding aliases).
     :param backends: An list of packages to load v2 backends from.
+    :param requested_args: If set, the command line arguments of the run, which are used to skip
+      loading the backends which declare a `BackendManifest` that the run does not need.
     :raises: :class:``pants.base.exceptions.BuildConfigurationError`` if there is a problem loading
       the build configuration.
     """
     backend_packages = FrozenOrderedSet(["pants.core", "pants.backend.project_info", *backends])
     for backend_package in backend_packages:
+        if requested_args is not None:
+            manifest = load_backend_manifest(backend_package)
+            if manifest is not None and not manifest.is_needed(requested_args):
+                load_backend_target_fields(build_configuration, backend_package, manifest)
+                continue
         load_backend(build_configuration, backend_package)
 
 
+def load_backend_manifest(backend_package: str) -> Optional[BackendManifest]:
+    """Load the `BackendManifest` of the given backend package, if it declares one."""
+    manifest_module = f"{backend_package}.{MANIFEST_MODULE}"
+    try:
+        module = importlib.import_module(manifest_module)
+    except ModuleNotFoundError as ex:
+        # The backend does not declare a manifest, or does not exist (which `load_backend` will
+        # report).
+        if ex.name is not None and f"{manifest_module}.".startswith(f"{ex.name}."):
+            return None
+        traceback.print_exc()
+        raise BackendConfigurationError(f"Failed to load {manifest_module}: {ex!r}")
+    manifest = getattr(module, "MANIFEST", None)
+    if not isinstance(manifest, BackendManifest):
+        raise BackendConfigurationError(
+            f"{manifest_module} must define a `MANIFEST` of type BackendManifest, but it was "
+            f"{manifest!r}."
+        )
+    return manifest
+
+
+def load_backend_target_fields(
+    build_configuration: BuildConfiguration.Builder,
+    backend_package: str,
+    manifest: BackendManifest,
+) -> None:
+    """Installs only the target fields of a backend which the run does not otherwise need."""
+    for field_module in manifest.target_field_modules:
+        try:
+            module = importlib.import_module(field_module)
+        except ImportError as ex:
+            traceback.print_exc()
+            raise BackendConfigurationError(
+                f"Failed to load the target fields of the {backend_package} backend: {ex!r}"
+            )
+        build_configuration.register_rules(backend_package, module.rules())
+    build_configuration.register_unloaded_options_scopes(manifest.options_scopes)
+
+
 def load_backend(build_configuration: BuildConfiguration.Builder, backend_package: str) -> None:
     """Installs the given backend package into the build configuration.
 
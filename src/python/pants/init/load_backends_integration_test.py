@@ -41,3 +41,14 @@ def test_each_distinct_backend_loads(backend) -> None:
     """This should catch graph incompleteness errors, i.e. when a required rule is not
     registered."""
     assert_backends_load([backend])
+
+
+def test_lazy_backends() -> None:
+    """Config for the backends which are not loaded by a run should not be reported as invalid."""
+    run_pants(
+        ["--lazy-backends", "roots"],
+        config={
+            "GLOBAL": {"backend_packages": ["pants.backend.python.lint.flake8"]},
+            "flake8": {"args": ["--max-line-length=100"]},
+        },
+    ).assert_success()
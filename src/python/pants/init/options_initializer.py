@@ -35,12 +35,17 @@ def _initialize_build_configuration(
     plugin_resolver: PluginResolver,
     options_bootstrapper: OptionsBootstrapper,
     env: CompleteEnvironment,
+    *,
+    allow_lazy_backends: bool = False,
 ) -> BuildConfiguration:
     """Initialize a BuildConfiguration for the given OptionsBootstrapper.
 
     NB: This method:
       1. has the side-effect of (idempotently) adding PYTHONPATH entries for this process
       2. is expensive to call, because it might resolve plugins from the network
+
+    If `allow_lazy_backends` is set and `[GLOBAL].lazy_backends` is enabled, backends which the
+    arguments of the run do not need are not loaded.
     """
 
     bootstrap_options = options_bootstrapper.get_bootstrap_options().for_global_scope()
@@ -57,6 +62,11 @@ def _initialize_build_configuration(
         bootstrap_options.plugins,
         working_set,
         bootstrap_options.backend_packages,
+        requested_args=(
+            options_bootstrapper.args[1:]
+            if allow_lazy_backends and bootstrap_options.lazy_backends
+            else None
+        ),
     )
 
 
@@ -91,21 +101,30 @@ class OptionsInitializer:
     OptionsBootstrapper as well, but for now we do the opposite thing, and the Scheduler is
     used only to resolve plugins.
       see: https://github.com/pantsbuild/pants/issues/10360
+
+    Only an OptionsInitializer whose BuildConfigurations are used for a single run should
+    `allow_lazy_backends`: a Scheduler which is shared by runs must load all backends.
     """
 
     def __init__(
         self,
         options_bootstrapper: OptionsBootstrapper,
         executor: PyExecutor | None = None,
+        *,
+        allow_lazy_backends: bool = False,
     ) -> None:
         self._bootstrap_scheduler = create_bootstrap_scheduler(options_bootstrapper, executor)
         self._plugin_resolver = PluginResolver(self._bootstrap_scheduler)
+        self._allow_lazy_backends = allow_lazy_backends
 
     def build_config_and_options(
         self, options_bootstrapper: OptionsBootstrapper, env: CompleteEnvironment, *, raise_: bool
     ) -> tuple[BuildConfiguration, Options]:
         build_config = _initialize_build_configuration(
-            self._plugin_resolver, options_bootstrapper, env
+            self._plugin_resolver,
+            options_bootstrapper,
+            env,
+            allow_lazy_backends=self._allow_lazy_backends,
         )
         with self.handle_unknown_flags(options_bootstrapper, env, raise_=raise_):
             options = options_bootstrapper.full_options(build_config)
@@ -120,7 +139,10 @@ class OptionsInitializer:
             yield
         except UnknownFlagsError as err:
             build_config = _initialize_build_configuration(
-                self._plugin_resolver, options_bootstrapper, env
+                self._plugin_resolver,
+                options_bootstrapper,
+                env,
+                allow_lazy_backends=self._allow_lazy_backends,
             )
             # We need an options instance in order to get "did you mean" suggestions, but we know
             # there are bad flags in the args, so we generate options with no flags.
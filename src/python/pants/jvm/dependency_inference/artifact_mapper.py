@@ -5,13 +5,14 @@ from __future__ import annotations
 import logging
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Iterable
+from typing import Iterable
 
 from pants.backend.java.subsystems.java_infer import JavaInferSubsystem
 from pants.build_graph.address import Address
 from pants.engine.rules import collect_rules, rule
 from pants.engine.target import AllTargets, Targets
 from pants.jvm.dependency_inference.jvm_artifact_mappings import JVM_ARTIFACT_MAPPINGS
+from pants.jvm.dependency_inference.symbol_trie import FrozenTrieNode, MutableTrieNode
 from pants.jvm.target_types import (
     JvmArtifactArtifactField,
     JvmArtifactGroupField,
@@ -20,7 +21,6 @@ from pants.jvm.target_types import (
 )
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
-from pants.util.meta import frozen_after_init
 from pants.util.ordered_set import FrozenOrderedSet, OrderedSet
 
 logger = logging.getLogger(__name__)
@@ -56,78 +56,6 @@ class AvailableThirdPartyArtifacts:
         return candidate_artifact_addresses
 
 
-class MutableTrieNode:
-    __slots__ = [
-        "children",
-        "recursive",
-        "addresses",
-        "first_party",
-    ]  # don't use a `dict` to store attrs
-
-    def __init__(self):
-        self.children: dict[str, MutableTrieNode] = {}
-        self.recursive: bool = False
-        self.addresses: OrderedSet[Address] = OrderedSet()
-        self.first_party: bool = False
-
-    def ensure_child(self, name: str) -> MutableTrieNode:
-        if name in self.children:
-            return self.children[name]
-        node = MutableTrieNode()
-        self.children[name] = node
-        return node
-
-
-@frozen_after_init
-class FrozenTrieNode:
-    __slots__ = [
-        "_is_frozen",
-        "_children",
-        "_recursive",
-        "_addresses",
-        "_first_party",
-    ]  # don't use a `dict` to store attrs (speeds up attr access significantly)
-
-    def __init__(self, node: MutableTrieNode) -> None:
-        children = {}
-        for key, child in node.children.items():
-            children[key] = FrozenTrieNode(child)
-        self._children: FrozenDict[str, FrozenTrieNode] = FrozenDict(children)
-        self._recursive: bool = node.recursive
-        self._addresses: FrozenOrderedSet[Address] = FrozenOrderedSet(node.addresses)
-        self._first_party: bool = node.first_party
-
-    def find_child(self, name: str) -> FrozenTrieNode | None:
-        return self._children.get(name)
-
-    @property
-    def recursive(self) -> bool:
-        return self._recursive
-
-    @property
-    def first_party(self) -> bool:
-        return self._first_party
-
-    @property
-    def addresses(self) -> FrozenOrderedSet[Address]:
-        return self._addresses
-
-    def __hash__(self) -> int:
-        return hash((self._children, self._recursive, self._addresses))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, FrozenTrieNode):
-            return False
-        return (
-            self._children == other._children
-            and self.recursive == other.recursive
-            and self.addresses == other.addresses
-        )
-
-    def __repr__(self):
-        return f"FrozenTrieNode(children={repr(self._children)}, recursive={self._recursive}, addresses={self._addresses}, first_party={self._first_party})"
-
-
 class AllJvmArtifactTargets(Targets):
     pass
 
@@ -209,17 +137,12 @@ async def compute_java_third_party_artifact_mapping(
         addresses: Iterable[Address],
         first_party: bool,
     ) -> None:
-        imp_parts = package_pattern.split(".")
         recursive = False
-        if imp_parts[-1] == "**":
+        if package_pattern.endswith(".**"):
             recursive = True
-            imp_parts = imp_parts[0:-1]
-
-        current_node = mapping
-        for imp_part in imp_parts:
-            child_node = current_node.ensure_child(imp_part)
-            current_node = child_node
+            package_pattern = package_pattern[: -len(".**")]
 
+        current_node = mapping.ensure_descendant(package_pattern)
         current_node.addresses.update(addresses)
         current_node.first_party = first_party
         current_node.recursive = recursive
@@ -261,16 +184,7 @@ def find_artifact_mapping(
     mapping: ThirdPartyPackageToArtifactMapping,
 ) -> FrozenOrderedSet[Address]:
     imp_parts = import_name.split(".")
-    current_node = mapping.mapping_root
-
-    found_nodes = []
-    for imp_part in imp_parts:
-        child_node_opt = current_node.find_child(imp_part)
-        if not child_node_opt:
-            break
-        found_nodes.append(child_node_opt)
-        current_node = child_node_opt
-
+    found_nodes = mapping.mapping_root.find_path(import_name)
     if not found_nodes:
         return FrozenOrderedSet()
 
@@ -13,11 +13,9 @@ from pants.core.util_rules import config_files, source_files
 from pants.core.util_rules.external_tool import rules as external_tool_rules
 from pants.engine.addresses import Address, Addresses
 from pants.engine.target import Dependencies, DependenciesRequest
-from pants.jvm.dependency_inference.artifact_mapper import (
-    FrozenTrieNode,
-    ThirdPartyPackageToArtifactMapping,
-)
+from pants.jvm.dependency_inference.artifact_mapper import ThirdPartyPackageToArtifactMapping
 from pants.jvm.dependency_inference.symbol_mapper import JvmFirstPartyPackageMappingException
+from pants.jvm.dependency_inference.symbol_trie import FrozenTrieNode
 from pants.jvm.jdk_rules import rules as java_util_rules
 from pants.jvm.resolve.coursier_fetch import rules as coursier_fetch_rules
 from pants.jvm.resolve.coursier_setup import rules as coursier_setup_rules
@@ -12,8 +12,14 @@ from pants.build_graph.address import Address
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.unions import UnionMembership, union
 from pants.jvm.dependency_inference.artifact_mapper import AllJvmTypeProvidingTargets
+from pants.jvm.dependency_inference.symbol_trie import (
+    FrozenTrieNode,
+    MutableTrieNode,
+    strip_wildcard_import,
+)
 from pants.jvm.target_types import JvmProvidesTypesField
 from pants.util.logging import LogLevel
+from pants.util.ordered_set import FrozenOrderedSet
 
 logger = logging.getLogger(__name__)
 
@@ -28,36 +34,77 @@ class JvmFirstPartyPackageMappingException(Exception):
 
 
 class SymbolMap:
-    """A mapping of JVM package names to owning addresses."""
+    """A mutable mapping of JVM symbols to owning addresses, used to build a `FrozenSymbolMap`."""
 
     def __init__(self):
-        self._symbol_map: dict[str, set[Address]] = defaultdict(set)
+        self._root = MutableTrieNode()
 
     def add_symbol(self, symbol: str, address: Address):
         """Declare a single Address as a provider of a symbol."""
-        self._symbol_map[symbol].add(address)
+        self._root.ensure_descendant(symbol).addresses.add(address)
 
-    def addresses_for_symbol(self, symbol: str) -> frozenset[Address]:
+    def merge(self, other: SymbolMap) -> None:
+        """Merge 'other' into this dependency map."""
+        self._root.merge(other._root)
+
+    def frozen(self) -> FrozenSymbolMap:
+        return FrozenSymbolMap(FrozenTrieNode(self._root))
+
+    def to_json_dict(self):
+        return self.frozen().to_json_dict()
+
+    def __repr__(self) -> str:
+        return f"SymbolMap({json.dumps(self.to_json_dict())})"
+
+
+@dataclass(frozen=True)
+class FrozenSymbolMap:
+    """An immutable mapping of JVM symbols to owning addresses, stored as a trie of their segments.
+
+    None of the lookups copy: the returned sets are owned by the trie.
+    """
+
+    root: FrozenTrieNode
+
+    def addresses_for_symbol(self, symbol: str) -> FrozenOrderedSet[Address]:
         """Returns the set of addresses that provide the passed symbol.
 
         :param symbol: a fully-qualified JVM symbol (e.g. `foo.bar.Thing`).
         """
-        return frozenset(self._symbol_map[symbol])
+        node = self.root.find(symbol)
+        return node.addresses if node else FrozenOrderedSet()
 
-    def merge(self, other: SymbolMap) -> None:
-        """Merge 'other' into this dependency map."""
-        for symbol, addresses in other._symbol_map.items():
-            self._symbol_map[symbol] |= addresses
+    def addresses_for_wildcard_import(self, import_name: str) -> FrozenOrderedSet[Address]:
+        """Returns the set of addresses that provide the direct members of the imported package.
+
+        :param import_name: a wildcard import, either with (e.g. `foo.bar._` or `foo.bar.*`) or
+            without (e.g. `foo.bar`) its wildcard suffix.
+        """
+        node = self.root.find(strip_wildcard_import(import_name))
+        return node.member_addresses if node else FrozenOrderedSet()
+
+    def addresses_for_longest_prefix(self, symbol: str) -> FrozenOrderedSet[Address]:
+        """Returns the set of addresses that provide the longest provided prefix of the symbol.
+
+        For example, the addresses which provide `foo.bar.Thing` would be returned for
+        `foo.bar.Thing.Inner` or `foo.bar.Thing.method` if those are not themselves provided.
+        """
+        for node in reversed(self.root.find_path(symbol)):
+            if node.addresses:
+                return node.addresses
+        return FrozenOrderedSet()
 
     def to_json_dict(self):
         return {
             "symbol_map": {
-                sym: [str(addr) for addr in addrs] for sym, addrs in self._symbol_map.items()
+                sym: [str(addr) for addr in node.addresses]
+                for sym, node in self.root.walk()
+                if node.addresses
             },
         }
 
     def __repr__(self) -> str:
-        return f"SymbolMap({json.dumps(self.to_json_dict())})"
+        return f"FrozenSymbolMap({json.dumps(self.to_json_dict())})"
 
 
 @union
@@ -75,7 +122,7 @@ class FirstPartyMappingRequest:
 class FirstPartySymbolMapping:
     """A merged mapping of package names to owning addresses."""
 
-    symbols: SymbolMap
+    symbols: FrozenSymbolMap
 
 
 @rule(level=LogLevel.DEBUG)
@@ -92,9 +139,10 @@ async def merge_first_party_module_mappings(
         for marker_cls in union_membership.get(FirstPartyMappingRequest)
     )
 
-    merged_dep_map = SymbolMap()
+    merged_dep_map_builder = SymbolMap()
     for dep_map in all_mappings:
-        merged_dep_map.merge(dep_map)
+        merged_dep_map_builder.merge(dep_map)
+    merged_dep_map = merged_dep_map_builder.frozen()
 
     # `experimental_provides_types` ("`provides`") can be declared on a `java_sources` target,
     # so each generated `java_source` target will have that `provides` annotation. All that matters
@@ -0,0 +1,69 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from pants.build_graph.address import Address
+from pants.jvm.dependency_inference.symbol_mapper import FrozenSymbolMap, SymbolMap
+
+A = Address("", target_name="a")
+B = Address("", target_name="b")
+C = Address("", target_name="c")
+
+
+def symbol_map(*symbols: tuple[str, Address]) -> FrozenSymbolMap:
+    builder = SymbolMap()
+    for symbol, address in symbols:
+        builder.add_symbol(symbol, address=address)
+    return builder.frozen()
+
+
+def test_addresses_for_symbol() -> None:
+    symbols = symbol_map(
+        ("org.pantsbuild.A", A), ("org.pantsbuild.A", B), ("org.pantsbuild.sub.C", C)
+    )
+    assert list(symbols.addresses_for_symbol("org.pantsbuild.A")) == [A, B]
+    assert list(symbols.addresses_for_symbol("org.pantsbuild.sub.C")) == [C]
+    assert not symbols.addresses_for_symbol("org.pantsbuild")
+    assert not symbols.addresses_for_symbol("org.pantsbuild.A.Inner")
+    assert not symbols.addresses_for_symbol("com.example.A")
+
+    # The result is owned by the map, rather than being a copy.
+    assert symbols.addresses_for_symbol("org.pantsbuild.A") is symbols.addresses_for_symbol(
+        "org.pantsbuild.A"
+    )
+
+
+def test_addresses_for_wildcard_import() -> None:
+    symbols = symbol_map(
+        ("org.pantsbuild.A", A), ("org.pantsbuild.B", B), ("org.pantsbuild.sub.C", C)
+    )
+    for wildcard_import in ("org.pantsbuild._", "org.pantsbuild.*", "org.pantsbuild"):
+        assert list(symbols.addresses_for_wildcard_import(wildcard_import)) == [A, B]
+    assert list(symbols.addresses_for_wildcard_import("org.pantsbuild.sub._")) == [C]
+    assert not symbols.addresses_for_wildcard_import("org._")
+    assert not symbols.addresses_for_wildcard_import("com.example._")
+
+
+def test_addresses_for_longest_prefix() -> None:
+    symbols = symbol_map(("org.pantsbuild.A", A), ("org.pantsbuild.A.Inner", B))
+    assert list(symbols.addresses_for_longest_prefix("org.pantsbuild.A")) == [A]
+    assert list(symbols.addresses_for_longest_prefix("org.pantsbuild.A.method")) == [A]
+    assert list(symbols.addresses_for_longest_prefix("org.pantsbuild.A.Inner.method")) == [B]
+    assert not symbols.addresses_for_longest_prefix("org.pantsbuild.B")
+
+
+def test_merge() -> None:
+    merged = SymbolMap()
+    merged.add_symbol("org.pantsbuild.A", address=A)
+    other = SymbolMap()
+    other.add_symbol("org.pantsbuild.A", address=B)
+    other.add_symbol("org.pantsbuild.B", address=C)
+    merged.merge(other)
+
+    assert merged.to_json_dict() == {
+        "symbol_map": {
+            "org.pantsbuild.A": ["//:a", "//:b"],
+            "org.pantsbuild.B": ["//:c"],
+        }
+    }
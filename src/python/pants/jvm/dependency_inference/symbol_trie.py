@@ -0,0 +1,192 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Iterable, Iterator
+
+from pants.build_graph.address import Address
+from pants.util.frozendict import FrozenDict
+from pants.util.meta import frozen_after_init
+from pants.util.ordered_set import FrozenOrderedSet, OrderedSet
+
+# The suffixes of a wildcard import in Scala (`foo.bar._`) and in Java (`foo.bar.*`).
+WILDCARD_IMPORT_SUFFIXES = ("._", ".*")
+
+_EMPTY_CHILDREN: FrozenDict[str, FrozenTrieNode] = FrozenDict()
+_EMPTY_ADDRESSES: FrozenOrderedSet[Address] = FrozenOrderedSet()
+
+
+def split_symbol(symbol: str) -> list[str]:
+    """Split a dotted JVM symbol or package name into its segments."""
+    return symbol.split(".") if symbol else []
+
+
+def strip_wildcard_import(symbol: str) -> str:
+    """Strip the wildcard suffix, if any, from an import (e.g. `foo.bar._` -> `foo.bar`)."""
+    for suffix in WILDCARD_IMPORT_SUFFIXES:
+        if symbol.endswith(suffix):
+            return symbol[: -len(suffix)]
+    return symbol
+
+
+class MutableTrieNode:
+    __slots__ = [
+        "children",
+        "recursive",
+        "addresses",
+        "first_party",
+    ]  # don't use a `dict` to store attrs
+
+    def __init__(self):
+        self.children: dict[str, MutableTrieNode] = {}
+        self.recursive: bool = False
+        self.addresses: OrderedSet[Address] = OrderedSet()
+        self.first_party: bool = False
+
+    def ensure_child(self, name: str) -> MutableTrieNode:
+        if name in self.children:
+            return self.children[name]
+        node = MutableTrieNode()
+        self.children[sys.intern(name)] = node
+        return node
+
+    def ensure_descendant(self, symbol: str) -> MutableTrieNode:
+        """Return the node for the dotted `symbol`, creating it (and its parents) if necessary."""
+        node = self
+        for part in split_symbol(symbol):
+            node = node.ensure_child(part)
+        return node
+
+    def merge(self, other: MutableTrieNode) -> None:
+        """Merge the `other` trie into this one."""
+        self.addresses.update(other.addresses)
+        self.recursive = self.recursive or other.recursive
+        self.first_party = self.first_party or other.first_party
+        for name, other_child in other.children.items():
+            self.ensure_child(name).merge(other_child)
+
+
+@frozen_after_init
+class FrozenTrieNode:
+    """An immutable trie of dotted JVM names (packages and types) to the addresses providing them.
+
+    Each node corresponds to a single segment of a name, and so the size of the trie is
+    proportional to the number of unique segments. All lookups return sets which are owned by the
+    trie, rather than copies of them.
+    """
+
+    __slots__ = [
+        "_is_frozen",
+        "_children",
+        "_recursive",
+        "_addresses",
+        "_member_addresses",
+        "_first_party",
+        "_hash",
+    ]  # don't use a `dict` to store attrs (speeds up attr access significantly)
+
+    def __init__(
+        self,
+        node: MutableTrieNode,
+        _interned: dict[FrozenOrderedSet[Address], FrozenOrderedSet[Address]] | None = None,
+    ) -> None:
+        # Identical address sets (e.g. the many packages provided by a single artifact) are shared
+        # between nodes, rather than being stored once per node.
+        interned = {} if _interned is None else _interned
+
+        def intern(addresses: Iterable[Address]) -> FrozenOrderedSet[Address]:
+            frozen = FrozenOrderedSet(addresses)
+            if not frozen:
+                return _EMPTY_ADDRESSES
+            return interned.setdefault(frozen, frozen)
+
+        children = {
+            key: FrozenTrieNode(child, _interned=interned) for key, child in node.children.items()
+        }
+        self._children: FrozenDict[str, FrozenTrieNode] = (
+            FrozenDict(children) if children else _EMPTY_CHILDREN
+        )
+        self._recursive: bool = node.recursive
+        self._addresses: FrozenOrderedSet[Address] = intern(node.addresses)
+        self._first_party: bool = node.first_party
+
+        # The addresses which provide the direct members of this node when it is a package, i.e.
+        # the result of a wildcard import of it.
+        children_with_addresses = [child for child in children.values() if child.addresses]
+        self._member_addresses: FrozenOrderedSet[Address] = (
+            children_with_addresses[0].addresses
+            if len(children_with_addresses) == 1
+            else intern(a for child in children_with_addresses for a in child.addresses)
+        )
+
+        self._hash = hash((self._children, self._recursive, self._addresses))
+
+    def find_child(self, name: str) -> FrozenTrieNode | None:
+        return self._children.get(name)
+
+    def find(self, symbol: str) -> FrozenTrieNode | None:
+        """Return the node for the dotted `symbol`, if it is present in the trie."""
+        node = self
+        for part in split_symbol(symbol):
+            child = node.find_child(part)
+            if child is None:
+                return None
+            node = child
+        return node
+
+    def find_path(self, symbol: str) -> list[FrozenTrieNode]:
+        """Return the nodes for each leading segment of the dotted `symbol` which is in the trie.
+
+        The result will have one node per segment of `symbol` iff `symbol` is present in the trie.
+        """
+        path = []
+        node = self
+        for part in split_symbol(symbol):
+            child = node.find_child(part)
+            if child is None:
+                break
+            path.append(child)
+            node = child
+        return path
+
+    def walk(self, prefix: str = "") -> Iterator[tuple[str, FrozenTrieNode]]:
+        """Yield the dotted name of, and each node in, this trie (excluding this node)."""
+        for name, child in self._children.items():
+            symbol = f"{prefix}.{name}" if prefix else name
+            yield symbol, child
+            yield from child.walk(symbol)
+
+    @property
+    def recursive(self) -> bool:
+        return self._recursive
+
+    @property
+    def first_party(self) -> bool:
+        return self._first_party
+
+    @property
+    def addresses(self) -> FrozenOrderedSet[Address]:
+        return self._addresses
+
+    @property
+    def member_addresses(self) -> FrozenOrderedSet[Address]:
+        """The addresses which provide the direct children of this node."""
+        return self._member_addresses
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, FrozenTrieNode):
+            return False
+        return (
+            self._hash == other._hash
+            and self._children == other._children
+            and self.recursive == other.recursive
+            and self.addresses == other.addresses
+        )
+
+    def __repr__(self):
+        return f"FrozenTrieNode(children={repr(self._children)}, recursive={self._recursive}, addresses={self._addresses}, first_party={self._first_party})"
@@ -0,0 +1,98 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from pants.build_graph.address import Address
+from pants.jvm.dependency_inference.symbol_trie import (
+    FrozenTrieNode,
+    MutableTrieNode,
+    strip_wildcard_import,
+)
+
+A = Address("", target_name="a")
+B = Address("", target_name="b")
+C = Address("", target_name="c")
+
+
+def trie(**symbols: Address) -> MutableTrieNode:
+    root = MutableTrieNode()
+    for symbol, address in symbols.items():
+        root.ensure_descendant(symbol.replace("__", ".")).addresses.add(address)
+    return root
+
+
+def test_find() -> None:
+    root = FrozenTrieNode(trie(org__pantsbuild__A=A, org__pantsbuild__B=B))
+    node = root.find("org.pantsbuild.A")
+    assert node is not None and set(node.addresses) == {A}
+    assert root.find("org.pantsbuild.C") is None
+    assert root.find("org.pantsbuild.A.Inner") is None
+    assert root.find("") is root
+
+    assert [n.addresses for n in root.find_path("org.pantsbuild.A.Inner")] == [
+        root.find("org").addresses,  # type: ignore[union-attr]
+        root.find("org.pantsbuild").addresses,  # type: ignore[union-attr]
+        node.addresses,
+    ]
+    assert root.find_path("com.example") == []
+
+
+def test_member_addresses() -> None:
+    root = FrozenTrieNode(
+        trie(org__pantsbuild__A=A, org__pantsbuild__B=B, org__pantsbuild__sub__C=C)
+    )
+    package = root.find("org.pantsbuild")
+    assert package is not None
+    assert list(package.member_addresses) == [A, B]
+    assert not root.find("org.pantsbuild.A").member_addresses  # type: ignore[union-attr]
+
+    # A package with a single member shares that member's addresses.
+    sub = root.find("org.pantsbuild.sub")
+    assert sub is not None
+    assert sub.member_addresses is sub.find_child("C").addresses  # type: ignore[union-attr]
+
+
+def test_addresses_are_interned() -> None:
+    root = FrozenTrieNode(trie(org__a__A=A, org__b__B=A, com__C=B))
+    a = root.find("org.a.A")
+    b = root.find("org.b.B")
+    assert a is not None and b is not None
+    assert a.addresses is b.addresses
+
+
+def test_merge() -> None:
+    merged = trie(org__pantsbuild__A=A)
+    other = trie(org__pantsbuild__A=B, org__pantsbuild__B=C)
+    other.ensure_descendant("org.pantsbuild").recursive = True
+    merged.merge(other)
+
+    root = FrozenTrieNode(merged)
+    assert list(root.find("org.pantsbuild.A").addresses) == [A, B]  # type: ignore[union-attr]
+    assert list(root.find("org.pantsbuild.B").addresses) == [C]  # type: ignore[union-attr]
+    assert root.find("org.pantsbuild").recursive  # type: ignore[union-attr]
+
+
+def test_walk() -> None:
+    root = FrozenTrieNode(trie(org__pantsbuild__A=A, com__B=B))
+    assert [symbol for symbol, _ in root.walk()] == [
+        "org",
+        "org.pantsbuild",
+        "org.pantsbuild.A",
+        "com",
+        "com.B",
+    ]
+
+
+def test_equality() -> None:
+    assert FrozenTrieNode(trie(org__A=A)) == FrozenTrieNode(trie(org__A=A))
+    assert hash(FrozenTrieNode(trie(org__A=A))) == hash(FrozenTrieNode(trie(org__A=A)))
+    assert FrozenTrieNode(trie(org__A=A)) != FrozenTrieNode(trie(org__A=B))
+    assert FrozenTrieNode(trie(org__A=A)) != FrozenTrieNode(trie(org__B=A))
+
+
+def test_strip_wildcard_import() -> None:
+    assert strip_wildcard_import("foo.bar._") == "foo.bar"
+    assert strip_wildcard_import("foo.bar.*") == "foo.bar"
+    assert strip_wildcard_import("foo.bar") == "foo.bar"
+    assert strip_wildcard_import("foo.bar_") == "foo.bar_"
@@ -16,6 +16,7 @@ from pants.engine.rules import collect_rules, rule
 from pants.jvm.compile import ClasspathEntry
 from pants.jvm.resolve.coursier_fetch import Coordinate, Coordinates, CoursierLockfileEntry
 from pants.jvm.resolve.coursier_setup import Coursier
+from pants.jvm.subsystems import JvmSubsystem
 from pants.util.logging import LogLevel
 
 
@@ -24,6 +25,7 @@ class JdkSetup:
     digest: Digest
     nailgun_jar: str
     coursier: Coursier
+    jvm_options: tuple[str, ...]
     jdk_preparation_script: ClassVar[str] = "__jdk.sh"
     java_home: ClassVar[str] = "__java_home"
 
@@ -32,6 +34,7 @@ class JdkSetup:
             bash.path,
             self.jdk_preparation_script,
             f"{self.java_home}/bin/java",
+            *self.jvm_options,
             "-cp",
             ":".join([self.nailgun_jar, *classpath_entries]),
         )
@@ -46,7 +49,9 @@ class JdkSetup:
 
 
 @rule
-async def setup_jdk(coursier: Coursier, javac: JavacSubsystem, bash: BashBinary) -> JdkSetup:
+async def setup_jdk(
+    coursier: Coursier, javac: JavacSubsystem, jvm: JvmSubsystem, bash: BashBinary
+) -> JdkSetup:
     nailgun = await Get(
         ClasspathEntry,
         CoursierLockfileEntry(
@@ -129,6 +134,7 @@ async def setup_jdk(coursier: Coursier, javac: JavacSubsystem, bash: BashBinary)
         ),
         nailgun_jar=nailgun.filenames[0],
         coursier=coursier,
+        jvm_options=tuple(jvm.options.global_options),
     )
 
 
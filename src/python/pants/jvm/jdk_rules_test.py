@@ -90,3 +90,11 @@ def test_java_binary_versions(rule_runner: RuleRunner) -> None:
     expected_exception_msg = r".*?JVM bogusjdk:999 not found in index.*?"
     with pytest.raises(ExecutionError, match=expected_exception_msg):
         assert "javac 16.0" in run_javac_version(rule_runner)
+
+
+@maybe_skip_jdk_test
+def test_jvm_global_options(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(
+        ["--jvm-global-options=['-XshowSettings:vm']"], env_inherit=PYTHON_BOOTSTRAP_ENV
+    )
+    assert "Max. Heap Size" in run_javac_version(rule_runner)
@@ -42,3 +42,15 @@ class JvmSubsystem(Subsystem):
                 "one compatible resolve will be used instead."
             ),
         )
+
+        register(
+            "--global-options",
+            type=list,
+            member_type=str,
+            advanced=True,
+            help=(
+                "List of JVM options to pass to all JVM processes, including the nailgun servers "
+                "which keep JVM tools warm between runs.\n\nSetting a maximum heap size (e.g. "
+                "`-Xmx1g`) bounds the memory used by each server."
+            ),
+        )
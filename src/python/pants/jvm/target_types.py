@@ -20,6 +20,8 @@ _DEFAULT_PACKAGE_MAPPING_URL = git_url(
 
 
 class JvmArtifactGroupField(StringField):
+    __slots__ = ()
+
     alias = "group"
     required = True
     help = (
@@ -29,6 +31,8 @@ class JvmArtifactGroupField(StringField):
 
 
 class JvmArtifactArtifactField(StringField):
+    __slots__ = ()
+
     alias = "artifact"
     required = True
     help = (
@@ -38,6 +42,8 @@ class JvmArtifactArtifactField(StringField):
 
 
 class JvmArtifactVersionField(StringField):
+    __slots__ = ()
+
     alias = "version"
     required = True
     help = (
@@ -47,6 +53,8 @@ class JvmArtifactVersionField(StringField):
 
 
 class JvmArtifactPackagesField(StringSequenceField):
+    __slots__ = ()
+
     alias = "packages"
     help = (
         "The JVM packages this artifact provides for the purposes of dependency inference.\n\n"
@@ -65,6 +73,8 @@ class JvmArtifactPackagesField(StringSequenceField):
 
 
 class JvmProvidesTypesField(StringSequenceField):
+    __slots__ = ()
+
     alias = "experimental_provides_types"
     help = (
         "Signals that the specified types should be fulfilled by these source files during "
@@ -103,6 +113,8 @@ class JvmArtifact(Target):
 
 
 class JvmCompatibleResolveNamesField(StringSequenceField):
+    __slots__ = ()
+
     alias = "compatible_resolves"
     required = False
     help = (
@@ -113,6 +125,8 @@ class JvmCompatibleResolveNamesField(StringSequenceField):
 
 
 class JvmResolveName(StringField):
+    __slots__ = ()
+
     alias = "resolve"
     required = False
     help = (
@@ -123,6 +137,8 @@ class JvmResolveName(StringField):
 
 
 class JvmRequirementsField(SpecialCasedDependencies):
+    __slots__ = ()
+
     alias = "requirements"
     required = True
     help = (
@@ -132,6 +148,8 @@ class JvmRequirementsField(SpecialCasedDependencies):
 
 
 class JvmLockfileSources(SingleSourceField):
+    __slots__ = ()
+
     expected_file_extensions = (".lockfile",)
     # Expect 0 or 1 files.
     expected_num_files = range(0, 2)
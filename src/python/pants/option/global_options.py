@@ -81,6 +81,14 @@ class RemoteCacheWarningsBehavior(Enum):
     backoff = "backoff"
 
 
+@enum.unique
+class WorkunitsQueueFullPolicy(Enum):
+    """What to do when the queue of workunits for a slow WorkunitsCallback is full."""
+
+    block = "block"
+    drop = "drop"
+
+
 @enum.unique
 class AuthPluginState(Enum):
     OK = "ok"
@@ -319,6 +327,8 @@ class ExecutionOptions:
     local_cache: bool
     process_execution_local_parallelism: int
     process_execution_local_enable_nailgun: bool
+    process_execution_local_nailgun_pool_size: int
+    process_execution_local_nailgun_idle_timeout: int | None
     process_execution_remote_parallelism: int
     process_execution_cache_namespace: str | None
 
@@ -375,6 +385,8 @@ class ExecutionOptions:
             process_execution_remote_parallelism=dynamic_remote_options.parallelism,
             process_execution_cache_namespace=bootstrap_options.process_execution_cache_namespace,
             process_execution_local_enable_nailgun=bootstrap_options.process_execution_local_enable_nailgun,
+            process_execution_local_nailgun_pool_size=bootstrap_options.process_execution_local_nailgun_pool_size,
+            process_execution_local_nailgun_idle_timeout=bootstrap_options.process_execution_local_nailgun_idle_timeout,
             # Remote store setup.
             remote_store_address=dynamic_remote_options.store_address,
             remote_store_headers=dynamic_remote_options.store_headers,
@@ -452,6 +464,8 @@ DEFAULT_EXECUTION_OPTIONS = ExecutionOptions(
     process_cleanup=True,
     local_cache=True,
     process_execution_local_enable_nailgun=True,
+    process_execution_local_nailgun_pool_size=CPU_COUNT,
+    process_execution_local_nailgun_idle_timeout=None,
     # Remote store setup.
     remote_store_address=None,
     remote_store_headers={
@@ -511,6 +525,20 @@ class GlobalOptions(Subsystem):
                 "plugin dist, or available as sources in the repo."
             ),
         )
+        register(
+            "--lazy-backends",
+            advanced=True,
+            type=bool,
+            default=False,
+            help=(
+                "Only load the backends in `backend_packages` which the goals and flags of the "
+                "run need, for those backends which declare when they are needed (e.g. linters, "
+                "which are only needed by `lint` and `fmt`). This reduces the startup time of runs "
+                "without `pantsd`. Backends which provide target types are always loaded, since "
+                "BUILD files may use them.\n\nThis has no effect when running with `pantsd`, "
+                "which loads all backends so that its scheduler can be shared by all goals."
+            ),
+        )
         register(
             "--plugins",
             advanced=True,
@@ -773,14 +801,17 @@ class GlobalOptions(Subsystem):
 
         # Whether or not to make necessary arrangements to have concurrent runs in pants.
         # In practice, this means that if this is set, a run will not even try to use pantsd.
-        # NB: Eventually, we would like to deprecate this flag in favor of making pantsd runs parallelizable.
+        # NB: Runs with identical bootstrap options already run concurrently in pantsd (see
+        # `--pantsd-max-concurrent-runs`), so this is only needed for runs with differing options.
         register(
             "--concurrent",
             type=bool,
             default=False,
-            help="Enable concurrent runs of Pants. Without this enabled, Pants will "
-            "start up all concurrent invocations (e.g. in other terminals) without pantsd. "
-            "Enabling this option requires parallel Pants invocations to block on the first.",
+            help="Enable concurrent runs of Pants with differing options. Without this enabled, "
+            "pantsd runs concurrent invocations (e.g. in other terminals) which have identical "
+            "options in parallel (see `--pantsd-max-concurrent-runs`), but an invocation with "
+            "different options must wait for the others to finish. With this enabled, the "
+            "invocation will not use pantsd at all.",
         )
 
         # NB: We really don't want this option to invalidate the daemon, because different clients might have
@@ -793,10 +824,38 @@ class GlobalOptions(Subsystem):
             default=60.0,
             help="The maximum amount of time to wait for the invocation to start until "
             "raising a timeout exception. "
-            "Because pantsd currently does not support parallel runs, "
-            "any prior running Pants command must be finished for the current one to start. "
+            "If other Pants commands with different options are running, or if "
+            "`--pantsd-max-concurrent-runs` commands are already running, they must finish "
+            "for the current one to start. "
             "To never timeout, use the value -1.",
         )
+        register(
+            "--pantsd-max-concurrent-runs",
+            advanced=True,
+            type=int,
+            default=4,
+            help=(
+                "The maximum number of runs which pantsd will execute concurrently.\n\n"
+                "Concurrent runs share the same in-memory graph as long as their bootstrap "
+                "options are identical. A run with different bootstrap options waits for all "
+                "other runs to complete before restarting the scheduler with its options. Set to "
+                "1 to execute runs one at a time."
+            ),
+        )
+        register(
+            "--pantsd-client-fast-path",
+            advanced=True,
+            type=bool,
+            default=True,
+            help=(
+                "If true, and a previous run with identical flags, `PANTS_*` environment variables "
+                "and config files successfully connected to a still-running pantsd, then connect "
+                "directly to pantsd without parsing options or importing most of the Pants client. "
+                "This significantly lowers the latency of each run.\n\n"
+                "Changes to any config file, flag, or `PANTS_*` environment variable cause the "
+                "full client to be used for the next run."
+            ),
+        )
         register(
             "--pantsd-max-memory-usage",
             advanced=True,
@@ -808,7 +867,9 @@ class GlobalOptions(Subsystem):
             help=(
                 "The maximum memory usage of the pantsd process.\n\n"
                 "When the maximum memory is exceeded, the daemon will restart gracefully, "
-                "although all previous in-memory caching will be lost. Setting too low means that "
+                "although all previous in-memory caching will be lost. Before that point, the "
+                "daemon will attempt to free memory: see `--pantsd-memory-eviction-threshold`. "
+                "Setting too low means that "
                 "you may miss out on some caching, whereas setting too high may over-consume "
                 "resources and may result in the operating system killing Pantsd due to memory "
                 "overconsumption (e.g. via the OOM killer).\n\n"
@@ -817,6 +878,46 @@ class GlobalOptions(Subsystem):
                 "There is at most one pantsd process per workspace."
             ),
         )
+        register(
+            "--pantsd-memory-eviction-threshold",
+            advanced=True,
+            type=float,
+            default=0.75,
+            help=(
+                "The fraction of `--pantsd-max-memory-usage` above which pantsd will evict "
+                "memoized values which have not been used recently (see "
+                "`--pantsd-memory-eviction-idle-runs`), rather than waiting to restart once the "
+                "maximum is exceeded.\n\n"
+                "Evicted values are recomputed if they are needed again, which is usually much "
+                "cheaper than a restart. Set to 1 to only evict once the maximum is exceeded, as a "
+                "last resort before restarting."
+            ),
+        )
+        register(
+            "--pantsd-memory-eviction-idle-runs",
+            advanced=True,
+            type=int,
+            default=3,
+            help=(
+                "The number of consecutive runs for which a memoized value must not have been "
+                "used in order for it to be evicted when `--pantsd-memory-eviction-threshold` is "
+                "exceeded."
+            ),
+        )
+        register(
+            "--pantsd-warmup-specs",
+            advanced=True,
+            type=list,
+            member_type=str,
+            default=[],
+            help=(
+                "Target or file specs (e.g. `::`) whose transitive targets pantsd will compute in "
+                "the background while it is idle, so that later runs find BUILD files parsed, "
+                "source roots computed, and dependencies inferred.\n\n"
+                "Warming up is cancelled as soon as a run starts, and is resumed once all runs "
+                "have completed: any work which was completed before it was cancelled is kept."
+            ),
+        )
 
         # These facilitate configuring the native engine.
         register(
@@ -1075,6 +1176,34 @@ class GlobalOptions(Subsystem):
             ),
             advanced=True,
         )
+        register(
+            "--process-execution-local-nailgun-pool-size",
+            type=int,
+            default=DEFAULT_EXECUTION_OPTIONS.process_execution_local_nailgun_pool_size,
+            default_help_repr="#cores",
+            advanced=True,
+            help=(
+                "The maximum number of nailgun servers (warm JVMs) to keep running at once.\n\n"
+                "Each distinct JVM tool (e.g. javac, scalac or a dependency parser) runs in its "
+                "own servers, which are reused by later requests for the same tool, including "
+                "across runs while pantsd is alive. When the pool is full, the least recently "
+                "used idle server is shut down to make room for a new one. If this value is "
+                "lower than `--process-execution-local-parallelism`, at most this many JVM "
+                "requests will run concurrently.\n\nThe heap size of each server can be capped "
+                "using `[jvm].global_options` (e.g. `-Xmx1g`)."
+            ),
+        )
+        register(
+            "--process-execution-local-nailgun-idle-timeout",
+            type=int,
+            default=DEFAULT_EXECUTION_OPTIONS.process_execution_local_nailgun_idle_timeout,
+            advanced=True,
+            help=(
+                "If set, the number of seconds after which an idle nailgun server will be shut "
+                "down to release its memory. If not set, idle servers are only shut down to "
+                "make room for other servers in the pool."
+            ),
+        )
 
         register(
             "--remote-execution",
@@ -1450,6 +1579,31 @@ class GlobalOptions(Subsystem):
                 "when run with Docker."
             ),
         )
+        register(
+            "--streaming-workunits-queue-size",
+            type=int,
+            default=16,
+            advanced=True,
+            help=(
+                "The number of batches of workunits (one per "
+                "`--streaming-workunits-report-interval`) which may be queued for each streaming "
+                "workunit event receiver while it is busy. Each receiver runs in its own thread, "
+                "so a slow receiver does not delay the others until its queue is full: see "
+                "`--streaming-workunits-queue-full-policy`."
+            ),
+        )
+        register(
+            "--streaming-workunits-queue-full-policy",
+            type=WorkunitsQueueFullPolicy,
+            default=WorkunitsQueueFullPolicy.block,
+            advanced=True,
+            help=(
+                "What to do when the queue of a streaming workunit event receiver is full. "
+                "`block` waits for the receiver, which delays polling for workunits (and so all "
+                "other receivers), but does not lose any workunits. `drop` discards the batch of "
+                "workunits for that receiver only. The final batch of a run is never dropped."
+            ),
+        )
 
     @classmethod
     def validate_instance(cls, opts):
@@ -1470,6 +1624,36 @@ class GlobalOptions(Subsystem):
                 f"{opts.rule_threads_core}."
             )
 
+        if opts.process_execution_local_nailgun_pool_size < 1:
+            raise OptionsError(
+                "--process-execution-local-nailgun-pool-size must be at least 1, but it was set "
+                f"to {opts.process_execution_local_nailgun_pool_size}."
+            )
+
+        if opts.streaming_workunits_queue_size < 1:
+            raise OptionsError(
+                "--streaming-workunits-queue-size must be at least 1, but it was set to "
+                f"{opts.streaming_workunits_queue_size}."
+            )
+
+        if opts.pantsd_max_concurrent_runs < 1:
+            raise OptionsError(
+                "--pantsd-max-concurrent-runs must be at least 1, but it was set to "
+                f"{opts.pantsd_max_concurrent_runs}."
+            )
+
+        if not 0 < opts.pantsd_memory_eviction_threshold <= 1:
+            raise OptionsError(
+                "--pantsd-memory-eviction-threshold must be greater than 0 and at most 1, but it "
+                f"was set to {opts.pantsd_memory_eviction_threshold}."
+            )
+
+        if opts.pantsd_memory_eviction_idle_runs < 1:
+            raise OptionsError(
+                "--pantsd-memory-eviction-idle-runs must be at least 1, but it was set to "
+                f"{opts.pantsd_memory_eviction_idle_runs}."
+            )
+
         if opts.remote_execution and (opts.remote_cache_read or opts.remote_cache_write):
             raise OptionsError(
                 "`--remote-execution` cannot be set at the same time as either "
@@ -1536,15 +1720,19 @@ class GlobalOptions(Subsystem):
         validate_remote_headers("remote_store_headers")
 
     @staticmethod
-    def create_py_executor(bootstrap_options: OptionValueContainer) -> PyExecutor:
+    def compute_executor_arguments(bootstrap_options: OptionValueContainer) -> tuple[int, int]:
+        """Computes the arguments (core threads, max threads) to `PyExecutor`."""
         rule_threads_max = (
             bootstrap_options.rule_threads_max
             if bootstrap_options.rule_threads_max
             else 4 * bootstrap_options.rule_threads_core
         )
-        return PyExecutor(
-            core_threads=bootstrap_options.rule_threads_core, max_threads=rule_threads_max
-        )
+        return bootstrap_options.rule_threads_core, rule_threads_max
+
+    @staticmethod
+    def create_py_executor(bootstrap_options: OptionValueContainer) -> PyExecutor:
+        core_threads, max_threads = GlobalOptions.compute_executor_arguments(bootstrap_options)
+        return PyExecutor(core_threads=core_threads, max_threads=max_threads)
 
     @staticmethod
     def compute_pants_ignore(buildroot, global_options):
@@ -209,13 +209,20 @@ class Options:
     def scope_to_flags(self) -> dict[str, list[str]]:
         return self._scope_to_flags
 
-    def verify_configs(self, global_config: Config) -> None:
-        """Verify all loaded configs have correct scopes and options."""
+    def verify_configs(self, global_config: Config, ignored_scopes: Iterable[str] = ()) -> None:
+        """Verify all loaded configs have correct scopes and options.
 
+        :param ignored_scopes: Scopes which are not registered (e.g. because the backend which
+          registers them was not loaded), and whose config should not be verified.
+        """
+
+        ignored_scopes = set(ignored_scopes)
         error_log = []
         for config in global_config.configs():
             for section in config.sections():
                 scope = GLOBAL_SCOPE if section == GLOBAL_SCOPE_CONFIG_SECTION else section
+                if scope in ignored_scopes and not self.is_known_scope(scope):
+                    continue
                 try:
                     valid_options_under_scope = set(self.for_scope(scope, check_deprecations=False))
                 # Only catch ConfigValidationError. Other exceptions will be raised directly.
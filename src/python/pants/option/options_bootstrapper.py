@@ -5,8 +5,12 @@ from __future__ import annotations
 
 import itertools
 import os
+import re
+import threading
 import warnings
+from collections import OrderedDict
 from dataclasses import dataclass
+from hashlib import sha256
 from pathlib import Path
 from typing import Iterable, Mapping, Sequence
 
@@ -25,6 +29,78 @@ from pants.util.memo import memoized_method, memoized_property
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.strutil import ensure_text
 
+# Matches the path of a quoted `@fromfile` option value (but not a literal `@@` value) in config.
+_FROMFILE_CONFIG_VALUE_RE = re.compile(rb"""["']@(?!@)([^"']+)["']""")
+
+
+def _file_digest(path: str) -> tuple[str | None, bytes | None]:
+    """The digest (or None, if it does not exist) and the content of a file."""
+    try:
+        content = read_file(path, binary_mode=True)
+    except OSError:
+        return None, None
+    return sha256(content).hexdigest(), content
+
+
+def _fromfile_arg_path(arg: str) -> str | None:
+    """The path of the `@fromfile` value of the given arg or env var value, if it has one."""
+    value = arg.split("=", 1)[-1] if arg.startswith("-") else arg
+    if value.startswith("@") and not value.startswith("@@"):
+        return value[1:]
+    return None
+
+
+@dataclass(frozen=True)
+class _CachedOptionsBootstrapper:
+    # The digest of each config file (including absent candidate rcfiles) that was consulted, and of
+    # each file that was referenced by an `@fromfile` option value.
+    config_file_digests: tuple[tuple[str, str | None], ...]
+    options_bootstrapper: OptionsBootstrapper
+
+    def is_valid(self) -> bool:
+        return all(_file_digest(path)[0] == digest for path, digest in self.config_file_digests)
+
+
+class _OptionsBootstrapperCache:
+    """A bounded, in-memory cache of OptionsBootstrappers, for use in long-lived processes.
+
+    Because an OptionsBootstrapper memoizes the options that it parses, a cache hit skips both
+    config parsing and the parsing of the full options for every scope.
+    """
+
+    _MAX_ENTRIES = 8
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Held while creating an OptionsBootstrapper for a miss, since creation uses
+        # `warnings.catch_warnings`, which is not thread-safe.
+        self.create_lock = threading.Lock()
+        self._entries: OrderedDict[tuple, _CachedOptionsBootstrapper] = OrderedDict()
+
+    def get(self, key: tuple) -> OptionsBootstrapper | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        if not entry.is_valid():
+            return None
+        return entry.options_bootstrapper
+
+    def put(self, key: tuple, entry: _CachedOptionsBootstrapper) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._MAX_ENTRIES:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_options_bootstrapper_cache = _OptionsBootstrapperCache()
+
 
 @dataclass(frozen=True)
 class OptionsBootstrapper:
@@ -104,7 +180,12 @@ class OptionsBootstrapper:
 
     @classmethod
     def create(
-        cls, env: Mapping[str, str], args: Sequence[str], *, allow_pantsrc: bool
+        cls,
+        env: Mapping[str, str],
+        args: Sequence[str],
+        *,
+        allow_pantsrc: bool,
+        use_cache: bool = False,
     ) -> OptionsBootstrapper:
         """Parses the minimum amount of configuration necessary to create an OptionsBootstrapper.
 
@@ -114,7 +195,55 @@ class OptionsBootstrapper:
           consume pantsrc files, they should pass False in order to avoid reading files from
           absolute paths. Production usecases should pass True to allow options values to make the
           decision of whether to respect pantsrc files.
+        :param use_cache: True to reuse the OptionsBootstrapper (and so, the options that it has
+          already parsed) from a previous call with identical env, args and config file contents.
+          This is only useful in long-lived processes, such as pantsd.
         """
+        if not use_cache:
+            return cls._create(env, args, allow_pantsrc=allow_pantsrc)[0]
+
+        pants_env = tuple(sorted((k, v) for k, v in env.items() if k.startswith("PANTS_")))
+        key = (pants_env, tuple(args), allow_pantsrc)
+        cached = _options_bootstrapper_cache.get(key)
+        if cached is not None:
+            return cached
+
+        with _options_bootstrapper_cache.create_lock:
+            # Another thread might have created it while we waited.
+            cached = _options_bootstrapper_cache.get(key)
+            if cached is not None:
+                return cached
+            options_bootstrapper, config_file_paths = cls._create(
+                env, args, allow_pantsrc=allow_pantsrc
+            )
+            # The content of `@fromfile` values is read while parsing options, and so those files
+            # are validated along with the config files which (might) reference them.
+            config_file_digests: dict[str, str | None] = {}
+            for path in config_file_paths:
+                digest, content = _file_digest(path)
+                config_file_digests[path] = digest
+                for match in _FROMFILE_CONFIG_VALUE_RE.findall(content or b""):
+                    fromfile_path = match.decode()
+                    config_file_digests[fromfile_path] = _file_digest(fromfile_path)[0]
+            for value in itertools.chain(args, (v for _, v in pants_env)):
+                fromfile_path = _fromfile_arg_path(value)
+                if fromfile_path is not None:
+                    config_file_digests[fromfile_path] = _file_digest(fromfile_path)[0]
+
+            _options_bootstrapper_cache.put(
+                key,
+                _CachedOptionsBootstrapper(
+                    tuple(config_file_digests.items()), options_bootstrapper
+                ),
+            )
+        return options_bootstrapper
+
+    @classmethod
+    def _create(
+        cls, env: Mapping[str, str], args: Sequence[str], *, allow_pantsrc: bool
+    ) -> tuple[OptionsBootstrapper, list[str]]:
+        """Create an OptionsBootstrapper, and return it along with the paths of all config files
+        (including absent candidate rcfiles) that were consulted to create it."""
         with warnings.catch_warnings(record=True):
             # We can't use pants.engine.fs.FileContent here because it would cause a circular dep.
             @dataclass(frozen=True)
@@ -143,6 +272,7 @@ class OptionsBootstrapper:
             # Now re-read the config, post-bootstrapping. Note the order: First whatever we bootstrapped
             # from (typically pants.toml), then config override, then rcfiles.
             full_config_paths = pre_bootstrap_config.sources()
+            consulted_config_paths = [get_default_pants_config_file(), *config_file_paths]
             if allow_pantsrc and bootstrap_option_values.pantsrc:
                 rcfiles = [
                     os.path.expanduser(str(rcfile))
@@ -150,6 +280,7 @@ class OptionsBootstrapper:
                 ]
                 existing_rcfiles = list(filter(os.path.exists, rcfiles))
                 full_config_paths.extend(existing_rcfiles)
+                consulted_config_paths.extend(rcfiles)
 
             full_config_files_products = [filecontent_for(p) for p in full_config_paths]
             post_bootstrap_config = Config.load(
@@ -167,13 +298,14 @@ class OptionsBootstrapper:
             args = alias.expand_args(tuple(args))
             bargs = cls._get_bootstrap_args(args)
 
-            return cls(
+            options_bootstrapper = cls(
                 env_tuples=env_tuples,
                 bootstrap_args=bargs,
                 args=args,
                 config=post_bootstrap_config,
                 alias=alias,
             )
+            return options_bootstrapper, consulted_config_paths
 
     @classmethod
     def _get_bootstrap_args(cls, args: Sequence[str]) -> tuple[str, ...]:
@@ -4,13 +4,17 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from pathlib import Path
 from textwrap import dedent
+from typing import Iterator
+
+import pytest
 
 from pants.base.build_environment import get_buildroot
 from pants.option.option_value_container import OptionValueContainer
-from pants.option.options_bootstrapper import OptionsBootstrapper
+from pants.option.options_bootstrapper import OptionsBootstrapper, _options_bootstrapper_cache
 from pants.option.scope import ScopeInfo
 from pants.util.contextutil import temporary_file, temporary_file_path
 from pants.util.logging import LogLevel
@@ -416,3 +420,80 @@ class TestOptionsBootstrapper:
             config_arg,
             "--backend-packages=pants.backend.python.lint.pyupgrade",
         ) == ob.bootstrap_args
+
+
+class TestOptionsBootstrapperCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> Iterator[None]:
+        _options_bootstrapper_cache.clear()
+        yield
+        _options_bootstrapper_cache.clear()
+
+    def test_cache_hit(self, tmp_path: Path) -> None:
+        config = tmp_path / "config"
+        config.write_text("[GLOBAL]\nlogdir = 'logdir1'\n")
+        args = [f"--pants-config-files=['{config.as_posix()}']"]
+
+        def create(env: dict[str, str] | None = None) -> OptionsBootstrapper:
+            return OptionsBootstrapper.create(
+                env=env or {}, args=args, allow_pantsrc=False, use_cache=True
+            )
+
+        ob = create()
+        assert create() is ob
+        # Non-`PANTS_` env vars do not affect options.
+        assert create({"HOME": "/home/user"}) is ob
+        assert create({"PANTS_LOGDIR": "logdir2"}) is not ob
+        # Nor does use of the cache affect the result.
+        assert OptionsBootstrapper.create(env={}, args=args, allow_pantsrc=False) == ob
+
+        # Editing a config file invalidates the cached OptionsBootstrapper.
+        config.write_text("[GLOBAL]\nlogdir = 'logdir3'\n")
+        ob2 = create()
+        assert ob2 is not ob
+        assert "logdir3" == ob2.get_bootstrap_options().for_global_scope().logdir
+
+    def test_cache_invalidated_by_fromfile_values(self, tmp_path: Path) -> None:
+        config = tmp_path / "config"
+        config.write_text(f"[GLOBAL]\nlogdir = '@{tmp_path.as_posix()}/logdir.txt'\n")
+        (tmp_path / "logdir.txt").write_text("logdir1")
+        (tmp_path / "workdir.txt").write_text("workdir1")
+        args = [
+            f"--pants-config-files=['{config.as_posix()}']",
+            f"--pants-workdir=@{tmp_path.as_posix()}/workdir.txt",
+        ]
+
+        def create() -> OptionsBootstrapper:
+            return OptionsBootstrapper.create(
+                env={}, args=args, allow_pantsrc=False, use_cache=True
+            )
+
+        ob = create()
+        assert create() is ob
+
+        (tmp_path / "logdir.txt").write_text("logdir2")
+        ob2 = create()
+        assert ob2 is not ob
+        assert "logdir2" == ob2.get_bootstrap_options().for_global_scope().logdir
+
+        (tmp_path / "workdir.txt").write_text("workdir2")
+        ob3 = create()
+        assert ob3 is not ob2
+        assert "workdir2" == ob3.get_bootstrap_options().for_global_scope().pants_workdir
+
+    def test_concurrent_creates(self, tmp_path: Path) -> None:
+        config = tmp_path / "config"
+        config.write_text("[GLOBAL]\nlogdir = 'logdir1'\n")
+        args = [f"--pants-config-files=['{config.as_posix()}']"]
+
+        # Concurrent misses are serialized, and so all share the first OptionsBootstrapper.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            obs = list(
+                executor.map(
+                    lambda _: OptionsBootstrapper.create(
+                        env={}, args=args, allow_pantsrc=False, use_cache=True
+                    ),
+                    range(8),
+                )
+            )
+        assert all(ob is obs[0] for ob in obs)
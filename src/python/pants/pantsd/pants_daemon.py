@@ -94,6 +94,11 @@ class PantsDaemon(PantsDaemonProcessManager):
             ),
             pid=os.getpid(),
             max_memory_usage_in_bytes=bootstrap_options.pantsd_max_memory_usage,
+            memory_eviction_threshold_in_bytes=int(
+                bootstrap_options.pantsd_max_memory_usage
+                * bootstrap_options.pantsd_memory_eviction_threshold
+            ),
+            memory_eviction_idle_sessions=bootstrap_options.pantsd_memory_eviction_idle_runs,
         )
 
         store_gc_service = StoreGCService(
@@ -205,8 +210,10 @@ class PantsDaemon(PantsDaemonProcessManager):
 def launch_new_pantsd_instance():
     """An external entrypoint that spawns a new pantsd instance."""
 
+    # NB: The OptionsBootstrapper is cached in order for it to be reused by the first run, whose
+    # args and env are identical to the daemon's.
     options_bootstrapper = OptionsBootstrapper.create(
-        env=os.environ, args=sys.argv, allow_pantsrc=True
+        env=os.environ, args=sys.argv, allow_pantsrc=True, use_cache=True
     )
     daemon = PantsDaemon.create(options_bootstrapper)
     daemon.run_sync()
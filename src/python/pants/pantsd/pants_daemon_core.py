@@ -6,13 +6,14 @@ from __future__ import annotations
 import logging
 import threading
 from contextlib import contextmanager
-from typing import Iterator
+from typing import Callable, Iterator
 
 from typing_extensions import Protocol
 
 from pants.build_graph.build_configuration import BuildConfiguration
 from pants.engine.environment import CompleteEnvironment
 from pants.engine.internals.native_engine import PyExecutor
+from pants.engine.internals.session import SessionValues
 from pants.init.engine_initializer import EngineInitializer, GraphScheduler
 from pants.init.options_initializer import OptionsInitializer
 from pants.option.global_options import AuthPluginResult, DynamicRemoteOptions
@@ -34,6 +35,69 @@ class PantsServicesConstructor(Protocol):
         ...
 
 
+class RunSlots:
+    """Admits runs which share the current Scheduler concurrently, and runs which must (re-)
+    initialize the Scheduler exclusively.
+
+    Runs which need to initialize the Scheduler are given priority over new shared runs, in order
+    to avoid them being starved by a steady stream of compatible runs.
+    """
+
+    # The interval on which waiting runs re-check whether they may start, and call `on_wait`.
+    WAIT_INTERVAL = 0.1
+
+    def __init__(self, lock: threading.RLock) -> None:
+        self._runs_changed = threading.Condition(lock)
+        self._active_runs = 0
+        self._pending_exclusive_runs = 0
+
+    @property
+    def active_runs(self) -> int:
+        return self._active_runs
+
+    def acquire(
+        self,
+        needs_exclusive: Callable[[], bool],
+        max_concurrent_runs: int,
+        on_wait: Callable[[int], None],
+    ) -> bool:
+        """Wait until a run may start, and return True if it must run exclusively.
+
+        Must be called under the lock. Because other runs may change the Scheduler while this run
+        is waiting, `needs_exclusive` is re-evaluated each time that the run is woken up. `on_wait`
+        is called (with the number of active runs) each time the run must continue waiting, and may
+        raise to give up.
+        """
+        pending_exclusive = False
+        try:
+            while True:
+                exclusive = needs_exclusive()
+                if exclusive != pending_exclusive:
+                    self._pending_exclusive_runs += 1 if exclusive else -1
+                    pending_exclusive = exclusive
+                if exclusive:
+                    can_start = self._active_runs == 0
+                else:
+                    can_start = (
+                        self._active_runs < max_concurrent_runs
+                        and self._pending_exclusive_runs == 0
+                    )
+                if can_start:
+                    self._active_runs += 1
+                    return exclusive
+                on_wait(self._active_runs)
+                self._runs_changed.wait(timeout=self.WAIT_INTERVAL)
+        finally:
+            if pending_exclusive:
+                self._pending_exclusive_runs -= 1
+                self._runs_changed.notify_all()
+
+    def release(self) -> None:
+        """Must be called under the lock."""
+        self._active_runs -= 1
+        self._runs_changed.notify_all()
+
+
 class PantsDaemonCore:
     """A container for the state of a PantsDaemon that is affected by the bootstrap options.
 
@@ -52,6 +116,7 @@ class PantsDaemonCore:
         self._executor = executor
         self._services_constructor = services_constructor
         self._lifecycle_lock = threading.RLock()
+        self._run_slots = RunSlots(self._lifecycle_lock)
         # N.B. This Event is used as nothing more than an atomic flag - nothing waits on it.
         self._kill_switch = threading.Event()
 
@@ -117,10 +182,20 @@ class PantsDaemonCore:
             self._scheduler = None
             raise e
 
+    @contextmanager
     def prepare(
-        self, options_bootstrapper: OptionsBootstrapper, env: CompleteEnvironment
-    ) -> tuple[GraphScheduler, OptionsInitializer]:
-        """Get a scheduler for the given options_bootstrapper.
+        self,
+        options_bootstrapper: OptionsBootstrapper,
+        env: CompleteEnvironment,
+        *,
+        max_concurrent_runs: int = 1,
+        on_wait: Callable[[int], None] = lambda active_runs: None,
+    ) -> Iterator[tuple[GraphScheduler, OptionsInitializer]]:
+        """Get a scheduler for the given options_bootstrapper, for the duration of a run.
+
+        Up to `max_concurrent_runs` runs may share the scheduler concurrently, as long as their
+        options match those that it was initialized with. A run which needs to (re-)initialize the
+        scheduler waits until all other runs have completed: see `RunSlots`.
 
         Runs in a client context (generally in DaemonPantsRunner) so logging is sent to the client.
         """
@@ -130,20 +205,12 @@ class PantsDaemonCore:
                 options_bootstrapper, env, raise_=True
             )
 
-        scheduler_restart_explanation: str | None = None
-
         # Because these options are computed dynamically via side-effects like reading from a file,
         # they need to be re-evaluated every run. We only reinitialize the scheduler if changes
         # were made, though.
         dynamic_remote_options, auth_plugin_result = DynamicRemoteOptions.from_options(
             options, env, self._prior_auth_plugin_result
         )
-        remote_options_changed = (
-            self._prior_dynamic_remote_options is not None
-            and dynamic_remote_options != self._prior_dynamic_remote_options
-        )
-        if remote_options_changed:
-            scheduler_restart_explanation = "Remote cache/execution options updated"
 
         # Compute the fingerprint of the bootstrap options. Note that unlike
         # PantsDaemonProcessManager (which fingerprints only `daemon=True` options), this
@@ -153,33 +220,64 @@ class PantsDaemonCore:
             GLOBAL_SCOPE,
             options_bootstrapper.bootstrap_options,
         )
-        bootstrap_options_changed = (
-            self._fingerprint is not None and options_fingerprint != self._fingerprint
-        )
-        if bootstrap_options_changed:
-            scheduler_restart_explanation = "Initialization options changed"
+
+        def scheduler_restart_explanation() -> str | None:
+            if (
+                self._prior_dynamic_remote_options is not None
+                and dynamic_remote_options != self._prior_dynamic_remote_options
+            ):
+                return "Remote cache/execution options updated"
+            if self._fingerprint is not None and options_fingerprint != self._fingerprint:
+                return "Initialization options changed"
+            return None
 
         with self._lifecycle_lock:
-            if self._scheduler is None or scheduler_restart_explanation:
-                # The fingerprint mismatches, either because this is the first run (and there is no
-                # fingerprint) or because relevant options have changed. Create a new scheduler
-                # and services.
-                bootstrap_options = options.bootstrap_option_values()
-                assert bootstrap_options is not None
-                with self._handle_exceptions():
-                    self._initialize(
-                        options_fingerprint,
-                        bootstrap_options,
-                        build_config,
-                        dynamic_remote_options,
-                        scheduler_restart_explanation,
-                    )
+            exclusive = self._run_slots.acquire(
+                lambda: self._scheduler is None or scheduler_restart_explanation() is not None,
+                max_concurrent_runs,
+                on_wait,
+            )
+            try:
+                if exclusive:
+                    # The fingerprint mismatches, either because this is the first run (and there
+                    # is no fingerprint) or because relevant options have changed. Create a new
+                    # scheduler and services.
+                    bootstrap_options = options.bootstrap_option_values()
+                    assert bootstrap_options is not None
+                    with self._handle_exceptions():
+                        self._initialize(
+                            options_fingerprint,
+                            bootstrap_options,
+                            build_config,
+                            dynamic_remote_options,
+                            scheduler_restart_explanation(),
+                        )
 
-            self._prior_dynamic_remote_options = dynamic_remote_options
-            self._prior_auth_plugin_result = auth_plugin_result
+                self._prior_dynamic_remote_options = dynamic_remote_options
+                self._prior_auth_plugin_result = auth_plugin_result
 
-            assert self._scheduler is not None
-            return self._scheduler, self._options_initializer
+                assert self._scheduler is not None
+                scheduler = self._scheduler
+            except BaseException:
+                self._run_slots.release()
+                raise
+            if self._services is not None:
+                self._services.client_run_started()
+
+        try:
+            yield scheduler, self._options_initializer
+        finally:
+            with self._lifecycle_lock:
+                self._run_slots.release()
+                if self._run_slots.active_runs == 0 and self._services is not None:
+                    self._services.client_runs_completed(
+                        SessionValues(
+                            {
+                                OptionsBootstrapper: options_bootstrapper,
+                                CompleteEnvironment: env,
+                            }
+                        )
+                    )
 
     def shutdown(self) -> None:
         with self._lifecycle_lock:
@@ -0,0 +1,87 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from pants.pantsd.pants_daemon_core import RunSlots
+
+
+class GiveUp(Exception):
+    pass
+
+
+def give_up(active_runs: int) -> None:
+    raise GiveUp()
+
+
+def test_shared_runs_up_to_limit() -> None:
+    lock = threading.RLock()
+    slots = RunSlots(lock)
+    with lock:
+        assert not slots.acquire(lambda: False, 2, give_up)
+        assert not slots.acquire(lambda: False, 2, give_up)
+        with pytest.raises(GiveUp):
+            slots.acquire(lambda: False, 2, give_up)
+        assert slots.active_runs == 2
+
+        slots.release()
+        assert not slots.acquire(lambda: False, 2, give_up)
+
+
+def test_exclusive_run_waits_for_shared_runs() -> None:
+    lock = threading.RLock()
+    slots = RunSlots(lock)
+    with lock:
+        assert not slots.acquire(lambda: False, 2, give_up)
+        with pytest.raises(GiveUp):
+            slots.acquire(lambda: True, 2, give_up)
+        slots.release()
+        assert slots.acquire(lambda: True, 2, give_up)
+
+        # Once the exclusive run has initialized the Scheduler, compatible runs may share it.
+        assert not slots.acquire(lambda: False, 2, give_up)
+
+
+def test_pending_exclusive_run_has_priority() -> None:
+    lock = threading.RLock()
+    slots = RunSlots(lock)
+    with lock:
+        assert not slots.acquire(lambda: False, 4, give_up)
+
+    exclusive_started = threading.Event()
+    waiting = threading.Event()
+
+    def exclusive_run() -> None:
+        with lock:
+            assert slots.acquire(lambda: True, 4, lambda active_runs: waiting.set())
+        exclusive_started.set()
+
+    thread = threading.Thread(target=exclusive_run, daemon=True)
+    thread.start()
+    assert waiting.wait(timeout=10)
+
+    with lock:
+        # Although there is capacity, a new shared run must wait for the pending exclusive run.
+        with pytest.raises(GiveUp):
+            slots.acquire(lambda: False, 4, give_up)
+        slots.release()
+
+    assert exclusive_started.wait(timeout=10)
+    thread.join(timeout=10)
+    assert slots.active_runs == 1
+
+
+def test_exclusive_run_may_become_shared() -> None:
+    lock = threading.RLock()
+    slots = RunSlots(lock)
+    needs_exclusive = iter([True, False])
+    with lock:
+        assert not slots.acquire(lambda: False, 4, give_up)
+        # The run needs exclusivity at first, but (e.g. because another run initialized the
+        # scheduler with its options while it was waiting) no longer does once it is woken up.
+        assert not slots.acquire(lambda: next(needs_exclusive), 4, lambda active_runs: None)
+        assert slots.active_runs == 2
@@ -10,13 +10,13 @@ import sys
 import time
 import traceback
 from abc import ABCMeta
-from hashlib import sha256
 from typing import Callable, cast
 
 import psutil
 
 from pants.base.build_environment import get_buildroot
 from pants.bin.pants_env_vars import DAEMON_ENTRYPOINT
+from pants.bin.pantsd_fast_path import host_fingerprint
 from pants.option.options import Options
 from pants.option.options_fingerprinter import OptionsFingerprinter
 from pants.option.scope import GLOBAL_SCOPE
@@ -84,10 +84,7 @@ class ProcessManager:
         to identify reboots, but it's more challenging than it should be because it would involve
         subtracting from the current time, which might hit aliasing issues.
         """
-        hasher = sha256()
-        for component in os.uname():
-            hasher.update(component.encode())
-        return hasher.hexdigest()[:12]
+        return host_fingerprint()
 
     @staticmethod
     def _maybe_cast(item, caster):
@@ -8,6 +8,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Dict, KeysView, Tuple
 
+from pants.engine.internals.session import SessionValues
 from pants.util.meta import frozen_after_init
 
 logger = logging.getLogger(__name__)
@@ -44,6 +45,19 @@ class PantsService(ABC):
     def run(self):
         """The main entry-point for the service called by the service runner."""
 
+    def client_run_started(self) -> None:
+        """Called when a client run starts using the Scheduler.
+
+        Called under the PantsDaemonCore lifecycle lock, and so must not block.
+        """
+
+    def client_runs_completed(self, session_values: SessionValues) -> None:
+        """Called when the last active client run has completed, with the SessionValues of that
+        run.
+
+        Called under the PantsDaemonCore lifecycle lock, and so must not block.
+        """
+
     def mark_pausing(self):
         """Triggers pausing of the service, without waiting for it to have paused.
 
@@ -246,6 +260,16 @@ class PantsServices:
                 return False
         return True
 
+    def client_run_started(self) -> None:
+        """See `PantsService.client_run_started`."""
+        for service in self._service_threads:
+            service.client_run_started()
+
+    def client_runs_completed(self, session_values: SessionValues) -> None:
+        """See `PantsService.client_runs_completed`."""
+        for service in self._service_threads:
+            service.client_runs_completed(session_values)
+
     def shutdown(self) -> None:
         """Shut down and join all service threads."""
         for service, service_thread in self._service_threads.items():
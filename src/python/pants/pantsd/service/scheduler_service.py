@@ -1,15 +1,24 @@
 # Copyright 2016 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+from __future__ import annotations
+
 import logging
+import threading
 import time
 from typing import Optional, Tuple, cast
 
 import psutil
 
+from pants.base.specs_parser import SpecsParser
+from pants.engine.addresses import Addresses
 from pants.engine.fs import PathGlobs, Snapshot
-from pants.engine.internals.scheduler import ExecutionTimeoutError
+from pants.engine.internals.scheduler import ExecutionTimeoutError, SchedulerSession
+from pants.engine.internals.selectors import Params
+from pants.engine.internals.session import SessionValues
+from pants.engine.target import TransitiveTargets, TransitiveTargetsRequest
 from pants.init.engine_initializer import GraphScheduler
+from pants.option.options_bootstrapper import OptionsBootstrapper
 from pants.pantsd.service.pants_service import PantsService
 
 
@@ -17,7 +26,8 @@ class SchedulerService(PantsService):
     """The pantsd scheduler service.
 
     This service uses the scheduler to watch the filesystem and determine whether pantsd needs to
-    restart in order to reload its state.
+    restart in order to reload its state. While no client runs are active, it also uses the
+    scheduler to warm up the graph for `--pantsd-warmup-specs`.
     """
 
     # The interval on which we will long-poll the invalidation globs. If a glob changes, the poll
@@ -26,6 +36,10 @@ class SchedulerService(PantsService):
     INVALIDATION_POLL_INTERVAL = 0.5
     # A grace period after startup that we will wait before enforcing our pid.
     PIDFILE_GRACE_PERIOD = 5
+    # The minimum interval between evictions of idle memoized values. Memory which has been freed
+    # is not necessarily returned to the OS, and so an eviction may not lower usage below the
+    # eviction threshold: this avoids repeatedly scanning the graph while that is the case.
+    MEMORY_EVICTION_INTERVAL = 30
 
     def __init__(
         self,
@@ -36,6 +50,8 @@ class SchedulerService(PantsService):
         pidfile: str,
         pid: int,
         max_memory_usage_in_bytes: int,
+        memory_eviction_threshold_in_bytes: int | None = None,
+        memory_eviction_idle_sessions: int = 3,
     ) -> None:
         """
         :param graph_scheduler: The GraphScheduler instance for graph construction.
@@ -47,6 +63,11 @@ class SchedulerService(PantsService):
         :param pid: This processes' pid.
         :param max_memory_usage_in_bytes: The maximum memory usage of the process: the service will
                                           shut down if it observes more than this amount in use.
+        :param memory_eviction_threshold_in_bytes: The memory usage above which the service will
+                                                   evict memoized values which have not been used
+                                                   recently. Defaults to the maximum memory usage.
+        :param memory_eviction_idle_sessions: The number of consecutive Sessions that a memoized
+                                              value must not have been used in to be evicted.
         """
         super().__init__()
         self._graph_helper = graph_scheduler
@@ -69,6 +90,17 @@ class SchedulerService(PantsService):
         self._pidfile = pidfile
         self._pid = pid
         self._max_memory_usage_in_bytes = max_memory_usage_in_bytes
+        self._memory_eviction_threshold_in_bytes = (
+            memory_eviction_threshold_in_bytes
+            if memory_eviction_threshold_in_bytes is not None
+            else max_memory_usage_in_bytes
+        )
+        self._memory_eviction_idle_sessions = memory_eviction_idle_sessions
+        self._last_memory_eviction_time: float | None = None
+
+        # The Session of the in-progress warmup, if any. Guarded by the lock.
+        self._warmup_lock = threading.Lock()
+        self._warmup_session: SchedulerSession | None = None
 
     def _get_snapshot(self, globs: Tuple[str, ...], poll: bool) -> Optional[Snapshot]:
         """Returns a Snapshot of the input globs.
@@ -121,8 +153,37 @@ class SchedulerService(PantsService):
         if int(pid_from_file) != self._pid:
             raise Exception(f"Another instance of pantsd is running at {pid_from_file}")
 
+    def _memory_usage_in_bytes(self) -> int:
+        return cast(int, psutil.Process(self._pid).memory_info()[0])
+
+    def _maybe_evict(self, memory_usage_in_bytes: int) -> int:
+        """If memory usage is above the eviction threshold, evict memoized values which have not
+        been used recently, and return the resulting memory usage."""
+        if memory_usage_in_bytes <= self._memory_eviction_threshold_in_bytes:
+            return memory_usage_in_bytes
+        now = time.time()
+        if (
+            self._last_memory_eviction_time is not None
+            and now - self._last_memory_eviction_time < self.MEMORY_EVICTION_INTERVAL
+        ):
+            return memory_usage_in_bytes
+        self._last_memory_eviction_time = now
+
+        evicted = self._scheduler.evict_idle_nodes(self._memory_eviction_idle_sessions)
+        memory_usage_after_in_bytes = self._memory_usage_in_bytes()
+        bytes_per_mib = 1_048_576
+        self._logger.info(
+            f"pantsd was using {memory_usage_in_bytes / bytes_per_mib:.2f} MiB of memory (above "
+            f"the eviction threshold of "
+            f"{self._memory_eviction_threshold_in_bytes / bytes_per_mib:.2f} MiB): evicted "
+            f"{evicted} memoized values which were unused in the last "
+            f"{self._memory_eviction_idle_sessions} runs, and is now using "
+            f"{memory_usage_after_in_bytes / bytes_per_mib:.2f} MiB."
+        )
+        return memory_usage_after_in_bytes
+
     def _check_memory_usage(self):
-        memory_usage_in_bytes = psutil.Process(self._pid).memory_info()[0]
+        memory_usage_in_bytes = self._maybe_evict(self._memory_usage_in_bytes())
         if memory_usage_in_bytes > self._max_memory_usage_in_bytes:
             bytes_per_mib = 1_048_576
             raise Exception(
@@ -131,6 +192,72 @@ class SchedulerService(PantsService):
                 f"{self._max_memory_usage_in_bytes / bytes_per_mib:.2f} MiB)."
             )
 
+    def _cancel_warmup(self) -> None:
+        with self._warmup_lock:
+            if self._warmup_session is not None:
+                self._warmup_session.cancel()
+                self._warmup_session = None
+
+    def client_run_started(self) -> None:
+        """Cancel any in-progress warmup, so that it does not compete with the run for resources.
+
+        Nodes which were completed by the warmup remain memoized.
+        """
+        self._cancel_warmup()
+
+    def client_runs_completed(self, session_values: SessionValues) -> None:
+        """Begin warming up in the background, using the options of the last completed run."""
+        options_bootstrapper = session_values[OptionsBootstrapper]
+        specs = tuple(options_bootstrapper.bootstrap_options.for_global_scope().pantsd_warmup_specs)
+        if not specs or self._state.is_terminating:
+            return
+        with self._warmup_lock:
+            if self._warmup_session is not None:
+                return
+            session = self._scheduler.new_session(
+                build_id="scheduler_service_warmup_session",
+                session_values=session_values,
+                # NB: Eviction counts idle epochs as client runs, so warmups must not begin epochs.
+                advance_epoch=False,
+            )
+            self._warmup_session = session
+        threading.Thread(
+            target=self._warm_up,
+            args=(session, options_bootstrapper, specs),
+            name="SchedulerServiceWarmupThread",
+            daemon=True,
+        ).start()
+
+    def _warm_up(
+        self,
+        session: SchedulerSession,
+        options_bootstrapper: OptionsBootstrapper,
+        specs: tuple[str, ...],
+    ) -> None:
+        """Compute the transitive targets of the warmup specs, which requires parsing BUILD files,
+        computing source roots, and running dependency inference (including computing any module
+        mappings) for all of them."""
+        start = time.time()
+        try:
+            parsed_specs = SpecsParser(self._build_root).parse_specs(specs)
+            (addresses,) = session.product_request(
+                Addresses, [Params(parsed_specs, options_bootstrapper)]
+            )
+            session.product_request(
+                TransitiveTargets, [TransitiveTargetsRequest(cast(Addresses, addresses))]
+            )
+        except (Exception, KeyboardInterrupt) as e:
+            if session.is_cancelled:
+                self._logger.debug(f"Warmup was cancelled after {time.time() - start:.2f}s.")
+            else:
+                self._logger.warning(f"Failed to warm up `--pantsd-warmup-specs`: {e!r}")
+        else:
+            self._logger.debug(f"Warmed up in {time.time() - start:.2f}s.")
+        finally:
+            with self._warmup_lock:
+                if self._warmup_session is session:
+                    self._warmup_session = None
+
     def _check_invalidation_watcher_liveness(self):
         self._scheduler.check_invalidation_watcher_liveness()
 
@@ -157,3 +284,4 @@ class SchedulerService(PantsService):
                 self._logger.critical(f"The scheduler was invalidated: {e!r}")
                 self.terminate()
         self._scheduler_session.cancel()
+        self._cancel_warmup()
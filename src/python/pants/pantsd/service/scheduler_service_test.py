@@ -0,0 +1,121 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from pants.core.target_types import GenericTarget
+from pants.engine.environment import CompleteEnvironment
+from pants.engine.internals.session import SessionValues
+from pants.init.engine_initializer import GraphScheduler
+from pants.option.options_bootstrapper import OptionsBootstrapper
+from pants.pantsd.service.scheduler_service import SchedulerService
+from pants.testutil.rule_runner import RuleRunner
+
+
+def create_service(
+    rule_runner: RuleRunner, max_memory_usage_in_bytes: int = 2 ** 32, **kwargs
+) -> SchedulerService:
+    return SchedulerService(
+        graph_scheduler=GraphScheduler(rule_runner.scheduler.scheduler, goal_map={}),
+        build_root=rule_runner.build_root,
+        invalidation_globs=(),
+        pidfile=os.path.join(rule_runner.build_root, "pid"),
+        pid=os.getpid(),
+        max_memory_usage_in_bytes=max_memory_usage_in_bytes,
+        **kwargs,
+    )
+
+
+def session_values(rule_runner: RuleRunner) -> SessionValues:
+    return SessionValues(
+        {
+            OptionsBootstrapper: rule_runner.options_bootstrapper,
+            CompleteEnvironment: rule_runner.environment,
+        }
+    )
+
+
+def test_warmup() -> None:
+    rule_runner = RuleRunner(target_types=[GenericTarget])
+    rule_runner.write_files(
+        {
+            "src/a/BUILD": "target(dependencies=['src/b'])",
+            "src/b/BUILD": "target()",
+        }
+    )
+    service = create_service(rule_runner)
+
+    # Without warmup specs, there is nothing to do.
+    service.client_runs_completed(session_values(rule_runner))
+    assert service._warmup_session is None
+
+    graph_len_before = rule_runner.scheduler.scheduler.graph_len()
+    rule_runner.set_options(["--pantsd-warmup-specs=['src/a']"])
+    service.client_runs_completed(session_values(rule_runner))
+    deadline = time.time() + 30
+    while service._warmup_session is not None and time.time() < deadline:
+        time.sleep(0.05)
+    assert service._warmup_session is None
+    assert rule_runner.scheduler.scheduler.graph_len() > graph_len_before
+
+
+def test_warmup_cancelled_by_run() -> None:
+    rule_runner = RuleRunner(target_types=[GenericTarget])
+    rule_runner.write_files({"src/a/BUILD": "target()"})
+    rule_runner.set_options(["--pantsd-warmup-specs=['src::']"])
+    service = create_service(rule_runner)
+
+    service.client_runs_completed(session_values(rule_runner))
+    warmup_session = service._warmup_session
+    service.client_run_started()
+    assert service._warmup_session is None
+    assert warmup_session is None or warmup_session.is_cancelled
+
+
+def test_memory_eviction(monkeypatch) -> None:
+    rule_runner = RuleRunner()
+    service = create_service(
+        rule_runner,
+        max_memory_usage_in_bytes=100,
+        memory_eviction_threshold_in_bytes=50,
+        memory_eviction_idle_sessions=2,
+    )
+    evictions: list[int] = []
+    monkeypatch.setattr(
+        service._scheduler, "evict_idle_nodes", lambda idle: evictions.append(idle) or 1
+    )
+
+    # The memory usage which will be measured, in order.
+    measurements: list[int] = []
+    monkeypatch.setattr(service, "_memory_usage_in_bytes", lambda: measurements.pop(0))
+
+    # Below the threshold, nothing is evicted.
+    measurements.extend([40])
+    service._check_memory_usage()
+    assert evictions == []
+
+    # Above the threshold, idle values are evicted, and usage is re-measured: pantsd only restarts
+    # if it is still above the maximum.
+    measurements.extend([120, 80])
+    service._check_memory_usage()
+    assert evictions == [2]
+    assert measurements == []
+
+    # Evictions are rate limited, so pantsd restarts if it is above the maximum in the meantime.
+    measurements.extend([120])
+    with pytest.raises(Exception, match="above the `--pantsd-max-memory-usage` limit"):
+        service._check_memory_usage()
+    assert evictions == [2]
+    assert measurements == []
+
+    service._last_memory_eviction_time = None
+    measurements.extend([120, 110])
+    with pytest.raises(Exception, match="above the `--pantsd-max-memory-usage` limit"):
+        service._check_memory_usage()
+    assert evictions == [2, 2]
+    assert measurements == []
@@ -9,14 +9,15 @@ from typing import List, cast
 
 from pants.backend.project_info import dependees
 from pants.backend.project_info.dependees import Dependees, DependeesRequest
-from pants.base.build_environment import get_buildroot
+from pants.base.build_environment import get_buildroot, get_git
 from pants.engine.addresses import Address
-from pants.engine.collection import Collection
+from pants.engine.collection import Collection, DeduplicatedCollection
 from pants.engine.internals.graph import Owners, OwnersRequest
-from pants.engine.rules import Get, collect_rules, rule
+from pants.engine.rules import Get, _uncacheable_rule, collect_rules, rule
 from pants.option.option_value_container import OptionValueContainer
 from pants.option.subsystem import Subsystem
 from pants.util.docutil import doc_url
+from pants.util.logging import LogLevel
 from pants.vcs.git import Git
 
 
@@ -52,6 +53,38 @@ async def find_changed_owners(request: ChangedRequest) -> ChangedAddresses:
     return ChangedAddresses(dependees_with_roots)
 
 
+@dataclass(frozen=True)
+class ChangedFilesRequest:
+    """The files changed since a Git ref, including uncommitted and untracked files.
+
+    If set, `diff_filter` selects the kinds of changes to include, as for `git diff --diff-filter`.
+    """
+
+    since: str
+    diff_filter: str | None = None
+
+
+class ChangedFiles(DeduplicatedCollection[str]):
+    sort_input = True
+
+
+# NB: Like the files for `--changed-since`, the changed files are determined for every run, since
+# the engine is not notified of changes to the Git repository.
+@_uncacheable_rule(desc="Find changed files", level=LogLevel.DEBUG)
+def find_changed_files(request: ChangedFilesRequest) -> ChangedFiles:
+    git = get_git()
+    if not git:
+        raise ValueError("Changed files can only be determined if Git is used for the repository.")
+    return ChangedFiles(
+        git.changed_files(
+            from_commit=request.since,
+            include_untracked=True,
+            relative_to=get_buildroot(),
+            diff_filter=request.diff_filter,
+        )
+    )
+
+
 @dataclass(frozen=True)
 class ChangedOptions:
     """A wrapper for the options from the `Changed` Subsystem.
@@ -105,19 +105,29 @@ class Git:
         from_commit: str | None = None,
         include_untracked: bool = False,
         relative_to: PurePath | str | None = None,
+        diff_filter: str | None = None,
     ) -> set[str]:
+        """The files changed since `from_commit` (or HEAD), including uncommitted changes.
+
+        :param diff_filter: If set, only include the kinds of changes selected by this value of
+          `git diff --diff-filter` (e.g. `AR` for added and renamed files). Untracked files are
+          considered to be added.
+        """
         relative_to = PurePath(relative_to) if relative_to is not None else self.worktree
         rel_suffix = ["--", str(relative_to)]
-        uncommitted_changes = self._check_output(["diff", "--name-only", "HEAD"] + rel_suffix)
+        diff_args = ["diff", "--name-only"]
+        if diff_filter:
+            diff_args.append(f"--diff-filter={diff_filter}")
+        uncommitted_changes = self._check_output([*diff_args, "HEAD"] + rel_suffix)
 
         files = set(uncommitted_changes.splitlines())
         if from_commit:
             # Grab the diff from the merge-base to HEAD using ... syntax.  This ensures we have just
             # the changes that have occurred on the current branch.
-            committed_cmd = ["diff", "--name-only", from_commit + "...HEAD"] + rel_suffix
+            committed_cmd = [*diff_args, from_commit + "...HEAD"] + rel_suffix
             committed_changes = self._check_output(committed_cmd)
             files.update(committed_changes.split())
-        if include_untracked:
+        if include_untracked and (not diff_filter or "A" in diff_filter):
             untracked_cmd = [
                 "ls-files",
                 "--other",
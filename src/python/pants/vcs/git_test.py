@@ -219,6 +219,23 @@ def test_commit_with_new_untracked_file_adds_file(worktree: Path, git: Git) -> N
     assert set() == git.changed_files(include_untracked=True)
 
 
+def test_changed_files_diff_filter(worktree: Path, readme_file: Path, git: Git) -> None:
+    assert set() == git.changed_files(from_commit="HEAD^", diff_filter="A")
+
+    (worktree / "added").write_text("added")
+    git.add(worktree / "added")
+    git.commit("Add a file.")
+    (worktree / "untracked").write_text("untracked")
+    readme_file.write_text("Modified.")
+
+    assert {"added", "untracked"} == git.changed_files(
+        from_commit="HEAD^", include_untracked=True, diff_filter="A"
+    )
+    assert {"README"} == git.changed_files(
+        from_commit="HEAD^", include_untracked=True, diff_filter="M"
+    )
+
+
 def test_bad_ref_stderr_issues_13396(git: Git) -> None:
     with pytest.raises(GitException, match=re.escape("fatal: bad revision 'remote/dne...HEAD'\n")):
         git.changed_files(from_commit="remote/dne")
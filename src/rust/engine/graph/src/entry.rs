@@ -218,6 +218,10 @@ pub struct Entry<N: Node> {
   node: N,
 
   pub state: Arc<Mutex<EntryState<N>>>,
+
+  // The Graph epoch in which this Entry was last requested: see `Graph::evict_idle`. Only
+  // maintained for the copy of the Entry which is stored in the Graph.
+  pub(crate) last_used_epoch: u32,
 }
 
 impl<N: Node> Entry<N> {
@@ -230,6 +234,7 @@ impl<N: Node> Entry<N> {
     Entry {
       node,
       state: Arc::new(Mutex::new(EntryState::initial())),
+      last_used_epoch: 0,
     }
   }
 
@@ -711,6 +716,46 @@ impl<N: Node> Entry<N> {
     };
   }
 
+  ///
+  /// Clears the state of this Node and drops its previous result (if any), in order to free the
+  /// memory held by its value. Unlike `clear`, the Node will always be assigned a new Generation
+  /// when it next runs, since there is no previous result to compare its new result to.
+  ///
+  /// Returns false without modifying the Node if it is running, if something is polling it, or if
+  /// it does not hold a value.
+  ///
+  pub(crate) fn evict(&mut self) -> bool {
+    let mut state = self.state.lock();
+    let (run_token, generation) = match *state {
+      EntryState::NotStarted {
+        previous_result: None,
+        ..
+      } => return false,
+      EntryState::NotStarted {
+        run_token,
+        generation,
+        ..
+      } => (run_token, generation),
+      EntryState::Completed {
+        run_token,
+        generation,
+        ref pollers,
+        ..
+      } if pollers.is_empty() => (run_token, generation),
+      EntryState::Completed { .. } | EntryState::Running { .. } => return false,
+    };
+
+    test_trace_log!("Evicting node {:?}", self.node);
+
+    // Swap in a state with a new RunToken value, which invalidates any outstanding work.
+    *state = EntryState::NotStarted {
+      run_token: run_token.next(),
+      generation,
+      previous_result: None,
+    };
+    true
+  }
+
   ///
   /// Dirties this Node, which will cause it to examine its dependencies the next time it is
   /// requested, and re-run if any of them have changed generations.
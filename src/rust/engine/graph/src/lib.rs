@@ -70,6 +70,10 @@ type Nodes<N> = HashMap<N, EntryId>;
 struct InnerGraph<N: Node> {
   nodes: Nodes<N>,
   pg: PGraph<N>,
+  // Incremented by `Graph::advance_epoch`, and recorded on each Entry when it is requested.
+  epoch: u32,
+  // The total number of Entries which have been evicted by `Graph::evict_idle`.
+  evicted: usize,
 }
 
 impl<N: Node> InnerGraph<N> {
@@ -398,6 +402,8 @@ impl<N: Node> Graph<N> {
     let inner = Arc::new(Mutex::new(InnerGraph {
       nodes: HashMap::default(),
       pg: DiGraph::new(),
+      epoch: 0,
+      evicted: 0,
     }));
     let _join = executor.spawn(Self::cycle_check_task(Arc::downgrade(&inner)));
 
@@ -465,8 +471,10 @@ impl<N: Node> Graph<N> {
         true
       };
 
-      let dst_entry = inner.entry_for_id(dst_id).cloned().unwrap();
-      (dst_retry, dst_entry, dst_id)
+      let epoch = inner.epoch;
+      let dst_entry = inner.entry_for_id_mut(dst_id).unwrap();
+      dst_entry.last_used_epoch = epoch;
+      (dst_retry, dst_entry.clone(), dst_id)
     };
 
     // Return the state of the destination.
@@ -735,6 +743,48 @@ impl<N: Node> Graph<N> {
     inner.invalidate_from_roots(predicate)
   }
 
+  ///
+  /// Begins a new epoch of use of the Graph (typically: a new Session). Epochs are used to decide
+  /// which Nodes have been used recently: see `Graph::evict_idle`.
+  ///
+  pub fn advance_epoch(&self) {
+    let mut inner = self.inner.lock();
+    inner.epoch = inner.epoch.wrapping_add(1);
+  }
+
+  ///
+  /// Evicts the values of Nodes which match the predicate, and which have not been requested in
+  /// at least `idle_epochs` epochs, in order to free memory. Returns the number of evicted Nodes.
+  ///
+  /// Unlike invalidation, eviction does not dirty the dependees of a Node, since its value would
+  /// be the same if it re-ran: an evicted Node will only re-run if it is requested again. Edges are
+  /// preserved, so the predicate must not match invalidation roots: if a root were evicted, later
+  /// invalidation would skip it (as NotStarted), and fail to dirty its dependees.
+  ///
+  pub fn evict_idle<P: Fn(&N) -> bool>(&self, idle_epochs: u32, predicate: P) -> usize {
+    let mut inner = self.inner.lock();
+    let epoch = inner.epoch;
+    let mut evicted = 0;
+    for entry in inner.pg.node_weights_mut() {
+      if epoch.wrapping_sub(entry.last_used_epoch) >= idle_epochs
+        && predicate(entry.node())
+        && entry.evict()
+      {
+        evicted += 1;
+      }
+    }
+    inner.evicted += evicted;
+    evicted
+  }
+
+  ///
+  /// The total number of Nodes which have been evicted by `Graph::evict_idle`.
+  ///
+  pub fn evicted_count(&self) -> usize {
+    let inner = self.inner.lock();
+    inner.evicted
+  }
+
   pub fn visualize<V: NodeVisualizer<N>>(
     &self,
     visualizer: V,
@@ -99,6 +99,52 @@ async fn invalidate_and_rerun() {
   assert_eq!(context.runs(), vec![TNode::new(1), TNode::new(2)]);
 }
 
+#[tokio::test]
+async fn evict_idle() {
+  let graph = empty_graph();
+  let context = TContext::new(graph.clone());
+
+  // Create three nodes.
+  assert_eq!(
+    graph.create(TNode::new(2), &context).await,
+    Ok(vec![T(0, 0), T(1, 0), T(2, 0)])
+  );
+
+  // Nodes which have been used within the idle window are not evicted.
+  graph.advance_epoch();
+  assert_eq!(graph.evict_idle(2, |_| true), 0);
+
+  // Evict the idle upper and middle Nodes.
+  graph.advance_epoch();
+  assert_eq!(graph.evict_idle(2, |n| n.id != 0), 2);
+  assert_eq!(graph.evicted_count(), 2);
+
+  // Confirm that the evicted Nodes re-run, but that the bottom Node does not.
+  assert_eq!(
+    graph.create(TNode::new(2), &context).await,
+    Ok(vec![T(0, 0), T(1, 0), T(2, 0)])
+  );
+  assert_eq!(
+    context.runs(),
+    vec![
+      TNode::new(2),
+      TNode::new(1),
+      TNode::new(0),
+      TNode::new(2),
+      TNode::new(1)
+    ]
+  );
+
+  // And that edges were preserved, such that invalidation still reaches the evicted Nodes.
+  assert_eq!(
+    graph.invalidate_from_roots(|n| n.id == 0),
+    InvalidationResult {
+      cleared: 1,
+      dirtied: 2
+    }
+  );
+}
+
 #[tokio::test]
 async fn invalidate_with_changed_dependencies() {
   let graph = empty_graph();
@@ -41,7 +41,9 @@ use log::Level;
 use protos::gen::build::bazel::remote::execution::v2 as remexec;
 use remexec::ExecutedActionMetadata;
 use serde::{Deserialize, Serialize};
-use workunit_store::{in_workunit, RunId, RunningWorkunit, WorkunitMetadata, WorkunitStore};
+use workunit_store::{
+  in_workunit, RunId, RunningWorkunit, UserMetadataItem, WorkunitMetadata, WorkunitStore,
+};
 
 pub mod cache;
 #[cfg(test)]
@@ -640,6 +642,16 @@ impl CommandRunner for BoundedCommandRunner {
       permit.concurrency_slot()
     );
 
+    // Record the slot on the workunit, so that the processes which ran concurrently can be laid
+    // out by slot (e.g. in `--stats-trace-file`).
+    workunit.update_metadata(|mut metadata| {
+      metadata.user_metadata.push((
+        "execution_slot".to_string(),
+        UserMetadataItem::ImmediateInt(permit.concurrency_slot() as i64),
+      ));
+      metadata
+    });
+
     for (_, process) in req.0.iter_mut() {
       if let Some(ref execution_slot_env_var) = process.execution_slot_variable {
         process.env.insert(
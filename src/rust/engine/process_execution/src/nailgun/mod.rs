@@ -1,7 +1,9 @@
 use std::collections::BTreeSet;
 use std::net::SocketAddr;
 use std::path::{Path, PathBuf};
+use std::time::Duration;
 
+use async_semaphore::AsyncSemaphore;
 use async_trait::async_trait;
 use futures::future::{FutureExt, TryFutureExt};
 use futures::stream::{BoxStream, StreamExt};
@@ -83,9 +85,13 @@ fn construct_nailgun_client_request(
 /// If that flag is set, it will connect to a running nailgun server and run the command there.
 /// Otherwise, it will just delegate to the regular local runner.
 ///
+/// The number of concurrently running nailgun requests is bounded by the size of the pool, which
+/// may be smaller than the local parallelism in order to bound the memory used by nailgun servers.
+///
 pub struct CommandRunner {
   inner: super::local::CommandRunner,
   nailgun_pool: NailgunPool,
+  nailgun_semaphore: AsyncSemaphore,
   executor: Executor,
 }
 
@@ -96,6 +102,7 @@ impl CommandRunner {
     store: Store,
     executor: Executor,
     nailgun_pool_size: usize,
+    nailgun_idle_timeout: Option<Duration>,
   ) -> Self {
     let named_caches = runner.named_caches().clone();
     CommandRunner {
@@ -103,10 +110,12 @@ impl CommandRunner {
       nailgun_pool: NailgunPool::new(
         workdir_base,
         nailgun_pool_size,
+        nailgun_idle_timeout,
         store,
         executor.clone(),
         named_caches,
       ),
+      nailgun_semaphore: AsyncSemaphore::new(nailgun_pool_size),
       executor,
     }
   }
@@ -157,10 +166,16 @@ impl super::CommandRunner for CommandRunner {
           construct_nailgun_server_request(&nailgun_name, nailgun_args, original_request.clone());
         trace!("Running request under nailgun:\n {:#?}", &nailgun_req);
 
+        // Wait for a slot in the pool: see the `NailgunPool` docs.
+        let _permit = {
+          let _blocking_token = workunit.blocking();
+          self.nailgun_semaphore.acquire().await
+        };
+
         // Get an instance of a nailgun server for this fingerprint, and then run in its directory.
         let mut nailgun_process = self
           .nailgun_pool
-          .acquire(nailgun_req, context.clone())
+          .acquire(nailgun_req, context.clone(), workunit)
           .await
           .map_err(|e| format!("Failed to connect to nailgun! {}", e))?;
 
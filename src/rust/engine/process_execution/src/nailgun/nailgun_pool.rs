@@ -17,6 +17,7 @@ use regex::Regex;
 use store::Store;
 use task_executor::Executor;
 use tempfile::TempDir;
+use workunit_store::{Metric, RunningWorkunit};
 
 use crate::local::prepare_workdir;
 use crate::{Context, MultiPlatformProcess, NamedCaches, Process, ProcessMetadata};
@@ -44,10 +45,14 @@ pub type Port = u16;
 /// this, it never actually waits for a pool entry to complete, and can instead assume that at
 /// least one pool slot is always idle when `acquire` is entered.
 ///
+/// If an `idle_timeout` is configured, idle processes which have not been used for longer than
+/// the timeout are shut down the next time that the pool is accessed.
+///
 #[derive(Clone)]
 pub struct NailgunPool {
   workdir_base: PathBuf,
   size: usize,
+  idle_timeout: Option<Duration>,
   store: Store,
   executor: Executor,
   named_caches: NamedCaches,
@@ -58,6 +63,7 @@ impl NailgunPool {
   pub fn new(
     workdir_base: PathBuf,
     size: usize,
+    idle_timeout: Option<Duration>,
     store: Store,
     executor: Executor,
     named_caches: NamedCaches,
@@ -65,6 +71,7 @@ impl NailgunPool {
     NailgunPool {
       workdir_base,
       size,
+      idle_timeout,
       store,
       executor,
       named_caches,
@@ -79,17 +86,29 @@ impl NailgunPool {
   /// If the server is not running, or if it's running with a different configuration,
   /// this code will start a new server as a side effect.
   ///
+  /// Reuse, start, and eviction counts are recorded as counters on the given workunit.
+  ///
   pub async fn acquire(
     &self,
     server_process: Process,
     context: Context,
+    workunit: &mut RunningWorkunit,
   ) -> Result<BorrowedNailgunProcess, String> {
     let name = server_process.description.clone();
     let requested_fingerprint = NailgunProcessFingerprint::new(name.clone(), &server_process)?;
     let mut processes = self.processes.lock().await;
 
+    // Shut down any processes which have been idle for longer than the idle timeout.
+    if let Some(idle_timeout) = self.idle_timeout {
+      let evicted = Self::evict_expired(&mut *processes, idle_timeout);
+      if evicted > 0 {
+        workunit.increment_counter(Metric::LocalNailgunServerEvictions, evicted as u64);
+      }
+    }
+
     // Start by seeing whether there are any idle processes with a matching fingerprint.
     if let Some((_idx, process)) = Self::find_usable(&mut *processes, &requested_fingerprint)? {
+      workunit.increment_counter(Metric::LocalNailgunServerReuses, 1);
       return Ok(BorrowedNailgunProcess::new(process));
     }
 
@@ -103,6 +122,7 @@ impl NailgunPool {
       })?;
 
       processes.swap_remove(idx);
+      workunit.increment_counter(Metric::LocalNailgunServerEvictions, 1);
     }
 
     // Start the new process.
@@ -124,6 +144,7 @@ impl NailgunPool {
       last_used: Instant::now(),
       process: process.clone(),
     });
+    workunit.increment_counter(Metric::LocalNailgunServerStarts, 1);
 
     Ok(BorrowedNailgunProcess::new(process.lock_arc().await))
   }
@@ -154,6 +175,30 @@ impl NailgunPool {
     Ok(None)
   }
 
+  ///
+  /// Remove idle processes which were last released more than `idle_timeout` ago, and return the
+  /// number of processes removed. Dropping a pool entry kills its process.
+  ///
+  fn evict_expired(pool_entries: &mut Vec<PoolEntry>, idle_timeout: Duration) -> usize {
+    let original_len = pool_entries.len();
+    pool_entries.retain(|pool_entry| {
+      if let Some(process) = pool_entry.process.try_lock_arc() {
+        let expired = process.released_at.elapsed() >= idle_timeout;
+        if expired {
+          debug!(
+            "Shutting down nailgun server {} after being idle for more than {:?}.",
+            process.name, idle_timeout
+          );
+        }
+        !expired
+      } else {
+        // The process is in use.
+        true
+      }
+    });
+    original_len - pool_entries.len()
+  }
+
   ///
   /// Find the least recently used idle (but not necessarily usable) process in the pool.
   ///
@@ -229,6 +274,7 @@ pub struct NailgunProcess {
   port: Port,
   executor: task_executor::Executor,
   handle: std::process::Child,
+  released_at: Instant,
 }
 
 fn read_port(child: &mut std::process::Child) -> Result<Port, String> {
@@ -343,6 +389,7 @@ impl NailgunProcess {
       name,
       executor,
       handle: child,
+      released_at: Instant::now(),
     })
   }
 }
@@ -414,9 +461,10 @@ impl BorrowedNailgunProcess {
   /// Clears the working directory for the process before returning it.
   ///
   pub async fn release(&mut self) -> Result<(), String> {
-    let process = self.0.as_ref().expect("release may only be called once.");
+    let process = self.0.as_mut().expect("release may only be called once.");
 
     clear_workdir(process.workdir.path(), &process.executor).await?;
+    process.released_at = Instant::now();
 
     // Once we've successfully cleaned up, remove the process.
     let _ = self.0.take();
@@ -1,16 +1,16 @@
 use std::path::PathBuf;
+use std::time::Duration;
 
 use store::Store;
 use task_executor::Executor;
 use tempfile::TempDir;
 use testutil::owned_string_vec;
-use workunit_store::WorkunitStore;
+use workunit_store::{RunningWorkunit, WorkunitStore};
 
 use crate::nailgun::NailgunPool;
 use crate::{Context, NamedCaches, Process};
 
-fn pool(size: usize) -> NailgunPool {
-  let _ = WorkunitStore::setup_for_tests();
+fn pool(size: usize, idle_timeout: Option<Duration>) -> NailgunPool {
   let named_caches_dir = TempDir::new().unwrap();
   let store_dir = TempDir::new().unwrap();
   let executor = Executor::new();
@@ -18,13 +18,14 @@ fn pool(size: usize) -> NailgunPool {
   NailgunPool::new(
     std::env::temp_dir(),
     size,
+    idle_timeout,
     store,
     executor,
     NamedCaches::new(named_caches_dir.path().to_owned()),
   )
 }
 
-async fn run(pool: &NailgunPool, port: u16) -> PathBuf {
+async fn run(pool: &NailgunPool, workunit: &mut RunningWorkunit, port: u16) -> PathBuf {
   let mut p = pool
     .acquire(
       Process::new(owned_string_vec(&[
@@ -33,6 +34,7 @@ async fn run(pool: &NailgunPool, port: u16) -> PathBuf {
         &format!("echo Mock port {}.; sleep 10", port),
       ])),
       Context::default(),
+      workunit,
     )
     .await
     .unwrap();
@@ -44,14 +46,31 @@ async fn run(pool: &NailgunPool, port: u16) -> PathBuf {
 
 #[tokio::test]
 async fn acquire() {
-  let pool = pool(1);
+  let (_, mut workunit) = WorkunitStore::setup_for_tests();
+  let pool = pool(1, None);
 
   // Sequential calls with the same fingerprint reuse the entry.
-  let workdir_one = run(&pool, 100).await;
-  let workdir_two = run(&pool, 100).await;
+  let workdir_one = run(&pool, &mut workunit, 100).await;
+  let workdir_two = run(&pool, &mut workunit, 100).await;
   assert_eq!(workdir_one, workdir_two);
 
   // A call with a different fingerprint launches in a new workdir and succeeds.
-  let workdir_three = run(&pool, 200).await;
+  let workdir_three = run(&pool, &mut workunit, 200).await;
+  assert_ne!(workdir_two, workdir_three);
+}
+
+#[tokio::test]
+async fn acquire_after_idle_timeout() {
+  let (_, mut workunit) = WorkunitStore::setup_for_tests();
+  let pool = pool(2, Some(Duration::from_millis(100)));
+
+  // A call within the idle timeout reuses the entry.
+  let workdir_one = run(&pool, &mut workunit, 100).await;
+  let workdir_two = run(&pool, &mut workunit, 100).await;
+  assert_eq!(workdir_one, workdir_two);
+
+  // But once the entry has been idle for longer than the timeout, it is replaced.
+  tokio::time::sleep(Duration::from_millis(200)).await;
+  let workdir_three = run(&pool, &mut workunit, 100).await;
   assert_ne!(workdir_two, workdir_three);
 }
@@ -100,6 +100,8 @@ pub struct ExecutionStrategyOptions {
   pub local_cleanup: bool,
   pub local_cache: bool,
   pub local_enable_nailgun: bool,
+  pub local_nailgun_pool_size: usize,
+  pub local_nailgun_idle_timeout: Option<Duration>,
   pub remote_cache_read: bool,
   pub remote_cache_write: bool,
 }
@@ -183,9 +185,8 @@ impl Core {
           local_execution_root_dir.to_path_buf(),
           store.clone(),
           executor.clone(),
-          // TODO: The nailgun pool size should almost certainly be configurable independent
-          // of concurrency, along with per-instance memory usage.
-          exec_strategy_opts.local_parallelism,
+          exec_strategy_opts.local_nailgun_pool_size,
+          exec_strategy_opts.local_nailgun_idle_timeout,
         ))
       } else {
         Box::new(local_command_runner)
@@ -105,6 +105,7 @@ fn native_engine(py: Python, m: &PyModule) -> PyO3Result<()> {
   m.add_function(wrap_pyfunction!(graph_invalidate_all_paths, m)?)?;
   m.add_function(wrap_pyfunction!(graph_invalidate_all, m)?)?;
   m.add_function(wrap_pyfunction!(graph_len, m)?)?;
+  m.add_function(wrap_pyfunction!(graph_evict_idle_nodes, m)?)?;
   m.add_function(wrap_pyfunction!(graph_visualize, m)?)?;
 
   m.add_function(wrap_pyfunction!(nailgun_server_create, m)?)?;
@@ -238,6 +239,8 @@ impl PyExecutionStrategyOptions {
     local_cleanup: bool,
     local_cache: bool,
     local_enable_nailgun: bool,
+    local_nailgun_pool_size: usize,
+    local_nailgun_idle_timeout_secs: Option<u64>,
     remote_cache_read: bool,
     remote_cache_write: bool,
   ) -> Self {
@@ -247,6 +250,8 @@ impl PyExecutionStrategyOptions {
       local_cleanup,
       local_cache,
       local_enable_nailgun,
+      local_nailgun_pool_size,
+      local_nailgun_idle_timeout: local_nailgun_idle_timeout_secs.map(Duration::from_secs),
       remote_cache_read,
       remote_cache_write,
     })
@@ -349,6 +354,7 @@ impl PySession {
     build_id: String,
     session_values: PyObject,
     cancellation_latch: &PySessionCancellationLatch,
+    advance_epoch: bool,
     py: Python,
   ) -> PyO3Result<Self> {
     let core = scheduler.0.core.clone();
@@ -363,6 +369,7 @@ impl PySession {
           build_id,
           session_values.into(),
           cancellation_latch,
+          advance_epoch,
         )
       })
       .map_err(PyException::new_err)?;
@@ -1072,6 +1079,15 @@ fn graph_len(py: Python, py_scheduler: &PyScheduler) -> u64 {
     .enter(|| py.allow_threads(|| core.graph.len() as u64))
 }
 
+#[pyfunction]
+fn graph_evict_idle_nodes(py: Python, py_scheduler: &PyScheduler, idle_sessions: u32) -> u64 {
+  py_scheduler
+    .0
+    .core
+    .executor
+    .enter(|| py.allow_threads(|| py_scheduler.0.evict_idle_nodes(idle_sessions) as u64))
+}
+
 #[pyfunction]
 fn graph_visualize(
   py: Python,
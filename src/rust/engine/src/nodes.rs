@@ -435,20 +435,24 @@ impl WrappedNode for MultiPlatformExecuteProcess {
       workunit.update_metadata(|initial| WorkunitMetadata {
         stdout: Some(res.stdout_digest),
         stderr: Some(res.stderr_digest),
-        user_metadata: vec![
-          (
-            "definition".to_string(),
-            UserMetadataItem::ImmediateString(definition),
-          ),
-          (
-            "source".to_string(),
-            UserMetadataItem::ImmediateString(format!("{:?}", res.metadata.source)),
-          ),
-          (
-            "exit_code".to_string(),
-            UserMetadataItem::ImmediateInt(res.exit_code as i64),
-          ),
-        ],
+        user_metadata: initial
+          .user_metadata
+          .into_iter()
+          .chain(vec![
+            (
+              "definition".to_string(),
+              UserMetadataItem::ImmediateString(definition),
+            ),
+            (
+              "source".to_string(),
+              UserMetadataItem::ImmediateString(format!("{:?}", res.metadata.source)),
+            ),
+            (
+              "exit_code".to_string(),
+              UserMetadataItem::ImmediateInt(res.exit_code as i64),
+            ),
+          ])
+          .collect(),
         ..initial
       });
       if let Some(total_elapsed) = res.metadata.total_elapsed {
@@ -114,6 +114,18 @@ impl Scheduler {
     self.core.graph.clear();
   }
 
+  ///
+  /// Evict the values of Nodes which have not been requested by the most recent `idle_sessions`
+  /// Sessions, in order to free memory. Filesystem Nodes are never evicted, since they are the roots
+  /// of invalidation.
+  ///
+  pub fn evict_idle_nodes(&self, idle_sessions: u32) -> usize {
+    self
+      .core
+      .graph
+      .evict_idle(idle_sessions, |node| node.fs_subject().is_none())
+  }
+
   ///
   /// Return Scheduler and per-Session metrics.
   ///
@@ -137,6 +149,10 @@ impl Scheduler {
       session.preceding_graph_size() as i64,
     );
     m.insert("resulting_graph_size", self.core.graph.len() as i64);
+    m.insert(
+      "evicted_graph_node_count",
+      self.core.graph.evicted_count() as i64,
+    );
     m
   }
 
@@ -142,6 +142,7 @@ impl Session {
     build_id: String,
     session_values: Value,
     cancelled: AsyncLatch,
+    advance_epoch: bool,
   ) -> Result<Session, String> {
     let workunit_store = WorkunitStore::new(!should_render_ui);
     let display = tokio::sync::Mutex::new(SessionDisplay::new(
@@ -159,6 +160,9 @@ impl Session {
     core.sessions.add(&handle)?;
     let run_id = core.sessions.generate_run_id();
     let preceding_graph_size = core.graph.len();
+    if advance_epoch {
+      core.graph.advance_epoch();
+    }
     Ok(Session {
       handle,
       state: Arc::new(SessionState {
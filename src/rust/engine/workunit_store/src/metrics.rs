@@ -27,6 +27,14 @@ pub enum Metric {
   /// processes directly.
   LocalCacheTotalTimeSavedMs,
   LocalExecutionRequests,
+  /// The number of nailgun servers which were shut down, either to make room in the pool for a
+  /// server with a different fingerprint, or because they had been idle for longer than the
+  /// configured idle timeout.
+  LocalNailgunServerEvictions,
+  /// The number of requests which were run in an already-running (and thus warm) nailgun server.
+  LocalNailgunServerReuses,
+  /// The number of nailgun servers which were started to run a request.
+  LocalNailgunServerStarts,
   RemoteProcessTotalTimeRunMs,
   RemoteCacheRequests,
   RemoteCacheRequestsCached,
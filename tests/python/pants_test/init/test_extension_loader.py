@@ -19,6 +19,7 @@ from pkg_resources import (
 )
 
 from pants.base.exceptions import BuildConfigurationError
+from pants.build_graph.backend_manifest import BackendManifest
 from pants.build_graph.build_configuration import BuildConfiguration
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.engine.rules import rule
@@ -28,6 +29,7 @@ from pants.init.extension_loader import (
     PluginNotFound,
     load_backend,
     load_backends_and_plugins,
+    load_build_configuration_from_source,
     load_plugins,
 )
 from pants.option.subsystem import Subsystem
@@ -109,6 +111,7 @@ class LoaderTest(unittest.TestCase):
         rules=None,
         target_types=None,
         module_name="register",
+        manifest=None,
     ):
 
         package_name = f"__test_package_{uuid.uuid4().hex}"
@@ -130,9 +133,15 @@ class LoaderTest(unittest.TestCase):
             register_entrypoint("rules", rules)
             register_entrypoint("target_types", target_types)
 
+            if manifest is not None:
+                manifest_module = types.ModuleType(f"{package_name}.manifest")
+                setattr(manifest_module, "MANIFEST", manifest)
+                sys.modules[f"{package_name}.manifest"] = manifest_module
+
             yield package_name
         finally:
             del sys.modules[package_name]
+            sys.modules.pop(f"{package_name}.manifest", None)
 
     def assert_empty(self):
         build_configuration = self.bc_builder.create()
@@ -333,3 +342,53 @@ class LoaderTest(unittest.TestCase):
         # the plugin will override the alias registered by the backend
         registered_aliases = build_configuration.registered_aliases
         self.assertEqual(DummyObject2, registered_aliases.objects["override-alias"])
+
+    def test_lazy_backends(self):
+        def backend_rules():
+            return [example_rule]
+
+        field_module_name = f"__test_fields_{uuid.uuid4().hex}"
+        field_module = types.ModuleType(field_module_name)
+        setattr(field_module, "rules", lambda: [example_plugin_rule])
+        sys.modules[field_module_name] = field_module
+
+        manifest = BackendManifest(
+            goals=("lint",),
+            options_scopes=("dummy-linter",),
+            target_field_modules=(field_module_name,),
+        )
+        try:
+            with self.create_register(rules=backend_rules, manifest=manifest) as backend_package:
+
+                def load(requested_args):
+                    bc_builder = BuildConfiguration.Builder()
+                    load_build_configuration_from_source(
+                        bc_builder, [backend_package], requested_args
+                    )
+                    return bc_builder.create()
+
+                # Only the target fields of the backend are loaded if the run does not need it.
+                build_configuration = load(["test", "::"])
+                assert example_rule.rule not in build_configuration.rules
+                assert example_plugin_rule.rule in build_configuration.rules
+                assert build_configuration.unloaded_options_scopes == FrozenOrderedSet(
+                    ["dummy-linter"]
+                )
+
+                for requested_args in (
+                    None,
+                    ["lint", "::"],
+                    ["test", "--dummy-linter-skip", "::"],
+                    ["test", "--help"],
+                    [],
+                ):
+                    build_configuration = load(requested_args)
+                    assert example_rule.rule in build_configuration.rules
+                    assert not build_configuration.unloaded_options_scopes
+        finally:
+            del sys.modules[field_module_name]
+
+    def test_load_invalid_manifest(self):
+        with self.create_register(manifest="not a manifest") as backend_package:
+            with self.assertRaises(BuildConfigurationError):
+                load_build_configuration_from_source(self.bc_builder, [backend_package], ["lint"])